@@ -74,6 +74,7 @@ from vibe_piper.expectations import (
     expect_table_columns_to_match_set,
     expect_table_columns_to_not_contain,
 )
+from vibe_piper.expressions import Expression, ExpressionError, compile_expression
 from vibe_piper.materialization import (
     FileStrategy,
     IncrementalStrategy,
@@ -104,9 +105,20 @@ from vibe_piper.orchestration import (
     ExecutionState,
     OrchestrationConfig,
     OrchestrationEngine,
+    OutputReleaser,
     ParallelExecutor,
+    ResourcePool,
     StateManager,
 )
+from vibe_piper.partitions import (
+    MultiPartitionsDefinition,
+    PartitionRecord,
+    PartitionsDefinition,
+    PartitionStatus,
+    PartitionStatusStore,
+    StaticPartitionsDefinition,
+    TimeWindowPartitionsDefinition,
+)
 from vibe_piper.pipeline import (
     PipelineBuilder,
     PipelineDefinitionContext,
@@ -159,6 +171,7 @@ from vibe_piper.sql_assets import (
     render_sql_template,
     validate_sql,
 )
+from vibe_piper.versioning import AssetVersion, VersionLedger
 
 # Schema evolution
 try:
@@ -383,12 +396,29 @@ __all__ = [
     "DefaultExecutor",
     "ErrorStrategy",
     "calculate_checksum",
+    # Expressions
+    "Expression",
+    "ExpressionError",
+    "compile_expression",
     # Orchestration
     "ExecutionState",
     "OrchestrationConfig",
     "OrchestrationEngine",
+    "OutputReleaser",
     "ParallelExecutor",
+    "ResourcePool",
     "StateManager",
+    # Versioning
+    "AssetVersion",
+    "VersionLedger",
+    # Partitions
+    "PartitionsDefinition",
+    "StaticPartitionsDefinition",
+    "TimeWindowPartitionsDefinition",
+    "MultiPartitionsDefinition",
+    "PartitionStatus",
+    "PartitionRecord",
+    "PartitionStatusStore",
     "Expectation",
     "ValidationResult",
     "QualityMetric",
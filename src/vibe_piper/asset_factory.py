@@ -7,7 +7,7 @@ creation paths.
 """
 
 from collections.abc import Callable
-from typing import Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from vibe_piper.types import (
     Asset,
@@ -18,6 +18,9 @@ from vibe_piper.types import (
     Schema,
 )
 
+if TYPE_CHECKING:
+    from vibe_piper.partitions import PartitionsDefinition
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -40,6 +43,9 @@ def create_asset(
     cache_ttl: int | None = None,
     parallel: bool = False,
     lazy: bool = False,
+    resources: dict[str, int | float] | None = None,
+    priority: int = 0,
+    partitions: "PartitionsDefinition | None" = None,
     create_operator: bool = False,
     operator_type: OperatorType | None = None,
 ) -> Asset:
@@ -67,6 +73,9 @@ def create_asset(
         cache_ttl: Cache time-to-live in seconds
         parallel: Whether to enable parallel execution
         lazy: Whether to enable lazy evaluation
+        resources: Resource units held while executing, keyed by pool name
+        priority: Scheduling priority (higher runs first)
+        partitions: Optional partitions definition for partitioned execution
         create_operator: Whether to create an Operator from fn
         operator_type: Type of operator to create (SOURCE or TRANSFORM)
 
@@ -98,6 +107,13 @@ def create_asset(
                 cache_ttl=3600,
                 parallel=True,
             )
+
+        Create an asset that holds a database connection and 8 GB of memory::
+
+            asset = create_asset(
+                name="my_asset",
+                resources={"postgres": 1, "memory_gb": 8},
+            )
     """
     # Generate URI if not provided
     asset_uri = uri
@@ -170,6 +186,9 @@ def create_asset(
                 # Transform functions receive upstream data
                 return fn(data, context)  # type: ignore
 
+        # Expose the user's function so code versioning hashes it, not the wrapper
+        wrapped_fn.__wrapped__ = fn  # type: ignore[attr-defined]
+
         asset_operator = Operator(
             name=name,
             operator_type=op_type,
@@ -193,4 +212,7 @@ def create_asset(
         cache_ttl=cache_ttl,
         parallel=parallel,
         lazy=lazy,
+        resources=dict(resources or {}),
+        priority=priority,
+        partitions=partitions,
     )
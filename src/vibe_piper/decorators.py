@@ -66,6 +66,11 @@ class AssetDecorator:
         parallel = kwargs.pop("parallel", False)
         lazy = kwargs.pop("lazy", False)
 
+        # Extract scheduling parameters
+        resources = kwargs.pop("resources", None)
+        priority = kwargs.pop("priority", 0)
+        partitions = kwargs.pop("partitions", None)
+
         # Case 1: @asset (no parentheses) - func_or_name is the function
         if callable(func_or_name):
             return create_asset(
@@ -85,6 +90,9 @@ class AssetDecorator:
                 cache_ttl=cache_ttl,
                 parallel=parallel,
                 lazy=lazy,
+                resources=resources,
+                priority=priority,
+                partitions=partitions,
             )
 
         # Case 2 & 3: @asset(...) - with or without parameters
@@ -112,6 +120,9 @@ class AssetDecorator:
                 cache_ttl=cache_ttl,
                 parallel=parallel,
                 lazy=lazy,
+                resources=resources,
+                priority=priority,
+                partitions=partitions,
             )
 
         return decorator
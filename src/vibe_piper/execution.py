@@ -23,6 +23,7 @@ from vibe_piper.materialization import (
     TableStrategy,
     ViewStrategy,
 )
+from vibe_piper.partitions import partition_storage_key
 from vibe_piper.types import (
     Asset,
     AssetGraph,
@@ -207,6 +208,9 @@ class DefaultExecutor:
                         # Multiple upstream - operator must use new contract
                         raise
 
+                # Partitions of an asset are stored (and overwritten) independently
+                storage_key = partition_storage_key(asset.name, context.config.get("partition_key"))
+
                 # Check if we should materialize data
                 if strategy.should_materialize(context):
                     # For incremental strategy, try to load existing data
@@ -217,7 +221,7 @@ class DefaultExecutor:
                             io_manager = get_io_manager(io_manager_name)
 
                             io_context = PipelineContext(
-                                pipeline_id=asset.name,
+                                pipeline_id=storage_key,
                                 run_id=context.run_id,
                                 config=context.config,
                                 state=context.state,
@@ -239,9 +243,9 @@ class DefaultExecutor:
                     io_manager = get_io_manager(io_manager_name)
 
                     # Create a modified context for the IO manager
-                    # Use asset name as pipeline_id for proper isolation
+                    # Use asset name (and partition) as pipeline_id for proper isolation
                     io_context = PipelineContext(
-                        pipeline_id=asset.name,
+                        pipeline_id=storage_key,
                         run_id=context.run_id,
                         config=context.config,
                         state=context.state,
@@ -495,17 +499,13 @@ class ExecutionEngine:
         Returns:
             Tuple of asset names in execution order
         """
-        # Get all dependencies for the target assets (recursively)
-        to_execute = set()
+        # Collect targets plus their transitive dependencies (memoized by the graph)
+        to_execute: set[str] = set()
         for target in targets:
+            if graph.get_asset(target) is None:
+                continue
             to_execute.add(target)
-            # Add all upstream dependencies
-            deps = graph.get_dependencies(target)
-            for dep in deps:
-                to_execute.add(dep.name)
-                # Recursively add dependencies of dependencies
-                upstream = self._get_execution_order_for_targets(graph, (dep.name,))
-                to_execute.update(upstream)
+            to_execute.update(asset.name for asset in graph.get_upstream(target))
 
         # Get full topological order
         full_order = graph.topological_order()
@@ -8,8 +8,10 @@ libraries, group them into suites, and apply them to data in pipelines.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import AsyncIterable, Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 from vibe_piper.types import DataType, Expectation, ValidationResult
@@ -255,6 +257,24 @@ class SuiteResult:
         return details
 
 
+def merge_chunk_results(results: Iterable[ValidationResult]) -> ValidationResult:
+    """
+    Merge the results of one check over several chunks of a dataset.
+
+    Args:
+        results: Per-chunk results, in chunk order
+
+    Returns:
+        Valid only if every chunk is valid, with all errors and warnings
+    """
+    results = list(results)
+    return ValidationResult(
+        is_valid=all(result.is_valid for result in results),
+        errors=tuple(error for result in results for error in result.errors),
+        warnings=tuple(warning for result in results for warning in result.warnings),
+    )
+
+
 class ExpectationSuite:
     """
     A collection of expectations that can be run together.
@@ -383,24 +403,145 @@ class ExpectationSuite:
         """
         return tuple(self._expectations.keys())
 
-    def validate(self, data: Any) -> SuiteResult:
+    def validate(
+        self,
+        data: Any,
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> SuiteResult:
         """
         Validate data against all expectations in this suite.
 
+        With several workers (or an executor) the expectations run
+        concurrently; results and failure-strategy handling are the same as
+        sequentially.
+
         Args:
             data: The data to validate
+            max_workers: Run expectations on this many threads
+            executor: Optional executor to run expectations on instead (a
+                ProcessPoolExecutor needs picklable expectations and data)
+
+        Returns:
+            SuiteResult with detailed results
+        """
+        if executor is None and (max_workers <= 1 or len(self._expectations) <= 1):
+            return self._collect(
+                (name, partial(expectation.validate, data))
+                for name, expectation in self._expectations.items()
+            )
+
+        pool = executor or ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                name: pool.submit(expectation.validate, data)
+                for name, expectation in self._expectations.items()
+            }
+            result = self._collect((name, future.result) for name, future in futures.items())
+            # Expectations after a fail-fast stop are not needed
+            for future in futures.values():
+                future.cancel()
+        finally:
+            if executor is None:
+                pool.shutdown()
+        return result
+
+    def validate_stream(
+        self,
+        chunks: Iterable[Any],
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> SuiteResult:
+        """
+        Validate data delivered in chunks (e.g. a FileReaderIterator).
+
+        Expectations whose fn is a StatisticalCheck (mean, uniqueness, row
+        count, ...) are evaluated from statistics accumulated over every
+        chunk, so they see the whole dataset. Other expectations run on each
+        chunk and the per-chunk results are merged: an expectation passes
+        only if it passes on every chunk, which is right for row-level
+        expectations only. Expectations that need every record at once (a
+        DatasetCheck fn, or metadata whole_dataset=True) are rejected.
+
+        The stream stops at the first chunk on which an expectation fails
+        for good (a per-chunk failure, or a failing count-based statistical
+        check) when the failure strategy would stop there (fail-fast, or an
+        error-severity failure with continue-on-warning); the result then
+        covers the chunks read so far.
+
+        Args:
+            chunks: Iterable of data chunks
+            max_workers: Run the expectations of each chunk on this many threads
+            executor: Optional executor to run expectations on instead
+
+        Returns:
+            SuiteResult with detailed results
+
+        Raises:
+            ValueError: If the suite has expectations that need the whole dataset
+        """
+        stream = _ExpectationStream(self, max_workers, executor)
+        for chunk in chunks:
+            if stream.add(chunk):
+                break
+        return stream.finish()
+
+    async def validate_async_stream(
+        self,
+        records: AsyncIterable[Any],
+        chunk_size: int = 65_536,
+        max_workers: int = 1,
+    ) -> SuiteResult:
+        """
+        Validate records from an async stream (e.g. Source.stream).
+
+        Records are batched into lists of chunk_size and validated as in
+        validate_stream.
+
+        Args:
+            records: Async iterable of records
+            chunk_size: Records per chunk
+            max_workers: Run the expectations of each chunk on this many threads
 
         Returns:
             SuiteResult with detailed results
+
+        Raises:
+            ValueError: If the suite has expectations that need the whole dataset
         """
+        stream = _ExpectationStream(self, max_workers)
+        chunk: list[Any] = []
+        async for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                if stream.add(chunk):
+                    return stream.finish()
+                chunk = []
+        if chunk:
+            stream.add(chunk)
+        return stream.finish()
+
+    def _stops_on(self, failed: Sequence[str]) -> bool:
+        """Whether the failure strategy stops after the given expectations failed."""
+        if self.failure_strategy == FailureStrategy.FAIL_FAST:
+            return bool(failed)
+        if self.failure_strategy == FailureStrategy.CONTINUE_ON_WARNING:
+            return any(self._expectations[name].severity == "error" for name in failed)
+        return False
+
+    def _collect(
+        self, outcomes: Iterable[tuple[str, Callable[[], ValidationResult]]]
+    ) -> SuiteResult:
+        """Run expectation outcomes in suite order, applying the failure strategy."""
         results: dict[str, ValidationResult] = {}
         failed: list[str] = []
         warning_expectations: list[str] = []
         all_errors: list[str] = []
         all_warnings: list[str] = []
 
-        for exp_name, expectation in self._expectations.items():
-            result = expectation.validate(data)
+        for exp_name, outcome in outcomes:
+            expectation = self._expectations[exp_name]
+            result = outcome()
             results[exp_name] = result
 
             # Collect warnings
@@ -442,6 +583,89 @@ class ExpectationSuite:
         return name in self._expectations
 
 
+class _ExpectationStream:
+    """Partial results of an ExpectationSuite validated chunk by chunk."""
+
+    def __init__(
+        self, suite: ExpectationSuite, max_workers: int = 1, executor: Executor | None = None
+    ) -> None:
+        # Imported here: the validation package imports this module
+        from vibe_piper.validation.scan import (
+            DatasetCheck,
+            DatasetStatistics,
+            StatisticalCheck,
+            statistic_requests,
+        )
+
+        expectations = suite._expectations
+        whole_dataset = [
+            name
+            for name, expectation in expectations.items()
+            if isinstance(expectation.fn, DatasetCheck)
+            or expectation.metadata.get("whole_dataset", False)
+        ]
+        if whole_dataset:
+            msg = (
+                f"Expectations {whole_dataset} need the whole dataset and cannot validate a stream"
+            )
+            raise ValueError(msg)
+
+        self.suite = suite
+        self.max_workers = max_workers
+        self.executor = executor
+        self.statistical: dict[str, StatisticalCheck] = {}
+        for name, expectation in expectations.items():
+            if isinstance(expectation.fn, StatisticalCheck):
+                self.statistical[name] = expectation.fn
+        self.statistics = DatasetStatistics(statistic_requests(self.statistical.values()))
+        # The per-chunk expectations, run on each chunk with the suite's strategy
+        self.chunk_suite = ExpectationSuite(suite.name, suite.failure_strategy)
+        self.chunk_suite._expectations = {
+            name: expectation
+            for name, expectation in expectations.items()
+            if name not in self.statistical
+        }
+        self.partials: dict[str, list[ValidationResult]] = {}
+
+    def add(self, chunk: Any) -> bool:
+        """
+        Validate one chunk.
+
+        Returns:
+            True if validation should stop
+        """
+        if self.statistical:
+            self.statistics.update(chunk)
+        chunk_result = self.chunk_suite.validate(
+            chunk, max_workers=self.max_workers, executor=self.executor
+        )
+        for name, result in chunk_result.expectation_results.items():
+            self.partials.setdefault(name, []).append(result)
+        if self.suite.failure_strategy == FailureStrategy.COLLECT_ALL:
+            return False
+        # Count-based statistical failures cannot be undone by more data
+        failed = [
+            name
+            for name, check in self.statistical.items()
+            if check.monotonic and not check.evaluate(self.statistics).is_valid
+        ]
+        return self.suite._stops_on([*chunk_result.failed_expectations, *failed])
+
+    def _outcome(self, name: str) -> Callable[[], ValidationResult]:
+        if name in self.statistical:
+            return partial(self.statistical[name].evaluate, self.statistics)
+        return partial(merge_chunk_results, self.partials[name])
+
+    def finish(self) -> SuiteResult:
+        """Assemble the suite result from the accumulated state."""
+        names = [
+            name
+            for name in self.suite._expectations
+            if name in self.partials or (name in self.statistical and self.statistics.row_count)
+        ]
+        return self.suite._collect((name, self._outcome(name)) for name in names)
+
+
 # =============================================================================
 # Helper Functions for Creating Custom Expectations
 # =============================================================================
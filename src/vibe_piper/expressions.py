@@ -0,0 +1,1251 @@
+"""
+Safe expression language for computed fields and filters.
+
+Expressions are parsed once into an AST and compiled into two evaluators:
+
+- a per-row evaluator (nested closures, no ``eval``) for single records
+- a vectorized evaluator that computes a whole batch column by column with
+  NumPy, falling back to per-element evaluation only for the nodes that
+  cannot be vectorized (e.g. LIKE patterns or mixed-type columns)
+
+Both evaluators share the same semantics.
+
+Language:
+
+- literals: ``42``, ``3.5``, ``'text'``, ``"text"``, ``true``, ``false``, ``null``
+- fields: ``age``, nested fields with dots (``company.name``)
+- arithmetic: ``+ - * / // % **`` (``+`` also concatenates strings)
+- comparisons: ``= == != <> < <= > >=``, ``x BETWEEN a AND b``
+- boolean logic: ``AND``, ``OR``, ``NOT`` (three-valued, as in SQL)
+- null checks: ``x IS NULL``, ``x IS NOT NULL``
+- membership: ``x IN ('a', 'b')``, ``x NOT IN (1, 2)``
+- text matching: ``x LIKE 'ab%'`` (``%`` and ``_`` wildcards) and
+  ``x CONTAINS 'word'`` (whole-word match)
+- functions: lower, upper, trim, length, concat, substr, replace,
+  startswith, endswith, coalesce, abs, round, str, int, float, now
+- ``CASE WHEN cond THEN value [WHEN ...] [ELSE value] END``
+
+Keywords are case-insensitive; Python spellings (``and``, ``None``,
+``True``) work too. Nulls propagate: any operation on a null is null, and
+an operation that fails for a row (e.g. division by zero, adding a
+number to a string, or a power or repetition too large to compute) is null
+for that row. Filters keep rows whose
+condition is true; null counts as false.
+
+Example:
+    Compute a field and filter a batch::
+
+        from vibe_piper.expressions import compile_expression
+
+        total = compile_expression("price * (1 + tax_rate)")
+        totals = total.evaluate_batch(rows)
+
+        adults = compile_expression("age >= 18 AND email IS NOT NULL")
+        kept = [row for row, keep in zip(rows, adults.filter_mask(rows)) if keep]
+"""
+
+import importlib.util
+import math
+import operator
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
+
+# =============================================================================
+# Errors
+# =============================================================================
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed."""
+
+
+# =============================================================================
+# AST
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class Literal:
+    """Constant value."""
+
+    value: Any
+
+
+@dataclass(frozen=True)
+class Column:
+    """Field reference (dots address nested fields)."""
+
+    path: str
+
+
+@dataclass(frozen=True)
+class Unary:
+    """Unary operator: '-', '+' or 'not'."""
+
+    op: str
+    operand: Any
+
+
+@dataclass(frozen=True)
+class Binary:
+    """Arithmetic or comparison operator."""
+
+    op: str
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True)
+class Logical:
+    """'and' / 'or' over two operands."""
+
+    op: str
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True)
+class IsNull:
+    """IS [NOT] NULL check."""
+
+    operand: Any
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class InList:
+    """[NOT] IN membership test."""
+
+    operand: Any
+    items: tuple[Any, ...]
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class Match:
+    """[NOT] LIKE / CONTAINS text match."""
+
+    op: str
+    operand: Any
+    pattern: Any
+    negated: bool = False
+
+
+@dataclass(frozen=True)
+class Call:
+    """Function call."""
+
+    name: str
+    args: tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class Case:
+    """CASE WHEN ... THEN ... ELSE ... END."""
+
+    whens: tuple[tuple[Any, Any], ...]
+    default: Any
+
+
+# =============================================================================
+# Tokenizer
+# =============================================================================
+
+_KEYWORDS = frozenset(
+    {
+        "and",
+        "or",
+        "not",
+        "in",
+        "is",
+        "null",
+        "none",
+        "true",
+        "false",
+        "case",
+        "when",
+        "then",
+        "else",
+        "end",
+        "like",
+        "contains",
+        "between",
+    }
+)
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<number>\d+\.\d*(?:[eE][-+]?\d+)? | \.\d+(?:[eE][-+]?\d+)? | \d+(?:[eE][-+]?\d+)?)
+    | (?P<string>'(?:[^'\\]|\\.|'')*' | "(?:[^"\\]|\\.)*")
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+    | (?P<op>\*\*|//|==|!=|<>|<=|>=|[-+*/%<>=(),\[\]])
+    """,
+    re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class _Token:
+    kind: str
+    value: Any
+    pos: int
+
+
+def _unquote(text: str) -> str:
+    """Decode a quoted string literal."""
+    quote = text[0]
+    body = text[1:-1]
+    if quote == "'":
+        body = body.replace("''", "'")
+    return re.sub(r"\\(.)", lambda m: {"n": "\n", "t": "\t"}.get(m.group(1), m.group(1)), body)
+
+
+def _tokenize(source: str) -> list[_Token]:
+    """Split an expression into tokens."""
+    tokens = []
+    pos = 0
+    while pos < len(source):
+        match = _TOKEN_RE.match(source, pos)
+        if match is None:
+            msg = f"Unexpected character {source[pos]!r} at position {pos} in {source!r}"
+            raise ExpressionError(msg)
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "number":
+            is_float = any(c in text for c in ".eE")
+            tokens.append(_Token("number", float(text) if is_float else int(text), pos))
+        elif kind == "string":
+            tokens.append(_Token("string", _unquote(text), pos))
+        elif kind == "name":
+            lowered = text.lower()
+            if lowered in _KEYWORDS:
+                tokens.append(_Token("keyword", lowered, pos))
+            else:
+                tokens.append(_Token("name", text, pos))
+        elif kind == "op":
+            tokens.append(_Token("op", text, pos))
+        pos = match.end()
+    tokens.append(_Token("end", None, len(source)))
+    return tokens
+
+
+# =============================================================================
+# Parser
+# =============================================================================
+
+_COMPARISONS = {
+    "=": "==",
+    "==": "==",
+    "!=": "!=",
+    "<>": "!=",
+    "<": "<",
+    "<=": "<=",
+    ">": ">",
+    ">=": ">=",
+}
+
+
+class _Parser:
+    """Recursive-descent parser producing AST nodes."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.tokens = _tokenize(source)
+        self.index = 0
+
+    @property
+    def token(self) -> _Token:
+        return self.tokens[self.index]
+
+    def _error(self, message: str) -> ExpressionError:
+        return ExpressionError(f"{message} at position {self.token.pos} in {self.source!r}")
+
+    def _accept(self, kind: str, value: Any = None) -> _Token | None:
+        token = self.token
+        if token.kind == kind and (value is None or token.value == value):
+            self.index += 1
+            return token
+        return None
+
+    def _expect(self, kind: str, value: Any = None) -> _Token:
+        token = self._accept(kind, value)
+        if token is None:
+            expected = value or kind
+            found = self.token.value if self.token.kind != "end" else "end of expression"
+            raise self._error(f"Expected {expected!r}, found {found!r}")
+        return token
+
+    def parse(self) -> Any:
+        node = self._or()
+        if self.token.kind != "end":
+            raise self._error(f"Unexpected {self.token.value!r}")
+        return node
+
+    def _or(self) -> Any:
+        node = self._and()
+        while self._accept("keyword", "or"):
+            node = Logical("or", node, self._and())
+        return node
+
+    def _and(self) -> Any:
+        node = self._not()
+        while self._accept("keyword", "and"):
+            node = Logical("and", node, self._not())
+        return node
+
+    def _not(self) -> Any:
+        if self._accept("keyword", "not"):
+            return Unary("not", self._not())
+        return self._comparison()
+
+    def _comparison(self) -> Any:
+        left = self._additive()
+        token = self.token
+
+        if token.kind == "op" and token.value in _COMPARISONS:
+            self.index += 1
+            return Binary(_COMPARISONS[token.value], left, self._additive())
+
+        if self._accept("keyword", "is"):
+            negated = self._accept("keyword", "not") is not None
+            if not (self._accept("keyword", "null") or self._accept("keyword", "none")):
+                raise self._error("Expected NULL after IS")
+            return IsNull(left, negated)
+
+        negated = self._accept("keyword", "not") is not None
+        if self._accept("keyword", "in"):
+            return InList(left, self._items(), negated)
+        if self._accept("keyword", "like"):
+            return Match("like", left, self._additive(), negated)
+        if self._accept("keyword", "contains"):
+            return Match("contains", left, self._additive(), negated)
+        if self._accept("keyword", "between"):
+            low = self._additive()
+            self._expect("keyword", "and")
+            high = self._additive()
+            node = Logical("and", Binary(">=", left, low), Binary("<=", left, high))
+            return Unary("not", node) if negated else node
+        if negated:
+            raise self._error("Expected IN, LIKE, CONTAINS or BETWEEN after NOT")
+        return left
+
+    def _items(self) -> tuple[Any, ...]:
+        closing = ")" if self._accept("op", "(") else None
+        if closing is None:
+            self._expect("op", "[")
+            closing = "]"
+        items = []
+        if not self._accept("op", closing):
+            while True:
+                items.append(self._additive())
+                if self._accept("op", closing):
+                    break
+                self._expect("op", ",")
+        return tuple(items)
+
+    def _additive(self) -> Any:
+        node = self._term()
+        while self.token.kind == "op" and self.token.value in ("+", "-"):
+            op = self.token.value
+            self.index += 1
+            node = Binary(op, node, self._term())
+        return node
+
+    def _term(self) -> Any:
+        node = self._unary()
+        while self.token.kind == "op" and self.token.value in ("*", "/", "//", "%"):
+            op = self.token.value
+            self.index += 1
+            node = Binary(op, node, self._unary())
+        return node
+
+    def _unary(self) -> Any:
+        if self.token.kind == "op" and self.token.value in ("-", "+"):
+            op = self.token.value
+            self.index += 1
+            return Unary(op, self._unary())
+        return self._power()
+
+    def _power(self) -> Any:
+        node = self._primary()
+        if self._accept("op", "**"):
+            return Binary("**", node, self._unary())
+        return node
+
+    def _primary(self) -> Any:
+        token = self.token
+        if token.kind in ("number", "string"):
+            self.index += 1
+            return Literal(token.value)
+        if token.kind == "keyword":
+            if token.value in ("null", "none"):
+                self.index += 1
+                return Literal(None)
+            if token.value in ("true", "false"):
+                self.index += 1
+                return Literal(token.value == "true")
+            if token.value == "case":
+                self.index += 1
+                return self._case()
+        if token.kind == "name":
+            self.index += 1
+            if self._accept("op", "("):
+                return self._call(token.value)
+            return Column(token.value)
+        if self._accept("op", "("):
+            node = self._or()
+            self._expect("op", ")")
+            return node
+        found = token.value if token.kind != "end" else "end of expression"
+        raise self._error(f"Unexpected {found!r}")
+
+    def _call(self, name: str) -> Call:
+        function = FUNCTIONS.get(name.lower())
+        if function is None:
+            raise self._error(f"Unknown function {name!r}")
+        args = []
+        if not self._accept("op", ")"):
+            while True:
+                args.append(self._or())
+                if self._accept("op", ")"):
+                    break
+                self._expect("op", ",")
+        low, high = function.arity
+        if not low <= len(args) <= (high if high is not None else len(args)):
+            raise self._error(f"Wrong number of arguments for {name}()")
+        return Call(name.lower(), tuple(args))
+
+    def _case(self) -> Case:
+        whens = []
+        while self._accept("keyword", "when"):
+            condition = self._or()
+            self._expect("keyword", "then")
+            whens.append((condition, self._or()))
+        if not whens:
+            raise self._error("CASE requires at least one WHEN")
+        default = self._or() if self._accept("keyword", "else") else Literal(None)
+        self._expect("keyword", "end")
+        return Case(tuple(whens), default)
+
+
+# =============================================================================
+# Scalar Semantics
+# =============================================================================
+
+# Errors that make a single row's result null instead of failing the batch
+_ROW_ERRORS = (TypeError, ValueError, ZeroDivisionError, OverflowError, AttributeError)
+
+# Results beyond these sizes are null rather than computed (e.g. 9 ** 9 ** 9)
+_MAX_INT_BITS = 4096
+_MAX_SEQUENCE_LENGTH = 1_000_000
+
+
+def _mul(left: Any, right: Any) -> Any:
+    """Multiplication that refuses to build huge repeated strings."""
+    for sequence, count in ((left, right), (right, left)):
+        if isinstance(sequence, (str, list, tuple)) and isinstance(count, int):
+            if len(sequence) * count > _MAX_SEQUENCE_LENGTH:
+                msg = "Repeated sequence is too long"
+                raise OverflowError(msg)
+    return operator.mul(left, right)
+
+
+def _pow(base: Any, exponent: Any) -> Any:
+    """Exponentiation that refuses integer results with too many bits."""
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        if abs(base) > 1 and abs(base).bit_length() * exponent > _MAX_INT_BITS:
+            msg = "Integer power is too large"
+            raise OverflowError(msg)
+    return operator.pow(base, exponent)
+
+
+def _mod(left: Any, right: Any) -> Any:
+    """Modulo on numbers only (no printf-style string formatting)."""
+    if isinstance(left, (str, bytes)):
+        msg = "Modulo requires numbers"
+        raise TypeError(msg)
+    return operator.mod(left, right)
+
+
+_BINARY_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": _mul,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": _mod,
+    "**": _pow,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _is_null(value: Any) -> bool:
+    """None and NaN are null."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _binary(op: str, left: Any, right: Any) -> Any:
+    """Apply an operator with null propagation."""
+    if left is None or right is None:
+        return None
+    try:
+        result = _BINARY_OPS[op](left, right)
+    except _ROW_ERRORS:
+        return None
+    if isinstance(result, complex):
+        return None
+    return result
+
+
+def _sign(op: str, value: Any) -> Any:
+    """Unary minus or plus; null for nulls and non-numbers."""
+    if not isinstance(value, (int, float)):
+        return None
+    return -value if op == "-" else +value
+
+
+def _truth(value: Any) -> bool | None:
+    """Three-valued truthiness: None stays None."""
+    return None if value is None else bool(value)
+
+
+def _and(left: Any, right: Any) -> bool | None:
+    a, b = _truth(left), _truth(right)
+    if a is False or b is False:
+        return False
+    if a is None or b is None:
+        return None
+    return True
+
+
+def _or(left: Any, right: Any) -> bool | None:
+    a, b = _truth(left), _truth(right)
+    if a is True or b is True:
+        return True
+    if a is None or b is None:
+        return None
+    return False
+
+
+def _like_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a LIKE pattern (% and _ wildcards) to a regex."""
+    parts = (".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern)
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def _contains_regex(word: str) -> re.Pattern[str]:
+    """Regex matching a whole word or phrase."""
+    return re.compile(rf"(?<!\w){re.escape(word)}(?!\w)")
+
+
+_PATTERN_CACHE: dict[tuple[str, str], re.Pattern[str]] = {}
+
+
+def _pattern(op: str, pattern: str) -> re.Pattern[str]:
+    key = (op, pattern)
+    compiled = _PATTERN_CACHE.get(key)
+    if compiled is None:
+        compiled = _like_regex(pattern) if op == "like" else _contains_regex(pattern)
+        if len(_PATTERN_CACHE) < 1024:
+            _PATTERN_CACHE[key] = compiled
+    return compiled
+
+
+def _match(op: str, value: Any, pattern: Any) -> bool | None:
+    """LIKE / CONTAINS on strings; null for nulls and non-strings."""
+    if not isinstance(value, str) or not isinstance(pattern, str):
+        return None
+    regex = _pattern(op, pattern)
+    if op == "like":
+        return regex.fullmatch(value) is not None
+    return regex.search(value) is not None
+
+
+def _in(value: Any, items: Sequence[Any]) -> bool | None:
+    if value is None:
+        return None
+    try:
+        return value in items
+    except TypeError:
+        return None
+
+
+# =============================================================================
+# Functions
+# =============================================================================
+
+
+def _substr(value: str, start: int, length: int | None = None) -> str:
+    """1-based substring, as in SQL."""
+    begin = max(int(start) - 1, 0)
+    return value[begin:] if length is None else value[begin : begin + int(length)]
+
+
+def _concat(*args: Any) -> str:
+    """Concatenate the non-null arguments as strings."""
+    return "".join(str(arg) for arg in args if arg is not None)
+
+
+def _coalesce(*args: Any) -> Any:
+    return next((arg for arg in args if arg is not None), None)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _str_method(name: str) -> Callable[..., Any]:
+    def call(value: Any, *args: Any) -> Any:
+        if not isinstance(value, str):
+            raise TypeError(f"{name}() requires a string")
+        return getattr(value, name)(*args)
+
+    return call
+
+
+@dataclass(frozen=True)
+class Function:
+    """
+    Expression function.
+
+    Attributes:
+        fn: Scalar implementation
+        arity: (minimum, maximum) argument count (maximum None for variadic)
+        vector: Optional NumPy implementation name (see _VECTOR_FUNCTIONS)
+        null_safe: Whether null arguments give null without calling fn
+        volatile: Whether results differ between calls (e.g. now())
+    """
+
+    fn: Callable[..., Any]
+    arity: tuple[int, int | None]
+    vector: str | None = None
+    null_safe: bool = True
+    volatile: bool = False
+
+    def __call__(self, *args: Any) -> Any:
+        """Apply the function; row errors (and nulls, if null_safe) give null."""
+        if self.null_safe and any(arg is None for arg in args):
+            return None
+        try:
+            return self.fn(*args)
+        except _ROW_ERRORS:
+            return None
+
+
+FUNCTIONS: dict[str, Function] = {
+    "lower": Function(_str_method("lower"), (1, 1), vector="lower"),
+    "upper": Function(_str_method("upper"), (1, 1), vector="upper"),
+    "trim": Function(_str_method("strip"), (1, 1), vector="strip"),
+    "strip": Function(_str_method("strip"), (1, 1), vector="strip"),
+    "length": Function(len, (1, 1), vector="str_len"),
+    "len": Function(len, (1, 1), vector="str_len"),
+    "startswith": Function(_str_method("startswith"), (2, 2)),
+    "endswith": Function(_str_method("endswith"), (2, 2)),
+    "replace": Function(_str_method("replace"), (3, 3)),
+    "substr": Function(_substr, (2, 3)),
+    "concat": Function(_concat, (1, None), null_safe=False),
+    "coalesce": Function(_coalesce, (1, None), null_safe=False),
+    "abs": Function(abs, (1, 1), vector="abs"),
+    "round": Function(round, (1, 2)),
+    "str": Function(str, (1, 1)),
+    "int": Function(int, (1, 1)),
+    "float": Function(float, (1, 1)),
+    "now": Function(_now, (0, 0), null_safe=False, volatile=True),
+}
+
+
+# =============================================================================
+# Row Evaluator
+# =============================================================================
+
+RowFn = Callable[[Mapping[str, Any]], Any]
+
+
+def _field_getter(path: str) -> RowFn:
+    """Read a (possibly nested) field, treating NaN as null."""
+    keys = path.split(".")
+
+    def get(row: Mapping[str, Any]) -> Any:
+        if path in row:
+            value = row[path]
+        else:
+            value = row
+            for key in keys:
+                if isinstance(value, Mapping) and key in value:
+                    value = value[key]
+                else:
+                    return None
+        return None if _is_null(value) else value
+
+    return get
+
+
+def _compile_row(node: Any) -> RowFn:
+    """Compile an AST node into a function of one row."""
+    if isinstance(node, Literal):
+        value = node.value
+        return lambda row: value
+
+    if isinstance(node, Column):
+        return _field_getter(node.path)
+
+    if isinstance(node, Unary):
+        operand = _compile_row(node.operand)
+        if node.op == "not":
+
+            def negate(row: Mapping[str, Any]) -> Any:
+                value = _truth(operand(row))
+                return None if value is None else not value
+
+            return negate
+        op = node.op
+        return lambda row: _sign(op, operand(row))
+
+    if isinstance(node, Binary):
+        left, right, op = _compile_row(node.left), _compile_row(node.right), node.op
+        return lambda row: _binary(op, left(row), right(row))
+
+    if isinstance(node, Logical):
+        left, right = _compile_row(node.left), _compile_row(node.right)
+        if node.op == "and":
+
+            def both(row: Mapping[str, Any]) -> Any:
+                first = _truth(left(row))
+                return False if first is False else _and(first, right(row))
+
+            return both
+
+        def either(row: Mapping[str, Any]) -> Any:
+            first = _truth(left(row))
+            return True if first is True else _or(first, right(row))
+
+        return either
+
+    if isinstance(node, IsNull):
+        operand, negated = _compile_row(node.operand), node.negated
+        return lambda row: (operand(row) is None) != negated
+
+    if isinstance(node, InList):
+        operand = _compile_row(node.operand)
+        negated = node.negated
+        if all(isinstance(item, Literal) for item in node.items):
+            members = [item.value for item in node.items if item.value is not None]
+            try:
+                members = frozenset(members)  # type: ignore[assignment]
+            except TypeError:
+                pass
+
+            def member(row: Mapping[str, Any]) -> Any:
+                result = _in(operand(row), members)
+                return None if result is None else result != negated
+
+            return member
+        items = [_compile_row(item) for item in node.items]
+
+        def dynamic_member(row: Mapping[str, Any]) -> Any:
+            result = _in(operand(row), [item(row) for item in items])
+            return None if result is None else result != negated
+
+        return dynamic_member
+
+    if isinstance(node, Match):
+        operand, pattern = _compile_row(node.operand), _compile_row(node.pattern)
+        op, negated = node.op, node.negated
+
+        def match(row: Mapping[str, Any]) -> Any:
+            result = _match(op, operand(row), pattern(row))
+            return None if result is None else result != negated
+
+        return match
+
+    if isinstance(node, Call):
+        function = FUNCTIONS[node.name]
+        args = [_compile_row(arg) for arg in node.args]
+        return lambda row: function(*(arg(row) for arg in args))
+
+    if isinstance(node, Case):
+        conditions = [_compile_row(cond) for cond, _ in node.whens]
+        values = [_compile_row(value) for _, value in node.whens]
+        default = _compile_row(node.default)
+
+        def case(row: Mapping[str, Any]) -> Any:
+            for condition, value in zip(conditions, values, strict=True):
+                if _truth(condition(row)):
+                    return value(row)
+            return default(row)
+
+        return case
+
+    msg = f"Unsupported expression node: {node!r}"
+    raise ExpressionError(msg)
+
+
+# =============================================================================
+# Vectorized Evaluator
+# =============================================================================
+
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# Batches smaller than this are evaluated row by row
+VECTORIZE_MIN_ROWS = 32
+
+# int64 fast paths keep operands below this so +, - and * stay exact
+_INT_LIMIT = 2**31
+_FLOAT_INT_LIMIT = 2**53
+
+
+@dataclass
+class _Vec:
+    """
+    A column of values during vectorized evaluation.
+
+    Attributes:
+        values: NumPy array (placeholders at null positions)
+        nulls: Boolean null mask
+        kind: "bool", "int" (int64, |v| < 2**31), "float", "str" or "object"
+    """
+
+    values: Any
+    nulls: Any
+    kind: str
+
+
+def _to_vec(values: list[Any]) -> _Vec:
+    """Build a typed column from Python values."""
+    import numpy as np
+
+    n = len(values)
+    types = set(map(type, values))
+    types.discard(type(None))
+
+    # Mixed int/float columns stay objects so ints are not turned into floats
+    if types == {int} or types == {float}:
+        # NumPy converts None to NaN, which is null here too
+        try:
+            floats = np.array(values, dtype=np.float64)
+        except OverflowError:
+            floats = np.full(n, np.inf)
+        nulls = np.isnan(floats)
+        if types == {int}:
+            if np.abs(floats, where=~nulls, out=np.zeros(n)).max(initial=0) < _INT_LIMIT:
+                ints = np.where(nulls, 0, floats).astype(np.int64)
+                return _Vec(ints, nulls, "int")
+        elif np.abs(floats, where=~nulls, out=np.zeros(n)).max(initial=0) < _FLOAT_INT_LIMIT:
+            return _Vec(np.where(nulls, 0.0, floats), nulls, "float")
+
+    nulls = np.fromiter(map(_is_null, values), dtype=bool, count=n)
+    if types == {bool}:
+        return _Vec(np.array(values, dtype=object).astype(bool) & ~nulls, nulls, "bool")
+
+    # String columns use "" at nulls so comparisons and concatenation stay valid
+    kind = "str" if types == {str} else "object"
+    array = np.empty(n, dtype=object)
+    array[:] = values
+    array[nulls] = "" if kind == "str" else None
+    return _Vec(array, nulls, kind)
+
+
+def _constant(value: Any, n: int) -> _Vec:
+    """Broadcast a constant to a column of length n."""
+    import numpy as np
+
+    nulls = np.full(n, _is_null(value), dtype=bool)
+    if isinstance(value, bool):
+        return _Vec(np.full(n, value, dtype=bool), nulls, "bool")
+    if isinstance(value, int) and abs(value) < _INT_LIMIT:
+        return _Vec(np.full(n, value, dtype=np.int64), nulls, "int")
+    if isinstance(value, float) and not nulls.any():
+        return _Vec(np.full(n, value, dtype=np.float64), nulls, "float")
+    array = np.empty(n, dtype=object)
+    array.fill(None if nulls.any() else value)
+    return _Vec(array, nulls, "str" if isinstance(value, str) else "object")
+
+
+def _to_list(vec: _Vec) -> list[Any]:
+    """Convert a column back to Python values with None for nulls."""
+    import numpy as np
+
+    result: list[Any] = vec.values.tolist()
+    for i in np.flatnonzero(vec.nulls):
+        result[i] = None
+    return result
+
+
+def _numeric(vec: _Vec) -> Any:
+    """Values of a numeric column (bools as integers)."""
+    import numpy as np
+
+    return vec.values.astype(np.int64) if vec.kind == "bool" else vec.values
+
+
+class _VectorEvaluator:
+    """Evaluates an AST over a batch of rows, column by column."""
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]]) -> None:
+        self.rows = rows
+        self.n = len(rows)
+        self.columns: dict[str, _Vec] = {}
+
+    def evaluate(self, node: Any) -> _Vec:
+        method: Callable[[Any], _Vec] = getattr(self, f"_{type(node).__name__.lower()}")
+        return method(node)
+
+    # -- elementwise fallback ------------------------------------------------
+
+    def _elementwise(self, fn: Callable[..., Any], *vecs: _Vec) -> _Vec:
+        """Apply a scalar function row by row (nulls passed as None)."""
+        columns = [_to_list(vec) for vec in vecs]
+        return _to_vec([fn(*args) for args in zip(*columns, strict=True)] if columns else [])
+
+    # -- leaves --------------------------------------------------------------
+
+    def _literal(self, node: Literal) -> _Vec:
+        return _constant(node.value, self.n)
+
+    def _column(self, node: Column) -> _Vec:
+        vec = self.columns.get(node.path)
+        if vec is None:
+            path = node.path
+            if "." in path:
+                get = _field_getter(path)
+                values = [get(row) for row in self.rows]
+            else:
+                values = [row.get(path) for row in self.rows]
+            vec = self.columns[path] = _to_vec(values)
+        return vec
+
+    # -- operators -----------------------------------------------------------
+
+    def _unary(self, node: Unary) -> _Vec:
+        import numpy as np
+
+        operand = self.evaluate(node.operand)
+        if node.op == "not":
+            truth = self._truthy(operand)
+            return _Vec(~truth, operand.nulls.copy(), "bool")
+        sign = -1 if node.op == "-" else 1
+        if operand.kind in ("int", "float", "bool"):
+            kind = "float" if operand.kind == "float" else "int"
+            values = (sign * _numeric(operand)).astype(np.float64 if kind == "float" else np.int64)
+            return _Vec(values, operand.nulls, kind)
+        op = node.op
+        return self._elementwise(lambda v: _sign(op, v), operand)
+
+    def _binary(self, node: Binary) -> _Vec:
+        import numpy as np
+
+        left, right = self.evaluate(node.left), self.evaluate(node.right)
+        op = node.op
+        numeric = ("int", "float", "bool")
+        nulls = left.nulls | right.nulls
+
+        if left.kind in numeric and right.kind in numeric and op != "**":
+            a, b = _numeric(left), _numeric(right)
+            if op in ("==", "!=", "<", "<=", ">", ">="):
+                return _Vec(_BINARY_OPS[op](a, b), nulls, "bool")
+            is_int = left.kind != "float" and right.kind != "float"
+            if op in ("/", "//", "%"):
+                zero = b == 0
+                b = np.where(zero, 1, b)
+                nulls = nulls | zero
+            with np.errstate(all="ignore"):
+                values = _BINARY_OPS[op](a, b)
+            if op == "/":
+                return _Vec(values.astype(np.float64), nulls, "float")
+            if is_int:
+                # Exact in int64 since operands are below 2**31; widen if needed
+                if values.size and np.abs(values).max() >= _INT_LIMIT:
+                    return _Vec(values.astype(object), nulls, "object")
+                return _Vec(values.astype(np.int64), nulls, "int")
+            return _Vec(values.astype(np.float64), nulls, "float")
+
+        if left.kind == "str" and right.kind == "str":
+            if op == "+":
+                return _Vec(left.values + right.values, nulls, "str")
+            if op in ("==", "!=", "<", "<=", ">", ">="):
+                values = _BINARY_OPS[op](left.values, right.values).astype(bool)
+                return _Vec(values, nulls, "bool")
+
+        return self._elementwise(lambda a, b: _binary(op, a, b), left, right)
+
+    def _truthy(self, vec: _Vec) -> Any:
+        """Truth value of each non-null row (False at nulls)."""
+        if vec.kind == "bool":
+            truth = vec.values
+        elif vec.kind in ("int", "float"):
+            truth = vec.values != 0
+        else:
+            truth = vec.values.astype(bool)
+        return truth & ~vec.nulls
+
+    def _logical(self, node: Logical) -> _Vec:
+        left, right = self.evaluate(node.left), self.evaluate(node.right)
+        left_true, right_true = self._truthy(left), self._truthy(right)
+        left_false = ~left_true & ~left.nulls
+        right_false = ~right_true & ~right.nulls
+        if node.op == "and":
+            false = left_false | right_false
+            nulls = ~false & (left.nulls | right.nulls)
+            return _Vec(~false & ~nulls, nulls, "bool")
+        true = left_true | right_true
+        nulls = ~true & (left.nulls | right.nulls)
+        return _Vec(true, nulls, "bool")
+
+    def _isnull(self, node: IsNull) -> _Vec:
+        import numpy as np
+
+        operand = self.evaluate(node.operand)
+        values = ~operand.nulls if node.negated else operand.nulls.copy()
+        return _Vec(values, np.zeros(self.n, dtype=bool), "bool")
+
+    def _inlist(self, node: InList) -> _Vec:
+        import numpy as np
+
+        operand = self.evaluate(node.operand)
+        if not all(isinstance(item, Literal) for item in node.items):
+            items = [self.evaluate(item) for item in node.items]
+            item_columns = [_to_list(item) for item in items]
+            result = _to_vec(
+                [
+                    _in(value, [column[i] for column in item_columns])
+                    for i, value in enumerate(_to_list(operand))
+                ]
+            )
+            if node.negated:
+                return _Vec(~result.values.astype(bool), result.nulls, "bool")
+            return _Vec(result.values.astype(bool), result.nulls, "bool")
+
+        members = [item.value for item in node.items if item.value is not None]
+        if operand.kind in ("int", "float") and all(
+            isinstance(m, (int, float)) and not isinstance(m, bool) for m in members
+        ):
+            found = np.isin(operand.values, np.array(members, dtype=np.float64))
+        else:
+            try:
+                lookup = frozenset(members)
+                found = np.fromiter(
+                    (v in lookup for v in operand.values.tolist()), dtype=bool, count=self.n
+                )
+            except TypeError:
+                return self._elementwise(
+                    lambda v: None if (r := _in(v, members)) is None else r != node.negated,
+                    operand,
+                )
+        values = ~found if node.negated else found
+        return _Vec(values & ~operand.nulls, operand.nulls.copy(), "bool")
+
+    def _match(self, node: Match) -> _Vec:
+        operand, pattern = self.evaluate(node.operand), self.evaluate(node.pattern)
+        op, negated = node.op, node.negated
+
+        def match(value: Any, pat: Any) -> Any:
+            result = _match(op, value, pat)
+            return None if result is None else result != negated
+
+        return self._elementwise(match, operand, pattern)
+
+    def _call(self, node: Call) -> _Vec:
+        import numpy as np
+
+        function = FUNCTIONS[node.name]
+        if not node.args:
+            # Constant per batch (e.g. now())
+            return _constant(function(), self.n)
+        args = [self.evaluate(arg) for arg in node.args]
+
+        if function.vector and len(args) == 1:
+            arg = args[0]
+            if function.vector == "abs" and arg.kind in ("int", "float"):
+                return _Vec(np.abs(arg.values), arg.nulls, arg.kind)
+            if arg.kind == "str":
+                text = arg.values.astype(str)
+                if function.vector == "str_len":
+                    return _Vec(np.char.str_len(text).astype(np.int64), arg.nulls, "int")
+                values = getattr(np.char, function.vector)(text).astype(object)
+                return _Vec(values, arg.nulls, "str")
+        if node.name == "coalesce":
+            result = args[-1]
+            for arg in reversed(args[:-1]):
+                result = self._choose(~arg.nulls, arg, result)
+            return result
+        return self._elementwise(function, *args)
+
+    def _choose(self, mask: Any, chosen: _Vec, other: _Vec) -> _Vec:
+        """Take values from ``chosen`` where mask is set, else from ``other``."""
+        import numpy as np
+
+        nulls = np.where(mask, chosen.nulls, other.nulls)
+        if chosen.kind == other.kind and chosen.kind != "object":
+            return _Vec(np.where(mask, chosen.values, other.values), nulls, chosen.kind)
+        values = np.where(mask, chosen.values.astype(object), other.values.astype(object))
+        return _Vec(values, nulls, "object")
+
+    def _case(self, node: Case) -> _Vec:
+        import numpy as np
+
+        result = self.evaluate(node.default)
+        decided = np.zeros(self.n, dtype=bool)
+        branches = []
+        for condition, value in node.whens:
+            truth = self._truthy(self.evaluate(condition)) & ~decided
+            decided |= truth
+            branches.append((truth, value))
+        for truth, value in reversed(branches):
+            if truth.any():
+                result = self._choose(truth, self.evaluate(value), result)
+        return result
+
+
+# =============================================================================
+# Compiled Expressions
+# =============================================================================
+
+
+def _columns(node: Any) -> set[str]:
+    """Field paths referenced by an AST."""
+    if isinstance(node, Column):
+        return {node.path}
+    found: set[str] = set()
+    for value in vars(node).values():
+        children = value if isinstance(value, tuple) else (value,)
+        for child in children:
+            if isinstance(child, tuple):
+                for part in child:
+                    found |= _columns(part)
+            elif hasattr(child, "__dataclass_fields__"):
+                found |= _columns(child)
+    return found
+
+
+class Expression:
+    """
+    A parsed, compiled expression.
+
+    Create with compile_expression(), which caches compiled expressions by
+    source text.
+
+    Attributes:
+        source: Expression text
+        node: Root AST node
+        columns: Field paths the expression reads
+    """
+
+    def __init__(self, source: str) -> None:
+        """
+        Parse and compile an expression.
+
+        Args:
+            source: Expression text
+
+        Raises:
+            ExpressionError: If the expression is invalid
+        """
+        if not source or not source.strip():
+            msg = "Expression is empty"
+            raise ExpressionError(msg)
+        self.source = source
+        self.node = _Parser(source).parse()
+        self.columns = frozenset(_columns(self.node))
+        self._row_fn = _compile_row(self.node)
+
+    def __repr__(self) -> str:
+        return f"Expression({self.source!r})"
+
+    def evaluate(self, row: Mapping[str, Any]) -> Any:
+        """
+        Evaluate the expression for one row.
+
+        Args:
+            row: Field values
+
+        Returns:
+            Result (None for null)
+        """
+        return self._row_fn(row)
+
+    def evaluate_batch(self, rows: Sequence[Mapping[str, Any]]) -> list[Any]:
+        """
+        Evaluate the expression for many rows at once.
+
+        Large batches are evaluated column by column with NumPy; small
+        batches (or environments without NumPy) use the row evaluator.
+
+        Args:
+            rows: Field values of each row
+
+        Returns:
+            One result per row
+        """
+        if not _HAS_NUMPY or len(rows) < VECTORIZE_MIN_ROWS:
+            return [self._row_fn(row) for row in rows]
+        return _to_list(_VectorEvaluator(rows).evaluate(self.node))
+
+    def matches(self, row: Mapping[str, Any]) -> bool:
+        """
+        Check whether a row satisfies the expression as a filter.
+
+        Args:
+            row: Field values
+
+        Returns:
+            True if the result is true (null counts as false)
+        """
+        return bool(self._row_fn(row))
+
+    def filter_mask(self, rows: Sequence[Mapping[str, Any]]) -> list[bool]:
+        """
+        Evaluate the expression as a filter over many rows.
+
+        Args:
+            rows: Field values of each row
+
+        Returns:
+            One keep/drop flag per row
+        """
+        return [bool(value) for value in self.evaluate_batch(rows)]
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source: str) -> Expression:
+    """
+    Parse and compile an expression, caching by source text.
+
+    Args:
+        source: Expression text
+
+    Returns:
+        Compiled expression
+
+    Raises:
+        ExpressionError: If the expression is invalid
+
+    Example:
+        Evaluate a CASE expression::
+
+            tier = compile_expression(
+                "CASE WHEN spend >= 1000 THEN 'gold' WHEN spend >= 100 THEN 'silver' "
+                "ELSE 'bronze' END"
+            )
+            tier.evaluate({"spend": 250})  # "silver"
+    """
+    return Expression(source)
+
+
+__all__ = [
+    "Expression",
+    "ExpressionError",
+    "FUNCTIONS",
+    "Function",
+    "VECTORIZE_MIN_ROWS",
+    "compile_expression",
+]
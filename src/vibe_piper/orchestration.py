@@ -10,14 +10,22 @@ import logging
 import threading
 import time
 from collections.abc import Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from vibe_piper.caching import CacheManager
-from vibe_piper.execution import DefaultExecutor
+from vibe_piper.execution import DefaultExecutor, calculate_checksum
+from vibe_piper.io_managers import FileIOManager, IOManagerAdapter, get_io_manager
+from vibe_piper.partitions import (
+    UNPARTITIONED_KEY,
+    PartitionStatus,
+    PartitionStatusStore,
+    partition_storage_key,
+    upstream_partition_keys,
+)
 from vibe_piper.types import (
     Asset,
     AssetGraph,
@@ -27,6 +35,12 @@ from vibe_piper.types import (
     Executor,
     PipelineContext,
 )
+from vibe_piper.versioning import (
+    AssetVersion,
+    VersionLedger,
+    compute_code_hash,
+    compute_config_hash,
+)
 
 # =============================================================================
 # Logger
@@ -189,6 +203,216 @@ class StateManager:
                 logger.info(f"Cleared state for {pipeline_id}")
 
 
+# =============================================================================
+# Output Release
+# =============================================================================
+
+
+@dataclass
+class OutputReleaser:
+    """
+    Reference-counts asset outputs and releases them once fully consumed.
+
+    Each asset starts with a count of the downstream assets that will
+    consume it during the run. When the last consumer has executed, the
+    asset's in-memory data is dropped from its AssetResult (optionally
+    after spilling it to an IO manager), keeping only metadata such as
+    metrics, checksum and duration.
+
+    Assets without consumers in the run, and explicitly retained assets,
+    are never released since they are the outputs of the run.
+
+    Attributes:
+        remaining: Mapping of asset name to number of pending consumers
+        dependencies: Mapping of asset name to the upstream names it consumes
+        retained: Asset names whose data must never be released
+        spill_manager: Optional IO manager that receives released data
+        released: Names of assets whose data has been released
+    """
+
+    remaining: dict[str, int]
+    dependencies: dict[str, tuple[str, ...]]
+    retained: frozenset[str] = frozenset()
+    spill_manager: IOManagerAdapter | None = None
+    released: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: AssetGraph,
+        execution_order: tuple[str, ...],
+        retained: frozenset[str] = frozenset(),
+        spill_manager: IOManagerAdapter | None = None,
+    ) -> "OutputReleaser":
+        """
+        Build a releaser from the consumers of each asset within a run.
+
+        Args:
+            graph: The asset graph being executed
+            execution_order: Assets that will execute in this run
+            retained: Asset names whose data must be kept
+            spill_manager: Optional IO manager that receives released data
+
+        Returns:
+            OutputReleaser with consumer counts for the run
+        """
+        in_run = set(execution_order)
+        remaining: dict[str, int] = {name: 0 for name in execution_order}
+        dependencies: dict[str, tuple[str, ...]] = {}
+
+        for name in execution_order:
+            deps = tuple(dep for dep in graph.dependencies.get(name, ()) if dep in in_run)
+            dependencies[name] = deps
+            for dep in deps:
+                remaining[dep] += 1
+
+        # Assets nobody consumes in this run are the run's outputs
+        leaves = {name for name, count in remaining.items() if count == 0}
+
+        return cls(
+            remaining=remaining,
+            dependencies=dependencies,
+            retained=frozenset(retained) | frozenset(leaves),
+            spill_manager=spill_manager,
+        )
+
+    def consume(
+        self,
+        asset_name: str,
+        asset_results: dict[str, AssetResult],
+        context: PipelineContext,
+    ) -> None:
+        """
+        Record that an asset has executed and release exhausted upstreams.
+
+        Args:
+            asset_name: The asset that just finished executing
+            asset_results: Results collected so far (updated in place)
+            context: Pipeline execution context
+        """
+        for dep in self.dependencies.get(asset_name, ()):
+            self.remaining[dep] -= 1
+            if self.remaining[dep] <= 0:
+                self.release(dep, asset_results, context)
+
+    def release(
+        self,
+        asset_name: str,
+        asset_results: dict[str, AssetResult],
+        context: PipelineContext,
+    ) -> None:
+        """
+        Drop the in-memory data of an asset result.
+
+        Args:
+            asset_name: The asset whose data should be released
+            asset_results: Results collected so far (updated in place)
+            context: Pipeline execution context
+        """
+        if asset_name in self.retained or asset_name in self.released:
+            return
+
+        result = asset_results.get(asset_name)
+        if result is None or result.data is None:
+            return
+
+        metrics: dict[str, int | float] = {**result.metrics, "released": 1}
+
+        if self.spill_manager is not None:
+            # Key spilled data the same way DefaultExecutor materializes assets
+            io_context = PipelineContext(
+                pipeline_id=asset_name,
+                run_id=context.run_id,
+                config=context.config,
+                state=context.state,
+                metadata=context.metadata,
+            )
+            try:
+                self.spill_manager.handle_output(io_context, result.data)
+                metrics["spilled"] = 1
+            except Exception as e:
+                logger.warning(f"Failed to spill output of {asset_name}: {e}. Keeping it.")
+                return
+
+        asset_results[asset_name] = replace(result, data=None, metrics=metrics)
+        self.released.add(asset_name)
+        logger.debug(f"Released in-memory output of {asset_name}")
+
+
+# =============================================================================
+# Resource Pools
+# =============================================================================
+
+
+@dataclass
+class ResourcePool:
+    """
+    Tracks capacity of named resources shared by concurrently running assets.
+
+    Assets declare the units they hold while executing via Asset.resources.
+    Only resources with a configured capacity are constrained; anything else
+    an asset declares is ignored by the pool.
+
+    Attributes:
+        capacities: Mapping of resource name to total available units
+        in_use: Mapping of resource name to units currently held
+    """
+
+    capacities: Mapping[str, int | float]
+    in_use: dict[str, int | float] = field(default_factory=dict)
+
+    def request_for(self, asset: Asset) -> dict[str, int | float]:
+        """
+        Get the pooled resources an asset needs.
+
+        Args:
+            asset: The asset to inspect
+
+        Returns:
+            Mapping of pooled resource name to requested units
+        """
+        return {
+            name: amount
+            for name, amount in asset.resources.items()
+            if name in self.capacities and amount > 0
+        }
+
+    def validate(self, asset: Asset) -> None:
+        """
+        Check that an asset's request can ever be satisfied.
+
+        Args:
+            asset: The asset to check
+
+        Raises:
+            ValueError: If the asset requests more than a pool's capacity
+        """
+        for name, amount in self.request_for(asset).items():
+            if amount > self.capacities[name]:
+                msg = (
+                    f"Asset {asset.name!r} requests {amount} {name!r} but the pool "
+                    f"only has {self.capacities[name]}"
+                )
+                raise ValueError(msg)
+
+    def fits(self, request: Mapping[str, int | float]) -> bool:
+        """Check if a request fits in the remaining capacity."""
+        return all(
+            self.in_use.get(name, 0) + amount <= self.capacities[name]
+            for name, amount in request.items()
+        )
+
+    def acquire(self, request: Mapping[str, int | float]) -> None:
+        """Reserve the units of a request."""
+        for name, amount in request.items():
+            self.in_use[name] = self.in_use.get(name, 0) + amount
+
+    def release(self, request: Mapping[str, int | float]) -> None:
+        """Return the units of a request to the pool."""
+        for name, amount in request.items():
+            self.in_use[name] = self.in_use.get(name, 0) - amount
+
+
 # =============================================================================
 # Parallel Executor
 # =============================================================================
@@ -262,6 +486,18 @@ class OrchestrationConfig:
         error_strategy: How to handle execution errors
         enable_cache: Whether to enable result caching
         cache_ttl: Default TTL for cache entries (seconds)
+        retain_outputs: Keep the data of every asset result until the run
+            finishes. When False, an asset's data is released once its last
+            downstream consumer has executed.
+        spill_dir: Directory to spill released outputs to (pickle files)
+        spill_io_manager: Name of a registered IO manager to spill released
+            outputs to. Takes precedence over spill_dir.
+        resource_pools: Named resource capacities shared by parallel assets
+            (e.g. {"postgres": 4, "memory_gb": 32}). An asset only starts
+            when every pooled resource it declares fits.
+        enable_versioning: Record asset versions in a ledger and, in
+            incremental runs, only re-execute assets whose code, config or
+            upstream data changed since their last successful run
     """
 
     max_workers: int = 4
@@ -273,6 +509,11 @@ class OrchestrationConfig:
     error_strategy: ErrorStrategy = ErrorStrategy.FAIL_FAST
     enable_cache: bool = False
     cache_ttl: int | None = None
+    retain_outputs: bool = False
+    spill_dir: Path | None = None
+    spill_io_manager: str | None = None
+    resource_pools: Mapping[str, int | float] = field(default_factory=dict)
+    enable_versioning: bool = True
 
 
 @dataclass
@@ -286,10 +527,13 @@ class OrchestrationEngine:
     - Checkpoint-based recovery
     - Incremental run optimization
     - Result caching with TTL
+    - Partition-level fan-out with per-partition status
 
     Attributes:
         config: Orchestration configuration
         state_manager: Manages execution state persistence
+        partition_store: Persists per-partition materialization status
+        version_ledger: Persists asset versions for change-based incremental runs
         executor: The executor to use for running assets
         error_strategy: How to handle execution errors
         cache_manager: Cache manager for result caching
@@ -297,6 +541,8 @@ class OrchestrationEngine:
 
     config: OrchestrationConfig = field(default_factory=OrchestrationConfig)
     state_manager: StateManager = field(init=False)
+    partition_store: PartitionStatusStore = field(init=False)
+    version_ledger: VersionLedger = field(init=False)
     executor: Executor = field(default_factory=lambda: DefaultExecutor())
     error_strategy: ErrorStrategy = ErrorStrategy.FAIL_FAST
     cache_manager: CacheManager | None = None
@@ -304,6 +550,8 @@ class OrchestrationEngine:
     def __post_init__(self) -> None:
         """Initialize state manager and cache manager."""
         self.state_manager = StateManager(state_dir=self.config.state_dir)
+        self.partition_store = PartitionStatusStore(state_dir=self.config.state_dir / "partitions")
+        self.version_ledger = VersionLedger(self.config.state_dir / "versions.db")
 
         if self.config.enable_cache:
             self.cache_manager = CacheManager(enabled=True)
@@ -375,7 +623,7 @@ class OrchestrationEngine:
 
         # Determine assets to execute (skip if incremental and completed)
         assets_to_execute = self._filter_assets_for_incremental(
-            execution_order, state, use_incremental
+            execution_order, state, use_incremental, graph
         )
 
         logger.info(f"Executing {len(assets_to_execute)} assets (incremental={use_incremental})")
@@ -385,20 +633,17 @@ class OrchestrationEngine:
         logger.debug(f"Assets to execute: {assets_to_execute}")
         logger.debug(f"Graph assets: {graph.assets}")
 
+        releaser = self._create_releaser(graph, assets_to_execute, target_assets)
         if self.config.max_workers > 1:
             logger.debug(f"Using parallel execution with {self.config.max_workers} workers")
-            asset_results = self._execute_parallel(graph, assets_to_execute, context, state)
+            asset_results = self._execute_parallel(
+                graph, assets_to_execute, context, state, releaser
+            )
         else:
             logger.debug("Using sequential execution")
-            asset_results = self._execute_sequential(graph, assets_to_execute, context, state)
-
-        logger.info(f"Executing {len(assets_to_execute)} assets (incremental={use_incremental})")
-
-        # Execute assets (parallel or sequential)
-        if self.config.max_workers > 1:
-            asset_results = self._execute_parallel(graph, assets_to_execute, context, state)
-        else:
-            asset_results = self._execute_sequential(graph, assets_to_execute, context, state)
+            asset_results = self._execute_sequential(
+                graph, assets_to_execute, context, state, releaser
+            )
 
         # Save final state
         if use_incremental:
@@ -447,18 +692,450 @@ class OrchestrationEngine:
 
         return result
 
+    def execute_partitions(
+        self,
+        graph: AssetGraph,
+        partition_keys: Sequence[str] | None = None,
+        asset_names: Sequence[str] | None = None,
+        context: PipelineContext | None = None,
+        only_missing_or_stale: bool = False,
+    ) -> ExecutionResult:
+        """
+        Execute an asset graph partition by partition.
+
+        Each partitioned asset is expanded into one task per partition, and
+        unpartitioned assets run once. Tasks are dispatched to the worker
+        pool as soon as the partitions they read have finished, so
+        independent partitions run in parallel. Every partition is stored
+        under its own IO manager key (overwriting that partition only) and
+        its outcome is recorded in the partition status store.
+
+        Upstream partitions that are not part of the run are loaded from
+        their IO manager. A partition receives the matching partition of a
+        same-partitioned upstream, the whole output of an unpartitioned
+        upstream, and a mapping of partition key to data otherwise.
+
+        Args:
+            graph: The asset graph to execute
+            partition_keys: Partitions to execute (defaults to all partitions)
+            asset_names: Assets to execute (defaults to all assets)
+            context: Optional pipeline context. If None, creates a new context.
+            only_missing_or_stale: Skip partitions that are materialized and
+                not older than the upstream partitions they read
+
+        Returns:
+            ExecutionResult keyed by partition storage key (e.g. "sales[2024-01-01]")
+        """
+        start_time = time.time()
+        timestamp = datetime.now()
+
+        if context is None:
+            import uuid
+
+            context = PipelineContext(pipeline_id=graph.name, run_id=str(uuid.uuid4()))
+
+        plan = self.plan_partitions(graph, partition_keys, asset_names, only_missing_or_stale)
+        logger.info(
+            f"Executing {sum(len(keys) for keys in plan.values())} partitions "
+            f"across {len(plan)} assets"
+        )
+
+        asset_results = self._execute_partition_tasks(graph, plan, context)
+
+        succeeded = sum(1 for r in asset_results.values() if r.success)
+        failed = sum(1 for r in asset_results.values() if not r.success)
+        errors = [
+            f"{name}: {result.error}"
+            for name, result in asset_results.items()
+            if not result.success
+        ]
+        duration_ms = (time.time() - start_time) * 1000
+
+        metrics = {
+            **self._aggregate_metrics(asset_results),
+            "partitions_executed": len(asset_results),
+        }
+
+        result = ExecutionResult(
+            success=failed == 0,
+            asset_results=asset_results,
+            errors=tuple(errors),
+            metrics=metrics,
+            duration_ms=duration_ms,
+            timestamp=timestamp,
+            assets_executed=len(asset_results),
+            assets_succeeded=succeeded,
+            assets_failed=failed,
+        )
+
+        logger.info(
+            f"Partition execution completed: {succeeded} succeeded, "
+            f"{failed} failed in {duration_ms:.0f}ms"
+        )
+
+        return result
+
+    def plan_partitions(
+        self,
+        graph: AssetGraph,
+        partition_keys: Sequence[str] | None = None,
+        asset_names: Sequence[str] | None = None,
+        only_missing_or_stale: bool = False,
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Determine which partitions of which assets a run should execute.
+
+        When only missing or stale partitions are requested, a partition is
+        also re-run if any upstream partition it reads is re-run in the same
+        plan, so staleness propagates downstream.
+
+        Args:
+            graph: The asset graph
+            partition_keys: Partitions to consider (defaults to all partitions)
+            asset_names: Assets to consider (defaults to all assets)
+            only_missing_or_stale: Keep only missing, failed or stale partitions
+
+        Returns:
+            Mapping of asset name (in topological order) to partition keys,
+            using UNPARTITIONED_KEY for unpartitioned assets
+        """
+        selected = set(asset_names) if asset_names is not None else None
+        requested = set(partition_keys) if partition_keys is not None else None
+        plan: dict[str, tuple[str, ...]] = {}
+
+        for name in graph.topological_order():
+            if selected is not None and name not in selected:
+                continue
+            asset = graph.get_asset(name)
+            if asset is None:
+                continue
+
+            if asset.partitions is None:
+                candidates: tuple[str, ...] = (UNPARTITIONED_KEY,)
+            else:
+                candidates = tuple(
+                    key
+                    for key in asset.partitions.get_partition_keys()
+                    if requested is None or key in requested
+                )
+
+            if only_missing_or_stale:
+                candidates = tuple(
+                    key
+                    for key in candidates
+                    if self._upstream_planned(graph, asset, key, plan)
+                    or self._is_partition_stale(graph, asset, key)
+                )
+
+            if candidates:
+                plan[name] = candidates
+
+        return plan
+
+    def get_partition_status(self, asset: Asset) -> dict[str, PartitionStatus]:
+        """
+        Get the materialization status of every partition of an asset.
+
+        Args:
+            asset: The asset to inspect
+
+        Returns:
+            Mapping of partition key to status (UNPARTITIONED_KEY for
+            unpartitioned assets)
+        """
+        keys = asset.partitions.get_partition_keys() if asset.partitions else (UNPARTITIONED_KEY,)
+        records = self.partition_store.get_records(asset.name)
+        return {
+            key: records[key].status if key in records else PartitionStatus.MISSING for key in keys
+        }
+
+    def _upstream_planned(
+        self,
+        graph: AssetGraph,
+        asset: Asset,
+        partition_key: str,
+        plan: Mapping[str, tuple[str, ...]],
+    ) -> bool:
+        """Check if any upstream partition read by a partition is in the plan."""
+        downstream_key = None if partition_key == UNPARTITIONED_KEY else partition_key
+        for dep in graph.get_dependencies(asset.name):
+            planned = plan.get(dep.name)
+            if planned and set(upstream_partition_keys(dep, asset, downstream_key)) & set(planned):
+                return True
+        return False
+
+    def _is_partition_stale(self, graph: AssetGraph, asset: Asset, partition_key: str) -> bool:
+        """
+        Check if a partition needs to be (re-)materialized.
+
+        A partition is stale when it never materialized successfully, or
+        when an upstream partition it reads materialized after it did.
+        """
+        record = self.partition_store.get_record(asset.name, partition_key)
+        if record is None or record.status != PartitionStatus.MATERIALIZED:
+            return True
+        if record.materialized_at is None:
+            return True
+
+        downstream_key = None if partition_key == UNPARTITIONED_KEY else partition_key
+        for dep in graph.get_dependencies(asset.name):
+            for upstream_key in upstream_partition_keys(dep, asset, downstream_key):
+                upstream = self.partition_store.get_record(dep.name, upstream_key)
+                if (
+                    upstream is not None
+                    and upstream.materialized_at is not None
+                    and upstream.materialized_at > record.materialized_at
+                ):
+                    return True
+        return False
+
+    def _execute_partition_tasks(
+        self,
+        graph: AssetGraph,
+        plan: Mapping[str, tuple[str, ...]],
+        context: PipelineContext,
+    ) -> dict[str, AssetResult]:
+        """
+        Fan out planned partitions across the worker pool.
+
+        Args:
+            graph: The asset graph
+            plan: Mapping of asset name to partition keys to execute
+            context: Pipeline execution context
+
+        Returns:
+            Mapping of partition storage key to execution result
+        """
+        # Build the task DAG: a task waits for the planned upstream partitions it reads
+        tasks: dict[str, tuple[Asset, str]] = {}
+        for name, keys in plan.items():
+            asset = graph.get_asset(name)
+            if asset is None:
+                continue
+            for key in keys:
+                tasks[partition_storage_key(name, key)] = (asset, key)
+
+        task_dependencies: dict[str, tuple[str, ...]] = {}
+        for task_key, (asset, key) in tasks.items():
+            downstream_key = None if key == UNPARTITIONED_KEY else key
+            task_dependencies[task_key] = tuple(
+                upstream_task
+                for dep in graph.get_dependencies(asset.name)
+                for upstream_key in upstream_partition_keys(dep, asset, downstream_key)
+                if (upstream_task := partition_storage_key(dep.name, upstream_key)) in tasks
+            )
+
+        # Release intermediate partitions once every consuming partition ran
+        releaser: OutputReleaser | None = None
+        if not self.config.retain_outputs:
+            remaining = {task_key: 0 for task_key in tasks}
+            for deps in task_dependencies.values():
+                for dep in deps:
+                    remaining[dep] += 1
+            releaser = OutputReleaser(
+                remaining=remaining,
+                dependencies=task_dependencies,
+                retained=frozenset(task_key for task_key, count in remaining.items() if count == 0),
+            )
+
+        pool = ResourcePool(capacities=self.config.resource_pools)
+        for asset, _ in tasks.values():
+            pool.validate(asset)
+
+        order_index = {task_key: index for index, task_key in enumerate(tasks)}
+        asset_results: dict[str, AssetResult] = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, self.config.max_workers)) as executor:
+            finished: set[str] = set()
+            pending: set[str] = set(tasks)
+            running: dict[Future[AssetResult], tuple[str, dict[str, int | float]]] = {}
+
+            while pending or running:
+                ready = sorted(
+                    (
+                        task_key
+                        for task_key in pending
+                        if all(dep in finished for dep in task_dependencies[task_key])
+                    ),
+                    key=lambda task_key: (-tasks[task_key][0].priority, order_index[task_key]),
+                )
+
+                reserved: set[str] = set()
+                for task_key in ready:
+                    if len(running) >= max(1, self.config.max_workers):
+                        break
+
+                    asset, key = tasks[task_key]
+                    request = pool.request_for(asset)
+                    if reserved.intersection(request) or not pool.fits(request):
+                        reserved.update(request)
+                        continue
+
+                    pool.acquire(request)
+                    upstream_results = self._partition_upstream_results(
+                        graph, asset, key, asset_results, context
+                    )
+                    future = executor.submit(
+                        self._execute_partition, asset, key, context, upstream_results
+                    )
+                    running[future] = (task_key, request)
+                    pending.discard(task_key)
+
+                if not running:
+                    if pending:
+                        msg = "No partitions ready for execution - possible circular dependency"
+                        logger.error(msg)
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task_key, request = running.pop(future)
+                    pool.release(request)
+                    asset, key = tasks[task_key]
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        error_msg = f"Exception executing {task_key}: {e}"
+                        logger.error(error_msg)
+                        result = AssetResult(asset_name=asset.name, success=False, error=error_msg)
+
+                    self.partition_store.record(
+                        asset.name,
+                        key,
+                        success=result.success,
+                        checksum=result.checksum,
+                        error=result.error,
+                    )
+                    asset_results[task_key] = result
+                    finished.add(task_key)
+                    if releaser is not None:
+                        releaser.consume(task_key, asset_results, context)
+
+                    if not result.success and self.error_strategy == ErrorStrategy.FAIL_FAST:
+                        pending.clear()
+
+        return asset_results
+
+    def _partition_upstream_results(
+        self,
+        graph: AssetGraph,
+        asset: Asset,
+        partition_key: str,
+        asset_results: Mapping[str, AssetResult],
+        context: PipelineContext,
+    ) -> dict[str, AssetResult]:
+        """
+        Collect the upstream data read by one partition of an asset.
+
+        Args:
+            graph: The asset graph
+            asset: The downstream asset
+            partition_key: Partition of the downstream asset
+            asset_results: Results produced so far in this run
+            context: Pipeline execution context
+
+        Returns:
+            Mapping of upstream asset name to an AssetResult holding its data
+        """
+        downstream_key = None if partition_key == UNPARTITIONED_KEY else partition_key
+        upstream_results: dict[str, AssetResult] = {}
+
+        for dep in graph.get_dependencies(asset.name):
+            upstream_keys = upstream_partition_keys(dep, asset, downstream_key)
+            data_by_key = {
+                key: self._load_partition(dep, key, asset_results, context) for key in upstream_keys
+            }
+
+            if dep.partitions is None or (
+                downstream_key is not None and dep.partitions == asset.partitions
+            ):
+                data = data_by_key[upstream_keys[0]]
+            else:
+                data = data_by_key
+
+            upstream_results[dep.name] = AssetResult(asset_name=dep.name, success=True, data=data)
+
+        return upstream_results
+
+    def _load_partition(
+        self,
+        asset: Asset,
+        partition_key: str,
+        asset_results: Mapping[str, AssetResult],
+        context: PipelineContext,
+    ) -> Any:
+        """
+        Get the data of an upstream partition.
+
+        Uses this run's in-memory result when available, otherwise loads
+        the materialized partition from the asset's IO manager.
+        """
+        storage_key = partition_storage_key(asset.name, partition_key)
+        result = asset_results.get(storage_key)
+        if result is not None and result.data is not None:
+            return result.data
+
+        io_context = PipelineContext(
+            pipeline_id=storage_key,
+            run_id=context.run_id,
+            config=context.config,
+            state=context.state,
+            metadata=context.metadata,
+        )
+        try:
+            return get_io_manager(asset.io_manager or "memory").load_input(io_context)
+        except Exception as e:
+            logger.warning(f"Failed to load upstream partition {storage_key}: {e}")
+            return None
+
+    def _execute_partition(
+        self,
+        asset: Asset,
+        partition_key: str,
+        context: PipelineContext,
+        upstream_results: Mapping[str, AssetResult],
+    ) -> AssetResult:
+        """
+        Execute a single partition of an asset.
+
+        The partition context (key and, for time windows, its bounds) is
+        merged into the context config. Results are not cached since the
+        cache is keyed by asset rather than partition.
+        """
+        partition_config: dict[str, Any] = {}
+        if asset.partitions is not None:
+            partition_config = asset.partitions.get_partition_context(partition_key)
+
+        partition_context = PipelineContext(
+            pipeline_id=context.pipeline_id,
+            run_id=context.run_id,
+            config={**context.config, **partition_config},
+            state=context.state,
+            metadata=context.metadata,
+        )
+        logger.debug(f"Executing {partition_storage_key(asset.name, partition_key)}")
+        return self.executor.execute(asset, partition_context, upstream_results)
+
     def _filter_assets_for_incremental(
-        self, execution_order: tuple[str, ...], state: ExecutionState, use_incremental: bool
+        self,
+        execution_order: tuple[str, ...],
+        state: ExecutionState,
+        use_incremental: bool,
+        graph: AssetGraph | None = None,
     ) -> tuple[str, ...]:
         """
         Filter assets for incremental execution.
 
-        Skips assets that have already completed successfully in previous runs.
+        With versioning enabled, skips assets whose recorded version still
+        matches their code, config and upstream data. Otherwise skips assets
+        that have already completed successfully in previous runs.
 
         Args:
             execution_order: Topological order of all assets
             state: Current execution state
             use_incremental: Whether incremental mode is enabled
+            graph: The asset graph (required for version-based filtering)
 
         Returns:
             Tuple of asset names to execute
@@ -466,8 +1143,13 @@ class OrchestrationEngine:
         if not use_incremental or not self.config.skip_on_cached:
             return execution_order
 
-        # Skip assets that are already completed
-        filtered = tuple(name for name in execution_order if not state.is_asset_completed(name))
+        if graph is not None and self.config.enable_versioning:
+            # Rebuild only what changed (and everything downstream of it)
+            stale = self.get_stale_assets(graph, execution_order)
+            filtered = tuple(name for name in execution_order if name in stale)
+        else:
+            # Skip assets that are already completed
+            filtered = tuple(name for name in execution_order if not state.is_asset_completed(name))
 
         if len(filtered) < len(execution_order):
             logger.info(
@@ -477,114 +1159,273 @@ class OrchestrationEngine:
 
         return filtered
 
+    def get_stale_assets(
+        self, graph: AssetGraph, execution_order: tuple[str, ...] | None = None
+    ) -> dict[str, str]:
+        """
+        Find assets that differ from their last successful materialization.
+
+        An asset is stale when it has no recorded version, when its code or
+        config hash changed, when an upstream's output fingerprint differs
+        from the one it consumed, or when an upstream is itself stale.
+
+        Args:
+            graph: The asset graph
+            execution_order: Assets to check in topological order (defaults to all)
+
+        Returns:
+            Mapping of stale asset name to the reason it is stale
+        """
+        versions = self.version_ledger.get_all(graph.name)
+        stale: dict[str, str] = {}
+
+        for name in execution_order or graph.topological_order():
+            asset = graph.get_asset(name)
+            if asset is None:
+                continue
+
+            version = versions.get(name)
+            dependencies = graph.dependencies.get(name, ())
+            reason: str | None = None
+
+            if version is None:
+                reason = "never materialized"
+            elif version.code_hash != compute_code_hash(asset):
+                reason = "code changed"
+            elif version.config_hash != compute_config_hash(asset):
+                reason = "config changed"
+            elif set(version.upstream_versions) != set(dependencies):
+                reason = "dependencies changed"
+            else:
+                for dep in dependencies:
+                    if dep in stale:
+                        reason = f"upstream {dep} is stale"
+                        break
+                    dep_version = versions.get(dep)
+                    if (
+                        dep_version is None
+                        or dep_version.output_fingerprint != version.upstream_versions[dep]
+                    ):
+                        reason = f"upstream {dep} changed"
+                        break
+
+            if reason is not None:
+                stale[name] = reason
+                logger.debug(f"Asset {name} is stale: {reason}")
+
+        return stale
+
+    def _record_version(
+        self,
+        graph: AssetGraph,
+        asset_name: str,
+        result: AssetResult,
+        context: PipelineContext,
+    ) -> None:
+        """
+        Record the version of a successful materialization in the ledger.
+
+        Args:
+            graph: The asset graph
+            asset_name: The asset that materialized
+            result: Its execution result
+            context: Pipeline execution context
+        """
+        asset = graph.get_asset(asset_name)
+        if asset is None or not self.config.enable_versioning:
+            return
+
+        upstream_versions: dict[str, str] = {}
+        for dep in graph.dependencies.get(asset_name, ()):
+            dep_version = self.version_ledger.get(graph.name, dep)
+            upstream_versions[dep] = dep_version.output_fingerprint if dep_version else ""
+
+        fingerprint = result.checksum
+        if fingerprint is None and result.data is not None:
+            fingerprint = calculate_checksum(result.data)
+
+        try:
+            self.version_ledger.record(
+                AssetVersion(
+                    pipeline_id=graph.name,
+                    asset_name=asset_name,
+                    code_hash=compute_code_hash(asset),
+                    config_hash=compute_config_hash(asset),
+                    upstream_versions=upstream_versions,
+                    output_fingerprint=fingerprint or "",
+                    run_id=context.run_id,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record version of {asset_name}: {e}")
+
+    def _collect_upstream_results(
+        self,
+        graph: AssetGraph,
+        asset_name: str,
+        asset_results: Mapping[str, AssetResult],
+        context: PipelineContext,
+    ) -> dict[str, AssetResult]:
+        """
+        Collect upstream results for an asset.
+
+        Upstreams skipped by an incremental run are loaded from their IO
+        manager so downstream assets still receive their data.
+
+        Args:
+            graph: The asset graph
+            asset_name: The asset about to execute
+            asset_results: Results produced so far in this run
+            context: Pipeline execution context
+
+        Returns:
+            Mapping of upstream asset name to result
+        """
+        upstream_results: dict[str, AssetResult] = {}
+        for dep in graph.get_dependencies(asset_name):
+            if dep.name in asset_results:
+                upstream_results[dep.name] = asset_results[dep.name]
+                continue
+
+            data = self._load_partition(dep, UNPARTITIONED_KEY, asset_results, context)
+            if data is not None:
+                upstream_results[dep.name] = AssetResult(
+                    asset_name=dep.name, success=True, data=data
+                )
+        return upstream_results
+
     def _execute_parallel(
         self,
         graph: AssetGraph,
         execution_order: tuple[str, ...],
         context: PipelineContext,
         state: ExecutionState,
+        releaser: OutputReleaser | None = None,
     ) -> dict[str, AssetResult]:
         """
         Execute assets in parallel using thread pool.
 
+        Assets are dispatched as soon as their dependencies have finished, a
+        worker is free and their declared resources fit in the configured
+        pools. Higher-priority assets are considered first.
+
         Args:
             graph: The asset graph
             execution_order: Order of assets to execute
             context: Pipeline execution context
             state: Execution state to update
+            releaser: Optional releaser that drops fully consumed outputs
 
         Returns:
             Mapping of asset name to execution result
         """
         asset_results: dict[str, AssetResult] = {}
         parallel_exec = ParallelExecutor(max_workers=self.config.max_workers)
+        pool = ResourcePool(capacities=self.config.resource_pools)
+
+        # Reject requests that could never fit before anything starts running
+        for name in execution_order:
+            asset = graph.get_asset(name)
+            if asset is not None:
+                pool.validate(asset)
+
+        order_index = {name: index for index, name in enumerate(execution_order)}
 
         with parallel_exec as exec_ctx:
             # executor is now guaranteed to be non-None
             assert exec_ctx.executor is not None
-            # Execute assets in waves (respect dependencies)
-            completed: set[str] = set()
+            finished: set[str] = set()
             pending: set[str] = set(execution_order)
+            running: dict[Future[AssetResult], tuple[str, dict[str, int | float]]] = {}
+
+            while pending or running:
+                # Find assets ready for execution (all in-run deps finished),
+                # highest priority first, then in topological order
+                ready = sorted(
+                    (
+                        name
+                        for name in pending
+                        if all(
+                            dep in finished or dep not in order_index
+                            for dep in graph.dependencies.get(name, ())
+                        )
+                    ),
+                    key=lambda name: (-self._asset_priority(graph, name), order_index[name]),
+                )
 
-            while pending:
-                # Find assets ready for execution (all deps completed)
-                ready: list[str] = [
-                    name
-                    for name in pending
-                    if all(dep.name in completed for dep in graph.get_dependencies(name))
-                ]
-
-                if not ready:
-                    # No assets ready - likely circular dependency
-                    msg = "No assets ready for execution - possible circular dependency"
-                    logger.error(msg)
-                    break
-
-                # Submit ready assets for parallel execution
-                futures: dict[Any, str] = {}
-                if exec_ctx.executor is not None:
-                    for name in ready:
-                        asset = graph.get_asset(name)
-                        if asset:
-                            future = exec_ctx.executor.submit(
-                                self._execute_asset_with_state,
-                                asset,
-                                context,
-                                {
-                                    dep.name: asset_results[dep.name]
-                                    for dep in graph.get_dependencies(name)
-                                    if dep.name in asset_results
-                                },
-                                state,
-                            )
-                            futures[future] = name
-
-                # Wait for all to complete
-                if futures:
-                    for future in as_completed(futures):
-                        asset_name = futures[future]
-                        try:
-                            result = future.result()
-                            asset_results[asset_name] = result
-
-                            if result.success:
-                                state.mark_completed(asset_name)
-                            else:
-                                state.mark_failed(asset_name)
-
-                                # Handle error based on strategy
-                                if self.error_strategy == ErrorStrategy.FAIL_FAST:
-                                    # Cancel remaining futures
-                                    for f in futures:
-                                        if f != future and not f.done():
-                                            f.cancel()
-                                    break
-                        except Exception as e:
-                            # Unexpected error
-                            error_msg = f"Exception executing {asset_name}: {e}"
-                            logger.error(error_msg)
-                            asset_results[asset_name] = AssetResult(
-                                asset_name=asset_name,
-                                success=False,
-                                error=error_msg,
-                            )
-                            state.mark_failed(asset_name)
-
-                            if self.error_strategy == ErrorStrategy.FAIL_FAST:
-                                for f in futures:
-                                    if f != future and not f.done():
-                                        f.cancel()
-                                break
-
-                # Mark completed as done
+                # Resources wanted by a higher-priority asset that could not
+                # start are reserved for it, so smaller requests can't starve it
+                reserved: set[str] = set()
                 for name in ready:
-                    completed.add(name)
+                    if len(running) >= self.config.max_workers:
+                        break
+
+                    asset = graph.get_asset(name)
+                    if asset is None:
+                        pending.discard(name)
+                        finished.add(name)
+                        continue
+
+                    request = pool.request_for(asset)
+                    if reserved.intersection(request) or not pool.fits(request):
+                        reserved.update(request)
+                        continue
+
+                    pool.acquire(request)
+                    future = exec_ctx.executor.submit(
+                        self._execute_asset_with_state,
+                        asset,
+                        context,
+                        self._collect_upstream_results(graph, name, asset_results, context),
+                        state,
+                    )
+                    running[future] = (name, request)
                     pending.discard(name)
 
-                # Checkpoint periodically
-                if len(completed) % self.config.checkpoint_interval == 0:
-                    logger.info(f"Checkpoint: {len(completed)} assets completed so far")
-                    self.state_manager.save_state(state)
+                if not running:
+                    if pending:
+                        # No assets ready - likely circular dependency
+                        msg = "No assets ready for execution - possible circular dependency"
+                        logger.error(msg)
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    asset_name, request = running.pop(future)
+                    pool.release(request)
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # Unexpected error
+                        error_msg = f"Exception executing {asset_name}: {e}"
+                        logger.error(error_msg)
+                        result = AssetResult(
+                            asset_name=asset_name,
+                            success=False,
+                            error=error_msg,
+                        )
+
+                    asset_results[asset_name] = result
+                    finished.add(asset_name)
+                    if releaser is not None:
+                        releaser.consume(asset_name, asset_results, context)
+
+                    if result.success:
+                        state.mark_completed(asset_name)
+                        self._record_version(graph, asset_name, result, context)
+                    else:
+                        state.mark_failed(asset_name)
+
+                        # Handle error based on strategy: stop dispatching and
+                        # let already-running assets finish
+                        if self.error_strategy == ErrorStrategy.FAIL_FAST:
+                            pending.clear()
+
+                    # Checkpoint periodically
+                    if len(finished) % self.config.checkpoint_interval == 0:
+                        logger.info(f"Checkpoint: {len(finished)} assets completed so far")
+                        self.state_manager.save_state(state)
 
         return asset_results
 
@@ -594,6 +1435,7 @@ class OrchestrationEngine:
         execution_order: tuple[str, ...],
         context: PipelineContext,
         state: ExecutionState,
+        releaser: OutputReleaser | None = None,
     ) -> dict[str, AssetResult]:
         """
         Execute assets sequentially.
@@ -603,6 +1445,7 @@ class OrchestrationEngine:
             execution_order: Order of assets to execute
             context: Pipeline execution context
             state: Execution state to update
+            releaser: Optional releaser that drops fully consumed outputs
 
         Returns:
             Mapping of asset name to execution result
@@ -615,19 +1458,23 @@ class OrchestrationEngine:
                 continue
 
             # Get upstream results
-            upstream_results = {
-                dep.name: asset_results[dep.name]
-                for dep in graph.get_dependencies(asset_name)
-                if dep.name in asset_results
-            }
+            upstream_results = self._collect_upstream_results(
+                graph, asset_name, asset_results, context
+            )
 
             # Execute asset
             result = self._execute_asset_with_state(asset, context, upstream_results, state)
             asset_results[asset_name] = result
 
+            # Drop the local reference so released upstream data can be freed
+            del upstream_results
+            if releaser is not None:
+                releaser.consume(asset_name, asset_results, context)
+
             # Update state
             if result.success:
                 state.mark_completed(asset_name)
+                self._record_version(graph, asset_name, result, context)
             else:
                 state.mark_failed(asset_name)
 
@@ -721,6 +1568,44 @@ class OrchestrationEngine:
 
         return result
 
+    def _asset_priority(self, graph: AssetGraph, asset_name: str) -> int:
+        """Get the scheduling priority of an asset (0 if unknown)."""
+        asset = graph.get_asset(asset_name)
+        return asset.priority if asset is not None else 0
+
+    def _create_releaser(
+        self,
+        graph: AssetGraph,
+        execution_order: tuple[str, ...],
+        target_assets: tuple[str, ...] | None,
+    ) -> OutputReleaser | None:
+        """
+        Create an output releaser for a run, unless outputs are retained.
+
+        Args:
+            graph: The asset graph
+            execution_order: Assets that will execute in this run
+            target_assets: Explicitly requested assets, which are always retained
+
+        Returns:
+            OutputReleaser, or None if retain_outputs is enabled
+        """
+        if self.config.retain_outputs:
+            return None
+
+        spill_manager: IOManagerAdapter | None = None
+        if self.config.spill_io_manager is not None:
+            spill_manager = get_io_manager(self.config.spill_io_manager)
+        elif self.config.spill_dir is not None:
+            spill_manager = FileIOManager(base_path=self.config.spill_dir, format="pickle")
+
+        return OutputReleaser.from_graph(
+            graph,
+            execution_order,
+            retained=frozenset(target_assets or ()),
+            spill_manager=spill_manager,
+        )
+
     def _get_execution_order_for_targets(
         self, graph: AssetGraph, targets: tuple[str, ...]
     ) -> tuple[str, ...]:
@@ -734,17 +1619,13 @@ class OrchestrationEngine:
         Returns:
             Tuple of asset names in execution order
         """
-        # Get all dependencies for target assets (recursively)
+        # Collect targets plus their transitive dependencies (memoized by the graph)
         to_execute: set[str] = set()
         for target in targets:
+            if graph.get_asset(target) is None:
+                continue
             to_execute.add(target)
-            # Add all upstream dependencies
-            deps = graph.get_dependencies(target)
-            for dep in deps:
-                to_execute.add(dep.name)
-                # Recursively add dependencies of dependencies
-                upstream = self._get_execution_order_for_targets(graph, (dep.name,))
-                to_execute.update(upstream)
+            to_execute.update(asset.name for asset in graph.get_upstream(target))
 
         # Get full topological order
         full_order = graph.topological_order()
@@ -778,6 +1659,9 @@ class OrchestrationEngine:
                 and isinstance(result.data[0], DataRecord)
             ):
                 total_rows += len(result.data)
+            elif result.data is None and result.metrics.get("released"):
+                # Released outputs keep their row count in metrics
+                total_rows += int(result.metrics.get("row_count", 0))
 
         # Get cache statistics if available
         cache_stats = {}
@@ -793,6 +1677,7 @@ class OrchestrationEngine:
             "max_workers": self.config.max_workers,
             "incremental": self.config.enable_incremental,
             "cache_enabled": self.config.enable_cache,
+            "released_outputs": sum(1 for r in asset_results.values() if r.metrics.get("released")),
         }
 
         # Add cache stats
@@ -819,6 +1704,7 @@ class OrchestrationEngine:
             pipeline_id: The pipeline ID to clear state for
         """
         self.state_manager.clear_state(pipeline_id)
+        self.version_ledger.clear(pipeline_id)
         logger.info(f"Cleared state for pipeline {pipeline_id}")
 
     def get_state(self, pipeline_id: str) -> ExecutionState | None:
@@ -844,4 +1730,5 @@ class OrchestrationEngine:
             pipeline_id: The pipeline ID to clear state for
         """
         self.state_manager.clear_state(pipeline_id)
+        self.version_ledger.clear(pipeline_id)
         logger.info(f"Cleared state for pipeline {pipeline_id}")
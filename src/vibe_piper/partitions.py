@@ -0,0 +1,636 @@
+"""
+Partitioned assets for Vibe Piper.
+
+This module provides partition definitions (static key lists, time windows
+and multi-dimensional combinations) plus persistent per-partition
+materialization status, so that assets can be executed, stored and
+backfilled one partition at a time.
+"""
+
+import itertools
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from vibe_piper.types import Asset
+
+# =============================================================================
+# Logger
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+#: Separator between dimension keys of a multi-dimensional partition key
+MULTI_PARTITION_SEPARATOR = "|"
+
+#: Status key used for assets that are not partitioned
+UNPARTITIONED_KEY = "__all__"
+
+# =============================================================================
+# Partition Definitions
+# =============================================================================
+
+
+class PartitionsDefinition(ABC):
+    """
+    Base class for partition definitions.
+
+    A partitions definition describes the set of partition keys an asset
+    is split into. Each partition is executed and stored independently.
+    """
+
+    @abstractmethod
+    def get_partition_keys(self) -> tuple[str, ...]:
+        """
+        Get all partition keys in order.
+
+        Returns:
+            Tuple of partition keys
+        """
+        ...
+
+    def has_partition_key(self, key: str) -> bool:
+        """Check if a key belongs to this definition."""
+        return key in self.get_partition_keys()
+
+    def get_keys_in_range(self, start: datetime, end: datetime) -> tuple[str, ...]:
+        """
+        Get the partition keys that overlap a time range.
+
+        Definitions without a time component return all of their keys.
+
+        Args:
+            start: Start of the range (inclusive)
+            end: End of the range (exclusive)
+
+        Returns:
+            Tuple of partition keys
+        """
+        return self.get_partition_keys()
+
+    def get_partition_context(self, key: str) -> dict[str, Any]:
+        """
+        Get the context configuration passed to an asset for a partition.
+
+        Args:
+            key: The partition key
+
+        Returns:
+            Mapping merged into PipelineContext.config
+        """
+        return {"partition_key": key}
+
+
+@dataclass(frozen=True)
+class StaticPartitionsDefinition(PartitionsDefinition):
+    """
+    Partitions defined by a fixed list of keys.
+
+    Example:
+        Partition an asset by region::
+
+            regions = StaticPartitionsDefinition(keys=("us", "eu", "apac"))
+
+            @asset(partitions=regions)
+            def regional_sales(context):
+                region = context.get_config("partition_key")
+                ...
+
+    Attributes:
+        keys: The partition keys
+    """
+
+    keys: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """Validate the partition keys."""
+        object.__setattr__(self, "keys", tuple(self.keys))
+        if not self.keys:
+            msg = "StaticPartitionsDefinition requires at least one key"
+            raise ValueError(msg)
+        if len(set(self.keys)) != len(self.keys):
+            msg = "Duplicate partition keys in StaticPartitionsDefinition"
+            raise ValueError(msg)
+        for key in self.keys:
+            if not key or MULTI_PARTITION_SEPARATOR in key:
+                msg = f"Invalid partition key: {key!r}"
+                raise ValueError(msg)
+
+    def get_partition_keys(self) -> tuple[str, ...]:
+        """Get all partition keys in order."""
+        return self.keys
+
+
+_DEFAULT_TIME_FORMATS = {
+    "hourly": "%Y-%m-%dT%H",
+    "daily": "%Y-%m-%d",
+    "weekly": "%Y-%m-%d",
+    "monthly": "%Y-%m",
+}
+
+
+@dataclass(frozen=True)
+class TimeWindowPartitionsDefinition(PartitionsDefinition):
+    """
+    Partitions covering consecutive time windows.
+
+    Each key identifies the window starting at that time, formatted with
+    ``fmt``. Windows run from ``start`` until ``end`` (exclusive), or until
+    the current time when ``end`` is None; only complete windows are included.
+
+    Example:
+        Partition an asset by day::
+
+            daily = TimeWindowPartitionsDefinition(start=datetime(2024, 1, 1))
+
+            @asset(partitions=daily)
+            def daily_events(context):
+                start = context.get_config("partition_start")
+                end = context.get_config("partition_end")
+                ...
+
+    Attributes:
+        start: Start of the first window
+        end: End of the last window (exclusive), or None for "now"
+        frequency: Window size ("hourly", "daily", "weekly" or "monthly")
+        fmt: strftime format of partition keys (defaults per frequency)
+    """
+
+    start: datetime
+    end: datetime | None = None
+    frequency: str = "daily"
+    fmt: str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the time window configuration."""
+        if self.frequency not in _DEFAULT_TIME_FORMATS:
+            msg = (
+                f"Invalid partition frequency {self.frequency!r}. "
+                f"Must be one of {sorted(_DEFAULT_TIME_FORMATS)}"
+            )
+            raise ValueError(msg)
+        if self.frequency == "monthly" and self.start.day != 1:
+            msg = "Monthly partitions must start on the first day of a month"
+            raise ValueError(msg)
+        if self.end is not None and self.end <= self.start:
+            msg = "TimeWindowPartitionsDefinition end must be after start"
+            raise ValueError(msg)
+
+    @property
+    def key_format(self) -> str:
+        """The strftime format used for partition keys."""
+        return self.fmt or _DEFAULT_TIME_FORMATS[self.frequency]
+
+    def _next_window_start(self, current: datetime) -> datetime:
+        """Get the start of the window following the one starting at current."""
+        if self.frequency == "hourly":
+            return current + timedelta(hours=1)
+        if self.frequency == "daily":
+            return current + timedelta(days=1)
+        if self.frequency == "weekly":
+            return current + timedelta(weeks=1)
+        # Monthly windows always start on the first day of a month
+        year = current.year + current.month // 12
+        month = current.month % 12 + 1
+        return current.replace(year=year, month=month, day=1)
+
+    def _iter_windows(self, until: datetime) -> list[tuple[datetime, datetime]]:
+        """List complete windows ending at or before until."""
+        windows: list[tuple[datetime, datetime]] = []
+        current = self.start
+        while True:
+            next_start = self._next_window_start(current)
+            if next_start > until:
+                break
+            windows.append((current, next_start))
+            current = next_start
+        return windows
+
+    def _upper_bound(self) -> datetime:
+        """Get the end of the partitioned range."""
+        if self.end is not None:
+            return self.end
+        return datetime.now(self.start.tzinfo)
+
+    def get_partition_keys(self) -> tuple[str, ...]:
+        """Get all partition keys in order."""
+        return tuple(
+            window_start.strftime(self.key_format)
+            for window_start, _ in self._iter_windows(self._upper_bound())
+        )
+
+    def _align(self, value: datetime) -> datetime:
+        """Match the timezone awareness of value to start (naive means UTC)."""
+        if self.start.tzinfo is None and value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        if self.start.tzinfo is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC).astimezone(self.start.tzinfo)
+        return value
+
+    def get_keys_in_range(self, start: datetime, end: datetime) -> tuple[str, ...]:
+        """Get the keys of windows overlapping [start, end)."""
+        start, end = self._align(start), self._align(end)
+        return tuple(
+            window_start.strftime(self.key_format)
+            for window_start, window_end in self._iter_windows(self._upper_bound())
+            if window_start < end and window_end > start
+        )
+
+    def time_window(self, key: str) -> tuple[datetime, datetime]:
+        """
+        Get the time window covered by a partition.
+
+        Args:
+            key: The partition key
+
+        Returns:
+            Tuple of (window start, window end)
+
+        Raises:
+            ValueError: If the key does not match the key format
+        """
+        window_start = datetime.strptime(key, self.key_format)
+        if self.start.tzinfo is not None:
+            window_start = window_start.replace(tzinfo=self.start.tzinfo)
+        return window_start, self._next_window_start(window_start)
+
+    def get_partition_context(self, key: str) -> dict[str, Any]:
+        """Get the partition key plus its window bounds."""
+        window_start, window_end = self.time_window(key)
+        return {
+            "partition_key": key,
+            "partition_start": window_start.isoformat(),
+            "partition_end": window_end.isoformat(),
+        }
+
+
+@dataclass(frozen=True)
+class MultiPartitionsDefinition(PartitionsDefinition):
+    """
+    Partitions formed by the cross product of several dimensions.
+
+    Keys join one key per dimension with ``|`` in dimension order,
+    e.g. ``"2024-01-01|eu"``.
+
+    Example:
+        Partition by day and region::
+
+            partitions = MultiPartitionsDefinition(
+                dimensions={
+                    "date": TimeWindowPartitionsDefinition(start=datetime(2024, 1, 1)),
+                    "region": StaticPartitionsDefinition(keys=("us", "eu")),
+                }
+            )
+
+    Attributes:
+        dimensions: Mapping of dimension name to its partitions definition
+    """
+
+    dimensions: Mapping[str, PartitionsDefinition]
+
+    def __post_init__(self) -> None:
+        """Validate the dimensions."""
+        if len(self.dimensions) < 2:
+            msg = "MultiPartitionsDefinition requires at least two dimensions"
+            raise ValueError(msg)
+        for name, definition in self.dimensions.items():
+            if isinstance(definition, MultiPartitionsDefinition):
+                msg = f"Dimension {name!r} cannot itself be multi-dimensional"
+                raise ValueError(msg)
+
+    def __hash__(self) -> int:
+        """Hash by dimension names and definitions."""
+        return hash(tuple(self.dimensions.items()))
+
+    def get_partition_keys(self) -> tuple[str, ...]:
+        """Get all partition keys in order."""
+        return tuple(
+            MULTI_PARTITION_SEPARATOR.join(combo)
+            for combo in itertools.product(
+                *(definition.get_partition_keys() for definition in self.dimensions.values())
+            )
+        )
+
+    def get_keys_in_range(self, start: datetime, end: datetime) -> tuple[str, ...]:
+        """Get keys whose time dimensions overlap [start, end)."""
+        return tuple(
+            MULTI_PARTITION_SEPARATOR.join(combo)
+            for combo in itertools.product(
+                *(
+                    definition.get_keys_in_range(start, end)
+                    for definition in self.dimensions.values()
+                )
+            )
+        )
+
+    def get_dimension_keys(self, key: str) -> dict[str, str]:
+        """
+        Split a partition key into its per-dimension keys.
+
+        Args:
+            key: The multi-dimensional partition key
+
+        Returns:
+            Mapping of dimension name to dimension key
+
+        Raises:
+            ValueError: If the key has the wrong number of dimensions
+        """
+        parts = key.split(MULTI_PARTITION_SEPARATOR)
+        if len(parts) != len(self.dimensions):
+            msg = f"Partition key {key!r} does not have {len(self.dimensions)} dimensions"
+            raise ValueError(msg)
+        return dict(zip(self.dimensions, parts, strict=True))
+
+    def get_partition_context(self, key: str) -> dict[str, Any]:
+        """Get the partition key plus each dimension's context."""
+        dimension_keys = self.get_dimension_keys(key)
+        context: dict[str, Any] = {
+            "partition_key": key,
+            "partition_dimensions": dimension_keys,
+        }
+        for name, definition in self.dimensions.items():
+            dimension_context = definition.get_partition_context(dimension_keys[name])
+            if "partition_start" in dimension_context:
+                context["partition_start"] = dimension_context["partition_start"]
+                context["partition_end"] = dimension_context["partition_end"]
+        return context
+
+
+def partition_storage_key(asset_name: str, partition_key: str | None) -> str:
+    """
+    Get the key under which a partition of an asset is stored.
+
+    Args:
+        asset_name: Name of the asset
+        partition_key: Partition key, or None for unpartitioned assets
+
+    Returns:
+        Storage key used as the IO manager pipeline_id
+    """
+    if partition_key is None or partition_key == UNPARTITIONED_KEY:
+        return asset_name
+    return f"{asset_name}[{partition_key}]"
+
+
+def upstream_partition_keys(
+    upstream: Asset, downstream: Asset, partition_key: str | None
+) -> tuple[str, ...]:
+    """
+    Get the upstream partitions a downstream partition depends on.
+
+    Partitions map one-to-one when both assets share the same definition.
+    An unpartitioned upstream is consumed whole, and a differently
+    partitioned upstream is consumed across all of its partitions.
+
+    Args:
+        upstream: The upstream asset
+        downstream: The downstream asset
+        partition_key: Partition of the downstream asset (None if unpartitioned)
+
+    Returns:
+        Tuple of upstream partition keys (UNPARTITIONED_KEY if unpartitioned)
+    """
+    if upstream.partitions is None:
+        return (UNPARTITIONED_KEY,)
+    if partition_key is not None and upstream.partitions == downstream.partitions:
+        return (partition_key,)
+    return upstream.partitions.get_partition_keys()
+
+
+# =============================================================================
+# Partition Status Tracking
+# =============================================================================
+
+
+class PartitionStatus(Enum):
+    """Materialization status of a partition."""
+
+    MISSING = "missing"  # Never materialized
+    MATERIALIZED = "materialized"  # Materialized successfully
+    FAILED = "failed"  # Last materialization failed
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse a stored timestamp; naive timestamps are UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class PartitionRecord:
+    """
+    Materialization record for one partition of an asset.
+
+    Attributes:
+        asset_name: Name of the asset
+        partition_key: Partition key (UNPARTITIONED_KEY for unpartitioned assets)
+        status: Materialization status
+        updated_at: When the status was recorded
+        materialized_at: When the partition last materialized successfully
+        checksum: Checksum of the last successful output
+        error: Error message of the last failure
+    """
+
+    asset_name: str
+    partition_key: str
+    status: PartitionStatus
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    materialized_at: datetime | None = None
+    checksum: str | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert record to dictionary for serialization."""
+        return {
+            "asset_name": self.asset_name,
+            "partition_key": self.partition_key,
+            "status": self.status.value,
+            "updated_at": self.updated_at.isoformat(),
+            "materialized_at": self.materialized_at.isoformat() if self.materialized_at else None,
+            "checksum": self.checksum,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PartitionRecord":
+        """Create PartitionRecord from dictionary."""
+        return cls(
+            asset_name=data["asset_name"],
+            partition_key=data["partition_key"],
+            status=PartitionStatus(data["status"]),
+            updated_at=_parse_time(data["updated_at"]),
+            materialized_at=_parse_time(data["materialized_at"])
+            if data.get("materialized_at")
+            else None,
+            checksum=data.get("checksum"),
+            error=data.get("error"),
+        )
+
+
+@dataclass
+class PartitionStatusStore:
+    """
+    Persists per-partition materialization status for assets.
+
+    Status is kept in one append-only JSON Lines log per asset inside
+    ``state_dir`` and cached in memory: each update appends one line and
+    the latest line per partition wins, so recording a partition costs the
+    same however many partitions an asset has. Logs are compacted when
+    loaded once superseded lines outnumber live ones. Access is thread-safe
+    so partitions executing in parallel can record their outcome
+    concurrently.
+
+    Attributes:
+        state_dir: Directory to store partition status logs
+        lock: Thread lock for status access
+    """
+
+    state_dir: Path
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    _records: dict[str, dict[str, PartitionRecord]] = field(default_factory=dict, repr=False)
+
+    def _get_status_path(self, asset_name: str) -> Path:
+        """Get path to the status log for an asset."""
+        return self.state_dir / f"{asset_name}.partitions.jsonl"
+
+    def _get_legacy_path(self, asset_name: str) -> Path:
+        """Get path to the whole-file JSON status written by older versions."""
+        return self.state_dir / f"{asset_name}.partitions.json"
+
+    def _load(self, asset_name: str) -> dict[str, PartitionRecord]:
+        """Load records for an asset (caller must hold the lock)."""
+        if asset_name in self._records:
+            return self._records[asset_name]
+
+        records: dict[str, PartitionRecord] = {}
+        legacy_path = self._get_legacy_path(asset_name)
+        migrate = False
+        if legacy_path.exists():
+            try:
+                with open(legacy_path) as f:
+                    for item in json.load(f):
+                        record = PartitionRecord.from_dict(item)
+                        records[record.partition_key] = record
+                migrate = True
+            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                logger.warning(f"Failed to load partition status for {asset_name}: {e}")
+
+        lines = 0
+        status_path = self._get_status_path(asset_name)
+        if status_path.exists():
+            with open(status_path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    lines += 1
+                    try:
+                        record = PartitionRecord.from_dict(json.loads(line))
+                    except (json.JSONDecodeError, KeyError, ValueError) as e:
+                        # A torn final line from an interrupted write
+                        logger.warning(f"Skipping bad partition status for {asset_name}: {e}")
+                        continue
+                    records[record.partition_key] = record
+
+        self._records[asset_name] = records
+        if migrate or lines > 2 * len(records):
+            self._compact(asset_name)
+        return records
+
+    def _compact(self, asset_name: str) -> None:
+        """Rewrite the log with one line per partition (caller must hold the lock)."""
+        status_path = self._get_status_path(asset_name)
+        status_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = status_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w") as f:
+            for record in self._records.get(asset_name, {}).values():
+                f.write(json.dumps(record.to_dict()) + "\n")
+        tmp_path.replace(status_path)
+        self._get_legacy_path(asset_name).unlink(missing_ok=True)
+
+    def _append(self, record: PartitionRecord) -> None:
+        """Append one record to its asset's log (caller must hold the lock)."""
+        status_path = self._get_status_path(record.asset_name)
+        status_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(status_path, "a") as f:
+            f.write(json.dumps(record.to_dict()) + "\n")
+
+    def record(
+        self,
+        asset_name: str,
+        partition_key: str,
+        success: bool,
+        checksum: str | None = None,
+        error: str | None = None,
+    ) -> PartitionRecord:
+        """
+        Record the outcome of materializing a partition.
+
+        A failure keeps the time of the last successful materialization so
+        downstream staleness checks still see the old data version.
+
+        Args:
+            asset_name: Name of the asset
+            partition_key: Partition key (UNPARTITIONED_KEY for unpartitioned assets)
+            success: Whether materialization succeeded
+            checksum: Checksum of the output (if successful)
+            error: Error message (if failed)
+
+        Returns:
+            The stored PartitionRecord
+        """
+        now = datetime.now(UTC)
+        with self.lock:
+            records = self._load(asset_name)
+            previous = records.get(partition_key)
+            if success:
+                record = PartitionRecord(
+                    asset_name=asset_name,
+                    partition_key=partition_key,
+                    status=PartitionStatus.MATERIALIZED,
+                    updated_at=now,
+                    materialized_at=now,
+                    checksum=checksum,
+                )
+            else:
+                record = PartitionRecord(
+                    asset_name=asset_name,
+                    partition_key=partition_key,
+                    status=PartitionStatus.FAILED,
+                    updated_at=now,
+                    materialized_at=previous.materialized_at if previous else None,
+                    checksum=previous.checksum if previous else None,
+                    error=error,
+                )
+            records[partition_key] = record
+            self._append(record)
+        return record
+
+    def get_record(self, asset_name: str, partition_key: str) -> PartitionRecord | None:
+        """Get the record for a partition, if any."""
+        with self.lock:
+            return self._load(asset_name).get(partition_key)
+
+    def get_status(self, asset_name: str, partition_key: str) -> PartitionStatus:
+        """Get the status of a partition (MISSING if never recorded)."""
+        record = self.get_record(asset_name, partition_key)
+        return record.status if record is not None else PartitionStatus.MISSING
+
+    def get_records(self, asset_name: str) -> dict[str, PartitionRecord]:
+        """Get all partition records for an asset."""
+        with self.lock:
+            return dict(self._load(asset_name))
+
+    def clear(self, asset_name: str) -> None:
+        """Clear all partition status for an asset."""
+        with self.lock:
+            self._records.pop(asset_name, None)
+            self._get_status_path(asset_name).unlink(missing_ok=True)
+            self._get_legacy_path(asset_name).unlink(missing_ok=True)
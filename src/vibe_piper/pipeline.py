@@ -7,7 +7,7 @@ using the @asset decorator and pipeline builders.
 
 import inspect
 from collections.abc import Callable
-from typing import Any, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from vibe_piper.asset_factory import create_asset
 from vibe_piper.types import (
@@ -18,6 +18,9 @@ from vibe_piper.types import (
     OperatorType,
 )
 
+if TYPE_CHECKING:
+    from vibe_piper.partitions import PartitionsDefinition
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -147,6 +150,9 @@ class PipelineBuilder:
         cache_ttl: int | None = None,
         parallel: bool = False,
         lazy: bool = False,
+        resources: dict[str, int | float] | None = None,
+        priority: int = 0,
+        partitions: "PartitionsDefinition | None" = None,
     ) -> "PipelineBuilder":
         """
         Add an asset to the pipeline.
@@ -175,6 +181,9 @@ class PipelineBuilder:
             cache_ttl: Cache time-to-live in seconds
             parallel: Whether to enable parallel execution
             lazy: Whether to enable lazy evaluation
+            resources: Resource units held while executing, keyed by pool name
+            priority: Scheduling priority (higher runs first)
+            partitions: Optional partitions definition for partitioned execution
 
         Returns:
             Self for method chaining
@@ -226,6 +235,9 @@ class PipelineBuilder:
             cache_ttl=cache_ttl,
             parallel=parallel,
             lazy=lazy,
+            resources=resources,
+            priority=priority,
+            partitions=partitions,
             create_operator=True,
             operator_type=operator_type,
         )
@@ -365,6 +377,9 @@ class PipelineDefinitionContext:
         cache_ttl: int | None = None,
         parallel: bool = False,
         lazy: bool = False,
+        resources: dict[str, int | float] | None = None,
+        priority: int = 0,
+        partitions: "PartitionsDefinition | None" = None,
     ) -> Any:
         """
         Decorator or method to add an asset to the pipeline.
@@ -399,6 +414,9 @@ class PipelineDefinitionContext:
             cache_ttl: Cache time-to-live in seconds
             parallel: Whether to enable parallel execution
             lazy: Whether to enable lazy evaluation
+            resources: Resource units held while executing, keyed by pool name
+            priority: Scheduling priority (higher runs first)
+            partitions: Optional partitions definition for partitioned execution
 
         Returns:
             Either a decorator function or the decorated function
@@ -456,6 +474,9 @@ class PipelineDefinitionContext:
                 cache_ttl=cache_ttl,
                 parallel=parallel,
                 lazy=lazy,
+                resources=resources,
+                priority=priority,
+                partitions=partitions,
                 create_operator=True,
                 operator_type=operator_type,
             )
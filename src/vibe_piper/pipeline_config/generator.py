@@ -8,6 +8,7 @@ from collections.abc import Callable
 from types import ModuleType
 from typing import Any
 
+from vibe_piper.expressions import Column, ExpressionError, compile_expression
 from vibe_piper.pipeline_config.schema import (
     ExpectationCheck,
     PipelineConfig,
@@ -289,6 +290,9 @@ def _get_nested_value(data: dict[str, Any], path: str) -> Any:
 def _filter_rows(step: TransformStep, data: Any) -> Any:
     """Filter rows based on condition.
 
+    The condition is compiled once and evaluated for all records together
+    (see vibe_piper.expressions for the language).
+
     Args:
         step: Transform step with filter condition
         data: Input data (should be list of records)
@@ -305,53 +309,29 @@ def _filter_rows(step: TransformStep, data: Any) -> Any:
     if not isinstance(data, list):
         return data
 
-    # Simple condition evaluation (this is a simplified implementation)
-    # A full implementation would parse and evaluate conditions safely
     try:
-        result = []
-        for record in data:
-            if _evaluate_condition(step.condition, record):
-                result.append(record)
-        return result
+        compiled = compile_expression(step.condition)
+        mask = compiled.filter_mask([r if isinstance(r, dict) else {} for r in data])
     except Exception as e:
         msg = f"Failed to evaluate filter condition '{step.condition}': {e}"
         raise PipelineGeneratorError(msg) from e
+    return [record for record, keep in zip(data, mask, strict=True) if keep]
 
 
 def _evaluate_condition(condition: str, record: dict[str, Any]) -> bool:
-    """Evaluate a simple filter condition.
+    """Evaluate a filter condition for one record.
 
     Args:
         condition: Condition string (e.g., "email is not null")
         record: Record to evaluate
 
     Returns:
-        True if condition passes
+        True if condition passes (null counts as failing)
 
-    Note:
-        This is a simplified implementation. A full implementation would
-        include a proper condition parser and evaluator.
+    Raises:
+        ExpressionError: If the condition is invalid
     """
-    # Simple "field is not null" check
-    if " is not null" in condition:
-        field = condition.replace(" is not null", "").strip()
-        return field in record and record[field] is not None
-
-    # Simple "field contains 'value'" check
-    elif ' contains "' in condition:
-        parts = condition.split(' contains "')
-        field = parts[0].strip()
-        value = parts[1].replace('"', "").strip()
-        if field in record:
-            # For now, do exact match (not substring)
-            # This matches the test expectation where "active" shouldn't match "inactive"
-            # TODO: Implement proper substring matching with word boundaries if needed
-            return str(record.get(field, "")) == value
-        return False
-
-    # For now, return True for unknown conditions
-    # TODO: Implement proper condition parser
-    return True
+    return compile_expression(condition).matches(record)
 
 
 def _compute_field(step: TransformStep, data: Any) -> Any:
@@ -374,18 +354,46 @@ def _compute_field(step: TransformStep, data: Any) -> Any:
         return data
 
     # List of records
+    records = [record for record in data if isinstance(record, dict)]
+    values = iter(_compute_values(step.value or "", records))
     result = []
     for record in data:
         if isinstance(record, dict):
-            record_copy = record.copy()
-            record_copy[step.field] = _compute_value(step.value or "", record)
-            result.append(record_copy)
+            result.append({**record, step.field: next(values)})
         else:
             result.append(record)
 
     return result
 
 
+def _compute_values(expression: str, records: list[dict[str, Any]]) -> list[Any]:
+    """Compute a field value for each record from one expression.
+
+    Values that are not valid expressions, and bare names that are not
+    fields of the record, are taken as literal strings so configs such as
+    ``value: pending`` keep working.
+
+    Args:
+        expression: Value expression (e.g., "now()", "upper(name)", "price * qty")
+        records: Records for field references
+
+    Returns:
+        Computed value per record
+    """
+    try:
+        compiled = compile_expression(expression)
+    except ExpressionError:
+        return [expression] * len(records)
+
+    values = compiled.evaluate_batch(records)
+    if isinstance(compiled.node, Column):
+        return [
+            value if expression in record or value is not None else expression
+            for record, value in zip(records, values, strict=True)
+        ]
+    return values
+
+
 def _compute_value(expression: str, record: dict[str, Any]) -> Any:
     """Compute a field value from expression.
 
@@ -395,24 +403,8 @@ def _compute_value(expression: str, record: dict[str, Any]) -> Any:
 
     Returns:
         Computed value
-
-    Note:
-        This is a simplified implementation. A full implementation would
-        include a proper expression evaluator.
     """
-    # Handle "now()" function
-    if expression == "now()":
-        from datetime import datetime, timezone
-
-        return datetime.now(timezone.utc).isoformat()
-
-    # Handle simple field references
-    if expression in record:
-        return record[expression]
-
-    # For now, return the expression as-is
-    # TODO: Implement proper expression evaluator
-    return expression
+    return _compute_values(expression, [record])[0]
 
 
 def _generate_sink_function(name: str, config: SinkConfig) -> Callable:
@@ -23,7 +23,9 @@ from vibe_piper.scheduling.base import (
 from vibe_piper.scheduling.persistence import ScheduleStore
 
 if TYPE_CHECKING:
+    from vibe_piper.orchestration import OrchestrationEngine
     from vibe_piper.scheduling.schedules import CronSchedule, IntervalSchedule
+    from vibe_piper.types import AssetGraph
 
 logger = logging.getLogger(__name__)
 
@@ -330,6 +332,81 @@ class BackfillManager:
 
         return result
 
+    def backfill_partitions(
+        self,
+        config: BackfillConfig,
+        graph: "AssetGraph",
+        engine: "OrchestrationEngine",
+        asset_names: Sequence[str] | None = None,
+    ) -> BackfillResult:
+        """
+        Backfill the partitions of an asset graph that overlap a date range.
+
+        Only partitions that are missing, failed or stale are executed, and
+        only for the selected assets and everything downstream of them.
+        Partitions fan out in parallel through the orchestration engine.
+
+        Args:
+            config: The backfill configuration (start_date and end_date)
+            graph: The asset graph to backfill
+            engine: OrchestrationEngine used to execute partitions
+            asset_names: Assets to backfill (defaults to all assets)
+
+        Returns:
+            BackfillResult where each task is one executed partition
+        """
+        from vibe_piper.types import PipelineContext
+
+        started_at = datetime.utcnow()
+
+        # Affected assets are the selected ones plus everything downstream
+        if asset_names is None:
+            affected = set(graph.topological_order())
+        else:
+            affected = set(asset_names)
+            for name in asset_names:
+                affected.update(asset.name for asset in graph.get_downstream(name))
+
+        partition_keys: set[str] = set()
+        for name in affected:
+            asset = graph.get_asset(name)
+            if asset is not None and asset.partitions is not None:
+                partition_keys.update(
+                    asset.partitions.get_keys_in_range(config.start_date, config.end_date)
+                )
+
+        context = PipelineContext(
+            pipeline_id=graph.name,
+            run_id=f"bf_{config.backfill_id}",
+            config={**config.config, "backfill": True, "backfill_id": config.backfill_id},
+        )
+        execution = engine.execute_partitions(
+            graph,
+            partition_keys=sorted(partition_keys),
+            asset_names=[name for name in graph.topological_order() if name in affected],
+            context=context,
+            only_missing_or_stale=True,
+        )
+
+        completed_at = datetime.utcnow()
+        result = BackfillResult(
+            backfill_id=config.backfill_id,
+            schedule_id=config.schedule_id,
+            tasks_created=execution.assets_executed,
+            tasks_succeeded=execution.assets_succeeded,
+            tasks_failed=execution.assets_failed,
+            duration_ms=(completed_at - started_at).total_seconds() * 1000,
+            started_at=started_at,
+            completed_at=completed_at,
+        )
+
+        logger.info(
+            f"Completed partition backfill {config.backfill_id}: "
+            f"{result.tasks_succeeded} succeeded, {result.tasks_failed} failed"
+        )
+
+        return result
+
     def _execute_backfill_sequential(
         self,
         config: BackfillConfig,
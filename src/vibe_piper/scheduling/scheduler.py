@@ -611,6 +611,26 @@ class Scheduler:
             msg = f"Schedule {config.schedule_id} not found"
             raise ValueError(msg)
 
+        # Partitioned graphs backfill only the missing or stale partitions
+        if any(asset.partitions is not None for asset in schedule.asset_graph.assets):
+            from vibe_piper.orchestration import OrchestrationConfig, OrchestrationEngine
+            from vibe_piper.types import ErrorStrategy
+
+            engine = OrchestrationEngine(
+                config=OrchestrationConfig(
+                    max_workers=config.max_parallel if config.parallel else 1,
+                    state_dir=self.store.storage_dir / "state",
+                ),
+                error_strategy=ErrorStrategy.FAIL_FAST
+                if config.on_failure == "fail_fast"
+                else ErrorStrategy.CONTINUE,
+            )
+            return self.backfill_manager.backfill_partitions(
+                config=config,
+                graph=schedule.asset_graph,
+                engine=engine,
+            )
+
         # Define execution function for backfill tasks
         def execute_backfill_task(task: Any) -> tuple[bool, str | None]:
             try:
@@ -2,12 +2,13 @@
 Transformation Framework for Vibe Piper.
 
 This module provides comprehensive data transformation capabilities including:
-- Join operations (inner, left, right, full outer)
+- Join operations (inner, left, right, full outer) with hash, sort-merge and spilling strategies
 - Aggregation operations (groupby, rollup, cube)
-- Window functions (row_number, rank, lag, lead)
+- Window functions (row_number, rank, lag, lead, running and moving aggregates)
 - Pivot/unpivot operations
 - Data cleaning utilities (deduplication, null handling, outliers, text cleaning)
-- Fluent builder API for complex transformations
+- Fluent builder API for complex transformations, with logical plan optimization
+- Pluggable execution backends (pandas, Polars, DuckDB) with pandas fallback
 - Built-in transformations (extract_fields, map_field, compute_field, enrich_from_lookup)
 - Validation helpers (validate_record, validate_batch, field validators)
 """
@@ -19,13 +20,23 @@ from vibe_piper.transformations.aggregations import (
     GroupBy,
     Max,
     Min,
+    PartialAggregate,
     Rollup,
+    StdDev,
     Sum,
+    Variance,
+)
+from vibe_piper.transformations.backends import (
+    TransformBackend,
+    get_default_backend,
+    register_backend,
+    set_default_backend,
 )
 from vibe_piper.transformations.builder import TransformationBuilder, transform
 from vibe_piper.transformations.cleaning import (
     CleaningConfig,
     CleaningReport,
+    FusedCleaner,
     NullStrategy,
     OutlierAction,
     OutlierMethod,
@@ -52,8 +63,17 @@ from vibe_piper.transformations.cleaning import (
     summarize_report,
     trim_whitespace,
 )
+from vibe_piper.transformations.dedup import (
+    BloomFilter,
+    Deduplicator,
+    DedupMode,
+    DedupStats,
+    PersistentKeySet,
+)
+from vibe_piper.transformations.join_strategies import JoinStats, JoinStrategy
 from vibe_piper.transformations.joins import Join, JoinType, join
 from vibe_piper.transformations.pivot import Pivot, Unpivot
+from vibe_piper.transformations.plan import PlanStep, StepKind, optimize_plan
 from vibe_piper.transformations.transforms import (
     cast_field,
     compute_field,
@@ -62,6 +82,7 @@ from vibe_piper.transformations.transforms import (
     enrich_from_lookup,
     extract_fields,
     extract_nested_value,
+    filter_by_expression,
     filter_by_field,
     filter_rows,
     map_field,
@@ -69,6 +90,8 @@ from vibe_piper.transformations.transforms import (
     select_fields,
 )
 from vibe_piper.transformations.validators import (
+    BatchValidationReport,
+    SchemaValidator,
     create_filter_validator,
     create_validator_from_schema,
     validate_batch,
@@ -87,6 +110,8 @@ __all__ = [
     # Joins
     "Join",
     "JoinType",
+    "JoinStrategy",
+    "JoinStats",
     "join",
     # Aggregations
     "GroupBy",
@@ -95,8 +120,11 @@ __all__ = [
     "Avg",
     "Min",
     "Max",
+    "Variance",
+    "StdDev",
     "Rollup",
     "Cube",
+    "PartialAggregate",
     # Windows
     "Window",
     "window_function",
@@ -106,6 +134,14 @@ __all__ = [
     # Builder
     "TransformationBuilder",
     "transform",
+    "PlanStep",
+    "StepKind",
+    "optimize_plan",
+    # Backends
+    "TransformBackend",
+    "set_default_backend",
+    "get_default_backend",
+    "register_backend",
     # Built-in Transforms
     "extract_fields",
     "extract_nested_value",
@@ -114,6 +150,7 @@ __all__ = [
     "compute_field_from_expression",
     "filter_rows",
     "filter_by_field",
+    "filter_by_expression",
     "enrich_from_lookup",
     "rename_fields",
     "drop_fields",
@@ -129,6 +166,8 @@ __all__ = [
     "validate_enum",
     "validate_record",
     "validate_batch",
+    "SchemaValidator",
+    "BatchValidationReport",
     "create_validator_from_schema",
     "create_filter_validator",
     # Cleaning - Decorator and Main Functions
@@ -137,12 +176,18 @@ __all__ = [
     # Cleaning - Configuration and Reports
     "CleaningConfig",
     "CleaningReport",
+    "FusedCleaner",
     "NullStrategy",
     "OutlierMethod",
     "OutlierAction",
     # Cleaning - Deduplication
     "remove_duplicates",
     "find_duplicates",
+    "Deduplicator",
+    "DedupMode",
+    "DedupStats",
+    "BloomFilter",
+    "PersistentKeySet",
     # Cleaning - Null Handling
     "handle_nulls",
     "drop_nulls",
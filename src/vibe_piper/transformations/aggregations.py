@@ -3,18 +3,55 @@ Aggregation transformation operators.
 
 Provides advanced aggregation capabilities including groupby with multiple
 aggregations, rollup, and cube operations.
+
+Aggregation functions are defined as mergeable partial states (initial
+state, update with a value, merge two states, finalize). This lets GroupBy
+aggregate a dataset chunk by chunk or across workers and merge the partial
+results, and lets Rollup and Cube derive every coarser grouping from the
+finest one instead of rescanning the raw data.
 """
 
+import math
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations
 from typing import Any
 
 import pandas as pd
 
-from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema
+from vibe_piper.transformations.backends import resolve_backend
+from vibe_piper.transformations.backends.base import dataset_columns
+from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema, SchemaField
+
+# =============================================================================
+# Aggregation Functions
+# =============================================================================
+
+
+def _is_null(value: Any) -> bool:
+    """Check for None or NaN, which aggregations skip like pandas."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
 
 
 class AggregationFunction(ABC):
-    """Base class for aggregation functions."""
+    """
+    Base class for aggregation functions.
+
+    Subclasses that set ``agg_name`` to one of sum, count, mean, min or max
+    can run natively on the Polars and DuckDB backends; others use pandas.
+
+    Aggregations are also computed from partial states: ``initial_state``
+    creates an empty state, ``update`` folds in one value, ``merge``
+    combines two states and ``finalize`` produces the result. The default
+    implementation collects the values and calls ``apply`` on them, so
+    custom functions only need ``apply``; built-in functions keep
+    constant-size states.
+    """
+
+    agg_name: str | None = None
 
     def __init__(self, column: str, alias: str | None = None) -> None:
         """
@@ -36,20 +73,91 @@ class AggregationFunction(ABC):
         """Get the data type of the result."""
         return DataType.FLOAT
 
+    def initial_state(self) -> Any:
+        """Create the state of an empty group."""
+        return []
+
+    def update(self, state: Any, value: Any) -> Any:
+        """
+        Fold one value into a state.
+
+        Args:
+            state: Current state (may be mutated)
+            value: Column value
+
+        Returns:
+            Updated state
+        """
+        state.append(value)
+        return state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        """
+        Combine two partial states.
+
+        Args:
+            left: First state (not mutated)
+            right: Second state (not mutated)
+
+        Returns:
+            Combined state
+        """
+        return left + right
+
+    def finalize(self, state: Any) -> Any:
+        """
+        Produce the aggregation result from a state.
+
+        Args:
+            state: Final state
+
+        Returns:
+            Aggregated value
+        """
+        return self.apply(pd.Series(state))
+
 
 class Sum(AggregationFunction):
     """Sum aggregation function."""
 
+    agg_name = "sum"
+
     def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
         return series.sum()
 
+    def initial_state(self) -> Any:
+        return 0
+
+    def update(self, state: Any, value: Any) -> Any:
+        return state if _is_null(value) else state + value
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left + right
+
+    def finalize(self, state: Any) -> Any:
+        return state
+
 
 class Count(AggregationFunction):
     """Count aggregation function."""
 
+    agg_name = "count"
+
     def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
         return series.count()
 
+    def initial_state(self) -> Any:
+        return 0
+
+    def update(self, state: Any, value: Any) -> Any:
+        return state if _is_null(value) else state + 1
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return left + right
+
+    def finalize(self, state: Any) -> Any:
+        return state
+
     def get_result_dtype(self) -> DataType:
         return DataType.INTEGER
 
@@ -57,23 +165,385 @@ class Count(AggregationFunction):
 class Avg(AggregationFunction):
     """Average/mean aggregation function."""
 
+    agg_name = "mean"
+
     def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
         return series.mean()
 
+    def initial_state(self) -> Any:
+        # (sum, count)
+        return (0, 0)
+
+    def update(self, state: Any, value: Any) -> Any:
+        return state if _is_null(value) else (state[0] + value, state[1] + 1)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return (left[0] + right[0], left[1] + right[1])
+
+    def finalize(self, state: Any) -> Any:
+        return state[0] / state[1] if state[1] else None
+
 
 class Min(AggregationFunction):
     """Minimum aggregation function."""
 
+    agg_name = "min"
+
     def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
         return series.min()
 
+    def initial_state(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        if _is_null(value):
+            return state
+        return value if state is None or value < state else state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return self.update(left, right)
+
+    def finalize(self, state: Any) -> Any:
+        return state
+
 
 class Max(AggregationFunction):
     """Maximum aggregation function."""
 
+    agg_name = "max"
+
     def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
         return series.max()
 
+    def initial_state(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        if _is_null(value):
+            return state
+        return value if state is None or value > state else state
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return self.update(left, right)
+
+    def finalize(self, state: Any) -> Any:
+        return state
+
+
+class Variance(AggregationFunction):
+    """
+    Variance aggregation function.
+
+    Partial states are (count, mean, sum of squared deviations), updated
+    with Welford's algorithm and merged with Chan's parallel formula, so
+    chunked results match a single pass.
+    """
+
+    def __init__(self, column: str, alias: str | None = None, ddof: int = 1) -> None:
+        """
+        Initialize variance aggregation.
+
+        Args:
+            column: Column name to aggregate
+            alias: Optional alias for the result column
+            ddof: Delta degrees of freedom (1 for sample, 0 for population)
+        """
+        super().__init__(column, alias)
+        self.ddof = ddof
+
+    def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
+        return series.var(ddof=self.ddof)
+
+    def initial_state(self) -> Any:
+        return (0, 0.0, 0.0)
+
+    def update(self, state: Any, value: Any) -> Any:
+        if _is_null(value):
+            return state
+        count, mean, m2 = state
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        return (count, mean, m2 + delta * (value - mean))
+
+    def merge(self, left: Any, right: Any) -> Any:
+        n_a, mean_a, m2_a = left
+        n_b, mean_b, m2_b = right
+        count = n_a + n_b
+        if not count:
+            return left
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / count
+        return (count, mean, m2_a + m2_b + delta * delta * n_a * n_b / count)
+
+    def finalize(self, state: Any) -> Any:
+        count, _, m2 = state
+        return m2 / (count - self.ddof) if count > self.ddof else None
+
+
+class StdDev(Variance):
+    """Standard deviation aggregation function (mergeable like Variance)."""
+
+    def apply(self, series: pd.Series) -> Any:  # type: ignore[name-defined]
+        return series.std(ddof=self.ddof)
+
+    def finalize(self, state: Any) -> Any:
+        variance = super().finalize(state)
+        return None if variance is None else math.sqrt(variance)
+
+
+# =============================================================================
+# Partial Aggregation
+# =============================================================================
+
+
+def _defining_class(cls: type, attr: str) -> type:
+    """Find the class in the MRO that defines an attribute."""
+    return next(klass for klass in cls.__mro__ if attr in vars(klass))
+
+
+class _CollectValues:
+    """Partial states for a function whose apply() overrides its state methods."""
+
+    def __init__(self, agg: AggregationFunction) -> None:
+        self.agg = agg
+
+    def initial_state(self) -> Any:
+        return AggregationFunction.initial_state(self.agg)
+
+    def update(self, state: Any, value: Any) -> Any:
+        return AggregationFunction.update(self.agg, state, value)
+
+    def merge(self, left: Any, right: Any) -> Any:
+        return AggregationFunction.merge(self.agg, left, right)
+
+    def finalize(self, state: Any) -> Any:
+        return AggregationFunction.finalize(self.agg, state)
+
+
+def _state_functions(agg: AggregationFunction) -> Any:
+    """
+    Get the partial-state implementation for an aggregation.
+
+    A subclass that overrides apply() but inherits finalize() (e.g.
+    ``class Median(Sum)``) falls back to collecting values, so its apply()
+    still defines the result.
+    """
+    cls = type(agg)
+    if _defining_class(cls, "apply") is _defining_class(cls, "finalize"):
+        return agg
+    return _CollectValues(agg)
+
+
+def _sort_key(key: tuple[Any, ...]) -> tuple[tuple[bool, Any], ...]:
+    """Sort group keys ascending with nulls last."""
+    return tuple((value is None, value) for value in key)
+
+
+def _sorted_groups(groups: dict[tuple[Any, ...], Any]) -> list[tuple[Any, ...]]:
+    """Group keys in sorted order (insertion order if not comparable)."""
+    try:
+        return sorted(groups, key=_sort_key)
+    except TypeError:
+        return list(groups)
+
+
+@dataclass
+class PartialAggregate:
+    """
+    Mergeable intermediate result of a grouped aggregation.
+
+    Produced by GroupBy.partial() for one chunk of data; partials from
+    different chunks or workers are combined with merge() and turned into
+    records by GroupBy.finalize().
+
+    Attributes:
+        group_by: Grouping columns
+        aggregations: Aggregation functions, in state order
+        states: Per-group list of aggregation states, keyed by group values
+        schema: Schema of the input records (from the first non-empty chunk)
+        row_count: Number of input rows folded in
+    """
+
+    group_by: tuple[str, ...]
+    aggregations: list[AggregationFunction]
+    states: dict[tuple[Any, ...], list[Any]] = field(default_factory=dict)
+    schema: Schema | None = None
+    row_count: int = 0
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """
+        Merge another partial aggregate into this one.
+
+        Args:
+            other: Partial aggregate over the same grouping and aggregations
+
+        Returns:
+            self, updated in place
+
+        Raises:
+            ValueError: If the groupings differ
+        """
+        if other.group_by != self.group_by:
+            msg = f"Cannot merge partial aggregates grouped by {other.group_by} and {self.group_by}"
+            raise ValueError(msg)
+
+        functions = [_state_functions(agg) for agg in self.aggregations]
+        for key, other_states in other.states.items():
+            states = self.states.get(key)
+            if states is None:
+                self.states[key] = list(other_states)
+            else:
+                self.states[key] = [
+                    fn.merge(a, b) for fn, a, b in zip(functions, states, other_states, strict=True)
+                ]
+        self.schema = self.schema or other.schema
+        self.row_count += other.row_count
+        return self
+
+    def regroup(self, group_by: Sequence[str]) -> "PartialAggregate":
+        """
+        Derive a coarser grouping by merging the states of this one.
+
+        Args:
+            group_by: Subset of this partial's grouping columns
+
+        Returns:
+            New partial aggregate grouped by ``group_by``
+        """
+        positions = [self.group_by.index(col) for col in group_by]
+        functions = [_state_functions(agg) for agg in self.aggregations]
+        states: dict[tuple[Any, ...], list[Any]] = {}
+        for key, key_states in self.states.items():
+            coarse_key = tuple(key[i] for i in positions)
+            current = states.get(coarse_key)
+            if current is None:
+                states[coarse_key] = list(key_states)
+            else:
+                states[coarse_key] = [
+                    fn.merge(a, b) for fn, a, b in zip(functions, current, key_states, strict=True)
+                ]
+        return PartialAggregate(
+            group_by=tuple(group_by),
+            aggregations=self.aggregations,
+            states=states,
+            schema=self.schema,
+            row_count=self.row_count,
+        )
+
+    def results(self) -> list[dict[str, Any]]:
+        """
+        Finalize every group into a result row, in sorted key order.
+
+        Returns:
+            Rows with grouping columns followed by aggregation aliases
+        """
+        functions = [_state_functions(agg) for agg in self.aggregations]
+        rows = []
+        for key in _sorted_groups(self.states):
+            row = dict(zip(self.group_by, key, strict=True))
+            for agg, fn, state in zip(self.aggregations, functions, self.states[key], strict=True):
+                row[agg.alias] = fn.finalize(state)
+            rows.append(row)
+        return rows
+
+
+def _accumulate(
+    data: Sequence[DataRecord],
+    group_by: Sequence[str],
+    aggregations: list[AggregationFunction],
+    dropna: bool,
+) -> PartialAggregate:
+    """Fold records into per-group partial states in one pass."""
+    partial = PartialAggregate(group_by=tuple(group_by), aggregations=aggregations)
+    if not data:
+        return partial
+
+    rows = [record.data for record in data]
+    columns = set(dataset_columns(rows))
+    for col in group_by:
+        if col not in columns:
+            msg = f"Group column '{col}' not found in dataset"
+            raise ValueError(msg)
+    for agg in aggregations:
+        if agg.column not in columns:
+            msg = f"Aggregation column '{agg.column}' not found in dataset"
+            raise ValueError(msg)
+
+    functions = [_state_functions(agg) for agg in aggregations]
+    targets = [(agg.column, fn.update) for agg, fn in zip(aggregations, functions, strict=True)]
+    groups = partial.states
+    for row in rows:
+        key = tuple(row.get(col) for col in group_by)
+        if dropna and any(_is_null(value) for value in key):
+            continue
+        states = groups.get(key)
+        if states is None:
+            states = groups[key] = [fn.initial_state() for fn in functions]
+        for i, (column, update) in enumerate(targets):
+            states[i] = update(states[i], row.get(column))
+
+    partial.schema = data[0].schema
+    partial.row_count = len(rows)
+    return partial
+
+
+def _merge_partials(partials: Iterable[PartialAggregate]) -> PartialAggregate | None:
+    """Merge partial aggregates, returning None if there are none."""
+    merged = None
+    for partial in partials:
+        merged = partial if merged is None else merged.merge(partial)
+    return merged
+
+
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+"""Chunks submitted ahead per worker when aggregating chunks in parallel."""
+
+
+def _bounded_map(
+    executor: Executor,
+    fn: Callable[[Sequence[DataRecord]], PartialAggregate],
+    chunks: Iterable[Sequence[DataRecord]],
+    window: int,
+) -> Iterator[PartialAggregate]:
+    """Map fn over chunks on an executor with at most `window` chunks in flight."""
+    pending: deque[Future[PartialAggregate]] = deque()
+    for chunk in chunks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, chunk))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _map_chunks(
+    fn: Callable[[Sequence[DataRecord]], PartialAggregate],
+    chunks: Iterable[Sequence[DataRecord]],
+    max_workers: int,
+    executor: Executor | None,
+) -> Iterator[PartialAggregate]:
+    """
+    Compute a partial aggregate per chunk, optionally in parallel.
+
+    Chunks are pulled from the iterator only as workers free up (at most
+    CHUNKS_IN_FLIGHT_PER_WORKER per worker are submitted ahead), so a large
+    chunked source is never read into memory as a whole. With an executor,
+    max_workers is taken as its number of workers.
+    """
+    if executor is not None:
+        window = max(max_workers, 1) * CHUNKS_IN_FLIGHT_PER_WORKER
+        yield from _bounded_map(executor, fn, chunks, window)
+    elif max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            yield from _bounded_map(pool, fn, chunks, max_workers * CHUNKS_IN_FLIGHT_PER_WORKER)
+    else:
+        yield from map(fn, chunks)
+
+
+# =============================================================================
+# GroupBy
+# =============================================================================
+
 
 class GroupBy:
     """
@@ -95,6 +565,10 @@ class GroupBy:
                 ]
             )
             result = groupby_op.transform(data, context)
+
+        Aggregate a large file chunk by chunk::
+
+            result = groupby_op.transform_chunks(reader.read_chunks(100_000))
     """
 
     def __init__(
@@ -103,6 +577,7 @@ class GroupBy:
         group_by: str | list[str],
         aggregations: list[AggregationFunction],
         description: str | None = None,
+        backend: str | None = None,
     ) -> None:
         """
         Initialize a GroupBy transformation.
@@ -112,16 +587,19 @@ class GroupBy:
             group_by: Column(s) to group by
             aggregations: List of aggregation functions to apply
             description: Optional description
+            backend: Execution backend (pandas, polars, duckdb); defaults to
+                the pipeline's or the global backend
         """
         self.name = name
         self.group_by = [group_by] if isinstance(group_by, str) else group_by
         self.aggregations = aggregations
         self.description = description or f"Group by {self.group_by}"
+        self.backend = backend
 
     def transform(
         self,
         data: list[DataRecord],
-        ctx: Any,  # noqa: ARG002
+        ctx: Any,
     ) -> list[DataRecord]:
         """
         Apply the groupby aggregation.
@@ -139,79 +617,127 @@ class GroupBy:
         if not data:
             return []
 
-        # Convert to DataFrame
-        df = pd.DataFrame([record.data for record in data])
+        rows = [record.data for record in data]
+        columns = set(dataset_columns(rows))
 
         # Validate group columns exist
         for col in self.group_by:
-            if col not in df.columns:
+            if col not in columns:
                 msg = f"Group column '{col}' not found in dataset"
                 raise ValueError(msg)
 
-        # Group and aggregate
-        grouped = df.groupby(self.group_by, as_index=False)
-
-        # Apply aggregations
-        result_data = {}
         for agg_func in self.aggregations:
-            if agg_func.column not in df.columns:
+            if agg_func.column not in columns:
                 msg = f"Aggregation column '{agg_func.column}' not found in dataset"
                 raise ValueError(msg)
 
-            result_data[agg_func.alias] = grouped[agg_func.column].apply(agg_func.apply)
-
-        # Combine group columns with aggregations
-        result_df = grouped[self.group_by].first()
-        for alias, values in result_data.items():
-            # Use .values.tolist() to handle pandas 3.x grouped aggregation results
-            # grouped.apply() returns Series with group index, we need just the values
-            result_df[alias] = values.values.tolist()
+        # Group and aggregate on the selected backend
+        result_df = resolve_backend("groupby", self, ctx).groupby(self, rows)
 
         # Convert back to DataRecords
         return self._dataframe_to_records(result_df, data[0].schema)
 
+    def partial(self, data: Sequence[DataRecord]) -> PartialAggregate:
+        """
+        Aggregate one chunk of data into mergeable partial states.
+
+        Rows with a null group key are dropped, as in transform().
+
+        Args:
+            data: Chunk of input records
+
+        Returns:
+            Partial aggregate for the chunk
+
+        Raises:
+            ValueError: If group or aggregation columns not found
+        """
+        return _accumulate(data, self.group_by, self.aggregations, dropna=True)
+
+    def finalize(self, partial: PartialAggregate) -> list[DataRecord]:
+        """
+        Turn a (merged) partial aggregate into result records.
+
+        Args:
+            partial: Partial aggregate from partial(), possibly merged
+
+        Returns:
+            Aggregated dataset, sorted by group key
+        """
+        if partial.schema is None:
+            return []
+        rows = partial.results()
+        schema = self._result_schema(
+            list(self.group_by) + [a.alias for a in self.aggregations], partial.schema
+        )
+        return [DataRecord(data=row, schema=schema) for row in rows]
+
+    def transform_chunks(
+        self,
+        chunks: Iterable[Sequence[DataRecord]],
+        ctx: Any = None,  # noqa: ARG002
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> list[DataRecord]:
+        """
+        Aggregate a dataset delivered in chunks (e.g. a FileReaderIterator).
+
+        Each chunk is reduced to a partial aggregate and merged, so only
+        the per-group states are held in memory.
+
+        Args:
+            chunks: Iterable of record chunks
+            ctx: Pipeline context
+            max_workers: Aggregate chunks on this many threads (with
+                executor, the number of workers it runs chunks on)
+            executor: Optional executor (e.g. a ProcessPoolExecutor) to
+                aggregate chunks on instead
+
+        Returns:
+            Aggregated dataset, sorted by group key
+        """
+        partials = _map_chunks(self.partial, chunks, max_workers, executor)
+        merged = _merge_partials(partials)
+        return [] if merged is None else self.finalize(merged)
+
     def _dataframe_to_records(
         self,
         df: pd.DataFrame,
         original_schema: Schema,
     ) -> list[DataRecord]:
         """Convert DataFrame to DataRecords with proper schema."""
-        # Create new schema
-        from vibe_piper.types import SchemaField
+        new_schema = self._result_schema(list(df.columns), original_schema)
+        return [DataRecord(data=row, schema=new_schema) for row in df.to_dict("records")]
 
+    def _result_schema(self, columns: list[str], original_schema: Schema) -> Schema:
+        """Build the schema of grouped results."""
         new_fields = []
-        for col in df.columns:
+        for col in columns:
             if col in self.group_by:
                 # Use original field type
-                field = original_schema.get_field(col)
-                if field:
-                    new_fields.append(field)
+                original = original_schema.get_field(col)
+                if original:
+                    new_fields.append(original)
                 else:
                     new_fields.append(SchemaField(name=col, data_type=DataType.STRING))
             else:
-                # Find aggregation function for this column
+                # Find aggregation function for this column (empty groups give None)
                 for agg_func in self.aggregations:
                     if agg_func.alias == col:
                         new_fields.append(
-                            SchemaField(name=col, data_type=agg_func.get_result_dtype())
+                            SchemaField(
+                                name=col, data_type=agg_func.get_result_dtype(), nullable=True
+                            )
                         )
                         break
                 else:
                     new_fields.append(SchemaField(name=col, data_type=DataType.FLOAT))
 
-        new_schema = Schema(
+        return Schema(
             name=f"{original_schema.name}_grouped",
             fields=tuple(new_fields),
         )
 
-        # Convert rows to DataRecords
-        records = []
-        for _, row in df.iterrows():
-            data = {col: val for col, val in row.items()}
-            records.append(DataRecord(data=data, schema=new_schema))
-
-        return records
-
     def to_operator(self) -> Operator:
         """Convert to Operator instance."""
         return Operator(
@@ -233,22 +759,22 @@ class GroupBy:
         )
 
 
-class Rollup:
-    """
-    Rollup aggregation (subtotal aggregation).
+# =============================================================================
+# Rollup and Cube
+# =============================================================================
 
-    Creates hierarchical aggregations with subtotals at different levels.
 
-    Example:
-        Rollup by region and category with subtotals::
+class _GroupingSets(ABC):
+    """
+    Aggregation over several grouping sets of the same columns.
 
-            rollup_op = Rollup(
-                name="sales_rollup",
-                group_by=["region", "category"],
-                aggregations=[Sum("amount", "total")]
-            )
+    The data is aggregated once at the finest grouping (all columns, null
+    keys kept); every grouping set is then derived by merging those
+    partial states, so the raw data is scanned only once.
     """
 
+    kind = "grouping_sets"
+
     def __init__(
         self,
         name: str,
@@ -256,19 +782,14 @@ class Rollup:
         aggregations: list[AggregationFunction],
         description: str | None = None,
     ) -> None:
-        """
-        Initialize a Rollup transformation.
-
-        Args:
-            name: Unique identifier
-            group_by: Columns for hierarchical grouping
-            aggregations: Aggregation functions to apply
-            description: Optional description
-        """
         self.name = name
         self.group_by = group_by
         self.aggregations = aggregations
-        self.description = description or f"Rollup by {group_by}"
+        self.description = description
+
+    @abstractmethod
+    def grouping_sets(self) -> list[tuple[str, ...]]:
+        """Grouping sets to compute, in output order."""
 
     def transform(
         self,
@@ -276,57 +797,83 @@ class Rollup:
         ctx: Any,  # noqa: ARG002
     ) -> list[DataRecord]:
         """
-        Apply rollup aggregation.
+        Apply the aggregation.
+
+        Args:
+            data: Input dataset
+            ctx: Pipeline context
+
+        Returns:
+            One row per group of every grouping set; columns not in a
+            grouping set are None
 
-        Creates aggregations at each level of the hierarchy:
-        - Grand total (no grouping)
-        - Level 1 subtotals (first column)
-        - Level 2 subtotals (first two columns)
-        - ...
-        - Full detail (all columns)
+        Raises:
+            ValueError: If group or aggregation columns not found
         """
         if not data:
             return []
+        return self.finalize(self.partial(data))
 
-        results: list[dict[str, Any]] = []
+    def partial(self, data: Sequence[DataRecord]) -> PartialAggregate:
+        """
+        Aggregate one chunk of data at the finest grouping.
 
-        # Grand total
-        grand_total = self._aggregate_level(data, {})
-        results.append(grand_total)
+        Args:
+            data: Chunk of input records
 
-        # Subtotals at each level
-        for i in range(len(self.group_by)):
-            level_groups = self.group_by[: i + 1]
-            df = pd.DataFrame([record.data for record in data])
+        Returns:
+            Mergeable partial aggregate
+        """
+        return _accumulate(data, self.group_by, self.aggregations, dropna=False)
 
-            for _, group in df.groupby(level_groups, as_index=False, dropna=False):
-                group_records = [
-                    DataRecord(data=row, schema=data[0].schema) for _, row in group.iterrows()
-                ]
-                subtotal = self._aggregate_level(group_records, {})
-                results.append(subtotal)
+    def finalize(self, partial: PartialAggregate) -> list[DataRecord]:
+        """
+        Derive every grouping set from a finest-grouping partial aggregate.
 
-        # Convert to DataRecords
-        return self._results_to_records(results, data[0].schema)
+        Args:
+            partial: Partial aggregate from partial(), possibly merged
 
-    def _aggregate_level(
-        self, records: list[DataRecord], group_values: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Aggregate a single level."""
-        result = dict(group_values)
+        Returns:
+            Result records, grouping set by grouping set
+        """
+        if partial.schema is None:
+            return []
 
-        # Fill None for grouping columns not in this level
-        for col in self.group_by:
-            if col not in group_values:
-                result[col] = None
+        results: list[dict[str, Any]] = []
+        for grouping_set in self.grouping_sets():
+            for row in partial.regroup(grouping_set).results():
+                # Columns rolled up in this grouping set are None
+                results.append(
+                    {
+                        **{col: row.get(col) for col in self.group_by},
+                        **{agg.alias: row[agg.alias] for agg in self.aggregations},
+                    }
+                )
+        return self._results_to_records(results, partial.schema)
 
-        # Apply aggregations
-        df = pd.DataFrame([record.data for record in records])
-        for agg_func in self.aggregations:
-            if agg_func.column in df.columns:
-                result[agg_func.alias] = agg_func.apply(df[agg_func.column])
+    def transform_chunks(
+        self,
+        chunks: Iterable[Sequence[DataRecord]],
+        ctx: Any = None,  # noqa: ARG002
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> list[DataRecord]:
+        """
+        Aggregate a dataset delivered in chunks.
 
-        return result
+        Args:
+            chunks: Iterable of record chunks
+            ctx: Pipeline context
+            max_workers: Aggregate chunks on this many threads (with
+                executor, the number of workers it runs chunks on)
+            executor: Optional executor to aggregate chunks on instead
+
+        Returns:
+            Result records, grouping set by grouping set
+        """
+        partials = _map_chunks(self.partial, chunks, max_workers, executor)
+        merged = _merge_partials(partials)
+        return [] if merged is None else self.finalize(merged)
 
     def _results_to_records(
         self,
@@ -334,24 +881,26 @@ class Rollup:
         original_schema: Schema,
     ) -> list[DataRecord]:
         """Convert results to DataRecords."""
-        from vibe_piper.types import SchemaField
-
-        # Create schema
         new_fields = []
         for col in self.group_by:
-            field = original_schema.get_field(col)
-            if field:
-                new_fields.append(field)
-            else:
-                new_fields.append(SchemaField(name=col, data_type=DataType.STRING))
+            original = original_schema.get_field(col)
+            data_type = original.data_type if original else DataType.STRING
+            # Rolled-up grouping columns are None
+            new_fields.append(
+                SchemaField(name=col, data_type=data_type, required=False, nullable=True)
+            )
 
         for agg_func in self.aggregations:
             new_fields.append(
-                SchemaField(name=agg_func.alias, data_type=agg_func.get_result_dtype())
+                SchemaField(
+                    name=agg_func.alias,
+                    data_type=agg_func.get_result_dtype(),
+                    nullable=True,
+                )
             )
 
         new_schema = Schema(
-            name=f"{original_schema.name}_rollup",
+            name=f"{original_schema.name}_{self.kind}",
             fields=tuple(new_fields),
         )
 
@@ -367,22 +916,27 @@ class Rollup:
         )
 
 
-class Cube:
+class Rollup(_GroupingSets):
     """
-    Cube aggregation (multidimensional aggregation with subtotals).
+    Rollup aggregation (subtotal aggregation).
 
-    Creates aggregations for all combinations of grouping columns.
+    Creates hierarchical aggregations with subtotals at different levels:
+    the grand total, then subtotals by the first column, the first two
+    columns, and so on down to full detail. Every level is computed from
+    the full-detail aggregation rather than from the raw data.
 
     Example:
-        Cube by region and category::
+        Rollup by region and category with subtotals::
 
-            cube_op = Cube(
-                name="sales_cube",
+            rollup_op = Rollup(
+                name="sales_rollup",
                 group_by=["region", "category"],
                 aggregations=[Sum("amount", "total")]
             )
     """
 
+    kind = "rollup"
+
     def __init__(
         self,
         name: str,
@@ -391,118 +945,60 @@ class Cube:
         description: str | None = None,
     ) -> None:
         """
-        Initialize a Cube transformation.
+        Initialize a Rollup transformation.
 
         Args:
             name: Unique identifier
-            group_by: Columns for multidimensional analysis
+            group_by: Columns for hierarchical grouping
             aggregations: Aggregation functions to apply
             description: Optional description
         """
-        self.name = name
-        self.group_by = group_by
-        self.aggregations = aggregations
-        self.description = description or f"Cube by {group_by}"
-
-    def transform(
-        self,
-        data: list[DataRecord],
-        ctx: Any,  # noqa: ARG002
-    ) -> list[DataRecord]:
-        """
-        Apply cube aggregation.
+        super().__init__(name, group_by, aggregations, description or f"Rollup by {group_by}")
 
-        Creates aggregations for all combinations of grouping columns.
-        """
-        if not data:
-            return []
-
-        from itertools import combinations
-
-        results: list[dict[str, Any]] = []
-        df = pd.DataFrame([record.data for record in data])
-
-        # Generate all combinations
-        for r in range(len(self.group_by) + 1):
-            for combo in combinations(self.group_by, r):
-                if len(combo) == 0:
-                    # Grand total
-                    group_records = data
-                    group_values = {}
-                else:
-                    # Group by combination
-                    grouped = df.groupby(list(combo), as_index=False, dropna=False)
-                    for _, group in grouped:
-                        group_records = [
-                            DataRecord(data=row, schema=data[0].schema)
-                            for _, row in group.iterrows()
-                        ]
-                        group_values = {
-                            col: row[col] for _, row in group.iterrows() for col in combo
-                        }
-                        result = self._aggregate_level(group_records, group_values)
-                        results.append(result)
-                    continue
-
-                result = self._aggregate_level(group_records, group_values)
-                results.append(result)
-
-        # Convert to DataRecords
-        return self._results_to_records(results, data[0].schema)
-
-    def _aggregate_level(
-        self, records: list[DataRecord], group_values: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Aggregate a single combination."""
-        result = dict(group_values)
-
-        # Fill None for grouping columns not in this combination
-        for col in self.group_by:
-            if col not in group_values:
-                result[col] = None
+    def grouping_sets(self) -> list[tuple[str, ...]]:
+        """Grand total, then each prefix of the grouping columns."""
+        return [tuple(self.group_by[:i]) for i in range(len(self.group_by) + 1)]
 
-        # Apply aggregations
-        df = pd.DataFrame([record.data for record in records])
-        for agg_func in self.aggregations:
-            if agg_func.column in df.columns:
-                result[agg_func.alias] = agg_func.apply(df[agg_func.column])
 
-        return result
+class Cube(_GroupingSets):
+    """
+    Cube aggregation (multidimensional aggregation with subtotals).
 
-    def _results_to_records(
-        self,
-        results: list[dict[str, Any]],
-        original_schema: Schema,
-    ) -> list[DataRecord]:
-        """Convert results to DataRecords."""
-        from vibe_piper.types import SchemaField
+    Creates aggregations for all combinations of grouping columns, each
+    computed from the finest grouping rather than from the raw data.
 
-        # Create schema
-        new_fields = []
-        for col in self.group_by:
-            field = original_schema.get_field(col)
-            if field:
-                new_fields.append(field)
-            else:
-                new_fields.append(SchemaField(name=col, data_type=DataType.STRING))
+    Example:
+        Cube by region and category::
 
-        for agg_func in self.aggregations:
-            new_fields.append(
-                SchemaField(name=agg_func.alias, data_type=agg_func.get_result_dtype())
+            cube_op = Cube(
+                name="sales_cube",
+                group_by=["region", "category"],
+                aggregations=[Sum("amount", "total")]
             )
+    """
 
-        new_schema = Schema(
-            name=f"{original_schema.name}_cube",
-            fields=tuple(new_fields),
-        )
+    kind = "cube"
 
-        return [DataRecord(data=result, schema=new_schema) for result in results]
+    def __init__(
+        self,
+        name: str,
+        group_by: list[str],
+        aggregations: list[AggregationFunction],
+        description: str | None = None,
+    ) -> None:
+        """
+        Initialize a Cube transformation.
 
-    def to_operator(self) -> Operator:
-        """Convert to Operator instance."""
-        return Operator(
-            name=self.name,
-            operator_type=OperatorType.AGGREGATE,
-            fn=self.transform,
-            description=self.description,
-        )
+        Args:
+            name: Unique identifier
+            group_by: Columns for multidimensional analysis
+            aggregations: Aggregation functions to apply
+            description: Optional description
+        """
+        super().__init__(name, group_by, aggregations, description or f"Cube by {group_by}")
+
+    def grouping_sets(self) -> list[tuple[str, ...]]:
+        """Every combination of the grouping columns, smallest first."""
+        return [
+            combo for r in range(len(self.group_by) + 1) for combo in combinations(self.group_by, r)
+        ]
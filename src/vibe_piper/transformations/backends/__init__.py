@@ -0,0 +1,148 @@
+"""
+Pluggable execution backends for transformation operators.
+
+Join, GroupBy, Window, Pivot and Unpivot delegate their computation to a
+backend. The backend is chosen per operator (``backend=``), per pipeline
+(the ``transform_backend`` key of the pipeline context config) or globally
+with set_default_backend(). Operations a backend cannot run - because its
+engine is not installed or the operator uses custom functions - fall back
+to pandas.
+
+Example:
+    Run transformations on Polars by default::
+
+        from vibe_piper.transformations.backends import set_default_backend
+
+        set_default_backend("polars")
+"""
+
+import logging
+from typing import Any
+
+from vibe_piper.transformations.backends.base import TransformBackend
+from vibe_piper.transformations.backends.duckdb_backend import DuckDBBackend
+from vibe_piper.transformations.backends.pandas_backend import PandasBackend
+from vibe_piper.transformations.backends.polars_backend import PolarsBackend
+
+# =============================================================================
+# Logger
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+CONTEXT_CONFIG_KEY = "transform_backend"
+
+_BACKENDS: dict[str, TransformBackend] = {}
+_default_backend = "pandas"
+_warned_unavailable: set[str] = set()
+
+
+def register_backend(backend: TransformBackend) -> None:
+    """
+    Register (or replace) a backend under its name.
+
+    Args:
+        backend: Backend instance
+    """
+    _BACKENDS[backend.name] = backend
+
+
+def get_backend(name: str) -> TransformBackend:
+    """
+    Get a registered backend.
+
+    Args:
+        name: Backend name
+
+    Returns:
+        The backend
+
+    Raises:
+        ValueError: If no backend has that name
+    """
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        msg = f"Unknown transformation backend: {name!r}. Available: {sorted(_BACKENDS)}"
+        raise ValueError(msg) from None
+
+
+def set_default_backend(name: str) -> None:
+    """
+    Set the backend used when neither the operator nor the pipeline chooses one.
+
+    Args:
+        name: Backend name
+
+    Raises:
+        ValueError: If no backend has that name
+    """
+    global _default_backend
+    get_backend(name)
+    _default_backend = name
+
+
+def get_default_backend() -> str:
+    """
+    Get the name of the default backend.
+
+    Returns:
+        Backend name
+    """
+    return _default_backend
+
+
+def resolve_backend(
+    operation: str,
+    op: Any,
+    ctx: Any = None,
+) -> TransformBackend:
+    """
+    Choose the backend that will run an operator.
+
+    The operator's own ``backend`` wins, then the pipeline context config,
+    then the global default. If the chosen backend is unavailable or does
+    not support the operator, pandas is used instead.
+
+    Args:
+        operation: Operation name (join, groupby, window, pivot, unpivot)
+        op: The transformation operator
+        ctx: Optional pipeline context
+
+    Returns:
+        Backend to execute with
+    """
+    config = getattr(ctx, "config", None) or {}
+    name = getattr(op, "backend", None) or config.get(CONTEXT_CONFIG_KEY) or _default_backend
+    backend = get_backend(name)
+
+    if not backend.is_available():
+        if name not in _warned_unavailable:
+            _warned_unavailable.add(name)
+            logger.warning(f"Transformation backend {name!r} is not installed; using pandas")
+        return _BACKENDS["pandas"]
+    if not backend.supports(operation, op):
+        logger.debug(f"Backend {name!r} does not support this {operation}; using pandas")
+        return _BACKENDS["pandas"]
+    return backend
+
+
+register_backend(PandasBackend())
+register_backend(PolarsBackend())
+register_backend(DuckDBBackend())
+
+__all__ = [
+    "TransformBackend",
+    "PandasBackend",
+    "PolarsBackend",
+    "DuckDBBackend",
+    "register_backend",
+    "get_backend",
+    "set_default_backend",
+    "get_default_backend",
+    "resolve_backend",
+]
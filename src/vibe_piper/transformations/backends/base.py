@@ -0,0 +1,240 @@
+"""
+Execution backend interface for transformation operators.
+
+A backend computes the result of a Join, GroupBy, Window, Pivot or Unpivot
+from plain row dicts and returns a pandas DataFrame. The operators keep
+validation, empty-input handling and schema propagation, so every backend
+produces records with the same schema.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# =============================================================================
+# Logger
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+Row = Mapping[str, Any]
+
+# A chunk of data in columnar form: column name -> values (equal lengths)
+ColumnBatch = Mapping[str, Sequence[Any]]
+
+# Aggregations every native backend implements, keyed by AggregationFunction.agg_name
+NATIVE_AGGREGATIONS = frozenset({"sum", "count", "mean", "min", "max"})
+
+# Pivot aggfuncs every native backend implements
+NATIVE_PIVOT_AGGFUNCS = frozenset({"sum", "mean", "min", "max"})
+
+
+# =============================================================================
+# Backend Interface
+# =============================================================================
+
+
+class TransformBackend(ABC):
+    """
+    Base class for transformation execution backends.
+
+    Subclasses implement the operations they support natively and list them
+    in ``operations``. Operations (or operator configurations) a backend does
+    not support fall back to the pandas backend.
+
+    Attributes:
+        name: Backend name used for selection
+        operations: Operations implemented by the backend
+    """
+
+    name: ClassVar[str]
+    operations: ClassVar[frozenset[str]] = frozenset(
+        {"join", "groupby", "window", "pivot", "unpivot"}
+    )
+
+    def is_available(self) -> bool:
+        """
+        Check whether the backend's engine is installed.
+
+        Returns:
+            True if the backend can run
+        """
+        return True
+
+    def supports(self, operation: str, op: Any) -> bool:  # noqa: ARG002
+        """
+        Check whether an operator can run natively on this backend.
+
+        Args:
+            operation: Operation name (join, groupby, window, pivot, unpivot)
+            op: The transformation operator
+
+        Returns:
+            True if the backend can execute the operator
+        """
+        return operation in self.operations
+
+    @abstractmethod
+    def join(
+        self,
+        op: Any,
+        left_rows: list[Row],
+        right_rows: list[Row],
+        left_on: list[str],
+        right_on: list[str],
+    ) -> "pd.DataFrame":
+        """Join two datasets using the Join operator's type and suffixes."""
+
+    @abstractmethod
+    def groupby(self, op: Any, rows: list[Row]) -> "pd.DataFrame":
+        """Group rows and aggregate them using a GroupBy operator."""
+
+    @abstractmethod
+    def window(self, op: Any, rows: list[Row]) -> "pd.DataFrame":
+        """Apply a Window operator's functions."""
+
+    @abstractmethod
+    def pivot(self, op: Any, rows: list[Row], values: str | None) -> "pd.DataFrame":
+        """Pivot rows to columns using a Pivot operator and its resolved values column."""
+
+    @abstractmethod
+    def unpivot(self, op: Any, rows: list[Row]) -> "pd.DataFrame":
+        """Unpivot columns to rows using an Unpivot operator."""
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def dataset_columns(rows: Iterable[Row]) -> list[str]:
+    """
+    Get the columns of a dataset in first-seen order.
+
+    Args:
+        rows: Row dicts
+
+    Returns:
+        Union of the rows' keys
+    """
+    columns: dict[str, None] = {}
+    for row in rows:
+        if len(row) != len(columns) or any(key not in columns for key in row):
+            columns.update(dict.fromkeys(row))
+    return list(columns)
+
+
+def native_aggregations(op: Any) -> list[tuple[str, str, str]] | None:
+    """
+    Describe an operator's aggregations for native backends.
+
+    Args:
+        op: Operator with an ``aggregations`` list
+
+    Returns:
+        (alias, column, aggregation name) tuples, or None if any aggregation
+        has no native equivalent
+    """
+    specs = []
+    for agg in op.aggregations:
+        # Only trust agg_name declared on the exact class: subclasses may override apply()
+        agg_name = vars(type(agg)).get("agg_name")
+        if agg_name not in NATIVE_AGGREGATIONS:
+            return None
+        specs.append((agg.alias, agg.column, agg_name))
+    return specs
+
+
+def native_window_functions(op: Any) -> list[tuple[str, str, Any]] | None:
+    """
+    Describe a Window operator's functions for native backends.
+
+    Row numbers, lags and leads are supported natively.
+
+    Args:
+        op: Window operator
+
+    Returns:
+        (kind, alias, function) tuples, or None if any function has no
+        native equivalent
+    """
+    from vibe_piper.transformations.windows import Lag, Lead, RowNumber
+
+    specs: list[tuple[str, str, Any]] = []
+    for func in op.functions:
+        if type(func) is RowNumber:
+            specs.append(("row_number", func.alias, func))
+        elif type(func) is Lag:
+            specs.append(("lag", func.alias, func))
+        elif type(func) is Lead:
+            specs.append(("lead", func.alias, func))
+        else:
+            return None
+    return specs
+
+
+def pivot_labels(op: Any, rows: list[Row]) -> list[Any]:
+    """
+    Get the distinct values of a pivot's column, sorted as pandas does.
+
+    Args:
+        op: Pivot operator
+        rows: Input rows
+
+    Returns:
+        Sorted distinct non-null column values
+    """
+    values = {row.get(op.columns) for row in rows}
+    values.discard(None)
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=str)
+
+
+def join_layout(
+    left_columns: list[str],
+    right_columns: list[str],
+    left_on: list[str],
+    right_on: list[str],
+) -> tuple[set[str], set[str]]:
+    """
+    Work out how joined columns are named, following pandas merge rules.
+
+    Args:
+        left_columns: Columns of the left dataset
+        right_columns: Columns of the right dataset
+        left_on: Left join keys
+        right_on: Right join keys
+
+    Returns:
+        (shared_keys, overlap): keys with the same name on both sides (kept
+        once) and other columns present on both sides (which get suffixes)
+    """
+    shared_keys = {left for left, right in zip(left_on, right_on, strict=True) if left == right}
+    overlap = (set(left_columns) & set(right_columns)) - shared_keys
+    return shared_keys, overlap
+
+
+def finish_pivot(df: "pd.DataFrame", op: Any) -> "pd.DataFrame":
+    """
+    Match pandas pivot_table output: drop all-null columns and apply fill_value.
+
+    Args:
+        df: Pivoted frame (index columns first)
+        op: Pivot operator
+
+    Returns:
+        Finished frame
+    """
+    pivoted = [col for col in df.columns if col not in op.index]
+    empty = [col for col in pivoted if df[col].isna().all()]
+    if empty:
+        df = df.drop(columns=empty)
+    if op.fill_value is not None:
+        df = df.fillna(op.fill_value)
+    return df
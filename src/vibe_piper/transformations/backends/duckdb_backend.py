@@ -0,0 +1,251 @@
+"""
+DuckDB execution backend.
+
+Runs transformations as SQL on an in-process DuckDB connection. DuckDB's
+vectorized engine spills to disk when an operation does not fit in memory.
+Results follow pandas semantics (column naming, key sorting, null handling)
+so records match the pandas backend.
+"""
+
+import importlib.util
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pandas as pd
+
+from vibe_piper.transformations.backends.base import (
+    NATIVE_PIVOT_AGGFUNCS,
+    Row,
+    TransformBackend,
+    dataset_columns,
+    finish_pivot,
+    join_layout,
+    native_aggregations,
+    native_window_functions,
+    pivot_labels,
+)
+
+_ROW = "__vp_row"
+
+_AGGREGATE_SQL = {"sum": "SUM", "count": "COUNT", "mean": "AVG", "min": "MIN", "max": "MAX"}
+
+_JOIN_SQL = {"inner": "INNER", "left": "LEFT", "right": "RIGHT", "full": "FULL OUTER"}
+
+
+def _quote(identifier: str) -> str:
+    """Quote a SQL identifier."""
+    escaped = identifier.replace('"', '""')
+    return f'"{escaped}"'
+
+
+def _aggregate_sql(agg_name: str, expr: str) -> str:
+    """Render a named aggregation; sums of no values are 0, as in pandas."""
+    sql = f"{_AGGREGATE_SQL[agg_name]}({expr})"
+    return f"COALESCE({sql}, 0)" if agg_name == "sum" else sql
+
+
+def _fetch(con: Any, sql: str, params: list[Any] | None = None) -> pd.DataFrame:
+    """Run a query and fetch its result as a pandas DataFrame."""
+    df: pd.DataFrame = con.execute(sql, params).df()
+    return df
+
+
+class DuckDBBackend(TransformBackend):
+    """
+    Execute transformations with DuckDB.
+
+    Attributes:
+        memory_limit: Optional DuckDB memory limit (e.g. "4GB") before spilling
+        temp_directory: Optional directory for spilled data
+    """
+
+    name = "duckdb"
+
+    def __init__(self, memory_limit: str | None = None, temp_directory: str | None = None):
+        """
+        Initialize the backend.
+
+        Args:
+            memory_limit: Optional DuckDB memory limit (e.g. "4GB")
+            temp_directory: Optional directory for spilled data
+        """
+        self.memory_limit = memory_limit
+        self.temp_directory = temp_directory
+
+    def is_available(self) -> bool:
+        """DuckDB (and pyarrow, for loading rows) must be installed."""
+        return all(importlib.util.find_spec(module) for module in ("duckdb", "pyarrow"))
+
+    def supports(self, operation: str, op: Any) -> bool:
+        """Check for natively supported aggregations, window functions and aggfuncs."""
+        if operation == "groupby":
+            return native_aggregations(op) is not None
+        if operation == "window":
+            return native_window_functions(op) is not None
+        if operation == "pivot":
+            return isinstance(op.values, str) and op.aggfunc in NATIVE_PIVOT_AGGFUNCS
+        return super().supports(operation, op)
+
+    @contextmanager
+    def _connect(self, **tables: list[Row]) -> Iterator[Any]:
+        """Open an in-memory connection with row lists registered as tables."""
+        import duckdb
+        import pyarrow as pa
+
+        config: dict[str, str | bool | int | float | list[str]] = {}
+        if self.memory_limit:
+            config["memory_limit"] = self.memory_limit
+        if self.temp_directory:
+            config["temp_directory"] = self.temp_directory
+
+        con = duckdb.connect(config=config)
+        try:
+            for name, rows in tables.items():
+                columns = {col: [row.get(col) for row in rows] for col in dataset_columns(rows)}
+                columns[_ROW] = list(range(len(rows)))
+                con.register(name, pa.table(columns))
+            yield con
+        finally:
+            con.close()
+
+    def _columns(self, con: Any, table: str) -> list[str]:
+        """Get a registered table's columns (without the row ordinal)."""
+        names = [row[0] for row in con.execute(f"DESCRIBE {table}").fetchall()]
+        return [name for name in names if name != _ROW]
+
+    def join(
+        self,
+        op: Any,
+        left_rows: list[Row],
+        right_rows: list[Row],
+        left_on: list[str],
+        right_on: list[str],
+    ) -> pd.DataFrame:
+        """Hash join with pandas-style suffixes and row order."""
+        how = op.how.value
+        with self._connect(l=left_rows, r=right_rows) as con:
+            left_columns = self._columns(con, "l")
+            right_columns = self._columns(con, "r")
+            shared_keys, overlap = join_layout(left_columns, right_columns, left_on, right_on)
+
+            select = []
+            for col in left_columns:
+                name = f"{col}{op.left_suffix}" if col in overlap else col
+                if col in shared_keys and how == "right":
+                    expr = f"r.{_quote(col)}"
+                elif col in shared_keys and how == "full":
+                    expr = f"COALESCE(l.{_quote(col)}, r.{_quote(col)})"
+                else:
+                    expr = f"l.{_quote(col)}"
+                select.append(f"{expr} AS {_quote(name)}")
+            for col in right_columns:
+                if col not in shared_keys:
+                    name = f"{col}{op.right_suffix}" if col in overlap else col
+                    select.append(f"r.{_quote(col)} AS {_quote(name)}")
+
+            condition = " AND ".join(
+                f"l.{_quote(a)} IS NOT DISTINCT FROM r.{_quote(b)}"
+                for a, b in zip(left_on, right_on, strict=True)
+            )
+            # pandas keeps the order of the preserved side and sorts keys on outer joins
+            if how == "full":
+                order = ", ".join(
+                    f"COALESCE(l.{_quote(a)}, r.{_quote(b)}) NULLS LAST"
+                    for a, b in zip(left_on, right_on, strict=True)
+                )
+            else:
+                first, second = ("r", "l") if how == "right" else ("l", "r")
+                order = f"{first}.{_ROW}, {second}.{_ROW}"
+            sql = (
+                f"SELECT {', '.join(select)} FROM l {_JOIN_SQL[how]} JOIN r "
+                f"ON {condition} ORDER BY {order}"
+            )
+            return _fetch(con, sql)
+
+    def groupby(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Group with sorted keys, dropping null keys like pandas."""
+        keys = ", ".join(_quote(col) for col in op.group_by)
+        aggregates = ", ".join(
+            f"{_aggregate_sql(agg, _quote(column))} AS {_quote(alias)}"
+            for alias, column, agg in native_aggregations(op) or []
+        )
+        not_null = " AND ".join(f"{_quote(col)} IS NOT NULL" for col in op.group_by)
+        sql = f"SELECT {keys}, {aggregates} FROM t WHERE {not_null} GROUP BY {keys} ORDER BY {keys}"
+        with self._connect(t=rows) as con:
+            return _fetch(con, sql)
+
+    def window(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Compute every function over one named window."""
+        order_terms = [
+            f"{_quote(col)} {'ASC' if ascending else 'DESC'} NULLS LAST"
+            for col, ascending in zip(op.order_columns, op.order_ascending, strict=True)
+        ]
+        order = ", ".join([*order_terms, _ROW])
+        partition = (
+            f"PARTITION BY {', '.join(_quote(col) for col in op.partition_by)} "
+            if op.partition_by
+            else ""
+        )
+
+        with self._connect(t=rows) as con:
+            columns = self._columns(con, "t")
+            exprs = []
+            params: list[Any] = []
+            for kind, alias, func in native_window_functions(op) or []:
+                if kind == "row_number":
+                    expr = "row_number() OVER w"
+                else:
+                    if func.column not in columns:
+                        msg = f"Column '{func.column}' not found for {kind} function"
+                        raise ValueError(msg)
+                    expr = f"{kind}({_quote(func.column)}, {int(func.offset)}) OVER w"
+                    if func.default is not None:
+                        expr = f"COALESCE({expr}, ?)"
+                        params.append(func.default)
+                exprs.append(f"{expr} AS {_quote(alias)}")
+
+            sql = (
+                f"SELECT * EXCLUDE ({_ROW}), {', '.join(exprs)} FROM t "
+                f"WINDOW w AS ({partition}ORDER BY {order}) ORDER BY {order}"
+            )
+            return _fetch(con, sql, params)
+
+    def pivot(self, op: Any, rows: list[Row], values: str | None) -> pd.DataFrame:
+        """Pivot with one filtered aggregation per column label."""
+        if values is None:
+            msg = "The duckdb backend pivots a single values column"
+            raise ValueError(msg)
+        keys = ", ".join(_quote(col) for col in op.index)
+        cells = []
+        params: list[Any] = []
+        for label in pivot_labels(op, rows):
+            cells.append(
+                f"{_AGGREGATE_SQL[op.aggfunc]}({_quote(values)}) "
+                f"FILTER (WHERE {_quote(op.columns)} = ?) AS {_quote(str(label))}"
+            )
+            params.append(label)
+        not_null = " AND ".join(f"{_quote(col)} IS NOT NULL" for col in op.index)
+        sql = (
+            f"SELECT {', '.join([keys, *cells])} FROM t WHERE {not_null} "
+            f"GROUP BY {keys} ORDER BY {keys}"
+        )
+        with self._connect(t=rows) as con:
+            return finish_pivot(_fetch(con, sql, params), op)
+
+    def unpivot(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Unpivot column by column, like pandas melt."""
+        with self._connect(t=rows) as con:
+            columns = self._columns(con, "t")
+            value_vars = op.value_vars or [col for col in columns if col not in op.id_vars]
+            ids = "".join(f"{_quote(col)}, " for col in op.id_vars)
+            parts = [
+                f"SELECT {ids}? AS {_quote(op.var_name)}, {_quote(col)} AS "
+                f"{_quote(op.value_name)}, {i} AS __vp_var, {_ROW} FROM t"
+                for i, col in enumerate(value_vars)
+            ]
+            sql = (
+                f"SELECT * EXCLUDE (__vp_var, {_ROW}) FROM ({' UNION ALL '.join(parts)}) "
+                f"ORDER BY __vp_var, {_ROW}"
+            )
+            return _fetch(con, sql, list(value_vars))
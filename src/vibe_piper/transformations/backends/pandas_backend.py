@@ -0,0 +1,102 @@
+"""
+pandas execution backend.
+
+The default backend. It supports every operator configuration, including
+custom aggregation and window functions, and is the fallback for the other
+backends.
+"""
+
+from typing import Any, Literal
+
+import pandas as pd
+
+from vibe_piper.transformations.backends.base import Row, TransformBackend
+
+
+class PandasBackend(TransformBackend):
+    """Execute transformations with pandas."""
+
+    name = "pandas"
+
+    def supports(self, operation: str, op: Any) -> bool:  # noqa: ARG002
+        """pandas supports every operator configuration."""
+        return True
+
+    def join(
+        self,
+        op: Any,
+        left_rows: list[Row],
+        right_rows: list[Row],
+        left_on: list[str],
+        right_on: list[str],
+    ) -> pd.DataFrame:
+        """Join with pd.merge."""
+        from vibe_piper.transformations.joins import JoinType
+
+        # pandas uses "outer" for full outer join
+        how: Literal["inner", "left", "right", "outer"] = (
+            "outer" if op.how == JoinType.FULL else op.how.value
+        )
+        return pd.merge(
+            pd.DataFrame(left_rows),
+            pd.DataFrame(right_rows),
+            left_on=left_on,
+            right_on=right_on,
+            how=how,
+            suffixes=(op.left_suffix, op.right_suffix),
+        )
+
+    def groupby(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Group with DataFrame.groupby and apply each aggregation function."""
+        df = pd.DataFrame(rows)
+        grouped = df.groupby(op.group_by)
+
+        # One row per group (sorted keys), then one column per aggregation;
+        # every apply() result is indexed by the same sorted group keys
+        result_df = grouped.size().index.to_frame(index=False)
+        for agg_func in op.aggregations:
+            values = grouped[agg_func.column].apply(agg_func.apply)
+            result_df[agg_func.alias] = values.tolist()
+        return result_df
+
+    def window(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Sort, then compute each window function for all partitions at once."""
+        df = pd.DataFrame(rows)
+
+        # Sort data if order_by specified (stable, so ties keep input order)
+        if op.order_columns:
+            df = df.sort_values(by=op.order_columns, ascending=op.order_ascending, kind="stable")
+
+        # Number partitions once; functions group by these integer ids
+        if op.partition_by:
+            partition = df.groupby(op.partition_by, sort=False, dropna=False).ngroup()
+        else:
+            partition = pd.Series(0, index=df.index)
+
+        for func in op.functions:
+            df[func.alias] = func.compute(df, partition, op)
+
+        return df.reset_index(drop=True)
+
+    def pivot(self, op: Any, rows: list[Row], values: str | None) -> pd.DataFrame:
+        """Pivot with DataFrame.pivot_table."""
+        pivot_df = pd.DataFrame(rows).pivot_table(
+            index=op.index,
+            columns=op.columns,
+            values=values,
+            aggfunc=op.aggfunc,
+            fill_value=op.fill_value,
+        )
+
+        # Flatten column names
+        pivot_df.columns = [str(col) for col in pivot_df.columns]
+        return pivot_df.reset_index()
+
+    def unpivot(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Unpivot with DataFrame.melt."""
+        return pd.DataFrame(rows).melt(
+            id_vars=op.id_vars,
+            value_vars=op.value_vars,
+            var_name=op.var_name,
+            value_name=op.value_name,
+        )
@@ -0,0 +1,189 @@
+"""
+Polars execution backend.
+
+Runs joins, groupbys, windows, pivots and unpivots on Polars' multi-threaded
+engine. Results follow pandas semantics (column naming, key sorting, null
+handling) so records match the pandas backend.
+"""
+
+import importlib.util
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from vibe_piper.transformations.backends.base import (
+    NATIVE_PIVOT_AGGFUNCS,
+    Row,
+    TransformBackend,
+    dataset_columns,
+    finish_pivot,
+    join_layout,
+    native_aggregations,
+    native_window_functions,
+    pivot_labels,
+)
+
+_LEFT_ROW = "__vp_left_row"
+_RIGHT_ROW = "__vp_right_row"
+
+
+def _aggregate(expr: Any, agg_name: str) -> Any:
+    """Apply a named aggregation to a Polars expression."""
+    aggregations: dict[str, Callable[[Any], Any]] = {
+        "sum": lambda e: e.sum(),
+        "count": lambda e: e.count(),
+        "mean": lambda e: e.mean(),
+        "min": lambda e: e.min(),
+        "max": lambda e: e.max(),
+    }
+    return aggregations[agg_name](expr)
+
+
+def _to_pandas(frame: Any) -> pd.DataFrame:
+    """Hand a Polars frame back as a pandas DataFrame."""
+    df: pd.DataFrame = frame.to_pandas()
+    return df
+
+
+class PolarsBackend(TransformBackend):
+    """Execute transformations with Polars."""
+
+    name = "polars"
+
+    def is_available(self) -> bool:
+        """Polars (and pyarrow, for the pandas hand-off) must be installed."""
+        return all(importlib.util.find_spec(module) for module in ("polars", "pyarrow"))
+
+    def supports(self, operation: str, op: Any) -> bool:
+        """Check for natively supported aggregations, window functions and aggfuncs."""
+        if operation == "groupby":
+            return native_aggregations(op) is not None
+        if operation == "window":
+            return native_window_functions(op) is not None
+        if operation == "pivot":
+            return isinstance(op.values, str) and op.aggfunc in NATIVE_PIVOT_AGGFUNCS
+        return super().supports(operation, op)
+
+    @staticmethod
+    def _frame(rows: list[Row]) -> Any:
+        """Build a Polars DataFrame, inferring types from every row."""
+        import polars as pl
+
+        columns = dataset_columns(rows)
+        return pl.DataFrame({col: [row.get(col) for row in rows] for col in columns}, strict=False)
+
+    def join(
+        self,
+        op: Any,
+        left_rows: list[Row],
+        right_rows: list[Row],
+        left_on: list[str],
+        right_on: list[str],
+    ) -> pd.DataFrame:
+        """Hash join with pandas-style suffixes and row order."""
+        left = self._frame(left_rows)
+        right = self._frame(right_rows)
+        shared_keys, overlap = join_layout(left.columns, right.columns, left_on, right_on)
+
+        left_names = {c: f"{c}{op.left_suffix}" if c in overlap else c for c in left.columns}
+        right_names = {c: f"{c}{op.right_suffix}" if c in overlap else c for c in right.columns}
+        left = left.rename(left_names).with_row_index(_LEFT_ROW)
+        right = right.rename(right_names).with_row_index(_RIGHT_ROW)
+
+        how = op.how.value
+        joined = left.join(
+            right,
+            left_on=[left_names[c] for c in left_on],
+            right_on=[right_names[c] for c in right_on],
+            how=how,
+            coalesce=len(shared_keys) == len(left_on),
+            nulls_equal=True,
+        )
+
+        # pandas keeps the order of the preserved side and sorts keys on outer joins
+        if how == "full":
+            order = [left_names[c] for c in left_on]
+        elif how == "right":
+            order = [_RIGHT_ROW, _LEFT_ROW]
+        else:
+            order = [_LEFT_ROW, _RIGHT_ROW]
+        columns = [left_names[c] for c in left_names] + [
+            right_names[c] for c in right_names if c not in shared_keys
+        ]
+        return _to_pandas(joined.sort(order, nulls_last=True, maintain_order=True).select(columns))
+
+    def groupby(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Group with sorted keys, dropping null keys like pandas."""
+        import polars as pl
+
+        specs = native_aggregations(op) or []
+        exprs = [_aggregate(pl.col(column), agg).alias(alias) for alias, column, agg in specs]
+        return _to_pandas(
+            self._frame(rows)
+            .drop_nulls(op.group_by)
+            .group_by(op.group_by)
+            .agg(exprs)
+            .sort(op.group_by)
+        )
+
+    def window(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Sort once, then compute every function over its partition."""
+        import polars as pl
+
+        df = self._frame(rows)
+        if op.order_columns:
+            df = df.sort(
+                op.order_columns,
+                descending=[not ascending for ascending in op.order_ascending],
+                nulls_last=True,
+                maintain_order=True,
+            )
+
+        exprs = []
+        for kind, alias, func in native_window_functions(op) or []:
+            if kind == "row_number":
+                expr = pl.int_range(1, pl.len() + 1, dtype=pl.Int64)
+            else:
+                if func.column not in df.columns:
+                    msg = f"Column '{func.column}' not found for {kind} function"
+                    raise ValueError(msg)
+                offset = func.offset if kind == "lag" else -func.offset
+                expr = pl.col(func.column).shift(offset)
+                if func.default is not None:
+                    expr = expr.fill_null(func.default)
+            if op.partition_by:
+                expr = expr.over(op.partition_by)
+            exprs.append(expr.alias(alias))
+        return _to_pandas(df.with_columns(exprs))
+
+    def pivot(self, op: Any, rows: list[Row], values: str | None) -> pd.DataFrame:
+        """Pivot with one conditional aggregation per column label."""
+        import polars as pl
+
+        if values is None:
+            msg = "The polars backend pivots a single values column"
+            raise ValueError(msg)
+        exprs = []
+        for label in pivot_labels(op, rows):
+            cell = pl.col(values).filter(
+                (pl.col(op.columns) == label) & pl.col(values).is_not_null()
+            )
+            exprs.append(
+                pl.when(cell.count() > 0).then(_aggregate(cell, op.aggfunc)).alias(str(label))
+            )
+        df = _to_pandas(
+            self._frame(rows).drop_nulls(op.index).group_by(op.index).agg(exprs).sort(op.index)
+        )
+        return finish_pivot(df, op)
+
+    def unpivot(self, op: Any, rows: list[Row]) -> pd.DataFrame:
+        """Unpivot column by column, like pandas melt."""
+        return _to_pandas(
+            self._frame(rows).unpivot(
+                on=op.value_vars,
+                index=op.id_vars,
+                variable_name=op.var_name,
+                value_name=op.value_name,
+            )
+        )
@@ -2,22 +2,93 @@
 Transformation builder API.
 
 Provides a fluent builder interface for composing complex transformations
-with type safety and method chaining.
+with type safety and method chaining. Steps are recorded as a logical plan
+that is optimized before it runs (see vibe_piper.transformations.plan).
 """
 
-from collections.abc import Callable
-from typing import Any, TypeVar
-
+import warnings
+from collections.abc import Callable, Iterable, MutableSequence
+from typing import Any, TypeVar, overload
+
+from vibe_piper.transformations.plan import (
+    PlanStep,
+    StepKind,
+    format_plan,
+    optimize_plan,
+    window_plan_step,
+)
 from vibe_piper.types import DataRecord, PipelineContext
 
 T = TypeVar("T")
 
+DatasetFn = Callable[[list[DataRecord]], list[DataRecord]]
+
+
+class _PlanFunctions(MutableSequence[DatasetFn]):
+    """
+    Live view of a builder's plan as dataset-level functions.
+
+    Reading yields each step as a function; writing records custom steps
+    in the builder's plan, so code that edits ``builder.transformations``
+    directly keeps working.
+    """
+
+    def __init__(self, builder: "TransformationBuilder") -> None:
+        self._builder = builder
+
+    def _function(self, step: PlanStep) -> DatasetFn:
+        return lambda data: step.apply(data, self._builder.context)
+
+    @overload
+    def __getitem__(self, index: int) -> DatasetFn: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> MutableSequence[DatasetFn]: ...
+
+    def __getitem__(self, index: int | slice) -> DatasetFn | MutableSequence[DatasetFn]:
+        if isinstance(index, slice):
+            return [self._function(step) for step in self._builder.plan[index]]
+        return self._function(self._builder.plan[index])
+
+    @overload
+    def __setitem__(self, index: int, value: DatasetFn) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[DatasetFn]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            self._builder.plan[index] = [_custom_step(fn) for fn in value]
+        else:
+            self._builder.plan[index] = _custom_step(value)
+        self._builder._optimized_plan = None
+
+    def __delitem__(self, index: int | slice) -> None:
+        del self._builder.plan[index]
+        self._builder._optimized_plan = None
+
+    def __len__(self) -> int:
+        return len(self._builder.plan)
+
+    def insert(self, index: int, value: DatasetFn) -> None:
+        self._builder.plan.insert(index, _custom_step(value))
+        self._builder._optimized_plan = None
+
+
+def _custom_step(transform_fn: DatasetFn) -> PlanStep:
+    """Wrap a dataset-level function as a custom plan step."""
+    name = getattr(transform_fn, "__name__", type(transform_fn).__name__)
+    return PlanStep(kind=StepKind.CUSTOM, label=f"custom({name})", fn=transform_fn)
+
 
 class TransformationBuilder:
     """
     Fluent builder for composing transformations.
 
     Provides method chaining for building complex transformation pipelines.
+    Each method records a step in a logical plan; nothing runs until
+    execute() (or the operator from to_operator()) is called, at which point
+    the optimized plan is executed.
 
     Example:
         Build a complex transformation::
@@ -38,6 +109,8 @@ class TransformationBuilder:
         self,
         data: list[DataRecord],
         context: PipelineContext | None = None,
+        optimize: bool = True,
+        backend: str | None = None,
     ) -> None:
         """
         Initialize the transformation builder.
@@ -45,11 +118,83 @@ class TransformationBuilder:
         Args:
             data: Input dataset
             context: Optional pipeline context
+            optimize: Whether to optimize the logical plan before executing it
+            backend: Execution backend for joins, groupbys, windows and pivots
+                (pandas, polars, duckdb); defaults to the pipeline's or the
+                global backend
         """
         self.data = data
         self.context = context or PipelineContext(pipeline_id="transform_builder", run_id="run")
-        self.transformations: list[Callable[[list[DataRecord]], list[DataRecord]]] = []
-        self._current_data = data  # Track current data for pipe() operations
+        self.optimize = optimize
+        self.backend = backend
+        self.plan: list[PlanStep] = []
+        self._optimized_plan: list[PlanStep] | None = None
+
+    @property
+    def transformations(self) -> MutableSequence[DatasetFn]:
+        """
+        Recorded steps as dataset-level functions, in logical order.
+
+        The sequence is a live view of the plan: appending, inserting or
+        replacing functions records them as custom steps.
+        """
+        return _PlanFunctions(self)
+
+    @transformations.setter
+    def transformations(self, functions: Iterable[DatasetFn]) -> None:
+        self.plan = [_custom_step(fn) for fn in functions]
+        self._optimized_plan = None
+
+    @property
+    def _current_data(self) -> list[DataRecord]:
+        """Deprecated: the input with the logical plan applied; use execute()."""
+        warnings.warn(
+            "TransformationBuilder._current_data is deprecated; call execute() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        result = self.data
+        for step in self.plan:
+            result = step.apply(result, self.context)
+        return result
+
+    def _add_step(self, step: PlanStep) -> "TransformationBuilder":
+        """Record a step in the logical plan."""
+        self.plan.append(step)
+        self._optimized_plan = None
+        return self
+
+    def optimized_plan(self) -> list[PlanStep]:
+        """
+        Get the plan that execute() runs.
+
+        Returns:
+            Optimized plan steps (the logical plan if optimization is disabled)
+        """
+        if not self.optimize:
+            return list(self.plan)
+        if self._optimized_plan is None:
+            self._optimized_plan = optimize_plan(self.plan)
+        return self._optimized_plan
+
+    def explain(self) -> str:
+        """
+        Describe the logical and optimized plans.
+
+        Returns:
+            Human-readable plan description
+
+        Example:
+            Show how a pipeline will run::
+
+                print(builder.explain())
+        """
+        return (
+            "== Logical Plan ==\n"
+            f"{format_plan(self.plan)}\n"
+            "== Optimized Plan ==\n"
+            f"{format_plan(self.optimized_plan())}"
+        )
 
     def pipe(
         self,
@@ -60,6 +205,7 @@ class TransformationBuilder:
 
         This method provides an alternative fluent API pattern that allows
         chaining transformations using .pipe() instead of calling methods directly.
+        The function is recorded as a custom step and runs on execute().
 
         Args:
             transform_fn: Function that takes a list of DataRecord and returns a transformed list
@@ -85,19 +231,14 @@ class TransformationBuilder:
                     .map(lambda r: DataRecord(...))
                     .execute())
         """
-        # Apply the transformation to current data
-        self._current_data = transform_fn(self._current_data)
-
-        # Add transformation to the list for execute() to use
-        self.transformations.append(transform_fn)
-
-        return self
+        return self.custom(transform_fn)
 
     def filter(
         self,
         predicate: Callable[[DataRecord], bool] | str,
         field: str | None = None,
         value: Any = None,
+        columns: list[str] | None = None,
     ) -> "TransformationBuilder":
         """
         Add a filter transformation.
@@ -106,39 +247,70 @@ class TransformationBuilder:
             predicate: Function to test each record, or "equals"/"not_null" shortcut
             field: Field name (for shortcut predicates)
             value: Value to compare (for shortcut predicates)
+            columns: Columns a predicate function reads. Declaring them lets the
+                optimizer push the filter below joins, windows and groupbys and
+                prune unused columns (shortcuts declare their field automatically).
 
         Returns:
             self for method chaining
 
+        Raises:
+            ValueError: If a shortcut is unknown or missing its field
+
         Example:
             Using a function::
 
-                builder.filter(lambda r: r.get("age") > 18)
+                builder.filter(lambda r: r.get("age") > 18, columns=["age"])
 
             Using shortcut::
 
                 builder.filter("equals", field="status", value="active")
         """
+        if callable(predicate):
+            name = getattr(predicate, "__name__", type(predicate).__name__)
+            return self._add_step(
+                PlanStep(
+                    kind=StepKind.FILTER,
+                    label=f"filter({name})",
+                    fn=predicate,
+                    reads=frozenset(columns) if columns is not None else None,
+                )
+            )
 
-        def filter_fn(data: list[DataRecord]) -> list[DataRecord]:
-            if callable(predicate):
-                return [r for r in data if predicate(r)]
-            elif predicate == "equals":
-                if field is None:
-                    msg = "Field must be specified for 'equals' filter"
-                    raise ValueError(msg)
-                return [r for r in data if r.get(field) == value]
-            elif predicate == "not_null":
-                if field is None:
-                    msg = "Field must be specified for 'not_null' filter"
-                    raise ValueError(msg)
-                return [r for r in data if r.get(field) is not None]
-            else:
-                msg = f"Unknown filter predicate: {predicate}"
-                raise ValueError(msg)
-
-        self.transformations.append(filter_fn)
-        return self
+        if predicate not in ("equals", "not_null"):
+            msg = f"Unknown filter predicate: {predicate}"
+            raise ValueError(msg)
+        if field is None:
+            msg = f"Field must be specified for '{predicate}' filter"
+            raise ValueError(msg)
+
+        if predicate == "equals":
+            label = f"filter({field} == {value!r})"
+
+            def shortcut(r: DataRecord) -> bool:
+                return bool(r.get(field) == value)
+
+        else:
+            label = f"filter({field} is not null)"
+
+            def shortcut(r: DataRecord) -> bool:
+                return r.get(field) is not None
+
+        try:
+            key: tuple[Any, ...] | None = (predicate, field, value)
+            hash(key)
+        except TypeError:
+            key = None
+
+        return self._add_step(
+            PlanStep(
+                kind=StepKind.FILTER,
+                label=label,
+                fn=shortcut,
+                reads=frozenset([field]),
+                key=key,
+            )
+        )
 
     def map(
         self,
@@ -161,18 +333,15 @@ class TransformationBuilder:
                     schema=r.schema
                 ))
         """
-
-        def map_fn(data: list[DataRecord]) -> list[DataRecord]:
-            return [transform_fn(r) for r in data]
-
-        self.transformations.append(map_fn)
-        return self
+        name = getattr(transform_fn, "__name__", type(transform_fn).__name__)
+        return self._add_step(PlanStep(kind=StepKind.MAP, label=f"map({name})", fn=transform_fn))
 
     def join(
         self,
         right_data: list[DataRecord],
         on: str,
         how: str = "inner",
+        strategy: str = "backend",
     ) -> "TransformationBuilder":
         """
         Add a join transformation.
@@ -181,6 +350,8 @@ class TransformationBuilder:
             right_data: Right dataset to join with
             on: Column to join on
             how: Join type (inner, left, right, full)
+            strategy: Join algorithm (backend, auto, broadcast_hash,
+                sort_merge, grace_hash)
 
         Returns:
             self for method chaining
@@ -197,13 +368,16 @@ class TransformationBuilder:
             right_data=right_data,
             on=on,
             how=how,
+            backend=self.backend,
+            strategy=strategy,
+        )
+        return self._add_step(
+            PlanStep(
+                kind=StepKind.JOIN,
+                label=f"join({join_op.how.value} on {on}, right={len(right_data)} rows)",
+                operator=join_op,
+            )
         )
-
-        def join_fn(data: list[DataRecord]) -> list[DataRecord]:
-            return join_op.transform(data, self.context)
-
-        self.transformations.append(join_fn)
-        return self
 
     def groupby(
         self,
@@ -236,13 +410,19 @@ class TransformationBuilder:
             name="builder_groupby",
             group_by=group_by,
             aggregations=aggregations,
+            backend=self.backend,
+        )
+        aggs = ", ".join(
+            f"{type(agg).__name__}({getattr(agg, 'column', '?')}) as {getattr(agg, 'alias', '?')}"
+            for agg in aggregations
+        )
+        return self._add_step(
+            PlanStep(
+                kind=StepKind.GROUPBY,
+                label=f"groupby({groupby_op.group_by}; {aggs})",
+                operator=groupby_op,
+            )
         )
-
-        def groupby_fn(data: list[DataRecord]) -> list[DataRecord]:
-            return groupby_op.transform(data, self.context)
-
-        self.transformations.append(groupby_fn)
-        return self
 
     def window(
         self,
@@ -279,13 +459,9 @@ class TransformationBuilder:
             functions=functions,
             partition_by=partition_by,
             order_by=order_by,
+            backend=self.backend,
         )
-
-        def window_fn(data: list[DataRecord]) -> list[DataRecord]:
-            return window_op.transform(data, self.context)
-
-        self.transformations.append(window_fn)
-        return self
+        return self._add_step(window_plan_step(window_op))
 
     def pivot(
         self,
@@ -324,13 +500,15 @@ class TransformationBuilder:
             columns=columns,
             values=values,
             aggfunc=aggfunc,
+            backend=self.backend,
+        )
+        return self._add_step(
+            PlanStep(
+                kind=StepKind.PIVOT,
+                label=f"pivot({pivot_op.index} x {columns}; {aggfunc}({values}))",
+                operator=pivot_op,
+            )
         )
-
-        def pivot_fn(data: list[DataRecord]) -> list[DataRecord]:
-            return pivot_op.transform(data, self.context)
-
-        self.transformations.append(pivot_fn)
-        return self
 
     def unpivot(
         self,
@@ -369,13 +547,15 @@ class TransformationBuilder:
             value_vars=value_vars,
             var_name=var_name,
             value_name=value_name,
+            backend=self.backend,
+        )
+        return self._add_step(
+            PlanStep(
+                kind=StepKind.UNPIVOT,
+                label=f"unpivot({unpivot_op.id_vars}; {unpivot_op.value_vars})",
+                operator=unpivot_op,
+            )
         )
-
-        def unpivot_fn(data: list[DataRecord]) -> list[DataRecord]:
-            return unpivot_op.transform(data, self.context)
-
-        self.transformations.append(unpivot_fn)
-        return self
 
     def custom(
         self,
@@ -399,12 +579,18 @@ class TransformationBuilder:
 
                 builder.custom(my_transform)
         """
-        self.transformations.append(transform_fn)
-        return self
+        return self._add_step(_custom_step(transform_fn))
+
+    def _run(self, data: list[DataRecord], ctx: Any) -> list[DataRecord]:
+        """Run the optimized plan over a dataset."""
+        result = data
+        for step in self.optimized_plan():
+            result = step.apply(result, ctx)
+        return result
 
     def execute(self) -> list[DataRecord]:
         """
-        Execute all transformations in sequence.
+        Execute the optimized plan over the input dataset.
 
         Returns:
             Transformed dataset
@@ -414,14 +600,7 @@ class TransformationBuilder:
 
                 result = builder.execute()
         """
-        # Apply all transformations from original data
-        result = self.data
-        for transform_fn in self.transformations:
-            result = transform_fn(result)
-
-        # Update _current_data so subsequent execute() calls don't re-apply
-        self._current_data = result
-        return result
+        return self._run(self.data, self.context)
 
     def to_operator(self) -> Any:  # Operator
         """
@@ -440,11 +619,7 @@ class TransformationBuilder:
         from vibe_piper.types import Operator, OperatorType
 
         def execute_all(data: list[DataRecord], ctx: PipelineContext) -> list[DataRecord]:
-            # Execute all transformations
-            result = data
-            for transform_fn in self.transformations:
-                result = transform_fn(result)
-            return result
+            return self._run(data, ctx)
 
         return Operator(
             name="transformation_builder",
@@ -13,14 +13,21 @@ This module provides comprehensive data cleaning capabilities including:
 All functions operate on lists of DataRecord objects and return cleaned data.
 """
 
-from collections.abc import Callable
+import math
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
 
+from vibe_piper.transformations.dedup import Deduplicator, HashKeySet, key_hash
 from vibe_piper.types import DataRecord, DataType
 
 # =============================================================================
@@ -229,6 +236,8 @@ def clean_dataset(
 
     This is the main entry point for data cleaning. It applies all
     configured cleaning operations in order and generates a report.
+    The operations run fused, in two passes over the data (see
+    FusedCleaner); use FusedCleaner directly for chunked input.
 
     Args:
         data: Input dataset as list of DataRecord objects
@@ -251,100 +260,573 @@ def clean_dataset(
             )
             cleaned, report = clean_dataset(data, config)
     """
-    import time
+    return FusedCleaner(config).clean(data)
 
-    cleaning_config = config or CleaningConfig()
-    start_time = time.time()
 
-    # Initialize report
-    report_data = {
-        "original_count": len(data),
-        "details": {},
-    }
+# =============================================================================
+# Fused Cleaning Engine
+# =============================================================================
+
+_MISSING: Any = object()
+
+
+def _is_null(value: Any) -> bool:
+    """None or NaN, as pandas' isna() treats them."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _is_number(value: Any) -> bool:
+    """Int or float, but not bool (pandas keeps bool columns non-numeric)."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _outliers_enabled(config: CleaningConfig) -> bool:
+    """clean_dataset treats outliers only for non-IQR methods with a non-FLAG action."""
+    return (
+        config.outlier_action != OutlierAction.FLAG and config.outlier_method != OutlierMethod.IQR
+    )
+
+
+def _text_cleaner(config: CleaningConfig) -> Callable[[str], str] | None:
+    """Compose the configured text operations into one function."""
+    if not (config.trim_whitespace or config.normalize_text):
+        return None
+
+    steps: list[Callable[[str], str]] = []
+    if config.trim_whitespace:
+        steps.append(str.strip)
+    if config.normalize_text:
+        steps.append(lambda text: unicodedata.normalize("NFKC", text))
+    case = {"upper": str.upper, "lower": str.lower, "title": str.title}
+    if config.case_normalization in case:
+        steps.append(case[config.case_normalization])
+
+    def clean(text: str) -> str:
+        for step in steps:
+            text = step(text)
+        return text
+
+    return clean
 
-    operations: list[str] = []
-    cleaned_data = list(data)
 
-    # Apply cleaning operations in order
+def _iqr_bounds(series: np.ndarray, threshold: float) -> tuple[float, float]:
+    """Tukey fences at threshold times the interquartile range."""
+    q1, q3 = np.quantile(series, [0.25, 0.75])
+    iqr = q3 - q1
+    return q1 - threshold * iqr, q3 + threshold * iqr
 
-    # 1. Deduplication
-    if cleaning_config.dedup_columns is not None or len(cleaned_data) > 0:
-        cleaned_data, dup_report = remove_duplicates(
-            cleaned_data,
-            columns=cleaning_config.dedup_columns,
+
+def _outlier_bounds(
+    series: np.ndarray, method: OutlierMethod, threshold: float
+) -> tuple[float, float] | None:
+    """
+    Value range outside which detect_outliers flags a value.
+
+    Each detection method reduces to a [lower, upper] range, so the second
+    pass can test values without the rest of the column.
+    """
+    nan = float("nan")
+    if method == OutlierMethod.IQR:
+        return _iqr_bounds(series, threshold)
+    if method == OutlierMethod.ZSCORE:
+        mean = series.mean()
+        std = series.std(ddof=1) if len(series) > 1 else nan
+        return mean - threshold * std, mean + threshold * std
+    if method == OutlierMethod.MODIFIED_ZSCORE:
+        median = np.median(series)
+        spread = threshold * np.median(np.abs(series - median)) / 0.6745
+        return median - spread, median + spread
+    if method == OutlierMethod.PERCENTILE:
+        lower, upper = np.quantile(series, [threshold / 100, 1 - threshold / 100])
+        return lower, upper
+    # ISOLATION_FOREST and others not implemented yet
+    return None
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """Carry the last non-NaN value forward (leading NaNs stay)."""
+    index = np.where(np.isnan(values), 0, np.arange(len(values)))
+    np.maximum.accumulate(index, out=index)
+    return values[index]
+
+
+def _fill_array(values: np.ndarray, strategy: NullStrategy, fill: Any) -> np.ndarray:
+    """Apply a null strategy to a numeric column (NaN marks nulls)."""
+    nulls = np.isnan(values)
+    if not nulls.any() or nulls.all():
+        return values
+    if strategy == NullStrategy.FILL_FORWARD:
+        filled = _forward_fill(values)
+        return np.where(np.isnan(filled), values[~nulls][0], filled)
+    if strategy == NullStrategy.FILL_BACKWARD:
+        filled = _forward_fill(values[::-1])[::-1]
+        return np.where(np.isnan(filled), values[~nulls][-1], filled)
+    if strategy == NullStrategy.INTERPOLATE:
+        positions = np.arange(len(values))
+        interpolated: np.ndarray = np.interp(positions, positions[~nulls], values[~nulls])
+        interpolated[: np.argmax(~nulls)] = np.nan  # leading nulls have nothing to interpolate from
+        return interpolated
+    if fill is _MISSING or not _is_number(fill) or _is_null(fill):
+        return values
+    return np.where(nulls, float(fill), values)
+
+
+@dataclass
+class _ColumnScan:
+    """First-pass state for one column."""
+
+    types: set[type] = field(default_factory=set)
+    non_null: int = 0
+    first: Any = _MISSING
+    last: Any = _MISSING
+    last_position: int = -1
+    # (position, value) of each non-null value that follows a null run, for backward fill
+    next_values: list[tuple[int, Any]] = field(default_factory=list)
+    counts: Counter[Any] | None = None
+    values: array[float] | None = None
+
+    @property
+    def numeric(self) -> bool:
+        return bool(self.types) and all(
+            issubclass(t, int | float) and not issubclass(t, bool) for t in self.types
         )
-        report_data["duplicates_removed"] = dup_report["removed_count"]
-        if dup_report["removed_count"] > 0:
-            operations.append("deduplication")
-
-    # 2. Null handling
-    if cleaning_config.null_strategy != NullStrategy.KEEP:
-        cleaned_data, null_report = handle_nulls(
-            cleaned_data,
-            strategy=cleaning_config.null_strategy,
-            fill_value=cleaning_config.null_fill_value,
-            columns=cleaning_config.null_columns,
+
+
+class FusedCleaner:
+    """
+    Applies a CleaningConfig in two passes over the data.
+
+    The step-by-step cleaning functions each rebuild every record, and most
+    round-trip through a DataFrame. FusedCleaner compiles the configuration
+    instead. The first pass (fit) deduplicates, drops null rows and collects
+    only the column statistics the configuration needs: fill values, outlier
+    bounds and standardization parameters. The second pass (transform)
+    applies every fix to each record at once. Records that need no change
+    are passed through as they are.
+
+    Both passes accept chunked input, so large inputs can be streamed; the
+    chunks must be the same, in the same order, for both passes. Memory
+    grows by one byte per input record, plus one float per kept record for
+    each numeric column that needs statistics.
+
+    The result matches clean_dataset's step order: deduplication, null
+    handling, outlier treatment, text cleaning, standardization.
+
+    Attributes:
+        config: Cleaning configuration
+        report: Report of the last completed transform (None before)
+    """
+
+    def __init__(self, config: CleaningConfig | None = None) -> None:
+        """
+        Initialize the cleaner.
+
+        Args:
+            config: Cleaning configuration. If None, uses defaults.
+
+        Example:
+            Clean a dataset streamed from disk::
+
+                cleaner = FusedCleaner(config).fit(read_chunks())
+                for chunk in cleaner.transform(read_chunks()):
+                    write(chunk)
+                print(summarize_report(cleaner.report))
+        """
+        self.config = config or CleaningConfig()
+        self.report: CleaningReport | None = None
+        self._fitted = False
+
+    # -- first pass ---------------------------------------------------------
+
+    def _value_columns(self, name: str) -> bool:
+        """Whether a column's numeric values are needed for statistics."""
+        config = self.config
+        if config.null_strategy in (
+            NullStrategy.FILL_MEAN,
+            NullStrategy.FILL_MEDIAN,
+            NullStrategy.INTERPOLATE,
+        ) and (not config.null_columns or name in config.null_columns):
+            return True
+        if _outliers_enabled(self.config) and (
+            not config.outlier_columns or name in config.outlier_columns
+        ):
+            return True
+        return name in config.standardize_columns
+
+    def fit(self, chunks: Iterable[Sequence[DataRecord]]) -> "FusedCleaner":
+        """
+        Scan the data once and compile the cleaning plan.
+
+        Args:
+            chunks: Chunks of records (a single list is one chunk)
+
+        Returns:
+            self, for chaining
+        """
+        start_time = time.perf_counter()
+        config = self.config
+        dedup = Deduplicator(config.dedup_columns)
+        drop_rows = config.null_strategy == NullStrategy.DROP
+        mode_fill = config.null_strategy == NullStrategy.FILL_MODE
+        null_columns = config.null_columns or None
+
+        keep = bytearray()
+        scans: dict[str, _ColumnScan] = {}
+        columns: set[str] = set()
+        duplicates = null_dropped = 0
+        position = 0
+
+        for chunk in chunks:
+            hashes = [key_hash(record.data, dedup.columns) for record in chunk]
+            for record, is_new in zip(chunk, dedup.keys.add_new(hashes), strict=True):
+                data = record.data
+                if not is_new:
+                    keep.append(0)
+                    duplicates += 1
+                    continue
+                if drop_rows and null_columns is None and not columns.issuperset(data):
+                    # A new column: every record kept so far lacks it, as a null
+                    columns.update(data)
+                    if position:
+                        keep = bytearray(len(keep))
+                        null_dropped += position
+                        position = 0
+                        scans = {}
+                if drop_rows and any(
+                    _is_null(data.get(name)) for name in (null_columns or columns)
+                ):
+                    keep.append(0)
+                    null_dropped += 1
+                    continue
+                keep.append(1)
+
+                for name, value in data.items():
+                    scan = scans.get(name)
+                    if scan is None:
+                        scan = scans[name] = _ColumnScan()
+                        if mode_fill:
+                            scan.counts = Counter()
+                        if self._value_columns(name):
+                            scan.values = array("d")
+                    if _is_null(value):
+                        continue
+                    scan.types.add(type(value))
+                    scan.non_null += 1
+                    if scan.first is _MISSING:
+                        scan.first = value
+                    if position > scan.last_position + 1:
+                        scan.next_values.append((position, value))
+                    scan.last = value
+                    scan.last_position = position
+                    if scan.counts is not None:
+                        scan.counts[value] += 1
+                    if scan.values is not None:
+                        if not _is_number(value):
+                            scan.values = None
+                            continue
+                        scan.values.extend([math.nan] * (position - len(scan.values)))
+                        scan.values.append(value)
+                position += 1
+
+        self._keep = keep
+        self._scans = scans
+        self._kept = position
+        self._counts = Counter(
+            original_count=len(keep),
+            duplicates_removed=duplicates,
+            nulls_filled=null_dropped,
         )
-        report_data["nulls_filled"] = null_report["filled_count"]
-        if null_report["filled_count"] > 0:
-            operations.append("null_handling")
-
-    # 3. Outlier treatment
-    if (
-        cleaning_config.outlier_action != OutlierAction.FLAG
-        and cleaning_config.outlier_method != OutlierMethod.IQR
-    ):
-        cleaned_data, outlier_report = handle_outliers(
-            cleaned_data,
-            method=cleaning_config.outlier_method,
-            action=cleaning_config.outlier_action,
-            threshold=cleaning_config.outlier_threshold,
-            columns=cleaning_config.outlier_columns,
+        self._details: dict[str, dict[str, Any]] = {}
+        self._compile()
+        self._fit_ms = (time.perf_counter() - start_time) * 1000
+        self._fitted = True
+        return self
+
+    # -- compilation --------------------------------------------------------
+
+    def _detail(self, name: str, key: str, count: int) -> None:
+        if count:
+            column = self._details.setdefault(name, {})
+            column[key] = column.get(key, 0) + count
+
+    def _fill_value(self, scan: _ColumnScan, values: np.ndarray | None) -> Any:
+        """Constant fill value for a column, or _MISSING when it gets none."""
+        strategy = self.config.null_strategy
+        if strategy == NullStrategy.FILL_DEFAULT:
+            # A None default leaves the nulls (and the column's numeric values) as they are
+            fill = self.config.null_fill_value
+            return _MISSING if fill is None else fill
+        if strategy == NullStrategy.FILL_MODE and scan.counts:
+            top = max(scan.counts.values())
+            modes = [value for value, count in scan.counts.items() if count == top]
+            try:
+                return min(modes)  # pandas returns modes sorted
+            except TypeError:
+                return modes[0]
+        if strategy in (NullStrategy.FILL_MEAN, NullStrategy.FILL_MEDIAN) and values is not None:
+            series = values[~np.isnan(values)]
+            return float(series.mean() if strategy == NullStrategy.FILL_MEAN else np.median(series))
+        return _MISSING
+
+    def _compile(self) -> None:
+        """Turn the first-pass scans into per-column fixes."""
+        config = self.config
+        kept = self._kept
+        strategy = config.null_strategy
+        columns = list(self._scans)
+
+        # Null handling: constant fills, positional fills and numeric arrays
+        self._fills: dict[str, Any] = {}
+        self._forward: dict[str, _ColumnScan] = {}
+        self._backward: dict[str, _ColumnScan] = {}
+        fill_columns: list[str] = []
+        if strategy not in (NullStrategy.KEEP, NullStrategy.DROP):
+            targets = config.null_columns or columns
+            fill_columns = [name for name in targets if name in self._scans]
+
+        arrays: dict[str, np.ndarray] = {}
+        for name, scan in self._scans.items():
+            if scan.values is not None and scan.numeric:
+                values = np.full(kept, np.nan)
+                values[: len(scan.values)] = np.frombuffer(scan.values, dtype=np.float64)
+                arrays[name] = values
+            scan.values = None
+        original = {name: values.copy() for name, values in arrays.items()}
+
+        for name in fill_columns:
+            scan = self._scans[name]
+            nulls = kept - scan.non_null
+            if not nulls or not scan.non_null:
+                continue
+            if strategy in (NullStrategy.FILL_FORWARD, NullStrategy.FILL_BACKWARD):
+                target = self._forward if strategy == NullStrategy.FILL_FORWARD else self._backward
+                target[name] = scan
+                filled = nulls
+            elif strategy == NullStrategy.INTERPOLATE:
+                if name not in arrays:
+                    continue
+                filled = int(np.isnan(arrays[name]).sum())
+            else:
+                fill = self._fill_value(scan, arrays.get(name))
+                if fill is _MISSING:
+                    continue
+                self._fills[name] = fill
+                filled = nulls
+            if name in self._fills and not _is_number(self._fills[name]):
+                arrays.pop(name, None)  # no longer a numeric column
+            elif name in arrays:
+                arrays[name] = _fill_array(arrays[name], strategy, self._fills.get(name, _MISSING))
+                filled -= int(np.isnan(arrays[name]).sum())
+            self._counts["nulls_filled"] += filled
+            self._detail(name, "nulls_filled", filled)
+
+        # Outlier treatment on the filled values
+        drop = np.zeros(kept, dtype=bool)
+        self._flags: dict[str, np.ndarray] = {}
+        if _outliers_enabled(config):
+            targets = config.outlier_columns or columns
+            for name in targets:
+                if name not in arrays:
+                    continue
+                values = arrays[name]
+                series = values[~np.isnan(values)]
+                if not len(series):
+                    continue
+                bounds = _outlier_bounds(series, config.outlier_method, config.outlier_threshold)
+                if bounds is None:
+                    continue
+                with np.errstate(invalid="ignore"):
+                    mask = (values < bounds[0]) | (values > bounds[1])
+                found = int(mask.sum())
+                self._counts["outliers_handled"] += found
+                self._detail(name, "outliers_handled", found)
+                if not found:
+                    continue
+
+                action = config.outlier_action
+                if action == OutlierAction.DROP:
+                    drop |= mask
+                elif action in (OutlierAction.CAP, OutlierAction.FLOOR):
+                    lower, upper = _iqr_bounds(series, config.outlier_threshold)
+                    clipped = np.maximum(values, lower)
+                    if action == OutlierAction.CAP:
+                        clipped = np.minimum(clipped, upper)
+                    values[mask] = clipped[mask]
+                elif action == OutlierAction.MEAN_REPLACE:
+                    values[mask] = series.mean()
+                elif action == OutlierAction.MEDIAN_REPLACE:
+                    values[mask] = np.median(series)
+                elif action == OutlierAction.FLAG:
+                    self._flags[name] = mask
+
+        # Standardization (z-score) over the rows that survive
+        for name in config.standardize_columns:
+            if name not in arrays:
+                continue
+            values = arrays[name]
+            series = values[~np.isnan(values) & ~drop]
+            if not len(series):
+                continue
+            std = series.std(ddof=1) if len(series) > 1 else np.nan
+            with np.errstate(invalid="ignore", divide="ignore"):
+                arrays[name] = (values - series.mean()) / std
+            self._counts["types_converted"] += len(series)
+            self._detail(name, "types_converted", len(series))
+
+        # Only columns whose values changed are rewritten in the second pass
+        self._arrays = {
+            name: values
+            for name, values in arrays.items()
+            if not np.array_equal(values, original[name], equal_nan=True)
+        }
+        self._drop = drop if drop.any() else None
+        self._fill_columns = [
+            name for name in fill_columns if name in self._fills and name not in self._arrays
+        ]
+        self._text = _text_cleaner(config)
+        self._text_columns = (
+            [name for name, scan in self._scans.items() if scan.types == {str}]
+            if self._text is not None
+            else []
         )
-        report_data["outliers_handled"] = outlier_report["handled_count"]
-        if outlier_report["handled_count"] > 0:
-            operations.append("outlier_treatment")
-
-    # 4. Text cleaning
-    if cleaning_config.trim_whitespace or cleaning_config.normalize_text:
-        cleaned_data, text_report = clean_text(
-            cleaned_data,
-            trim=cleaning_config.trim_whitespace,
-            normalize=cleaning_config.normalize_text,
-            case_normalization=cleaning_config.case_normalization,
+
+    # -- second pass --------------------------------------------------------
+
+    def transform(self, chunks: Iterable[Sequence[DataRecord]]) -> Iterator[list[DataRecord]]:
+        """
+        Clean the data in a second pass.
+
+        Args:
+            chunks: The same chunks, in the same order, as passed to fit()
+
+        Yields:
+            Cleaned chunks (possibly empty)
+
+        Raises:
+            RuntimeError: If called before fit()
+        """
+        if not self._fitted:
+            msg = "FusedCleaner.transform() called before fit()"
+            raise RuntimeError(msg)
+
+        start_time = time.perf_counter()
+        keep, arrays, drop, flags = self._keep, self._arrays, self._drop, self._flags
+        fills = {name: self._fills[name] for name in self._fill_columns}
+        forward = {name: scan.first for name, scan in self._forward.items()}
+        backward = {name: (scan.next_values, 0, scan.last) for name, scan in self._backward.items()}
+        text, text_columns = self._text, self._text_columns
+        text_counts: Counter[str] = Counter()
+        index = position = final_count = 0
+
+        for chunk in chunks:
+            cleaned: list[DataRecord] = []
+            for record in chunk:
+                index += 1
+                if not keep[index - 1]:
+                    continue
+                row = position
+                position += 1
+                data = record.data
+                updates: dict[str, Any] = {}
+
+                for name, fill in fills.items():
+                    if _is_null(data.get(name)):
+                        updates[name] = fill
+                for name in forward:
+                    value = data.get(name)
+                    if _is_null(value):
+                        if name not in arrays:
+                            updates[name] = forward[name]
+                    else:
+                        forward[name] = value
+                for name, (next_values, at, last) in backward.items():
+                    if not _is_null(data.get(name)) or name in arrays:
+                        continue
+                    while at < len(next_values) and next_values[at][0] < row:
+                        at += 1
+                    backward[name] = (next_values, at, last)
+                    updates[name] = next_values[at][1] if at < len(next_values) else last
+                for name, values in arrays.items():
+                    new = values[row]
+                    old = data.get(name, _MISSING)
+                    if math.isnan(new):
+                        if not _is_null(old) and old is not _MISSING:
+                            updates[name] = math.nan
+                    elif _is_null(old) or old is _MISSING or new != old:
+                        updates[name] = float(new)
+
+                if drop is not None and drop[row]:
+                    continue
+                for name, mask in flags.items():
+                    updates[f"{name}_is_outlier"] = bool(mask[row])
+                if text is not None:
+                    for name in text_columns:
+                        value = updates.get(name, data.get(name))
+                        if isinstance(value, str):
+                            new_text = text(value)
+                            if new_text != value:
+                                updates[name] = new_text
+                                text_counts[name] += 1
+
+                if updates:
+                    record = DataRecord(
+                        data={**data, **updates}, schema=record.schema, metadata=record.metadata
+                    )
+                cleaned.append(record)
+            final_count += len(cleaned)
+            yield cleaned
+
+        self.report = self._build_report(
+            final_count, text_counts, self._fit_ms + (time.perf_counter() - start_time) * 1000
         )
-        report_data["text_normalized"] = text_report["normalized_count"]
-        if text_report["normalized_count"] > 0:
-            operations.append("text_cleaning")
-
-    # 5. Standardization
-    if cleaning_config.standardize_columns:
-        cleaned_data, std_report = standardize_columns(
-            cleaned_data,
-            columns=cleaning_config.standardize_columns,
+
+    def _build_report(
+        self, final_count: int, text_counts: Counter[str], duration_ms: float
+    ) -> CleaningReport:
+        counts = self._counts
+        details = {name: dict(column) for name, column in self._details.items()}
+        for name, count in text_counts.items():
+            details.setdefault(name, {})["text_normalized"] = count
+        counts = counts.copy()
+        counts["text_normalized"] = sum(text_counts.values())
+
+        operations = [
+            operation
+            for operation, key in (
+                ("deduplication", "duplicates_removed"),
+                ("null_handling", "nulls_filled"),
+                ("outlier_treatment", "outliers_handled"),
+                ("text_cleaning", "text_normalized"),
+                ("standardization", "types_converted"),
+            )
+            if counts[key] > 0
+        ]
+        return CleaningReport(
+            original_count=counts["original_count"],
+            final_count=final_count,
+            duplicates_removed=counts["duplicates_removed"],
+            nulls_filled=counts["nulls_filled"],
+            outliers_handled=counts["outliers_handled"],
+            text_normalized=counts["text_normalized"],
+            types_converted=counts["types_converted"],
+            operations=tuple(operations),
+            duration_ms=duration_ms,
+            details=details,
         )
-        report_data["types_converted"] = std_report["converted_count"]
-        if std_report["converted_count"] > 0:
-            operations.append("standardization")
-
-    # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
-
-    # Create report
-    report = CleaningReport(
-        original_count=report_data["original_count"],
-        final_count=len(cleaned_data),
-        duplicates_removed=report_data.get("duplicates_removed", 0),
-        nulls_filled=report_data.get("nulls_filled", 0),
-        outliers_handled=report_data.get("outliers_handled", 0),
-        text_normalized=report_data.get("text_normalized", 0),
-        types_converted=report_data.get("types_converted", 0),
-        operations=tuple(operations),
-        duration_ms=duration_ms,
-        details=report_data.get("details", {}),
-    )
 
-    return cleaned_data, report
+    def clean(self, data: Sequence[DataRecord]) -> tuple[list[DataRecord], CleaningReport]:
+        """
+        Fit and transform an in-memory dataset.
+
+        Args:
+            data: Input dataset
+
+        Returns:
+            Tuple of (cleaned_data, report)
+        """
+        self.fit([data])
+        cleaned = [record for chunk in self.transform([data]) for record in chunk]
+        return cleaned, cast(CleaningReport, self.report)
 
 
 # =============================================================================
@@ -360,6 +842,10 @@ def remove_duplicates(
     """
     Remove duplicate records from dataset.
 
+    Records are compared by a 64-bit hash of their key and returned
+    unchanged. For chunked or incremental feeds, use
+    vibe_piper.transformations.dedup.Deduplicator instead.
+
     Args:
         data: Input dataset
         columns: Columns to consider for deduplication. If None, uses all columns.
@@ -380,30 +866,28 @@ def remove_duplicates(
     if not data:
         return data, {"removed_count": 0, "original_count": 0}
 
-    # Convert to DataFrame for efficient deduplication
-    df = pd.DataFrame([record.data for record in data])
-
-    # Select columns for deduplication
     subset = list(columns) if columns else None
+    hashes = [key_hash(record.data, subset) for record in data]
 
-    original_count = len(df)
-
-    if keep == "none":
-        # Remove all duplicates (keep only unique)
-        df_cleaned = df.drop_duplicates(subset=subset, keep=False)
+    if keep == "first":
+        flags = HashKeySet().add_new(hashes)
+        cleaned_data = [record for record, is_new in zip(data, flags, strict=True) if is_new]
     else:
-        df_cleaned = df.drop_duplicates(subset=subset, keep=keep)  # type: ignore[arg-type]
-
-    removed_count = original_count - len(df_cleaned)
-
-    # Reconstruct DataRecord objects
-    cleaned_data = [
-        DataRecord(data=row.to_dict(), schema=data[0].schema) for _, row in df_cleaned.iterrows()
-    ]
+        counts = Counter(hashes)
+        if keep == "none":
+            # Remove all duplicates (keep only unique)
+            cleaned_data = [r for r, h in zip(data, hashes, strict=True) if counts[h] == 1]
+        else:
+            remaining = dict(counts)
+            cleaned_data = []
+            for record, h in zip(data, hashes, strict=True):
+                remaining[h] -= 1
+                if remaining[h] == 0:
+                    cleaned_data.append(record)
 
     report = {
-        "removed_count": removed_count,
-        "original_count": original_count,
+        "removed_count": len(data) - len(cleaned_data),
+        "original_count": len(data),
         "final_count": len(cleaned_data),
         "columns": subset,
     }
@@ -430,16 +914,10 @@ def find_duplicates(
 
             dup_indices = find_duplicates(data, columns=("email",))
     """
-    if not data:
-        return []
-
-    df = pd.DataFrame([record.data for record in data])
     subset = list(columns) if columns else None
+    flags = HashKeySet().add_new([key_hash(record.data, subset) for record in data])
 
-    # Boolean mask of duplicates (True for all but first occurrence)
-    duplicates = df.duplicated(subset=subset, keep="first")
-
-    return [i for i, is_dup in enumerate(duplicates) if is_dup]
+    return [i for i, is_new in enumerate(flags) if not is_new]
 
 
 # =============================================================================
@@ -725,6 +1203,7 @@ def handle_outliers(
 
     for col, indices in outliers.items():
         series = df[col].dropna()
+        rows = pd.Index(indices)
         handled_count += len(indices)
 
         if action == OutlierAction.DROP:
@@ -733,25 +1212,24 @@ def handle_outliers(
             Q1 = series.quantile(0.25)
             Q3 = series.quantile(0.75)
             IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            df.loc[indices, col] = df.loc[indices, col].clip(lower=lower_bound, upper=upper_bound)
+            lower_bound = float(Q1 - threshold * IQR)
+            upper_bound = float(Q3 + threshold * IQR)
+            df.loc[rows, col] = df.loc[rows, col].clip(lower=lower_bound, upper=upper_bound)
         elif action == OutlierAction.FLOOR:
             Q1 = series.quantile(0.25)
             Q3 = series.quantile(0.75)
             IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            df.loc[indices, col] = df.loc[indices, col].clip(lower=lower_bound)
+            lower_bound = float(Q1 - threshold * IQR)
+            df.loc[rows, col] = df.loc[rows, col].clip(lower=lower_bound)
         elif action == OutlierAction.MEAN_REPLACE:
             mean_val = series.mean()
-            df.loc[indices, col] = mean_val
+            df.loc[rows, col] = mean_val
         elif action == OutlierAction.MEDIAN_REPLACE:
             median_val = series.median()
-            df.loc[indices, col] = median_val
+            df.loc[rows, col] = median_val
         elif action == OutlierAction.FLAG:
             df[f"{col}_is_outlier"] = False
-            df.loc[indices, f"{col}_is_outlier"] = True
+            df.loc[rows, f"{col}_is_outlier"] = True
 
     # Reconstruct DataRecord objects
     cleaned_data = [
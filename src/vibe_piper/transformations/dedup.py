@@ -0,0 +1,549 @@
+"""
+Streaming deduplication over key columns.
+
+A Deduplicator remembers the keys it has seen and drops records whose key
+was seen before, one chunk at a time, so feeds can be deduplicated in
+bounded memory and across incremental runs. Keys are stored as 64-bit
+hashes rather than values, in one of three key sets:
+
+- exact: an in-memory set of key hashes
+- bloom: a fixed-size Bloom filter for very large key spaces; memory does
+  not grow with the number of keys, at the cost of dropping a small
+  fraction (the configured error rate) of new records as false duplicates
+- persistent: key hashes stored in SQLite, so keys from previous runs are
+  remembered (e.g. to drop re-delivered events from at-least-once feeds)
+
+Key hashes are stable across processes (BLAKE2b of a canonical key), so
+persisted keys match on later runs.
+
+Filtering is tentative: keys of kept records are only added to the key set
+by commit(), once the caller has written the records downstream. A failed
+write can be retried (or rolled back) without its records being dropped as
+duplicates of themselves.
+"""
+
+import dataclasses
+import hashlib
+import math
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+from vibe_piper.types import DataRecord
+
+# =============================================================================
+# Key Hashing
+# =============================================================================
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Normalize a key value so equal values get the same hash.
+
+    Numbers that compare equal (1, 1.0 and np.int64(1)) and NaNs collapse
+    to one form, mappings and sets are ordered, and objects are reduced to
+    their type and fields, so neither dict insertion order nor a memory
+    address in a default repr changes the hash.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, str, bytes)):
+        return value
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+        return value
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, Mapping):
+        items = ((_canonical(k), _canonical(v)) for k, v in value.items())
+        return ("__map__", tuple(sorted(items, key=repr)))
+    if isinstance(value, (set, frozenset)):
+        return ("__set__", tuple(sorted((_canonical(v) for v in value), key=repr)))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical(v) for v in value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        return (type(value).__qualname__, _canonical(fields))
+    if getattr(type(value), "__repr__") is object.__repr__ and hasattr(value, "__dict__"):
+        return (type(value).__qualname__, _canonical(vars(value)))
+    return value
+
+
+def key_hash(data: Mapping[str, Any], columns: Sequence[str] | None = None) -> int:
+    """
+    Compute a stable 64-bit hash of a record's key.
+
+    Key values are normalized first (see _canonical), so nested dicts hash
+    the same regardless of insertion order.
+
+    Args:
+        data: Record data
+        columns: Key columns (None uses every field)
+
+    Returns:
+        Unsigned 64-bit key hash
+
+    Example:
+        Hash an event key::
+
+            key_hash({"event_id": "e1", "ts": 1}, ["event_id"])
+    """
+    if columns is None:
+        key: tuple[Any, ...] = tuple((k, _canonical(v)) for k, v in sorted(data.items()))
+    else:
+        key = tuple(_canonical(data.get(column)) for column in columns)
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# =============================================================================
+# Key Sets
+# =============================================================================
+
+
+class KeySet(Protocol):
+    """Set of key hashes used by Deduplicator."""
+
+    def contains(self, hashes: Sequence[int]) -> list[bool]:
+        """Return for each hash whether it is in the set, without adding it."""
+        ...
+
+    def add(self, hashes: Sequence[int]) -> None:
+        """Add hashes to the set."""
+        ...
+
+    def add_new(self, hashes: Sequence[int]) -> list[bool]:
+        """Add hashes, returning for each whether it was not seen before."""
+        ...
+
+    def __len__(self) -> int:
+        """Number of distinct keys added."""
+        ...
+
+
+class HashKeySet:
+    """Exact in-memory set of 64-bit key hashes."""
+
+    def __init__(self) -> None:
+        self._hashes: set[int] = set()
+
+    def contains(self, hashes: Sequence[int]) -> list[bool]:
+        seen = self._hashes
+        return [h in seen for h in hashes]
+
+    def add(self, hashes: Sequence[int]) -> None:
+        self._hashes.update(hashes)
+
+    def add_new(self, hashes: Sequence[int]) -> list[bool]:
+        seen = self._hashes
+        result = []
+        for h in hashes:
+            is_new = h not in seen
+            if is_new:
+                seen.add(h)
+            result.append(is_new)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit key hashes.
+
+    Sized for an expected number of keys and a target false positive rate;
+    memory is fixed at construction. Bit positions are derived from the key
+    hash by double hashing.
+
+    Attributes:
+        capacity: Expected number of distinct keys
+        error_rate: Target false positive rate at capacity
+        size: Number of bits
+        num_hashes: Bits set per key
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Expected number of distinct keys
+            error_rate: Target false positive rate at capacity
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity <= 0:
+            msg = f"Bloom filter capacity must be positive, got {capacity}"
+            raise ValueError(msg)
+        if not 0 < error_rate < 1:
+            msg = f"Bloom filter error_rate must be between 0 and 1, got {error_rate}"
+            raise ValueError(msg)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, h: int) -> Iterator[int]:
+        low, high = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (low + i * high) % self.size
+
+    def add_hash(self, h: int) -> bool:
+        """
+        Add a key hash.
+
+        Args:
+            h: Key hash
+
+        Returns:
+            True if the key was definitely not present before
+        """
+        bits = self._bits
+        is_new = False
+        for pos in self._positions(h):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                is_new = True
+        self._count += is_new
+        return is_new
+
+    def __contains__(self, h: int) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(h))
+
+    def contains(self, hashes: Sequence[int]) -> list[bool]:
+        return [h in self for h in hashes]
+
+    def add(self, hashes: Sequence[int]) -> None:
+        for h in hashes:
+            self.add_hash(h)
+
+    def add_new(self, hashes: Sequence[int]) -> list[bool]:
+        return [self.add_hash(h) for h in hashes]
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bit array."""
+        return len(self._bits)
+
+
+class PersistentKeySet:
+    """
+    Key hashes stored in SQLite, remembered across runs.
+
+    Each namespace is an independent set, so one database can serve several
+    feeds. Lookups and inserts are batched per chunk.
+
+    Attributes:
+        db_path: Path to the SQLite database file
+        namespace: Key set name within the database
+    """
+
+    _BATCH = 500
+
+    def __init__(self, db_path: Path | str, namespace: str = "default") -> None:
+        """
+        Initialize the key set.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+            namespace: Key set name within the database
+        """
+        self.db_path = Path(db_path)
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS dedup_keys (
+                    namespace TEXT NOT NULL,
+                    key_hash INTEGER NOT NULL,
+                    PRIMARY KEY (namespace, key_hash)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _signed(h: int) -> int:
+        """SQLite integers are signed 64-bit."""
+        return h - (1 << 64) if h >= 1 << 63 else h
+
+    def _existing(self, conn: sqlite3.Connection, signed: Sequence[int]) -> set[int]:
+        """Look up which signed hashes are stored, in batches."""
+        existing: set[int] = set()
+        distinct = list(dict.fromkeys(signed))
+        for start in range(0, len(distinct), self._BATCH):
+            batch = distinct[start : start + self._BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key_hash FROM dedup_keys WHERE namespace = ? "
+                f"AND key_hash IN ({placeholders})",
+                (self.namespace, *batch),
+            )
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def contains(self, hashes: Sequence[int]) -> list[bool]:
+        signed = [self._signed(h) for h in hashes]
+        with self._lock:
+            conn = self._connect()
+            try:
+                existing = self._existing(conn, signed)
+            finally:
+                conn.close()
+        return [h in existing for h in signed]
+
+    def add(self, hashes: Sequence[int]) -> None:
+        rows = [(self.namespace, self._signed(h)) for h in hashes]
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany("INSERT OR IGNORE INTO dedup_keys VALUES (?, ?)", rows)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def add_new(self, hashes: Sequence[int]) -> list[bool]:
+        signed = [self._signed(h) for h in hashes]
+        with self._lock:
+            conn = self._connect()
+            try:
+                existing = self._existing(conn, signed)
+                result = []
+                new_keys = []
+                for h in signed:
+                    is_new = h not in existing
+                    if is_new:
+                        existing.add(h)
+                        new_keys.append((self.namespace, h))
+                    result.append(is_new)
+                conn.executemany("INSERT INTO dedup_keys VALUES (?, ?)", new_keys)
+                conn.commit()
+                return result
+            finally:
+                conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT COUNT(*) FROM dedup_keys WHERE namespace = ?", (self.namespace,)
+                ).fetchone()
+                return int(row[0])
+            finally:
+                conn.close()
+
+    def clear(self) -> None:
+        """Forget every key in this namespace."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM dedup_keys WHERE namespace = ?", (self.namespace,))
+                conn.commit()
+            finally:
+                conn.close()
+
+
+# =============================================================================
+# Deduplicator
+# =============================================================================
+
+
+class DedupMode(str, Enum):
+    """Key set used to remember seen keys."""
+
+    EXACT = "exact"
+    BLOOM = "bloom"
+    PERSISTENT = "persistent"
+
+
+@dataclass
+class DedupStats:
+    """
+    Running deduplication counts.
+
+    Attributes:
+        seen: Records processed
+        removed: Records dropped as duplicates
+    """
+
+    seen: int = 0
+    removed: int = 0
+
+    @property
+    def kept(self) -> int:
+        """Records passed through."""
+        return self.seen - self.removed
+
+
+class Deduplicator:
+    """
+    Drops records whose key was seen before, chunk by chunk.
+
+    The first occurrence of each key is kept. State carries over between
+    calls, so a feed can be deduplicated as a stream of chunks; in
+    persistent mode it also carries over between runs.
+
+    filter() is tentative: keys of the records it keeps are held as pending
+    (later chunks still see them) until commit() adds them to the key set.
+    Call commit() once the kept records are written downstream, or
+    rollback() if the write failed, so a retried chunk is not dropped as a
+    duplicate of itself.
+
+    Attributes:
+        columns: Key columns (None uses every field)
+        mode: Key set kind
+        stats: Running counts
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str] | None = None,
+        mode: DedupMode | str = DedupMode.EXACT,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        path: Path | str | None = None,
+        namespace: str = "default",
+    ) -> None:
+        """
+        Initialize the deduplicator.
+
+        Args:
+            columns: Key columns (None uses every field)
+            mode: "exact", "bloom" or "persistent"
+            capacity: Expected distinct keys (bloom mode)
+            error_rate: False positive rate at capacity (bloom mode)
+            path: SQLite database path (persistent mode)
+            namespace: Key set name within the database (persistent mode)
+
+        Raises:
+            ValueError: If the mode is unknown or persistent mode has no path
+
+        Example:
+            Deduplicate an at-least-once feed across runs::
+
+                dedup = Deduplicator(
+                    columns=["event_id"], mode="persistent", path=".state/dedup.db"
+                )
+                for chunk in dedup.stream(read_chunks()):
+                    write(chunk)  # keys are committed once write returns
+        """
+        self.columns = tuple(columns) if columns is not None else None
+        self.mode = DedupMode(mode)
+        self.stats = DedupStats()
+        self.keys: KeySet
+        if self.mode == DedupMode.EXACT:
+            self.keys = HashKeySet()
+        elif self.mode == DedupMode.BLOOM:
+            self.keys = BloomFilter(capacity, error_rate)
+        else:
+            if path is None:
+                msg = "Persistent deduplication requires a database path"
+                raise ValueError(msg)
+            self.keys = PersistentKeySet(path, namespace)
+        self._pending: dict[int, None] = {}
+        self._pending_stats = DedupStats()
+
+    def filter(self, records: Sequence[DataRecord]) -> list[DataRecord]:
+        """
+        Drop records whose key was already seen (in this or earlier chunks).
+
+        Keys of the kept records stay pending until commit().
+
+        Args:
+            records: One chunk of records
+
+        Returns:
+            Records with a new key, in input order
+        """
+        hashes = [key_hash(record.data, self.columns) for record in records]
+        pending = self._pending
+        kept = []
+        for record, h, committed in zip(records, hashes, self.keys.contains(hashes), strict=True):
+            if committed or h in pending:
+                continue
+            pending[h] = None
+            kept.append(record)
+        removed = len(records) - len(kept)
+        self.stats.seen += len(records)
+        self.stats.removed += removed
+        self._pending_stats.seen += len(records)
+        self._pending_stats.removed += removed
+        return kept
+
+    @property
+    def pending(self) -> int:
+        """Keys kept by filter() and not yet committed."""
+        return len(self._pending)
+
+    def commit(self) -> None:
+        """Add the pending keys to the key set (persisting them in persistent mode)."""
+        if self._pending:
+            self.keys.add(list(self._pending))
+        self._pending = {}
+        self._pending_stats = DedupStats()
+
+    def rollback(self) -> None:
+        """Forget the pending keys, so their records are kept again if redelivered."""
+        self.stats.seen -= self._pending_stats.seen
+        self.stats.removed -= self._pending_stats.removed
+        self._pending = {}
+        self._pending_stats = DedupStats()
+
+    def stream(self, chunks: Iterable[Sequence[DataRecord]]) -> Iterator[list[DataRecord]]:
+        """
+        Deduplicate a stream of chunks lazily.
+
+        Each chunk's keys are committed when the consumer asks for the next
+        chunk, i.e. after it has processed this one; if the consumer raises,
+        the chunk's keys stay pending and are not committed.
+
+        Args:
+            chunks: Chunks of records
+
+        Yields:
+            Deduplicated chunks (possibly empty)
+        """
+        for chunk in chunks:
+            yield self.filter(chunk)
+            self.commit()
+
+
+__all__ = [
+    "BloomFilter",
+    "DedupMode",
+    "DedupStats",
+    "Deduplicator",
+    "HashKeySet",
+    "KeySet",
+    "PersistentKeySet",
+    "key_hash",
+]
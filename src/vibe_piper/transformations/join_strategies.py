@@ -0,0 +1,649 @@
+"""
+Record-level join algorithms.
+
+These strategies join row dicts directly, without converting to DataFrames:
+
+- broadcast hash join: index the (small) right side once and probe it with
+  each left row
+- sort-merge join: merge two inputs sorted on the join key (sorting them
+  first when they are not)
+- grace hash join: hash-partition both sides to disk as they are read and
+  join one partition at a time, streaming the output, so only one
+  partition's rows and index are held in memory
+
+All strategies follow pandas merge naming: join keys with the same name on
+both sides appear once, other overlapping columns get the left/right suffix.
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+Row = Mapping[str, Any]
+KeyFn = Callable[[Row], Any]
+
+# =============================================================================
+# Strategies and Stats
+# =============================================================================
+
+
+class JoinStrategy(str, Enum):
+    """Join algorithm selection."""
+
+    AUTO = "auto"
+    BACKEND = "backend"
+    BROADCAST_HASH = "broadcast_hash"
+    SORT_MERGE = "sort_merge"
+    GRACE_HASH = "grace_hash"
+
+
+@dataclass(frozen=True)
+class JoinStats:
+    """
+    Statistics for a single join execution.
+
+    Attributes:
+        strategy: Strategy that executed the join
+        join_type: Join type (inner, left, right, full)
+        left_rows: Rows in the left input
+        right_rows: Rows in the right input
+        output_rows: Rows produced
+        index_reused: Whether a cached right-side index was reused
+        index_bytes: Approximate size of the in-memory hash index
+        spilled_partitions: Partitions written to disk (grace hash join)
+        spilled_bytes: Bytes written to disk (grace hash join)
+        duration_seconds: Wall-clock duration of the join
+    """
+
+    strategy: JoinStrategy
+    join_type: str
+    left_rows: int
+    right_rows: int
+    output_rows: int
+    index_reused: bool = False
+    index_bytes: int = 0
+    spilled_partitions: int = 0
+    spilled_bytes: int = 0
+    duration_seconds: float = 0.0
+
+
+# =============================================================================
+# Output Layout
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class JoinLayout:
+    """
+    How input columns map to output columns.
+
+    Attributes:
+        left_on: Left join keys
+        right_on: Right join keys
+        left_columns: (input column, output column, is shared key) for the left side
+        right_columns: (input column, output column) for right columns kept
+        columns: Output column names in order
+    """
+
+    left_on: tuple[str, ...]
+    right_on: tuple[str, ...]
+    left_columns: tuple[tuple[str, str, bool], ...]
+    right_columns: tuple[tuple[str, str], ...]
+    columns: tuple[str, ...]
+
+    @classmethod
+    def build(
+        cls,
+        left_columns: Sequence[str],
+        right_columns: Sequence[str],
+        left_on: Sequence[str],
+        right_on: Sequence[str],
+        left_suffix: str,
+        right_suffix: str,
+    ) -> "JoinLayout":
+        """
+        Lay out joined columns following pandas merge rules.
+
+        Args:
+            left_columns: Columns of the left input
+            right_columns: Columns of the right input
+            left_on: Left join keys
+            right_on: Right join keys
+            left_suffix: Suffix for overlapping left columns
+            right_suffix: Suffix for overlapping right columns
+
+        Returns:
+            JoinLayout
+        """
+        shared = {lk for lk, rk in zip(left_on, right_on, strict=True) if lk == rk}
+        overlap = (set(left_columns) & set(right_columns)) - shared
+        left = tuple(
+            (col, f"{col}{left_suffix}" if col in overlap else col, col in shared)
+            for col in left_columns
+        )
+        right = tuple(
+            (col, f"{col}{right_suffix}" if col in overlap else col)
+            for col in right_columns
+            if col not in shared
+        )
+        return cls(
+            left_on=tuple(left_on),
+            right_on=tuple(right_on),
+            left_columns=left,
+            right_columns=right,
+            columns=tuple(name for _, name, _ in left) + tuple(name for _, name in right),
+        )
+
+    def combine(self, left: Row | None, right: Row | None) -> dict[str, Any]:
+        """
+        Build an output row from a left and/or right row.
+
+        Shared keys take the left value, or the right value for unmatched
+        right rows.
+
+        Args:
+            left: Left row (None for unmatched right rows)
+            right: Right row (None for unmatched left rows)
+
+        Returns:
+            Output row
+        """
+        row: dict[str, Any] = {}
+        for col, name, shared in self.left_columns:
+            if left is not None:
+                row[name] = left.get(col)
+            elif shared and right is not None:
+                row[name] = right.get(col)
+            else:
+                row[name] = None
+        for col, name in self.right_columns:
+            row[name] = right.get(col) if right is not None else None
+        return row
+
+
+def key_function(columns: Sequence[str]) -> KeyFn:
+    """
+    Build a function extracting the join key from a row.
+
+    Args:
+        columns: Key columns
+
+    Returns:
+        Function returning the key value (a tuple for composite keys)
+    """
+    if len(columns) == 1:
+        (column,) = columns
+
+        def single(row: Row) -> Any:
+            return row.get(column)
+
+        return single
+
+    def composite(row: Row) -> Any:
+        return tuple(row.get(column) for column in columns)
+
+    return composite
+
+
+# =============================================================================
+# Broadcast Hash Join
+# =============================================================================
+
+
+def build_hash_index(rows: Sequence[Row], key: KeyFn) -> dict[Any, list[int]]:
+    """
+    Index rows by join key.
+
+    Args:
+        rows: Rows to index
+        key: Key function
+
+    Returns:
+        Mapping of key to the positions of rows with that key
+    """
+    index: dict[Any, list[int]] = {}
+    for position, row in enumerate(rows):
+        index.setdefault(key(row), []).append(position)
+    return index
+
+
+def index_size(index: dict[Any, list[int]]) -> int:
+    """
+    Approximate the memory held by a hash index.
+
+    Args:
+        index: Hash index
+
+    Returns:
+        Size in bytes (dict plus position lists, excluding shared key objects)
+    """
+    return sys.getsizeof(index) + sum(sys.getsizeof(bucket) for bucket in index.values())
+
+
+def hash_join(
+    left_rows: Sequence[Row],
+    right_rows: Sequence[Row],
+    index: dict[Any, list[int]],
+    layout: JoinLayout,
+    how: str,
+) -> list[dict[str, Any]]:
+    """
+    Probe a right-side hash index with every left row.
+
+    Output order matches pandas: left order for inner/left joins, right
+    order for right joins and sorted keys for full joins.
+
+    Args:
+        left_rows: Left rows
+        right_rows: Right rows (positions referenced by the index)
+        index: Hash index over right_rows
+        layout: Output layout
+        how: Join type
+
+    Returns:
+        Output rows
+    """
+    left_key = key_function(layout.left_on)
+    combine = layout.combine
+
+    if how == "right":
+        # Keep right order: collect matches per right row, then emit in order
+        matches: list[list[Row]] = [[] for _ in right_rows]
+        for left in left_rows:
+            for position in index.get(left_key(left), ()):
+                matches[position].append(left)
+        output: list[dict[str, Any]] = []
+        for right, lefts in zip(right_rows, matches, strict=True):
+            if lefts:
+                output.extend(combine(left, right) for left in lefts)
+            else:
+                output.append(combine(None, right))
+        return output
+
+    keep_left = how in ("left", "full")
+    matched = bytearray(len(right_rows)) if how == "full" else None
+    output = []
+    for left in left_rows:
+        positions = index.get(left_key(left))
+        if positions:
+            for position in positions:
+                output.append(combine(left, right_rows[position]))
+                if matched is not None:
+                    matched[position] = 1
+        elif keep_left:
+            output.append(combine(left, None))
+
+    if matched is not None:
+        output.extend(
+            combine(None, right)
+            for right, was_matched in zip(right_rows, matched, strict=True)
+            if not was_matched
+        )
+        output = sort_by_key(output, [name for _, name, shared in layout.left_columns if shared])
+    return output
+
+
+def sort_by_key(rows: list[dict[str, Any]], columns: Sequence[str]) -> list[dict[str, Any]]:
+    """
+    Stable-sort rows by key columns with nulls last (pandas outer join order).
+
+    Rows are left unsorted if the keys are not mutually comparable.
+
+    Args:
+        rows: Rows to sort
+        columns: Key columns
+
+    Returns:
+        Sorted rows
+    """
+    if not columns:
+        return rows
+
+    def sort_key(row: dict[str, Any]) -> tuple[Any, ...]:
+        return tuple((row[col] is None, row[col]) for col in columns)
+
+    try:
+        return sorted(rows, key=sort_key)
+    except TypeError:
+        return rows
+
+
+# =============================================================================
+# Sort-Merge Join
+# =============================================================================
+
+
+def is_sorted(rows: Sequence[Row], key: KeyFn) -> bool:
+    """
+    Check whether rows are sorted ascending by a non-null key.
+
+    Args:
+        rows: Rows to check
+        key: Key function
+
+    Returns:
+        True if every key is non-null and keys never decrease
+    """
+    previous = None
+    try:
+        for position, row in enumerate(rows):
+            current = key(row)
+            if current is None or (isinstance(current, tuple) and None in current):
+                return False
+            if position and current < previous:
+                return False
+            previous = current
+    except TypeError:
+        return False
+    return True
+
+
+def merge_key_function(columns: Sequence[str]) -> KeyFn:
+    """
+    Build a join key that orders nulls last and keeps them comparable.
+
+    Null keys compare equal to each other, so they match as in the hash join.
+
+    Args:
+        columns: Key columns
+
+    Returns:
+        Function returning a (is-null, value) pair per key column
+    """
+    if len(columns) == 1:
+        (column,) = columns
+
+        def single(row: Row) -> Any:
+            value = row.get(column)
+            return (value is None, value)
+
+        return single
+
+    def composite(row: Row) -> Any:
+        return tuple((row.get(column) is None, row.get(column)) for column in columns)
+
+    return composite
+
+
+def sort_for_merge(rows: Sequence[Row], columns: Sequence[str]) -> Sequence[Row]:
+    """
+    Sort rows for sort_merge_join unless they already are.
+
+    Args:
+        rows: Rows to sort
+        columns: Key columns
+
+    Returns:
+        The rows themselves if sorted, else a stably sorted copy
+
+    Raises:
+        ValueError: If the keys are not mutually comparable
+    """
+    key = merge_key_function(columns)
+    keys = [key(row) for row in rows]
+    try:
+        if not any(current < previous for previous, current in zip(keys, keys[1:])):
+            return rows
+        return [rows[position] for position in sorted(range(len(rows)), key=keys.__getitem__)]
+    except TypeError as e:
+        msg = f"Cannot sort-merge join on {list(columns)}: keys are not comparable ({e})"
+        raise ValueError(msg) from e
+
+
+def sort_merge_join(
+    left_rows: Sequence[Row],
+    right_rows: Sequence[Row],
+    layout: JoinLayout,
+    how: str,
+) -> list[dict[str, Any]]:
+    """
+    Merge two inputs sorted on the join key.
+
+    Each run of equal keys is joined as a block, so memory use is bounded
+    by the largest block rather than by either input. Null keys sort last
+    and match each other, as in the hash join.
+
+    Args:
+        left_rows: Left rows sorted by key (see sort_for_merge)
+        right_rows: Right rows sorted by key
+        layout: Output layout
+        how: Join type
+
+    Returns:
+        Output rows, in key order
+    """
+    left_key = merge_key_function(layout.left_on)
+    right_key = merge_key_function(layout.right_on)
+    combine = layout.combine
+    keep_left = how in ("left", "full")
+    keep_right = how in ("right", "full")
+
+    output: list[dict[str, Any]] = []
+    i, j = 0, 0
+    n_left, n_right = len(left_rows), len(right_rows)
+    while i < n_left and j < n_right:
+        lk, rk = left_key(left_rows[i]), right_key(right_rows[j])
+        if lk < rk:
+            if keep_left:
+                output.append(combine(left_rows[i], None))
+            i += 1
+        elif rk < lk:
+            if keep_right:
+                output.append(combine(None, right_rows[j]))
+            j += 1
+        else:
+            i_end, j_end = i, j
+            while i_end < n_left and left_key(left_rows[i_end]) == lk:
+                i_end += 1
+            while j_end < n_right and right_key(right_rows[j_end]) == rk:
+                j_end += 1
+            if how == "right":
+                for right in right_rows[j:j_end]:
+                    output.extend(combine(left, right) for left in left_rows[i:i_end])
+            else:
+                for left in left_rows[i:i_end]:
+                    output.extend(combine(left, right) for right in right_rows[j:j_end])
+            i, j = i_end, j_end
+
+    if keep_left:
+        output.extend(combine(left, None) for left in left_rows[i:])
+    if keep_right:
+        output.extend(combine(None, right) for right in right_rows[j:])
+    return output
+
+
+# =============================================================================
+# Grace Hash Join
+# =============================================================================
+
+
+class GraceHashJoin:
+    """
+    Grace hash join of inputs that need not fit in memory.
+
+    Each side is hash-partitioned to spill files while it is iterated, so
+    neither input is materialized. join() then loads one partition at a
+    time, indexes its right rows and yields that partition's output, so
+    only one partition is in memory at once. Spill files are removed by
+    close() or on leaving a with block.
+
+    Attributes:
+        partitions: Number of hash partitions
+        spilled_bytes: Bytes written to spill files so far
+
+    Example:
+        Join a chunked left side without loading it::
+
+            with GraceHashJoin(["id"], ["id"], partitions=16) as grace:
+                left_columns = grace.spill_left(left_rows)
+                right_columns = grace.spill_right(right_rows)
+                layout = JoinLayout.build(
+                    left_columns, right_columns, ["id"], ["id"], "_x", "_y"
+                )
+                for rows in grace.join(layout, "inner"):
+                    write(rows)
+    """
+
+    def __init__(
+        self,
+        left_on: Sequence[str],
+        right_on: Sequence[str],
+        partitions: int,
+        spill_dir: Path | str | None = None,
+    ) -> None:
+        """
+        Create the spill directory.
+
+        Args:
+            left_on: Left join keys
+            right_on: Right join keys
+            partitions: Number of hash partitions
+            spill_dir: Directory for spill files (defaults to the system temp dir)
+        """
+        self.partitions = partitions
+        self.spilled_bytes = 0
+        self._left_key = key_function(left_on)
+        self._right_key = key_function(right_on)
+        self._tmp = tempfile.TemporaryDirectory(prefix="vibe_piper_join_", dir=spill_dir)
+        self._left_paths: list[Path] = []
+        self._right_paths: list[Path] = []
+
+    def spill_left(self, rows: Iterable[Row]) -> list[str]:
+        """
+        Partition the left rows to disk.
+
+        Args:
+            rows: Left rows (consumed lazily)
+
+        Returns:
+            Columns of the left rows, in first-seen order
+        """
+        self._left_paths, columns = self._spill(rows, self._left_key, "left")
+        return columns
+
+    def spill_right(self, rows: Iterable[Row]) -> list[str]:
+        """
+        Partition the right rows to disk.
+
+        Args:
+            rows: Right rows (consumed lazily)
+
+        Returns:
+            Columns of the right rows, in first-seen order
+        """
+        self._right_paths, columns = self._spill(rows, self._right_key, "right")
+        return columns
+
+    def _spill(self, rows: Iterable[Row], key: KeyFn, side: str) -> tuple[list[Path], list[str]]:
+        """Write rows to one file per hash partition, collecting their columns."""
+        partitions = self.partitions
+        paths = [Path(self._tmp.name) / f"{side}_{i}.pkl" for i in range(partitions)]
+        files = [path.open("wb") for path in paths]
+        columns: dict[str, None] = {}
+        try:
+            for row in rows:
+                if len(row) != len(columns) or any(col not in columns for col in row):
+                    columns.update(dict.fromkeys(row))
+                pickle.dump(dict(row), files[hash(key(row)) % partitions])
+        finally:
+            for file in files:
+                file.close()
+        self.spilled_bytes += sum(os.path.getsize(path) for path in paths)
+        return paths, list(columns)
+
+    def join(self, layout: JoinLayout, how: str) -> Iterator[list[dict[str, Any]]]:
+        """
+        Join the spilled sides one partition at a time.
+
+        Args:
+            layout: Output layout
+            how: Join type
+
+        Yields:
+            Output rows of each non-empty partition, following hash_join
+            ordering within the partition
+        """
+        for left_path, right_path in zip(self._left_paths, self._right_paths, strict=True):
+            right_part = list(_read_spill(right_path))
+            left_part = list(_read_spill(left_path))
+            if not left_part and not right_part:
+                continue
+            index = build_hash_index(right_part, self._right_key)
+            yield hash_join(left_part, right_part, index, layout, how)
+
+    def close(self) -> None:
+        """Remove the spill files."""
+        self._tmp.cleanup()
+
+    def __enter__(self) -> "GraceHashJoin":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def grace_hash_join(
+    left_rows: Iterable[Row],
+    right_rows: Iterable[Row],
+    layout: JoinLayout,
+    how: str,
+    partitions: int,
+    spill_dir: Path | str | None = None,
+) -> tuple[Iterator[dict[str, Any]], int]:
+    """
+    Join by hash-partitioning both inputs to disk.
+
+    Both inputs are spilled to per-partition files before this returns;
+    the output is then streamed one partition at a time as the returned
+    iterator is consumed, and the spill files are removed once it is
+    exhausted or closed. Output is grouped by partition; within a
+    partition it follows hash_join ordering.
+
+    Args:
+        left_rows: Left rows (consumed lazily)
+        right_rows: Right rows (consumed lazily)
+        layout: Output layout
+        how: Join type
+        partitions: Number of partitions
+        spill_dir: Directory for spill files (defaults to the system temp dir)
+
+    Returns:
+        (iterator of output rows, bytes spilled)
+    """
+    grace = GraceHashJoin(layout.left_on, layout.right_on, partitions, spill_dir)
+    try:
+        grace.spill_left(left_rows)
+        grace.spill_right(right_rows)
+    except BaseException:
+        grace.close()
+        raise
+    return _stream_join(grace, layout, how), grace.spilled_bytes
+
+
+def _stream_join(grace: GraceHashJoin, layout: JoinLayout, how: str) -> Iterator[dict[str, Any]]:
+    """Yield a spilled join's output rows, removing the spill files at the end."""
+    with grace:
+        for rows in grace.join(layout, how):
+            yield from rows
+
+
+def _read_spill(path: Path) -> Iterator[dict[str, Any]]:
+    """Read the rows of one spill file."""
+    with path.open("rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)  # noqa: S301 - files written by GraceHashJoin
+            except EOFError:
+                return
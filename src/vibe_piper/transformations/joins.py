@@ -2,16 +2,49 @@
 Join transformation operators.
 
 Provides join operations for combining datasets with support for inner,
-left, right, and full outer joins. Uses pandas merge functionality for
-in-memory transformations with proper schema propagation.
+left, right, and full outer joins. Joins run on a pluggable execution
+backend (pandas by default) unless a record-level strategy is requested:
+a broadcast hash join for small right sides, a sort-merge join for
+pre-sorted inputs, or a grace hash join that spills to disk for inputs too
+large to index in memory. strategy="auto" picks one from the input sizes.
 """
 
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime
 from enum import Enum
-from typing import Any
+from pathlib import Path
+from typing import Any, cast
 
+import numpy as np
 import pandas as pd
-
-from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema
+from pandas.api.extensions import ExtensionDtype
+
+from vibe_piper.transformations.backends import resolve_backend
+from vibe_piper.transformations.backends.base import dataset_columns
+from vibe_piper.transformations.join_strategies import (
+    GraceHashJoin,
+    JoinLayout,
+    JoinStats,
+    JoinStrategy,
+    build_hash_index,
+    grace_hash_join,
+    hash_join,
+    index_size,
+    is_sorted,
+    key_function,
+    sort_for_merge,
+    sort_merge_join,
+)
+from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema, SchemaField
+
+# =============================================================================
+# Logger
+# =============================================================================
+
+logger = logging.getLogger(__name__)
 
 
 class JoinType(str, Enum):
@@ -41,6 +74,29 @@ class Join:
                 description="Join customers with their orders"
             )
             result = join_op.transform(customers_data, context)
+
+        Force a sort-merge join (inputs not yet sorted on the key are sorted
+        first)::
+
+            join_op = Join(
+                name="events_sessions",
+                right_data=sessions,
+                on="session_id",
+                strategy="sort_merge",
+            )
+            result = join_op.transform(events, context)
+            print(join_op.last_stats)
+
+        Reuse the right-side hash index across calls while a lookup table
+        is unchanged::
+
+            join_op = Join(
+                name="enrich",
+                right_data=regions,
+                on="region",
+                strategy="broadcast_hash",
+                right_version=regions_etag,
+            )
     """
 
     def __init__(
@@ -52,6 +108,13 @@ class Join:
         left_suffix: str = "_x",
         right_suffix: str = "_y",
         description: str | None = None,
+        backend: str | None = None,
+        strategy: str | JoinStrategy = JoinStrategy.BACKEND,
+        broadcast_threshold: int = 100_000,
+        spill_threshold: int = 5_000_000,
+        spill_partitions: int = 16,
+        spill_dir: str | Path | None = None,
+        right_version: Any = None,
     ) -> None:
         """
         Initialize a Join transformation.
@@ -67,6 +130,25 @@ class Join:
             left_suffix: Suffix for overlapping left columns
             right_suffix: Suffix for overlapping right columns
             description: Optional description
+            backend: Execution backend (pandas, polars, duckdb); defaults to
+                the pipeline's or the global backend
+            strategy: Join algorithm. "backend" (default) runs the backend's
+                join; "broadcast_hash", "sort_merge" and "grace_hash" force a
+                record-level strategy; "auto" picks one from the input sizes
+                on the pandas backend and defers to native backends
+                otherwise.
+            broadcast_threshold: Largest right side (rows) for which "auto"
+                builds an in-memory hash index of the right side
+            spill_threshold: Combined input rows above which "auto" uses
+                the disk-spilling grace hash join
+            spill_partitions: Number of partitions for the grace hash join
+            spill_dir: Directory for grace hash join spill files (defaults
+                to the system temp dir)
+            right_version: Token identifying the contents of right_data.
+                When set, the broadcast hash join builds the right-side
+                index once and reuses it while right_version is unchanged;
+                change it after modifying right_data in place. None
+                rebuilds the index on every call.
 
         Raises:
             ValueError: If invalid join type or parameters
@@ -77,26 +159,61 @@ class Join:
             except ValueError as e:
                 msg = f"Invalid join type: {how!r}. Must be one of: inner, left, right, full"
                 raise ValueError(msg) from e
+        if isinstance(strategy, str):
+            try:
+                strategy = JoinStrategy(strategy)
+            except ValueError as e:
+                choices = ", ".join(s.value for s in JoinStrategy)
+                msg = f"Invalid join strategy: {strategy!r}. Must be one of: {choices}"
+                raise ValueError(msg) from e
+        if spill_partitions < 1:
+            msg = f"spill_partitions must be at least 1, got {spill_partitions}"
+            raise ValueError(msg)
+
+        # Right-side hash index, reused while right_version is unchanged
+        self._index_lock = threading.Lock()
+        self._index_key: tuple[Any, tuple[str, ...]] | None = None
+        self._index: dict[Any, list[int]] | None = None
 
         self.name = name
         self.right_data = right_data
+        self.right_version = right_version
         self.on = on
         self.how = how
         self.left_suffix = left_suffix
         self.right_suffix = right_suffix
         self.description = description or f"{how.value} join on {on}"
+        self.backend = backend
+        self.strategy = strategy
+        self.broadcast_threshold = broadcast_threshold
+        self.spill_threshold = spill_threshold
+        self.spill_partitions = spill_partitions
+        self.spill_dir = spill_dir
+        self.last_stats: JoinStats | None = None
+
+    @property
+    def right_data(self) -> list[DataRecord]:
+        """Right dataset; assigning a new one drops the cached index."""
+        return self._right_data
+
+    @right_data.setter
+    def right_data(self, value: list[DataRecord]) -> None:
+        with self._index_lock:
+            self._right_data = value
+            self._index = None
+            self._index_key = None
 
     def transform(
         self,
         left_data: list[DataRecord],
-        ctx: Any,  # noqa: ARG002
+        ctx: Any,
     ) -> list[DataRecord]:
         """
         Apply the join transformation.
 
         Args:
             left_data: Left dataset
-            ctx: Pipeline context (unused but required for interface)
+            ctx: Pipeline context (may select the execution backend)
 
         Returns:
             Joined dataset as list of DataRecords
@@ -104,6 +221,7 @@ class Join:
         Raises:
             ValueError: If join columns not found in datasets
         """
+        self.last_stats = None
         if not left_data or not self.right_data:
             # Handle empty datasets
             if self.how == JoinType.INNER:
@@ -116,67 +234,262 @@ class Join:
                 # Return both with nulls for missing columns
                 return left_data + self.right_data
 
-        # Convert to pandas DataFrames
-        left_df = self._records_to_dataframe(left_data)
-        right_df = self._records_to_dataframe(self.right_data)
+        left_rows = [record.data for record in left_data]
+        right_rows = [record.data for record in self.right_data]
 
         # Prepare join parameters
-        left_on, right_on = self._prepare_join_columns(left_df, right_df)
-
-        # Map JoinType to pandas merge how parameter
-        # pandas uses "outer" for full outer join
-        pandas_how = "outer" if self.how == JoinType.FULL else self.how.value
-
-        # Perform the join
-        merged_df = pd.merge(
-            left_df,
-            right_df,
-            left_on=left_on,
-            right_on=right_on,
-            how=pandas_how,
-            suffixes=(self.left_suffix, self.right_suffix),
+        left_on, right_on = self._prepare_join_columns(
+            dataset_columns(left_rows), dataset_columns(right_rows)
+        )
+
+        backend = resolve_backend("join", self, ctx)
+        strategy = self._choose_strategy(backend.name, left_rows, right_rows, left_on, right_on)
+        how = self.how.value
+        start = time.perf_counter()
+        index_reused, index_bytes, spilled_partitions, spilled_bytes = False, 0, 0, 0
+
+        if strategy == JoinStrategy.BACKEND:
+            merged_df = backend.join(self, left_rows, right_rows, left_on, right_on)
+            result = self._dataframe_to_records(merged_df, left_data[0].schema)
+        else:
+            layout = JoinLayout.build(
+                dataset_columns(left_rows),
+                dataset_columns(right_rows),
+                left_on,
+                right_on,
+                self.left_suffix,
+                self.right_suffix,
+            )
+            if strategy == JoinStrategy.BROADCAST_HASH:
+                index, index_reused = self._right_index(right_on)
+                index_bytes = index_size(index)
+                rows = hash_join(left_rows, right_rows, index, layout, how)
+            elif strategy == JoinStrategy.SORT_MERGE:
+                # AUTO only picks sorted inputs; a forced sort-merge sorts them
+                rows = sort_merge_join(
+                    sort_for_merge(left_rows, left_on),
+                    sort_for_merge(right_rows, right_on),
+                    layout,
+                    how,
+                )
+            else:
+                joined, spilled_bytes = grace_hash_join(
+                    left_rows,
+                    right_rows,
+                    layout,
+                    how,
+                    self.spill_partitions,
+                    self.spill_dir,
+                )
+                rows = list(joined)
+                spilled_partitions = self.spill_partitions
+            schema = self._joined_schema(
+                layout, rows, left_data[0].schema, self.right_data[0].schema
+            )
+            result = [DataRecord(data=row, schema=schema) for row in rows]
+
+        self.last_stats = JoinStats(
+            strategy=strategy,
+            join_type=how,
+            left_rows=len(left_rows),
+            right_rows=len(right_rows),
+            output_rows=len(result),
+            index_reused=index_reused,
+            index_bytes=index_bytes,
+            spilled_partitions=spilled_partitions,
+            spilled_bytes=spilled_bytes,
+            duration_seconds=time.perf_counter() - start,
+        )
+        logger.debug(f"Join {self.name!r}: {self.last_stats}")
+        return result
+
+    def _choose_strategy(
+        self,
+        backend_name: str,
+        left_rows: Sequence[Mapping[str, Any]],
+        right_rows: Sequence[Mapping[str, Any]],
+        left_on: list[str],
+        right_on: list[str],
+    ) -> JoinStrategy:
+        """Resolve AUTO to a concrete strategy from the backend and input sizes."""
+        if self.strategy != JoinStrategy.AUTO:
+            return self.strategy
+        if backend_name != "pandas":
+            # Native engines have their own join planners
+            return JoinStrategy.BACKEND
+        if len(right_rows) <= self.broadcast_threshold:
+            return JoinStrategy.BROADCAST_HASH
+        if is_sorted(left_rows, key_function(left_on)) and is_sorted(
+            right_rows, key_function(right_on)
+        ):
+            return JoinStrategy.SORT_MERGE
+        if len(left_rows) + len(right_rows) > self.spill_threshold:
+            return JoinStrategy.GRACE_HASH
+        return JoinStrategy.BACKEND
+
+    def _right_index(self, right_on: list[str]) -> tuple[dict[Any, list[int]], bool]:
+        """Get the right-side hash index, reusing it while right_version is unchanged."""
+        rows = [record.data for record in self.right_data]
+        if self.right_version is None:
+            return build_hash_index(rows, key_function(right_on)), False
+        key = (self.right_version, tuple(right_on))
+        with self._index_lock:
+            if self._index is not None and self._index_key == key:
+                return self._index, True
+            self._index = build_hash_index(rows, key_function(right_on))
+            self._index_key = key
+            return self._index, False
+
+    def transform_chunks(
+        self,
+        left_chunks: Iterable[Sequence[DataRecord]],
+        ctx: Any = None,  # noqa: ARG002
+    ) -> Iterator[list[DataRecord]]:
+        """
+        Join a left dataset delivered in chunks, streaming the output.
+
+        Uses the grace hash join: the left chunks and the right data are
+        spilled to hash partitions on disk as they are read, then joined
+        one partition at a time. Only one partition is in memory at once,
+        so the left side may be larger than memory. Output is grouped by
+        partition and the spill files are removed once it is consumed.
+
+        Args:
+            left_chunks: Chunks of left records (e.g. a FileReaderIterator)
+            ctx: Pipeline context
+
+        Yields:
+            Joined records of one partition at a time
+
+        Raises:
+            ValueError: If join columns not found in datasets
+        """
+        self.last_stats = None
+        how = self.how
+        if not self.right_data:
+            if how in (JoinType.LEFT, JoinType.FULL):
+                yield from (list(chunk) for chunk in left_chunks if chunk)
+            return
+
+        left_schemas: list[Schema] = []
+        left_count = 0
+
+        def left_rows() -> Iterator[Mapping[str, Any]]:
+            nonlocal left_count
+            for chunk in left_chunks:
+                if chunk and not left_schemas:
+                    left_schemas.append(chunk[0].schema)
+                left_count += len(chunk)
+                for record in chunk:
+                    yield record.data
+
+        right_schema = self.right_data[0].schema
+        key_left, key_right = self._key_columns()
+        start = time.perf_counter()
+        output_rows = 0
+        with GraceHashJoin(key_left, key_right, self.spill_partitions, self.spill_dir) as grace:
+            left_columns = grace.spill_left(left_rows())
+            if not left_count:
+                if how in (JoinType.RIGHT, JoinType.FULL):
+                    yield list(self.right_data)
+                return
+            right_columns = grace.spill_right(record.data for record in self.right_data)
+            left_on, right_on = self._prepare_join_columns(left_columns, right_columns)
+            layout = JoinLayout.build(
+                left_columns, right_columns, left_on, right_on, self.left_suffix, self.right_suffix
+            )
+            for rows in grace.join(layout, how.value):
+                schema = self._joined_schema(layout, rows, left_schemas[0], right_schema)
+                output_rows += len(rows)
+                yield [DataRecord(data=row, schema=schema) for row in rows]
+            spilled_bytes = grace.spilled_bytes
+
+        self.last_stats = JoinStats(
+            strategy=JoinStrategy.GRACE_HASH,
+            join_type=how.value,
+            left_rows=left_count,
+            right_rows=len(self.right_data),
+            output_rows=output_rows,
+            spilled_partitions=self.spill_partitions,
+            spilled_bytes=spilled_bytes,
+            duration_seconds=time.perf_counter() - start,
         )
+        logger.debug(f"Join {self.name!r}: {self.last_stats}")
 
-        # Convert back to DataRecords
-        return self._dataframe_to_records(merged_df, left_data[0].schema)
+    def _key_columns(self) -> tuple[list[str], list[str]]:
+        """Left and right join keys named by `on` (not validated)."""
+        if isinstance(self.on, str):
+            return [self.on], [self.on]
+        if isinstance(self.on, tuple):
+            return [self.on[0]], [self.on[1]]
+        return self.on, self.on
 
-    def _records_to_dataframe(self, records: list[DataRecord]) -> pd.DataFrame:
-        """Convert DataRecords to pandas DataFrame."""
-        data = [record.data for record in records]
-        return pd.DataFrame(data)
+    def _joined_schema(
+        self,
+        layout: JoinLayout,
+        rows: list[dict[str, Any]],
+        left_schema: Schema,
+        right_schema: Schema,
+    ) -> Schema:
+        """Build the output schema of a record-level join."""
+        fields = []
+        for col in layout.columns:
+            field = left_schema.get_field(col) or right_schema.get_field(col)
+            if field:
+                fields.append(
+                    SchemaField(
+                        name=field.name,
+                        data_type=field.data_type,
+                        required=False,  # Joins can introduce NULLs
+                        nullable=True,
+                        description=field.description,
+                        constraints=field.constraints,
+                    )
+                )
+            else:
+                sample = next((row[col] for row in rows if row[col] is not None), None)
+                fields.append(
+                    SchemaField(
+                        name=col,
+                        data_type=_value_data_type(sample),
+                        required=False,
+                        nullable=True,
+                    )
+                )
+        return Schema(name=f"{left_schema.name}_joined", fields=tuple(fields))
 
     def _prepare_join_columns(
         self,
-        left_df: pd.DataFrame,
-        right_df: pd.DataFrame,
+        left_columns: list[str],
+        right_columns: list[str],
     ) -> tuple[list[str], list[str]]:
-        """Prepare join columns for pandas merge."""
+        """Resolve and validate the left and right join columns."""
         if isinstance(self.on, str):
             # Single column with same name
-            if self.on not in left_df.columns:
+            if self.on not in left_columns:
                 msg = f"Join column '{self.on}' not found in left dataset"
                 raise ValueError(msg)
-            if self.on not in right_df.columns:
+            if self.on not in right_columns:
                 msg = f"Join column '{self.on}' not found in right dataset"
                 raise ValueError(msg)
             return [self.on], [self.on]
         elif isinstance(self.on, list):
             # Multiple columns with same names
             for col in self.on:
-                if col not in left_df.columns:
+                if col not in left_columns:
                     msg = f"Join column '{col}' not found in left dataset"
                     raise ValueError(msg)
-                if col not in right_df.columns:
+                if col not in right_columns:
                     msg = f"Join column '{col}' not found in right dataset"
                     raise ValueError(msg)
             return self.on, self.on
         elif isinstance(self.on, tuple):
             # Different column names
             left_col, right_col = self.on
-            if left_col not in left_df.columns:
+            if left_col not in left_columns:
                 msg = f"Join column '{left_col}' not found in left dataset"
                 raise ValueError(msg)
-            if right_col not in right_df.columns:
+            if right_col not in right_columns:
                 msg = f"Join column '{right_col}' not found in right dataset"
                 raise ValueError(msg)
             return [left_col], [right_col]
@@ -193,13 +506,9 @@ class Join:
         # Create new schema based on merged columns
         new_fields = []
         for col in df.columns:
-            # Infer data type from pandas dtype
-            dtype = self._infer_data_type(df[col].dtype)
             field = original_schema.get_field(col)
             if field:
                 # Make field nullable for joins (can introduce NULLs)
-                from vibe_piper.types import SchemaField
-
                 new_fields.append(
                     SchemaField(
                         name=field.name,
@@ -211,9 +520,8 @@ class Join:
                     )
                 )
             else:
-                # Create new field (nullable for joins)
-                from vibe_piper.types import SchemaField
-
+                # Create new field (nullable for joins), typed from the pandas dtype
+                dtype = self._infer_data_type(df[col].dtype)
                 new_fields.append(
                     SchemaField(name=col, data_type=dtype, required=False, nullable=True)
                 )
@@ -223,16 +531,12 @@ class Join:
             fields=tuple(new_fields),
         )
 
-        # Convert each row to DataRecord
-        records = []
-        for _, row in df.iterrows():
-            # Handle NaN values (replace with None)
-            data = {col: (val if pd.notna(val) else None) for col, val in row.items()}
-            records.append(DataRecord(data=data, schema=new_schema))
+        # Replace NaN/NaT with None, then convert all rows at once
+        df = df.astype(object).where(df.notna(), None)
+        rows = cast(list[dict[str, Any]], df.to_dict("records"))
+        return [DataRecord(data=row, schema=new_schema) for row in rows]
 
-        return records
-
-    def _infer_data_type(self, dtype: pd.dtype) -> DataType:  # type: ignore[name-defined]
+    def _infer_data_type(self, dtype: np.dtype[Any] | ExtensionDtype) -> DataType:
         """Infer DataType from pandas dtype."""
         if pd.api.types.is_integer_dtype(dtype):
             return DataType.INTEGER
@@ -262,10 +566,26 @@ class Join:
                 "on": self.on,
                 "left_suffix": self.left_suffix,
                 "right_suffix": self.right_suffix,
+                "strategy": self.strategy.value,
             },
         )
 
 
+def _value_data_type(value: Any) -> DataType:
+    """Infer DataType from a Python value."""
+    if isinstance(value, bool):
+        return DataType.BOOLEAN
+    if isinstance(value, int):
+        return DataType.INTEGER
+    if isinstance(value, float):
+        return DataType.FLOAT
+    if isinstance(value, datetime):
+        return DataType.DATETIME
+    if isinstance(value, date):
+        return DataType.DATE
+    return DataType.STRING
+
+
 def join(
     left: list[DataRecord],
     right: list[DataRecord],
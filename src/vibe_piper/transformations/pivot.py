@@ -3,14 +3,165 @@ Pivot and unpivot transformation operators.
 
 Provides data reshaping operations including pivot (rows to columns)
 and unpivot/melt (columns to rows).
+
+Besides the backend (DataFrame) path, both operators have a columnar path
+that works directly on chunks, given as record lists or column batches
+(mappings of column name to values). A columnar pivot keeps one sparse
+aggregation state per non-empty cell, and can emit sparse records that
+omit empty cells. With a declared (or sampled) label domain, every
+chunk of a streaming pivot gets the same columns.
 """
 
-from collections.abc import Callable
+import math
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 import pandas as pd
 
-from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema
+from vibe_piper.transformations.backends import resolve_backend
+from vibe_piper.transformations.backends.base import ColumnBatch, dataset_columns
+from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema, SchemaField
+
+_MISSING: Any = object()
+
+# Aggregations the columnar pivot keeps as running states
+_NATIVE_AGGFUNCS = frozenset({"sum", "count", "mean", "min", "max", "first", "last"})
+
+
+# =============================================================================
+# Columnar Helpers
+# =============================================================================
+
+
+def _is_missing(value: Any) -> bool:
+    """None or NaN (pandas drops both when pivoting)."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _sorted_labels(labels: Iterable[Any]) -> list[Any]:
+    """Sort labels as pandas does, falling back to string order for mixed types."""
+    labels = list(labels)
+    try:
+        return sorted(labels)
+    except TypeError:
+        return sorted(labels, key=str)
+
+
+def _chunk_columns(
+    chunk: Sequence[DataRecord] | ColumnBatch,
+) -> tuple[list[str], Schema | None]:
+    """Column names and schema (None for column batches) of a chunk."""
+    if isinstance(chunk, Mapping):
+        return list(chunk), None
+    rows = [record.data for record in chunk]
+    return dataset_columns(rows), (chunk[0].schema if chunk else None)
+
+
+def _column(chunk: Sequence[DataRecord] | ColumnBatch, name: str) -> Sequence[Any]:
+    """One column of a chunk."""
+    if isinstance(chunk, Mapping):
+        return chunk[name]
+    return [record.data.get(name) for record in chunk]
+
+
+def _chunk_length(chunk: Sequence[DataRecord] | ColumnBatch) -> int:
+    if isinstance(chunk, Mapping):
+        return len(next(iter(chunk.values()), ()))
+    return len(chunk)
+
+
+class _PivotCells:
+    """
+    Sparse aggregation states of a pivot, one per non-empty cell.
+
+    Rows are keyed by index tuple (in first-seen order), cells by label.
+    """
+
+    def __init__(self, aggfunc: str | Callable[[pd.Series], Any]) -> None:
+        self.aggfunc = aggfunc
+        self.native = aggfunc if isinstance(aggfunc, str) and aggfunc in _NATIVE_AGGFUNCS else None
+        self.rows: dict[tuple[Any, ...], dict[Any, Any]] = {}
+
+    def add(
+        self,
+        keys: Iterable[tuple[Any, ...]],
+        labels: Sequence[Any],
+        values: Sequence[Any],
+        domain: Mapping[Any, int] | None,
+        strict: bool,
+    ) -> None:
+        """Fold one chunk of (index key, label, value) triples into the states."""
+        rows = self.rows
+        native = self.native
+        for key, label, value in zip(keys, labels, values, strict=True):
+            if _is_missing(label) or _is_missing(value) or any(_is_missing(k) for k in key):
+                continue
+            if domain is not None and label not in domain:
+                if strict:
+                    msg = (
+                        f"Pivot label {label!r} is not in the domain sampled from the "
+                        f"first chunk; declare the domain to pivot this stream"
+                    )
+                    raise ValueError(msg)
+                continue
+
+            cells = rows.get(key)
+            if cells is None:
+                cells = rows[key] = {}
+            state = cells.get(label, _MISSING)
+            if native == "sum":
+                cells[label] = value if state is _MISSING else state + value
+            elif native == "count":
+                cells[label] = 1 if state is _MISSING else state + 1
+            elif native == "min":
+                cells[label] = value if state is _MISSING or value < state else state
+            elif native == "max":
+                cells[label] = value if state is _MISSING or value > state else state
+            elif native == "first":
+                if state is _MISSING:
+                    cells[label] = value
+            elif native == "last":
+                cells[label] = value
+            elif state is _MISSING:
+                cells[label] = [value, 1] if native == "mean" else [value]
+            elif native == "mean":
+                state[0] += value
+                state[1] += 1
+            else:
+                state.append(value)
+
+    def results(self, keys: Sequence[tuple[Any, ...]]) -> list[dict[Any, Any]]:
+        """
+        Final cell values of the given rows, as one label -> value mapping per key.
+
+        Other aggregations keep each cell's values and reduce them here with
+        one grouped pandas aggregation per column, not one Series per cell.
+        """
+        if self.native == "mean":
+            return [
+                {label: state[0] / state[1] for label, state in self.rows[key].items()}
+                for key in keys
+            ]
+        if self.native is not None:
+            return [dict(self.rows[key]) for key in keys]
+
+        results: list[dict[Any, Any]] = [{} for _ in keys]
+        columns: dict[Any, tuple[list[int], list[Any]]] = {}
+        for i, key in enumerate(keys):
+            for label, values in self.rows[key].items():
+                positions, column = columns.setdefault(label, ([], []))
+                positions.extend([i] * len(values))
+                column.extend(values)
+        for label, (positions, column) in columns.items():
+            reduced = pd.Series(column).groupby(positions, sort=False).agg(self.aggfunc)
+            for row, value in zip(reduced.index.tolist(), reduced.tolist(), strict=True):
+                results[row][label] = value
+        return results
+
+
+# =============================================================================
+# Pivot
+# =============================================================================
 
 
 class Pivot:
@@ -32,6 +183,21 @@ class Pivot:
                 description="Pivot sales by month"
             )
             result = pivot_op.transform(data, context)
+
+        Pivot a wide feature matrix chunk by chunk, with a fixed set of
+        columns and without materializing empty cells::
+
+            pivot_op = Pivot(
+                name="features",
+                index="user_id",
+                columns="feature",
+                values="value",
+                aggfunc="sum",
+                domain=feature_names,
+                sparse=True,
+            )
+            for chunk in pivot_op.transform_stream(read_chunks_by_user()):
+                write(chunk)
     """
 
     def __init__(
@@ -43,6 +209,9 @@ class Pivot:
         aggfunc: str | Callable[[pd.Series], Any] = "mean",  # type: ignore[name-defined]
         fill_value: Any = None,
         description: str | None = None,
+        backend: str | None = None,
+        domain: Sequence[Any] | None = None,
+        sparse: bool = False,
     ) -> None:
         """
         Initialize a Pivot transformation.
@@ -55,6 +224,15 @@ class Pivot:
             aggfunc: Aggregation function ('mean', 'sum', 'count', etc.)
             fill_value: Value to fill NaN with
             description: Optional description
+            backend: Execution backend (pandas, polars, duckdb); defaults to
+                the pipeline's or the global backend
+            domain: Pivot labels to produce columns for, in output order.
+                Every label gets a column, even if no row has it; rows
+                with other labels are ignored. Setting a domain (or
+                sparse) runs the columnar pivot.
+            sparse: Omit empty cells from output records instead of
+                storing fill_value in them; read them with
+                ``record.get(label, fill_value)``
         """
         self.name = name
         self.index = [index] if isinstance(index, str) else index
@@ -63,11 +241,14 @@ class Pivot:
         self.aggfunc = aggfunc
         self.fill_value = fill_value
         self.description = description or f"Pivot on {self.index} x {self.columns}"
+        self.backend = backend
+        self.domain = list(domain) if domain is not None else None
+        self.sparse = sparse
 
     def transform(
         self,
         data: list[DataRecord],
-        ctx: Any,  # noqa: ARG002
+        ctx: Any,
     ) -> list[DataRecord]:
         """
         Apply pivot transformation.
@@ -85,53 +266,256 @@ class Pivot:
         if not data:
             return []
 
-        # Convert to DataFrame
-        df = pd.DataFrame([record.data for record in data])
+        if self.domain is not None or self.sparse:
+            return self.transform_chunks([data], ctx)
+
+        rows = [record.data for record in data]
+        values_cols = self._resolve_values(dataset_columns(rows))
 
-        # Validate columns
+        # Perform pivot on the selected backend
+        pivot_df = resolve_backend("pivot", self, ctx).pivot(self, rows, values_cols)
+
+        # Convert back to DataRecords
+        return self._dataframe_to_records(pivot_df, data[0].schema)
+
+    def _resolve_values(self, columns: list[str]) -> str | None:
+        """
+        Validate the dataset's columns and resolve the values column.
+
+        Raises:
+            ValueError: If columns not found
+        """
         for col in self.index:
-            if col not in df.columns:
+            if col not in columns:
                 msg = f"Index column '{col}' not found in dataset"
                 raise ValueError(msg)
 
-        if self.columns not in df.columns:
+        if self.columns not in columns:
             msg = f"Columns column '{self.columns}' not found in dataset"
             raise ValueError(msg)
 
         # Determine values column(s)
-        values_cols: str | list[str] | None
+        values_cols: str | None
         if isinstance(self.values, str):
-            if self.values not in df.columns:
+            if self.values not in columns:
                 msg = f"Values column '{self.values}' not found in dataset"
                 raise ValueError(msg)
             values_cols = self.values
         elif callable(self.values):
             # Use all non-index, non-columns columns
-            temp_values = [
-                col for col in df.columns if col not in self.index and col != self.columns
-            ]
+            temp_values = [col for col in columns if col not in self.index and col != self.columns]
             if len(temp_values) != 1:
                 msg = "When values is callable, DataFrame must have exactly one value column"
                 raise ValueError(msg)
             values_cols = temp_values[0]
         else:
             values_cols = None
+        return values_cols
 
-        # Perform pivot
-        pivot_df = df.pivot_table(
-            index=self.index,
-            columns=self.columns,
-            values=values_cols,
-            aggfunc=self.aggfunc,
-            fill_value=self.fill_value,
-        )
+    # -- columnar pivot -----------------------------------------------------
 
-        # Flatten column names
-        pivot_df.columns = [str(col) for col in pivot_df.columns]
-        pivot_df = pivot_df.reset_index()
+    def sample_domain(
+        self,
+        data: Sequence[DataRecord] | ColumnBatch,
+        max_rows: int | None = None,
+    ) -> list[Any]:
+        """
+        Collect the pivot labels that occur in a sample of the data.
 
-        # Convert back to DataRecords
-        return self._dataframe_to_records(pivot_df, data[0].schema)
+        Args:
+            data: Records or a column batch
+            max_rows: Only look at the first max_rows rows
+
+        Returns:
+            Sorted distinct non-null labels
+
+        Example:
+            Fix the output columns from a sample before streaming::
+
+                pivot_op.domain = pivot_op.sample_domain(first_chunk)
+        """
+        labels = _column(data, self.columns)
+        if max_rows is not None:
+            labels = labels[:max_rows]
+        return _sorted_labels({label for label in labels if not _is_missing(label)})
+
+    def _accumulate(
+        self,
+        chunk: Sequence[DataRecord] | ColumnBatch,
+        cells: _PivotCells,
+        domain: Mapping[Any, int] | None,
+        strict: bool = False,
+    ) -> Schema | None:
+        """Fold one chunk into the cell states; returns the chunk's schema."""
+        columns, schema = _chunk_columns(chunk)
+        values_col = self._resolve_values(columns)
+        if values_col is None:
+            msg = "The columnar pivot requires a single values column"
+            raise ValueError(msg)
+
+        keys = zip(*(_column(chunk, col) for col in self.index), strict=True)
+        cells.add(keys, _column(chunk, self.columns), _column(chunk, values_col), domain, strict)
+        return schema
+
+    def transform_chunks(
+        self,
+        chunks: Iterable[Sequence[DataRecord] | ColumnBatch],
+        ctx: Any = None,  # noqa: ARG002
+    ) -> list[DataRecord]:
+        """
+        Pivot a dataset delivered in chunks, without building a DataFrame.
+
+        Chunks are folded into one sparse aggregation state per non-empty
+        cell, so memory grows with the number of filled cells rather than
+        rows x labels. Rows are sorted by index key and columns follow the
+        domain (sorted labels when no domain is declared), as in
+        transform().
+
+        Args:
+            chunks: Record lists or column batches
+            ctx: Pipeline context
+
+        Returns:
+            Pivoted dataset (wide format)
+
+        Raises:
+            ValueError: If columns not found
+        """
+        cells = _PivotCells(self.aggfunc)
+        domain = {label: i for i, label in enumerate(self.domain)} if self.domain else None
+        schema: Schema | None = None
+        for chunk in chunks:
+            if not _chunk_length(chunk):
+                continue
+            chunk_schema = self._accumulate(chunk, cells, domain)
+            schema = schema or chunk_schema
+
+        if not cells.rows:
+            return []
+        if self.domain is not None:
+            labels = self.domain
+        else:
+            labels = _sorted_labels({label for row in cells.rows.values() for label in row})
+        keys = _sorted_labels(cells.rows)
+        return self._cells_to_records(cells, keys, labels, self._pivot_schema(labels, schema))
+
+    def transform_stream(
+        self,
+        chunks: Iterable[Sequence[DataRecord] | ColumnBatch],
+        ctx: Any = None,  # noqa: ARG002
+    ) -> Iterator[list[DataRecord]]:
+        """
+        Pivot a stream of chunks grouped by index, one output chunk per input chunk.
+
+        Rows of each index key must be contiguous in the stream (e.g.
+        sorted by the index columns); a key may span chunk boundaries.
+        Only the rows of the current chunk are held in memory. Every
+        output chunk has the same schema: the columns of the declared
+        domain or, without one, of the labels in the first chunk.
+
+        Args:
+            chunks: Record lists or column batches, contiguous by index
+            ctx: Pipeline context
+
+        Yields:
+            Pivoted chunks (possibly empty), rows in input order
+
+        Raises:
+            ValueError: If an index key reappears after another key, or a
+                label is missing from a domain sampled from the first chunk
+        """
+        cells = _PivotCells(self.aggfunc)
+        labels = self.domain
+        domain: dict[Any, int] | None = None
+        schema: Schema | None = None
+        emitted: set[tuple[Any, ...]] = set()
+
+        for chunk in chunks:
+            if not _chunk_length(chunk):
+                yield []
+                continue
+            if labels is None:
+                labels = self.sample_domain(chunk)
+                strict = True
+            else:
+                strict = self.domain is None
+            if domain is None:
+                domain = {label: i for i, label in enumerate(labels)}
+
+            first_seen = len(cells.rows)
+            chunk_schema = self._accumulate(chunk, cells, domain, strict)
+            if schema is None:
+                schema = self._pivot_schema(labels, chunk_schema)
+
+            keys = list(cells.rows)
+            reappeared = emitted.intersection(keys[first_seen:])
+            if reappeared:
+                msg = (
+                    f"Index key {next(iter(reappeared))} reappeared in the stream; "
+                    f"transform_stream requires input grouped by {self.index}"
+                )
+                raise ValueError(msg)
+
+            # The last key may continue in the next chunk
+            done = keys[:-1]
+            yield self._cells_to_records(cells, done, labels, schema)
+            for key in done:
+                del cells.rows[key]
+            emitted.update(done)
+
+        if cells.rows and labels is not None and schema is not None:
+            yield self._cells_to_records(cells, list(cells.rows), labels, schema)
+
+    def _cells_to_records(
+        self,
+        cells: _PivotCells,
+        keys: Sequence[tuple[Any, ...]],
+        labels: Sequence[Any],
+        schema: Schema,
+    ) -> list[DataRecord]:
+        """Build output records for the given index keys."""
+        names = [str(label) for label in labels]
+        position = {label: i for i, label in enumerate(labels)}
+        records = []
+        for key, row in zip(keys, cells.results(keys), strict=True):
+            data = dict(zip(self.index, key, strict=True))
+            if self.sparse:
+                for label in sorted(row, key=position.__getitem__):
+                    data[names[position[label]]] = row[label]
+            else:
+                for label, name in zip(labels, names, strict=True):
+                    data[name] = row.get(label, self.fill_value)
+            records.append(DataRecord(data=data, schema=schema))
+        return records
+
+    def _pivot_schema(self, labels: Sequence[Any], original_schema: Schema | None) -> Schema:
+        """Schema of columnar pivot output: index fields, then one field per label."""
+        original = original_schema or Schema(name=self.name)
+        fields = []
+        for col in self.index:
+            fields.append(
+                original.get_field(col) or SchemaField(name=col, data_type=DataType.STRING)
+            )
+
+        values_field = original.get_field(self.values) if isinstance(self.values, str) else None
+        if self.aggfunc == "count":
+            dtype = DataType.INTEGER
+        elif self.aggfunc == "mean":
+            dtype = DataType.FLOAT
+        elif self.aggfunc in ("first", "last") and values_field is not None:
+            dtype = values_field.data_type
+        elif values_field is not None and values_field.data_type in (
+            DataType.INTEGER,
+            DataType.FLOAT,
+        ):
+            dtype = values_field.data_type
+        else:
+            dtype = DataType.FLOAT
+        fields.extend(
+            SchemaField(name=str(label), data_type=dtype, required=False, nullable=True)
+            for label in labels
+        )
+        return Schema(name=f"{original.name}_pivoted", fields=tuple(fields))
 
     def _dataframe_to_records(
         self,
@@ -139,8 +523,6 @@ class Pivot:
         original_schema: Schema,
     ) -> list[DataRecord]:
         """Convert DataFrame to DataRecords."""
-        from vibe_piper.types import SchemaField
-
         # Create new schema
         new_fields = []
 
@@ -199,6 +581,11 @@ class Pivot:
         )
 
 
+# =============================================================================
+# Unpivot
+# =============================================================================
+
+
 class Unpivot:
     """
     Unpivot transformation - converts columns to rows.
@@ -229,6 +616,8 @@ class Unpivot:
         var_name: str = "variable",
         value_name: str = "value",
         description: str | None = None,
+        backend: str | None = None,
+        dropna: bool = False,
     ) -> None:
         """
         Initialize an Unpivot transformation.
@@ -240,6 +629,10 @@ class Unpivot:
             var_name: Name for the variable column
             value_name: Name for the value column
             description: Optional description
+            backend: Execution backend (pandas, polars, duckdb); defaults to
+                the pipeline's or the global backend
+            dropna: Skip null values (and cells missing from sparse
+                records); runs the columnar unpivot
         """
         self.name = name
         self.id_vars = [id_vars] if isinstance(id_vars, str) else id_vars
@@ -247,11 +640,13 @@ class Unpivot:
         self.var_name = var_name
         self.value_name = value_name
         self.description = description or f"Unpivot on {self.id_vars}"
+        self.backend = backend
+        self.dropna = dropna
 
     def transform(
         self,
         data: list[DataRecord],
-        ctx: Any,  # noqa: ARG002
+        ctx: Any,
     ) -> list[DataRecord]:
         """
         Apply unpivot transformation.
@@ -269,25 +664,79 @@ class Unpivot:
         if not data:
             return []
 
-        # Convert to DataFrame
-        df = pd.DataFrame([record.data for record in data])
+        if self.dropna:
+            return [record for chunk in self.transform_stream([data], ctx) for record in chunk]
+
+        rows = [record.data for record in data]
+        self._check_columns(dataset_columns(rows))
+
+        # Perform unpivot (melt) on the selected backend
+        melted_df = resolve_backend("unpivot", self, ctx).unpivot(self, rows)
+
+        # Convert back to DataRecords
+        return self._dataframe_to_records(melted_df, data[0].schema)
 
-        # Validate id columns
+    def _check_columns(self, columns: list[str]) -> None:
+        """
+        Validate the id columns.
+
+        Raises:
+            ValueError: If id columns not found
+        """
         for col in self.id_vars:
-            if col not in df.columns:
+            if col not in columns:
                 msg = f"ID column '{col}' not found in dataset"
                 raise ValueError(msg)
 
-        # Perform unpivot (melt)
-        melted_df = df.melt(
-            id_vars=self.id_vars,
-            value_vars=self.value_vars,
-            var_name=self.var_name,
-            value_name=self.value_name,
-        )
+    def transform_stream(
+        self,
+        chunks: Iterable[Sequence[DataRecord] | ColumnBatch],
+        ctx: Any = None,  # noqa: ARG002
+    ) -> Iterator[list[DataRecord]]:
+        """
+        Unpivot a stream of chunks, one output chunk per input chunk.
 
-        # Convert back to DataRecords
-        return self._dataframe_to_records(melted_df, data[0].schema)
+        Works directly on the chunk's columns, without building a
+        DataFrame. As with melt, each chunk's output lists every row for
+        the first value column, then every row for the next.
+
+        Args:
+            chunks: Record lists or column batches
+            ctx: Pipeline context
+
+        Yields:
+            Unpivoted chunks (possibly empty)
+
+        Raises:
+            ValueError: If id columns not found
+        """
+        schema: Schema | None = None
+        for chunk in chunks:
+            if not _chunk_length(chunk):
+                yield []
+                continue
+            columns, chunk_schema = _chunk_columns(chunk)
+            self._check_columns(columns)
+            if schema is None:
+                schema = self._result_schema(chunk_schema or Schema(name=self.name))
+
+            value_vars = self.value_vars
+            if value_vars is None:
+                value_vars = [col for col in columns if col not in self.id_vars]
+            ids = [
+                dict(zip(self.id_vars, key, strict=True))
+                for key in zip(*(_column(chunk, col) for col in self.id_vars), strict=True)
+            ]
+
+            records = []
+            for var in value_vars:
+                values = _column(chunk, var) if var in columns else [None] * len(ids)
+                for base, value in zip(ids, values, strict=True):
+                    if self.dropna and _is_missing(value):
+                        continue
+                    data = {**base, self.var_name: var, self.value_name: value}
+                    records.append(DataRecord(data=data, schema=schema))
+            yield records
 
     def _dataframe_to_records(
         self,
@@ -295,8 +744,18 @@ class Unpivot:
         original_schema: Schema,
     ) -> list[DataRecord]:
         """Convert DataFrame to DataRecords."""
-        from vibe_piper.types import SchemaField
+        new_schema = self._result_schema(original_schema)
+
+        # Convert rows to DataRecords
+        records = []
+        for _, row in df.iterrows():
+            data = {col: val for col, val in row.items()}
+            records.append(DataRecord(data=data, schema=new_schema))
 
+        return records
+
+    def _result_schema(self, original_schema: Schema) -> Schema:
+        """Build the schema of unpivoted records."""
         # Create new schema
         new_fields = []
 
@@ -313,22 +772,16 @@ class Unpivot:
         # Variable column (string)
         new_fields.append(SchemaField(name=self.var_name, data_type=DataType.STRING))
 
-        # Value column (float or string)
-        new_fields.append(SchemaField(name=self.value_name, data_type=DataType.FLOAT))
+        # Value column (float or string; null where the wide cell was empty)
+        new_fields.append(
+            SchemaField(name=self.value_name, data_type=DataType.FLOAT, nullable=True)
+        )
 
-        new_schema = Schema(
+        return Schema(
             name=f"{original_schema.name}_unpivoted",
             fields=tuple(new_fields),
         )
 
-        # Convert rows to DataRecords
-        records = []
-        for _, row in df.iterrows():
-            data = {col: val for col, val in row.items()}
-            records.append(DataRecord(data=data, schema=new_schema))
-
-        return records
-
     def _infer_dtype_from_name(self, col: str) -> DataType:
         """Infer dtype from column name (basic heuristic)."""
         col_lower = col.lower()
@@ -0,0 +1,483 @@
+"""
+Logical plans for transformation pipelines.
+
+The TransformationBuilder records each step as a PlanStep instead of running
+it immediately. Before execution the plan is rewritten by a small rule-based
+optimizer:
+
+- adjacent windows with the same partitioning and ordering are merged so the
+  data is converted and sorted once
+- filters are pushed below joins, windows and groupbys when the columns they
+  read are unaffected by those steps
+- repeated filters are dropped
+- columns that no later step reads are pruned as early as possible (including
+  the right side of joins)
+- consecutive filter/map/project steps are fused into a single pass
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any
+
+from vibe_piper.types import DataRecord, Schema
+
+# =============================================================================
+# Plan Steps
+# =============================================================================
+
+
+class StepKind(str, Enum):
+    """Kind of a logical plan step."""
+
+    FILTER = "filter"
+    MAP = "map"
+    PROJECT = "project"
+    FUSED = "fused"
+    JOIN = "join"
+    GROUPBY = "groupby"
+    WINDOW = "window"
+    PIVOT = "pivot"
+    UNPIVOT = "unpivot"
+    CUSTOM = "custom"
+
+
+# Steps that operate on one record at a time and can share a single pass
+RECORD_STEP_KINDS = frozenset({StepKind.FILTER, StepKind.MAP, StepKind.PROJECT})
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """
+    A single step of a logical transformation plan.
+
+    Attributes:
+        kind: Kind of step
+        label: Human-readable description used by explain()
+        fn: Record predicate (FILTER), record function (MAP, PROJECT) or
+            dataset function (FUSED, CUSTOM); unused for operator steps
+        operator: Transformation operator with a ``transform(data, ctx)``
+            method (JOIN, GROUPBY, WINDOW, PIVOT, UNPIVOT)
+        reads: Columns the step reads, or None if unknown
+        columns: Columns kept by a PROJECT step
+        steps: Steps combined into a FUSED step
+        key: Hashable identity of a filter, used to drop repeated filters
+    """
+
+    kind: StepKind
+    label: str
+    fn: Callable[..., Any] | None = None
+    operator: Any = None
+    reads: frozenset[str] | None = None
+    columns: tuple[str, ...] = ()
+    steps: tuple["PlanStep", ...] = ()
+    key: tuple[Any, ...] | None = None
+
+    def apply(self, data: list[DataRecord], ctx: Any) -> list[DataRecord]:
+        """
+        Apply this step to a dataset.
+
+        Args:
+            data: Input dataset
+            ctx: Pipeline context passed to operator steps
+
+        Returns:
+            Transformed dataset
+        """
+        fn = self.fn
+        result: list[DataRecord]
+        if fn is None:
+            result = self.operator.transform(data, ctx)
+        elif self.kind == StepKind.FILTER:
+            result = [record for record in data if fn(record)]
+        elif self.kind in (StepKind.MAP, StepKind.PROJECT):
+            result = [fn(record) for record in data]
+        else:
+            result = fn(data)
+        return result
+
+
+def project_step(columns: Sequence[str]) -> PlanStep:
+    """
+    Create a step that keeps only the given columns.
+
+    Records are re-created with a schema restricted to the kept columns so
+    they still validate. Pruned schemas are cached per input schema.
+
+    Args:
+        columns: Columns to keep
+
+    Returns:
+        PROJECT plan step
+    """
+    kept = tuple(sorted(set(columns)))
+    keep = frozenset(kept)
+    pruned_schemas: dict[int, tuple[Schema, Schema]] = {}
+
+    def project(record: DataRecord) -> DataRecord:
+        entry = pruned_schemas.get(id(record.schema))
+        if entry is None or entry[0] is not record.schema:
+            fields = tuple(f for f in record.schema.fields if f.name in keep)
+            entry = (record.schema, replace(record.schema, fields=fields))
+            pruned_schemas[id(record.schema)] = entry
+        return DataRecord(
+            data={k: v for k, v in record.data.items() if k in keep},
+            schema=entry[1],
+            metadata=record.metadata,
+        )
+
+    return PlanStep(
+        kind=StepKind.PROJECT,
+        label=f"project({', '.join(kept)})",
+        fn=project,
+        reads=keep,
+        columns=kept,
+    )
+
+
+# =============================================================================
+# Optimizer
+# =============================================================================
+
+
+def optimize_plan(steps: Sequence[PlanStep]) -> list[PlanStep]:
+    """
+    Optimize a logical plan.
+
+    The optimized plan produces the same records as the original plan.
+
+    Args:
+        steps: Logical plan steps in execution order
+
+    Returns:
+        Optimized plan steps
+
+    Example:
+        Inspect an optimized plan::
+
+            for step in optimize_plan(builder.plan):
+                print(step.label)
+    """
+    plan = _merge_windows(list(steps))
+    plan = _push_down_filters(plan)
+    plan = _remove_redundant_filters(plan)
+    plan = _prune_columns(plan)
+    return _fuse_record_steps(plan)
+
+
+def format_plan(steps: Sequence[PlanStep]) -> str:
+    """
+    Render plan steps as an indented, numbered list.
+
+    Args:
+        steps: Plan steps
+
+    Returns:
+        Multi-line plan description
+    """
+    if not steps:
+        return "  (empty)"
+    lines = []
+    for i, step in enumerate(steps, 1):
+        lines.append(f"  {i}. {step.label}")
+        lines.extend(f"       - {child.label}" for child in step.steps)
+    return "\n".join(lines)
+
+
+def _merge_windows(plan: list[PlanStep]) -> list[PlanStep]:
+    """Merge adjacent windows that share partitioning and ordering."""
+    merged: list[PlanStep] = []
+    for step in plan:
+        prev = merged[-1] if merged else None
+        if (
+            prev is not None
+            and step.kind == StepKind.WINDOW
+            and prev.kind == StepKind.WINDOW
+            and step.operator.partition_by == prev.operator.partition_by
+            and step.operator.order_by == prev.operator.order_by
+            and not _window_inputs(step.operator) & _window_outputs(prev.operator)
+        ):
+            from vibe_piper.transformations.windows import Window
+
+            window_op = Window(
+                name=prev.operator.name,
+                functions=[*prev.operator.functions, *step.operator.functions],
+                partition_by=prev.operator.partition_by,
+                order_by=prev.operator.order_by,
+                backend=prev.operator.backend,
+            )
+            merged[-1] = window_plan_step(window_op)
+        else:
+            merged.append(step)
+    return merged
+
+
+def _push_down_filters(plan: list[PlanStep]) -> list[PlanStep]:
+    """Move filters with known reads below steps that don't affect them."""
+    plan = list(plan)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(1, len(plan)):
+            step, prev = plan[i], plan[i - 1]
+            if step.kind == StepKind.FILTER and _can_push_below(step, prev):
+                plan[i - 1], plan[i] = step, prev
+                changed = True
+    return plan
+
+
+def _can_push_below(filter_step: PlanStep, step: PlanStep) -> bool:
+    """Check whether a filter commutes with the step before it."""
+    reads = filter_step.reads
+    if not reads:
+        return False
+
+    if step.kind == StepKind.JOIN:
+        join_op = step.operator
+        if join_op.how.value not in ("inner", "left"):
+            return False
+        left_keys, right_keys = _join_keys(join_op)
+        right_only = _dataset_columns(join_op.right_data) - right_keys
+        # Filters on left columns see the same values before and after the join
+        # as long as no right column shadows (or is suffixed against) them
+        return not reads & right_only and not any(
+            column.endswith((join_op.left_suffix, join_op.right_suffix)) for column in reads
+        )
+    if step.kind == StepKind.WINDOW:
+        # Whole partitions are kept or dropped, so window results are unchanged
+        partition_by = step.operator.partition_by or []
+        return reads <= set(partition_by)
+    if step.kind == StepKind.GROUPBY:
+        return reads <= set(step.operator.group_by)
+    return False
+
+
+def _remove_redundant_filters(plan: list[PlanStep]) -> list[PlanStep]:
+    """Drop filters repeated within a run of consecutive filters."""
+    result: list[PlanStep] = []
+    seen: set[tuple[Any, ...]] = set()
+    for step in plan:
+        if step.kind != StepKind.FILTER:
+            seen.clear()
+            result.append(step)
+            continue
+        if step.key is not None:
+            if step.key in seen:
+                continue
+            seen.add(step.key)
+        result.append(step)
+    return result
+
+
+def _prune_columns(plan: list[PlanStep]) -> list[PlanStep]:
+    """Project away columns no later step reads, as early as possible."""
+    required: frozenset[str] | None = None  # None means every column is needed
+    pruned: list[PlanStep] = []
+    for step in reversed(plan):
+        if step.kind == StepKind.JOIN and required is not None:
+            step = _prune_join(step, required)
+        required = _required_before(step, required)
+        pruned.append(step)
+    pruned.reverse()
+    if required is not None:
+        # Project after the leading filters so fewer records are copied
+        position = next(
+            (i for i, step in enumerate(pruned) if step.kind != StepKind.FILTER), len(pruned)
+        )
+        pruned.insert(position, project_step(sorted(required)))
+    return pruned
+
+
+def _required_before(step: PlanStep, required: frozenset[str] | None) -> frozenset[str] | None:
+    """Columns a step needs from its input to produce the required output."""
+    kind = step.kind
+    if kind == StepKind.FILTER:
+        if required is None or step.reads is None:
+            return None
+        return required | step.reads
+    if kind == StepKind.PROJECT:
+        return frozenset(step.columns) if required is None else required
+    if kind == StepKind.JOIN:
+        if required is None:
+            return None
+        left_keys, _ = _join_keys(step.operator)
+        return _join_columns(step.operator, required) | left_keys
+    if kind == StepKind.WINDOW:
+        if required is None:
+            return None
+        window_op = step.operator
+        return (required - _window_outputs(window_op)) | _window_inputs(window_op)
+    if kind == StepKind.GROUPBY:
+        columns = [getattr(agg, "column", None) for agg in step.operator.aggregations]
+        if any(column is None for column in columns):
+            return None
+        return frozenset(step.operator.group_by) | frozenset(columns)  # type: ignore[arg-type]
+    if kind == StepKind.PIVOT:
+        pivot_op = step.operator
+        if not isinstance(pivot_op.values, str):
+            # Callable or missing values use every remaining column
+            return None
+        return frozenset([*pivot_op.index, pivot_op.columns, pivot_op.values])
+    if kind == StepKind.UNPIVOT:
+        if not step.operator.value_vars:
+            return None
+        return frozenset([*step.operator.id_vars, *step.operator.value_vars])
+    # Maps and custom steps may read anything
+    return None
+
+
+def _prune_join(step: PlanStep, required: frozenset[str]) -> PlanStep:
+    """Drop right-side columns of a join that no later step reads."""
+    from vibe_piper.transformations.joins import Join
+
+    join_op = step.operator
+    _, right_keys = _join_keys(join_op)
+    keep = _join_columns(join_op, required) | right_keys
+    right_columns = _dataset_columns(join_op.right_data)
+    if right_columns <= keep:
+        return step
+
+    project = project_step(sorted(keep))
+    pruned_op = Join(
+        name=join_op.name,
+        right_data=project.apply(join_op.right_data, None),
+        on=join_op.on,
+        how=join_op.how,
+        left_suffix=join_op.left_suffix,
+        right_suffix=join_op.right_suffix,
+        description=join_op.description,
+        backend=join_op.backend,
+        strategy=join_op.strategy,
+        broadcast_threshold=join_op.broadcast_threshold,
+        spill_threshold=join_op.spill_threshold,
+        spill_partitions=join_op.spill_partitions,
+        spill_dir=join_op.spill_dir,
+    )
+    dropped = ", ".join(sorted(right_columns - keep))
+    return replace(step, operator=pruned_op, label=f"{step.label} [pruned right: {dropped}]")
+
+
+def _fuse_record_steps(plan: list[PlanStep]) -> list[PlanStep]:
+    """Fuse runs of consecutive record-level steps into single passes."""
+    fused: list[PlanStep] = []
+    run: list[PlanStep] = []
+
+    def flush() -> None:
+        if len(run) == 1:
+            fused.append(run[0])
+        elif run:
+            fused.append(fused_step(run))
+        run.clear()
+
+    for step in plan:
+        if step.kind in RECORD_STEP_KINDS:
+            run.append(step)
+        else:
+            flush()
+            fused.append(step)
+    flush()
+    return fused
+
+
+def fused_step(steps: Sequence[PlanStep]) -> PlanStep:
+    """
+    Combine record-level steps into a single pass over the data.
+
+    Each record runs through the whole chain before the next one is read,
+    so no intermediate datasets are materialized.
+
+    Args:
+        steps: FILTER, MAP and PROJECT steps in execution order
+
+    Returns:
+        FUSED plan step
+    """
+    ops = tuple((step.kind == StepKind.FILTER, step.fn) for step in steps)
+
+    def run(data: list[DataRecord]) -> list[DataRecord]:
+        result: list[DataRecord] = []
+        append = result.append
+        for record in data:
+            for is_filter, fn in ops:
+                if is_filter:
+                    if not fn(record):  # type: ignore[misc]
+                        break
+                else:
+                    record = fn(record)  # type: ignore[misc]  # noqa: PLW2901
+            else:
+                append(record)
+        return result
+
+    return PlanStep(
+        kind=StepKind.FUSED,
+        label=f"fused pass ({len(steps)} steps)",
+        fn=run,
+        steps=tuple(steps),
+    )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def window_plan_step(window_op: Any) -> PlanStep:
+    """
+    Create a WINDOW plan step for a Window operator.
+
+    Args:
+        window_op: Window transformation
+
+    Returns:
+        WINDOW plan step
+    """
+    functions = ", ".join(f"{type(f).__name__} as {f.alias}" for f in window_op.functions)
+    return PlanStep(
+        kind=StepKind.WINDOW,
+        label=(
+            f"window({functions}; partition by {window_op.partition_by or []}, "
+            f"order by {window_op.order_by or []})"
+        ),
+        operator=window_op,
+        reads=_window_inputs(window_op),
+    )
+
+
+def _window_inputs(window_op: Any) -> frozenset[str]:
+    """Columns a window reads."""
+    columns = set(window_op.partition_by or []) | set(window_op.order_columns)
+    columns.update(f.column for f in window_op.functions if hasattr(f, "column"))
+    return frozenset(columns)
+
+
+def _window_outputs(window_op: Any) -> frozenset[str]:
+    """Columns a window adds."""
+    return frozenset(f.alias for f in window_op.functions)
+
+
+def _join_keys(join_op: Any) -> tuple[frozenset[str], frozenset[str]]:
+    """Left and right join key columns."""
+    on = join_op.on
+    if isinstance(on, str):
+        return frozenset([on]), frozenset([on])
+    if isinstance(on, tuple):
+        return frozenset([on[0]]), frozenset([on[1]])
+    return frozenset(on), frozenset(on)
+
+
+def _join_columns(join_op: Any, required: frozenset[str]) -> frozenset[str]:
+    """Input columns (either side) needed to produce the required join output."""
+    columns = set(required)
+    for column in required:
+        for suffix in (join_op.left_suffix, join_op.right_suffix):
+            if suffix and column.endswith(suffix):
+                columns.add(column[: -len(suffix)])
+    return frozenset(columns)
+
+
+def _dataset_columns(data: list[DataRecord]) -> frozenset[str]:
+    """Columns present in a dataset (taken from its first record)."""
+    if not data:
+        return frozenset()
+    first = data[0]
+    return frozenset(first.data) | frozenset(f.name for f in first.schema.fields)
@@ -8,6 +8,7 @@ computing derived fields, filtering, and enriching data from lookups.
 from collections.abc import Callable
 from typing import Any
 
+from vibe_piper.expressions import compile_expression
 from vibe_piper.types import DataRecord, RecordData
 
 
@@ -186,51 +187,46 @@ def compute_field_from_expression(
     expression: str,
 ) -> Callable[[list[DataRecord]], list[DataRecord]]:
     """
-    Add a computed field from a Python expression.
+    Add a computed field from an expression.
+
+    The expression is parsed once (see vibe_piper.expressions for the
+    language) and evaluated for the whole batch at a time. Rows where the
+    expression is null or fails (e.g. a missing field) get None.
 
     Args:
         field_name: Name of the new field to add
-        expression: Python expression (e.g., "age * 2" or "price * (1 + tax_rate)")
+        expression: Expression (e.g., "age * 2" or "price * (1 + tax_rate)")
 
     Returns:
         Transformation function
 
+    Raises:
+        ExpressionError: If the expression is invalid
+
     Example:
         Compute total from price and tax::
 
             compute = compute_field_from_expression("total", "price * (1 + tax_rate)")
             transformed = compute(records)
 
-        Note:
-            Only simple arithmetic expressions are supported.
+        Derive a label with CASE::
+
+            compute = compute_field_from_expression(
+                "tier", "CASE WHEN spend >= 1000 THEN 'gold' ELSE 'standard' END"
+            )
     """
+    compiled = compile_expression(expression)
 
     def transform(data: list[DataRecord]) -> list[DataRecord]:
-        result = []
-
-        for record in data:
-            new_data = dict(record.data)
-
-            # Build a safe namespace for evaluation
-            namespace = {
-                k: v for k, v in record.data.items() if isinstance(v, (int, float, str, bool))
-            }
-
-            try:
-                computed_value = eval(expression, {"__builtins__": {}}, namespace)
-                new_data[field_name] = computed_value
-            except Exception:
-                # If evaluation fails, set to None
-                new_data[field_name] = None
-
-            new_record = DataRecord(
-                data=new_data,
+        values = compiled.evaluate_batch([record.data for record in data])
+        return [
+            DataRecord(
+                data={**record.data, field_name: value},
                 schema=record.schema,
                 metadata=record.metadata,
             )
-            result.append(new_record)
-
-        return result
+            for record, value in zip(data, values, strict=True)
+        ]
 
     return transform
 
@@ -260,6 +256,37 @@ def filter_rows(
     return transform
 
 
+def filter_by_expression(expression: str) -> Callable[[list[DataRecord]], list[DataRecord]]:
+    """
+    Filter records by an expression, keeping rows where it is true.
+
+    Rows where the expression is null (e.g. a comparison with a null field)
+    are dropped, as in SQL.
+
+    Args:
+        expression: Condition (e.g., "age >= 18 AND status IN ('active', 'trial')")
+
+    Returns:
+        Transformation function
+
+    Raises:
+        ExpressionError: If the expression is invalid
+
+    Example:
+        Filter active adults::
+
+            filt = filter_by_expression("age >= 18 and email is not null")
+            filtered = filt(records)
+    """
+    compiled = compile_expression(expression)
+
+    def transform(data: list[DataRecord]) -> list[DataRecord]:
+        mask = compiled.filter_mask([record.data for record in data])
+        return [record for record, keep in zip(data, mask, strict=True) if keep]
+
+    return transform
+
+
 def filter_by_field(
     field_name: str,
     value: Any,
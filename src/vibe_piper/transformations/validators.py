@@ -2,11 +2,22 @@
 Validation helpers for transformations.
 
 Provides schema-aware validation functions that can be used in transformation pipelines.
+Record-at-a-time helpers suit single records; SchemaValidator compiles a schema
+into column-level checks for validating large batches at once.
 """
 
-from collections.abc import Callable
+import dataclasses
+import functools
+import importlib.util
+import operator
+import re
+from collections.abc import Callable, Mapping, Sequence
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+from vibe_piper.transformations.backends.base import ColumnBatch
 from vibe_piper.types import (
     DataRecord,
     DataType,
@@ -123,11 +134,15 @@ def validate_regex_pattern(value: str, pattern: str) -> bool:
                 # Value matches pattern
                 pass
     """
-    import re
-
     if not value or not isinstance(value, str):
         return False
-    return re.match(pattern, value) is not None
+    return _compile_pattern(pattern).match(value) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a regex once per pattern."""
+    return re.compile(pattern)
 
 
 def validate_range(
@@ -337,6 +352,9 @@ def validate_batch(
     """
     Validate a batch of records against a schema.
 
+    Runs a SchemaValidator over the batch; use SchemaValidator directly to
+    get the row-level error bitmap instead of messages.
+
     Args:
         records: List of records to validate
         schema: Schema to validate against
@@ -352,24 +370,7 @@ def validate_batch(
             if not result.is_valid:
                 print(f"Found {len(result.errors)} errors")
     """
-    all_errors: list[str] = []
-    all_warnings: list[str] = []
-
-    for idx, record in enumerate(records):
-        result = validate_record(record, schema, strict=strict)
-        if not result.is_valid:
-            for error in result.errors:
-                all_errors.append(f"Record {idx}: {error}")
-        for warning in result.warnings:
-            all_warnings.append(f"Record {idx}: {warning}")
-
-    is_valid = len(all_errors) == 0
-
-    return ValidationResult(
-        is_valid=is_valid,
-        errors=tuple(all_errors) if not is_valid else (),
-        warnings=tuple(all_warnings),
-    )
+    return SchemaValidator(schema, strict=strict).validate(records).to_validation_result()
 
 
 def create_validator_from_schema(
@@ -429,6 +430,425 @@ def create_filter_validator(
     return validator
 
 
+# Compiled batch validation
+
+_MISSING: Any = object()
+
+_TYPE_MAP: dict[DataType, type | tuple[type, ...]] = {
+    DataType.STRING: str,
+    DataType.INTEGER: int,
+    DataType.FLOAT: (int, float),
+    DataType.BOOLEAN: bool,
+    DataType.ARRAY: list,
+    DataType.OBJECT: dict,
+}
+
+# numpy dtype kinds that satisfy each type (bools are ints, ints are floats)
+_KIND_MAP: dict[DataType, str] = {
+    DataType.STRING: "U",
+    DataType.INTEGER: "biu",
+    DataType.FLOAT: "biuf",
+    DataType.BOOLEAN: "b",
+    DataType.ARRAY: "",
+    DataType.OBJECT: "",
+}
+
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _extract(rows: list[Mapping[str, Any]], name: str) -> list[Any]:
+    """One column of row dicts, with _MISSING where the field is absent."""
+    try:
+        return list(map(operator.itemgetter(name), rows))
+    except KeyError:
+        return [row.get(name, _MISSING) for row in rows]
+
+
+class _Column:
+    """One column of a batch, with lazily derived views shared by its checks."""
+
+    def __init__(self, values: Any, length: int) -> None:
+        self.length = length
+        self.typed: np.ndarray | None = None
+        if isinstance(values, pd.Series) and values.dtype.kind in "biuf":
+            values = values.to_numpy()
+        if isinstance(values, np.ndarray) and values.dtype != object:
+            self.typed = values
+            self.values: list[Any] = []
+            self.missing = self.null = np.zeros(length, dtype=bool)
+            return
+
+        self.values = values.tolist() if isinstance(values, np.ndarray | pd.Series) else values
+        if not isinstance(self.values, list):
+            self.values = list(self.values)
+        missing = self.values.count(_MISSING)
+        if missing == length:
+            self.missing = self.null = np.ones(length, dtype=bool)
+            self.values = [None] * length
+            return
+        if missing:
+            self.missing = np.fromiter((v is _MISSING for v in self.values), bool, length)
+            self.values = [None if v is _MISSING else v for v in self.values]
+        else:
+            self.missing = np.zeros(length, dtype=bool)
+        if self.values.count(None):
+            self.null = np.fromiter((v is None for v in self.values), bool, length)
+        else:
+            self.null = np.zeros(length, dtype=bool)
+
+    def value(self, row: int) -> Any:
+        """One value of the column."""
+        return self.typed[row] if self.typed is not None else self.values[row]
+
+    @functools.cached_property
+    def types(self) -> set[type]:
+        """Python types of the non-null values."""
+        types = set(map(type, self.values))
+        types.discard(type(None))
+        return types
+
+    @functools.cached_property
+    def numbers(self) -> np.ndarray:
+        """Numeric values as floats, NaN for everything else."""
+        if self.typed is not None:
+            if self.typed.dtype.kind in "biuf":
+                return self.typed.astype(np.float64)
+            return np.full(self.length, np.nan)
+        if all(issubclass(t, int | float) for t in self.types):
+            try:
+                return np.array(self.values, dtype=np.float64)
+            except OverflowError:
+                pass
+        return np.fromiter(
+            (float(v) if isinstance(v, int | float) else np.nan for v in self.values),
+            np.float64,
+            self.length,
+        )
+
+    @functools.cached_property
+    def lengths(self) -> np.ndarray:
+        """Lengths of string and list values, -1 for everything else."""
+        if self.typed is not None:
+            if self.typed.dtype.kind == "U":
+                return np.char.str_len(self.typed)
+            return np.full(self.length, -1)
+        if not self.types:
+            return np.full(self.length, -1)
+        if self.types <= {str, list} and not self.null.any():
+            return np.fromiter(map(len, self.values), np.int64, self.length)
+        return np.fromiter(
+            (len(v) if isinstance(v, str | list) else -1 for v in self.values),
+            np.int64,
+            self.length,
+        )
+
+    @functools.cached_property
+    def strings(self) -> pd.Series:
+        """The column as a pandas string Series (non-strings become NA)."""
+        if self.typed is not None:
+            values: Any = self.typed if self.typed.dtype.kind == "U" else [None] * self.length
+        elif self.types <= {str}:
+            values = self.values
+        else:
+            values = [v if isinstance(v, str) else None for v in self.values]
+        dtype = pd.StringDtype("pyarrow") if _HAS_PYARROW else pd.StringDtype()
+        return pd.Series(values, dtype=dtype)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Check:
+    """One compiled column check."""
+
+    field_name: str
+    kind: str
+    argument: Any = None
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchValidationReport:
+    """
+    Row-level outcome of validating a batch with a SchemaValidator.
+
+    Attributes:
+        checks: Check names ("field:check"), one bit each in the bitmap
+        bitmap: Error bitmap, one row per record and one bit per check
+            (packed with np.packbits); a set bit means the record failed
+            that check
+        summary: Number of failing records per check
+        warnings: Warnings (fields not in the schema, in strict mode)
+    """
+
+    checks: tuple[str, ...]
+    bitmap: np.ndarray
+    summary: dict[str, int]
+    warnings: tuple[str, ...] = ()
+    describe: Callable[[int, int], str] | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def row_count(self) -> int:
+        """Number of records validated."""
+        return len(self.bitmap)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether every record passed every check."""
+        return not any(self.summary.values())
+
+    @property
+    def invalid_mask(self) -> np.ndarray:
+        """Boolean mask of records that failed at least one check."""
+        return self.bitmap.any(axis=1)
+
+    @property
+    def invalid_rows(self) -> np.ndarray:
+        """Indices of records that failed at least one check."""
+        return np.flatnonzero(self.invalid_mask)
+
+    def failures(self, check: str) -> np.ndarray:
+        """
+        Boolean mask of records that failed one check.
+
+        Args:
+            check: Check name, e.g. "age:min_value"
+
+        Returns:
+            Mask with one entry per record
+
+        Raises:
+            KeyError: If the check does not exist
+        """
+        if check not in self.checks:
+            msg = f"Unknown check {check!r}"
+            raise KeyError(msg)
+        byte, bit = divmod(self.checks.index(check), 8)
+        mask: np.ndarray = (self.bitmap[:, byte] & (0x80 >> bit)) != 0
+        return mask
+
+    def to_validation_result(self, max_errors: int | None = None) -> ValidationResult:
+        """
+        Convert to a ValidationResult with one message per failure.
+
+        Messages match validate_batch's.
+
+        Args:
+            max_errors: Stop after this many error messages
+
+        Returns:
+            ValidationResult
+        """
+        errors: list[str] = []
+        for row in self.invalid_rows:
+            failed = np.flatnonzero(np.unpackbits(self.bitmap[row])[: len(self.checks)])
+            for check in failed:
+                message = self.describe(int(check), int(row)) if self.describe else ""
+                errors.append(f"Record {row}: {message}")
+                if max_errors is not None and len(errors) >= max_errors:
+                    break
+            if max_errors is not None and len(errors) >= max_errors:
+                break
+
+        return ValidationResult(
+            is_valid=not errors,
+            errors=tuple(errors),
+            warnings=self.warnings,
+        )
+
+
+class SchemaValidator:
+    """
+    Schema compiled into column-level checks for whole batches.
+
+    Each field's type, required-ness and constraints (min_value,
+    max_value, min_length, max_length, pattern, enum) become one check
+    that runs over the whole column at once. Types are checked per
+    distinct type (or by dtype for typed arrays), ranges as float array
+    comparisons, patterns with pandas string kernels (Arrow-backed when
+    pyarrow is installed) and enums with isin. The checks follow
+    validate_record's rules.
+
+    Attributes:
+        schema: Schema validated against
+        strict: Whether fields not in the schema produce warnings
+        checks: Compiled checks, in validate_record's error order
+    """
+
+    def __init__(self, schema: Schema, strict: bool = False) -> None:
+        """
+        Compile a schema.
+
+        Args:
+            schema: Schema to validate against
+            strict: If True, warn about fields not in the schema
+
+        Example:
+            Validate a large batch and keep the valid records::
+
+                validator = SchemaValidator(user_schema)
+                report = validator.validate(records)
+                valid = [r for r, bad in zip(records, report.invalid_mask) if not bad]
+        """
+        self.schema = schema
+        self.strict = strict
+        checks = [_Check(f.name, "required") for f in schema.fields if f.required]
+        for f in schema.fields:
+            if f.data_type in _TYPE_MAP:
+                checks.append(_Check(f.name, "type", f.data_type))
+            for name, value in (f.constraints or {}).items():
+                if name == "pattern":
+                    checks.append(_Check(f.name, name, re.compile(value)))
+                elif name in ("min_value", "max_value", "min_length", "max_length", "enum"):
+                    checks.append(_Check(f.name, name, value))
+        self.checks = tuple(checks)
+        self._fields = {f.name: f for f in schema.fields}
+
+    def _columns(
+        self, data: Sequence[DataRecord] | ColumnBatch
+    ) -> tuple[dict[str, _Column], int, list[str]]:
+        """Extract the schema's columns, their length and any warnings."""
+        names = self._fields
+        warnings: list[str] = []
+        if isinstance(data, Mapping):
+            length = len(next(iter(data.values()), ()))
+            columns = {
+                name: _Column(data[name] if name in data else [_MISSING] * length, length)
+                for name in names
+            }
+            if self.strict:
+                warnings = [
+                    f"Field '{key}' is not defined in schema" for key in data if key not in names
+                ]
+            return columns, length, warnings
+
+        rows = [record.data for record in data]
+        length = len(rows)
+        columns = {name: _Column(_extract(rows, name), length) for name in names}
+        if self.strict:
+            for idx, row in enumerate(rows):
+                for key in row:
+                    if key not in names:
+                        warnings.append(f"Record {idx}: Field '{key}' is not defined in schema")
+        return columns, length, warnings
+
+    def _run(self, check: _Check, column: _Column) -> np.ndarray:
+        """Failure mask of one check."""
+        kind, argument = check.kind, check.argument
+        if kind == "required":
+            return column.missing
+
+        # Missing fields and nulls in nullable fields are skipped
+        skip = column.missing | (column.null if self._fields[check.field_name].nullable else False)
+        none = np.zeros(column.length, dtype=bool)
+        if skip.all():
+            return none
+
+        if kind == "type":
+            if column.typed is not None:
+                return none if column.typed.dtype.kind in _KIND_MAP[argument] else ~skip
+            expected = _TYPE_MAP[argument]
+            if all(issubclass(t, expected) for t in column.types):
+                return none
+            return (
+                np.fromiter(
+                    (v is not None and not isinstance(v, expected) for v in column.values),
+                    bool,
+                    column.length,
+                )
+                & ~skip
+            )
+
+        if kind in ("min_value", "max_value"):
+            numbers = column.numbers
+            with np.errstate(invalid="ignore"):
+                failed: np.ndarray = (
+                    numbers < argument if kind == "min_value" else numbers > argument
+                )
+            return failed & ~skip
+
+        if kind in ("min_length", "max_length"):
+            lengths = column.lengths
+            failed = (lengths >= 0) & (
+                (lengths < argument) if kind == "min_length" else (lengths > argument)
+            )
+            return failed & ~skip
+
+        if kind == "pattern":
+            if column.typed is None and str not in column.types:
+                return none
+            strings = column.strings
+            try:
+                matched = strings.str.match(argument.pattern, flags=argument.flags, na=True)
+            except ValueError:  # pattern syntax the Arrow (RE2) kernel does not support
+                matched = strings.map(lambda v: v is pd.NA or argument.match(v) is not None)
+            # validate_regex_pattern rejects empty strings
+            failed = ~matched.to_numpy(dtype=bool, na_value=True) | (strings == "").to_numpy(
+                dtype=bool, na_value=False
+            )
+            return failed & ~skip
+
+        # enum
+        if column.typed is not None:
+            return ~np.isin(column.typed, list(argument)) & ~skip
+        try:
+            allowed = set(argument)
+            failed = np.fromiter((v not in allowed for v in column.values), bool, column.length)
+        except TypeError:  # unhashable values or allowed values
+            failed = np.fromiter((v not in argument for v in column.values), bool, column.length)
+        return failed & ~skip
+
+    def validate(self, data: Sequence[DataRecord] | ColumnBatch) -> BatchValidationReport:
+        """
+        Validate a batch.
+
+        Args:
+            data: Records, or a column batch (column name -> values)
+
+        Returns:
+            Report with the row-level error bitmap and per-check counts
+        """
+        columns, length, warnings = self._columns(data)
+        masks = np.zeros((length, len(self.checks)), dtype=bool)
+        for j, check in enumerate(self.checks):
+            masks[:, j] = self._run(check, columns[check.field_name])
+
+        names = tuple(f"{c.field_name}:{c.kind}" for c in self.checks)
+        counts = masks.sum(axis=0)
+        fields = self._fields
+        # Only enum messages quote the value; keep just those columns alive
+        enum_columns = {
+            c.field_name: columns[c.field_name] for c in self.checks if c.kind == "enum"
+        }
+
+        def describe(check_index: int, row: int) -> str:
+            check = self.checks[check_index]
+            name, argument = check.field_name, check.argument
+            if check.kind == "required":
+                return f"Required field '{name}' is missing"
+            if check.kind == "type":
+                return f"Field '{name}' has invalid type (expected {fields[name].data_type})"
+            if check.kind == "min_value":
+                return f"Field '{name}' is below minimum value {argument}"
+            if check.kind == "max_value":
+                return f"Field '{name}' exceeds maximum value {argument}"
+            if check.kind == "min_length":
+                return f"Field '{name}' is below minimum length {argument}"
+            if check.kind == "max_length":
+                return f"Field '{name}' exceeds maximum length {argument}"
+            if check.kind == "pattern":
+                return f"Field '{name}' does not match pattern '{argument.pattern}'"
+            value = enum_columns[name].value(row)
+            return f"Field '{name}' must be one of {argument}, got '{value}'"
+
+        return BatchValidationReport(
+            checks=names,
+            bitmap=np.packbits(masks, axis=1),
+            summary={name: int(count) for name, count in zip(names, counts, strict=True)},
+            warnings=tuple(warnings),
+            describe=describe,
+        )
+
+
 __all__ = [
     # Field validators
     "validate_field_type",
@@ -444,4 +864,7 @@ __all__ = [
     # Validator creators
     "create_validator_from_schema",
     "create_filter_validator",
+    # Compiled batch validation
+    "SchemaValidator",
+    "BatchValidationReport",
 ]
@@ -2,16 +2,25 @@
 Window function transformation operators.
 
 Provides window functions for advanced analytics including row_number,
-rank, dense_rank, lag, and lead operations.
+rank, dense_rank, lag and lead, plus running and moving aggregates (sum,
+avg, min, max, count) over row-based or time-range frames.
+
+Built-in functions are computed for all partitions at once with vectorized
+groupby operations (cumcount, shift, cumulative and rolling aggregates)
+rather than a Python loop over partitions.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
 from enum import Enum
 from typing import Any
 
 import pandas as pd
 
-from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema
+from vibe_piper.transformations.backends import resolve_backend
+from vibe_piper.transformations.backends.base import dataset_columns
+from vibe_piper.types import DataRecord, DataType, Operator, OperatorType, Schema, SchemaField
 
 
 class WindowFunctionType(str, Enum):
@@ -22,10 +31,21 @@ class WindowFunctionType(str, Enum):
     DENSE_RANK = "dense_rank"
     LAG = "lag"
     LEAD = "lead"
+    SUM = "sum"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+    COUNT = "count"
 
 
 class WindowFunction(ABC):
-    """Base class for window functions."""
+    """
+    Base class for window functions.
+
+    Custom functions implement ``apply``, which is called once per
+    partition. Built-in functions also override ``compute`` to process
+    every partition in one vectorized pass.
+    """
 
     def __init__(self, alias: str) -> None:
         """
@@ -44,6 +64,32 @@ class WindowFunction(ABC):
         """Apply window function to DataFrame."""
         pass
 
+    def compute(
+        self,
+        df: pd.DataFrame,
+        partition: pd.Series,
+        window: "Window",  # noqa: ARG002
+    ) -> pd.Series:
+        """
+        Compute the function for every partition.
+
+        Args:
+            df: Rows sorted by the window's order columns
+            partition: Integer partition id of each row (aligned with df)
+            window: The Window being applied
+
+        Returns:
+            Series aligned with df's index
+        """
+        result: pd.Series = pd.concat(
+            [self.apply(group) for _, group in df.groupby(partition, sort=False)]
+        )
+        return result
+
+    def get_result_dtype(self, schema: Schema) -> DataType:  # noqa: ARG002
+        """Get the data type of the result."""
+        return DataType.FLOAT
+
 
 class RowNumber(WindowFunction):
     """Row number function - assigns sequential row numbers."""
@@ -51,21 +97,55 @@ class RowNumber(WindowFunction):
     def apply(self, df: pd.DataFrame) -> pd.Series:  # type: ignore[name-defined]
         return pd.Series(range(1, len(df) + 1), index=df.index)
 
+    def compute(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        return df.groupby(partition, sort=False).cumcount() + 1
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        return DataType.INTEGER
+
+
+def _peer_starts(df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+    """Flag rows whose order key differs from the previous row in the partition."""
+    first = df.groupby(partition, sort=False).cumcount() == 0
+    if not window.order_columns:
+        # Without ordering every row of a partition is a peer
+        return first
+    current = df[window.order_columns]
+    previous = current.groupby(partition, sort=False).shift(1)
+    changed = (current != previous) & ~(current.isna() & previous.isna())
+    return first | changed.any(axis=1)
+
 
 class Rank(WindowFunction):
-    """Rank function - assigns ranks with gaps for ties."""
+    """Rank function - assigns ranks with gaps for ties in the order columns."""
 
     def apply(self, df: pd.DataFrame) -> pd.Series:  # type: ignore[name-defined]
-        # Use default index since no order_by specified yet
+        # Without the window's ordering each row is its own rank
         return pd.Series(range(1, len(df) + 1), index=df.index)
 
+    def compute(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        row_number = df.groupby(partition, sort=False).cumcount() + 1
+        # Peers share the row number of the first row in their tie group
+        ranks = row_number.where(_peer_starts(df, partition, window))
+        return ranks.groupby(partition, sort=False).ffill().astype("int64")
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        return DataType.INTEGER
+
 
 class DenseRank(WindowFunction):
-    """Dense rank function - assigns ranks without gaps for ties."""
+    """Dense rank function - assigns ranks without gaps for ties in the order columns."""
 
     def apply(self, df: pd.DataFrame) -> pd.Series:  # type: ignore[name-defined]
         return pd.Series(range(1, len(df) + 1), index=df.index)
 
+    def compute(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        starts = _peer_starts(df, partition, window).astype("int64")
+        return starts.groupby(partition, sort=False).cumsum()
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        return DataType.INTEGER
+
 
 class Lag(WindowFunction):
     """Lag function - accesses value from previous row."""
@@ -95,7 +175,19 @@ class Lag(WindowFunction):
         if self.column not in df.columns:
             msg = f"Column '{self.column}' not found for lag function"
             raise ValueError(msg)
-        return df[self.column].shift(self.offset).fillna(self.default)
+        shifted = df[self.column].shift(self.offset)
+        return shifted if self.default is None else shifted.fillna(self.default)
+
+    def compute(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        if self.column not in df.columns:
+            msg = f"Column '{self.column}' not found for lag function"
+            raise ValueError(msg)
+        shifted = df[self.column].groupby(partition, sort=False).shift(self.offset)
+        return shifted if self.default is None else shifted.fillna(self.default)
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        field = schema.get_field(self.column)
+        return field.data_type if field else DataType.FLOAT
 
 
 class Lead(WindowFunction):
@@ -126,7 +218,180 @@ class Lead(WindowFunction):
         if self.column not in df.columns:
             msg = f"Column '{self.column}' not found for lead function"
             raise ValueError(msg)
-        return df[self.column].shift(-self.offset).fillna(self.default)
+        shifted = df[self.column].shift(-self.offset)
+        return shifted if self.default is None else shifted.fillna(self.default)
+
+    def compute(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        if self.column not in df.columns:
+            msg = f"Column '{self.column}' not found for lead function"
+            raise ValueError(msg)
+        shifted = df[self.column].groupby(partition, sort=False).shift(-self.offset)
+        return shifted if self.default is None else shifted.fillna(self.default)
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        field = schema.get_field(self.column)
+        return field.data_type if field else DataType.FLOAT
+
+
+class WindowAggregate(WindowFunction):
+    """
+    Running or moving aggregate over a frame ending at the current row.
+
+    The frame is one of:
+
+    - unbounded (default): every row from the start of the partition,
+      i.e. ``ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW``
+    - ``preceding=n``: the current row and the n rows before it, i.e.
+      ``ROWS BETWEEN n PRECEDING AND CURRENT ROW``
+    - ``interval="7D"``: rows whose order key is within the interval before
+      the current row's, i.e. ``RANGE BETWEEN INTERVAL '7 days' PRECEDING
+      AND CURRENT ROW``. The window must be ordered by a single ascending
+      datetime column. Later rows with the same timestamp are not
+      included as peers.
+
+    Null values are skipped; frames with no values give None (0 for count).
+    """
+
+    agg_name = "sum"
+
+    def __init__(
+        self,
+        column: str,
+        preceding: int | None = None,
+        interval: str | timedelta | None = None,
+        alias: str | None = None,
+    ) -> None:
+        """
+        Initialize a window aggregate.
+
+        Args:
+            column: Column to aggregate
+            preceding: Rows before the current row in the frame (None for
+                unbounded)
+            interval: Time range before the current row's order key, as a
+                pandas offset string ("7D", "30min") or timedelta
+            alias: Result column name
+
+        Raises:
+            ValueError: If both preceding and interval are given, or
+                preceding is negative
+        """
+        if preceding is not None and interval is not None:
+            msg = "Specify either 'preceding' (rows frame) or 'interval' (range frame), not both"
+            raise ValueError(msg)
+        if preceding is not None and preceding < 0:
+            msg = f"'preceding' must be non-negative, got {preceding}"
+            raise ValueError(msg)
+
+        self.column = column
+        self.preceding = preceding
+        self.interval = interval
+        super().__init__(alias or f"{column}_window_{self.agg_name}")
+
+    def apply(self, df: pd.DataFrame) -> pd.Series:
+        partition = pd.Series(0, index=df.index)
+        return self.compute(df, partition, _UNORDERED)
+
+    def compute(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        if self.column not in df.columns:
+            msg = f"Column '{self.column}' not found for {self.agg_name} window function"
+            raise ValueError(msg)
+
+        if self.interval is not None:
+            return self._range_frame(df, partition, window)
+        if self.preceding is not None:
+            rolling = (
+                df[self.column]
+                .groupby(partition, sort=False)
+                .rolling(self.preceding + 1, min_periods=1)
+            )
+            return self._rolling_result(rolling)
+        return self._cumulative(df[self.column], partition)
+
+    def _range_frame(self, df: pd.DataFrame, partition: pd.Series, window: "Window") -> pd.Series:
+        """Aggregate over a time range of the single ascending order column."""
+        if len(window.order_columns) != 1 or not window.order_ascending[0]:
+            msg = (
+                f"Window function '{self.alias}' uses a time-range frame, which requires "
+                "ordering by exactly one ascending datetime column"
+            )
+            raise ValueError(msg)
+        on = window.order_columns[0]
+        frame = df[[self.column]].assign(**{on: pd.to_datetime(df[on])})
+        rolling = frame.groupby(partition, sort=False).rolling(
+            self.interval, on=on, closed="both", min_periods=1
+        )
+        result = getattr(rolling[self.column], self.agg_name)()
+        if self.agg_name == "count":
+            result = result.fillna(0).astype("int64")
+        # Rolling on a column indexes results by that column; rows come out
+        # partition by partition in input order, so realign by position
+        group_ids = partition.groupby(partition, sort=False).ngroup()
+        order = group_ids.argsort(kind="stable").to_numpy()
+        return pd.Series(result.to_numpy(), index=df.index[order]).reindex(df.index)
+
+    def _rolling_result(self, rolling: Any) -> pd.Series:
+        """Aggregate a grouped rolling window and realign to the input rows."""
+        result = getattr(rolling, self.agg_name)()
+        if self.agg_name == "count":
+            result = result.fillna(0).astype("int64")
+        # Drop the partition level so the result aligns with the input index
+        aligned: pd.Series = result.droplevel(0)
+        return aligned
+
+    def _cumulative(self, values: pd.Series, partition: pd.Series) -> pd.Series:
+        """Aggregate over an unbounded preceding frame."""
+        count = values.notna().astype("int64").groupby(partition, sort=False).cumsum()
+        if self.agg_name == "count":
+            return count
+        if self.agg_name in ("sum", "mean"):
+            total = values.fillna(0).groupby(partition, sort=False).cumsum().where(count > 0)
+            return total if self.agg_name == "sum" else total / count
+        # cummin/cummax leave nulls at null rows; carry the running value forward
+        running = getattr(values.groupby(partition, sort=False), f"cum{self.agg_name}")()
+        filled: pd.Series = running.groupby(partition, sort=False).ffill()
+        return filled
+
+
+class WindowSum(WindowAggregate):
+    """Running or moving sum."""
+
+    agg_name = "sum"
+
+
+class WindowAvg(WindowAggregate):
+    """Running or moving average."""
+
+    agg_name = "mean"
+
+
+class WindowMin(WindowAggregate):
+    """Running or moving minimum."""
+
+    agg_name = "min"
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        field = schema.get_field(self.column)
+        return field.data_type if field else DataType.FLOAT
+
+
+class WindowMax(WindowAggregate):
+    """Running or moving maximum."""
+
+    agg_name = "max"
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        field = schema.get_field(self.column)
+        return field.data_type if field else DataType.FLOAT
+
+
+class WindowCount(WindowAggregate):
+    """Running or moving count of non-null values."""
+
+    agg_name = "count"
+
+    def get_result_dtype(self, schema: Schema) -> DataType:
+        return DataType.INTEGER
 
 
 class Window:
@@ -147,6 +412,18 @@ class Window:
                 functions=[Rank(alias="rank")]
             )
             result = window_op.transform(data, context)
+
+        7-day moving sum of each user's spend, streaming one user at a time
+        from events grouped by user::
+
+            window_op = Window(
+                name="weekly_spend",
+                partition_by="user_id",
+                order_by="event_time",
+                functions=[WindowSum("amount", interval="7D", alias="spend_7d")],
+            )
+            for record in window_op.transform_stream(events, context):
+                ...
     """
 
     def __init__(
@@ -156,6 +433,7 @@ class Window:
         partition_by: str | list[str] | None = None,
         order_by: str | list[str] | None = None,
         description: str | None = None,
+        backend: str | None = None,
     ) -> None:
         """
         Initialize a Window transformation.
@@ -166,12 +444,15 @@ class Window:
             partition_by: Column(s) to partition by
             order_by: Column(s) to order by (supports "col desc" syntax)
             description: Optional description
+            backend: Execution backend (pandas, polars, duckdb); defaults to
+                the pipeline's or the global backend
         """
         self.name = name
         self.functions = functions
         self.partition_by = [partition_by] if isinstance(partition_by, str) else partition_by
         self.order_by = [order_by] if isinstance(order_by, str) else order_by
         self.description = description or "Window function"
+        self.backend = backend
 
         # Parse order_by to get columns and directions
         self.order_columns: list[str] = []
@@ -189,7 +470,7 @@ class Window:
     def transform(
         self,
         data: list[DataRecord],
-        ctx: Any,  # noqa: ARG002
+        ctx: Any,
     ) -> list[DataRecord]:
         """
         Apply window functions.
@@ -204,78 +485,104 @@ class Window:
         if not data:
             return []
 
-        # Convert to DataFrame
-        df = pd.DataFrame([record.data for record in data])
+        rows = [record.data for record in data]
+        columns = set(dataset_columns(rows))
 
         # Validate partition columns
         if self.partition_by:
             for col in self.partition_by:
-                if col not in df.columns:
+                if col not in columns:
                     msg = f"Partition column '{col}' not found in dataset"
                     raise ValueError(msg)
 
         # Validate order columns
         for col in self.order_columns:
-            if col not in df.columns:
+            if col not in columns:
                 msg = f"Order column '{col}' not found in dataset"
                 raise ValueError(msg)
 
-        # Sort data if order_by specified
-        if self.order_columns:
-            df = df.sort_values(by=self.order_columns, ascending=self.order_ascending)
-
-        # Apply window functions within partitions
-        if self.partition_by:
-            # Apply within each partition
-            grouped = df.groupby(self.partition_by, sort=False)
-
-            for func in self.functions:
-                # Apply function to each group and combine
-                results = []
-                for _, group in grouped:
-                    result = func.apply(group)
-                    results.append(result)
-
-                # Combine results
-                df[func.alias] = pd.concat(results)
-        else:
-            # Apply to entire dataset
-            for func in self.functions:
-                df[func.alias] = func.apply(df)
-
-        # Restore original order
-        df = df.reset_index(drop=True)
+        # Sort and apply window functions on the selected backend
+        df = resolve_backend("window", self, ctx).window(self, rows)
 
         # Convert back to DataRecords
         return self._dataframe_to_records(df, data[0].schema)
 
+    def transform_stream(
+        self,
+        records: Iterable[DataRecord],
+        ctx: Any,
+    ) -> Iterator[DataRecord]:
+        """
+        Apply window functions to a stream grouped by partition.
+
+        Records of each partition must be contiguous in the input (e.g.
+        sorted by the partition columns). Each partition is buffered,
+        transformed and yielded before the next one is read, so only one
+        partition is held in memory. Without partition_by the whole
+        stream is a single partition.
+
+        Args:
+            records: Input records, contiguous by partition
+            ctx: Pipeline context
+
+        Yields:
+            Records with window function results added
+
+        Raises:
+            ValueError: If a partition reappears after another partition
+        """
+        partition_by = self.partition_by or []
+        seen: set[tuple[Any, ...]] = set()
+        buffer: list[DataRecord] = []
+        current: tuple[Any, ...] = ()
+
+        for record in records:
+            key = tuple(record.data.get(col) for col in partition_by)
+            if buffer and key != current:
+                yield from self.transform(buffer, ctx)
+                seen.add(current)
+                buffer = []
+            if not buffer:
+                if key in seen:
+                    msg = (
+                        f"Partition {key} reappeared in the stream; transform_stream "
+                        f"requires input grouped by {partition_by}"
+                    )
+                    raise ValueError(msg)
+                current = key
+            buffer.append(record)
+
+        if buffer:
+            yield from self.transform(buffer, ctx)
+
     def _dataframe_to_records(
         self,
         df: pd.DataFrame,
         original_schema: Schema,
     ) -> list[DataRecord]:
         """Convert DataFrame to DataRecords."""
-        from vibe_piper.types import SchemaField
-
         # Create new schema with original fields plus window function results
         new_fields = list(original_schema.fields)
 
-        # Add window function result fields
+        # Add window function result fields (nullable: lags, empty frames)
         for func in self.functions:
-            new_fields.append(SchemaField(name=func.alias, data_type=DataType.FLOAT))
+            new_fields.append(
+                SchemaField(
+                    name=func.alias,
+                    data_type=func.get_result_dtype(original_schema),
+                    required=False,
+                    nullable=True,
+                )
+            )
 
         new_schema = Schema(
             name=f"{original_schema.name}_window",
             fields=tuple(new_fields),
         )
 
-        # Convert rows to DataRecords
-        records = []
-        for _, row in df.iterrows():
-            data = {col: val for col, val in row.items()}
-            records.append(DataRecord(data=data, schema=new_schema))
-
-        return records
+        # Replace NaN/NaT with None, then convert all rows at once
+        df = df.astype(object).where(df.notna(), None)
+        return [DataRecord(data=row, schema=new_schema) for row in df.to_dict("records")]
 
     def to_operator(self) -> Operator:
         """Convert to Operator instance."""
@@ -292,6 +599,24 @@ class Window:
         )
 
 
+# Window ordered by nothing, for applying a WindowAggregate to a single frame
+class _Unordered:
+    order_columns: list[str] = []
+    order_ascending: list[bool] = []
+
+
+_UNORDERED: Any = _Unordered()
+
+
+_AGGREGATES: dict[str, type[WindowAggregate]] = {
+    "sum": WindowSum,
+    "avg": WindowAvg,
+    "min": WindowMin,
+    "max": WindowMax,
+    "count": WindowCount,
+}
+
+
 def window_function(
     func_type: str,
     column: str | None = None,
@@ -301,8 +626,9 @@ def window_function(
     Convenience function to create window functions.
 
     Args:
-        func_type: Type of window function (row_number, rank, dense_rank, lag, lead)
-        column: Column name (for lag/lead)
+        func_type: Type of window function (row_number, rank, dense_rank, lag,
+            lead, sum, avg, min, max, count)
+        column: Column name (for lag/lead and aggregates)
         **kwargs: Additional arguments for specific function types
 
     Returns:
@@ -312,6 +638,10 @@ def window_function(
         Create a lag function::
 
             lag_func = window_function("lag", column="value", offset=1)
+
+        Create a 3-row moving average::
+
+            avg_func = window_function("avg", column="value", preceding=2)
     """
     alias = kwargs.pop("alias", None)
 
@@ -331,6 +661,11 @@ def window_function(
             msg = "Lead function requires 'column' parameter"
             raise ValueError(msg)
         return Lead(column=column, alias=alias, **kwargs)
+    elif func_type in _AGGREGATES:
+        if not column:
+            msg = f"{func_type} window function requires 'column' parameter"
+            raise ValueError(msg)
+        return _AGGREGATES[func_type](column=column, alias=alias, **kwargs)
     else:
         msg = f"Unknown window function type: {func_type}"
         raise ValueError(msg)
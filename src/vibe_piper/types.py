@@ -16,6 +16,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from typing import (
+    TYPE_CHECKING,
     Any,
     Protocol,
     TypeAlias,
@@ -23,6 +24,9 @@ from typing import (
     final,
 )
 
+if TYPE_CHECKING:
+    from vibe_piper.partitions import PartitionsDefinition
+
 # =============================================================================
 # Type Variables and Generics
 # =============================================================================
@@ -336,6 +340,11 @@ class Asset:
         created_at: Timestamp when the asset was created (default: None)
         updated_at: Timestamp when the asset was last updated (default: None)
         checksum: Optional checksum for data integrity verification (default: None)
+        resources: Resource units this asset holds while executing, keyed by
+                   pool name (e.g. {"postgres": 1, "memory_gb": 8})
+        priority: Scheduling priority; higher values are dispatched first (default: 0)
+        partitions: Optional partitions definition; partitioned assets are
+                    executed, stored and tracked one partition at a time
     """
 
     name: str
@@ -357,6 +366,9 @@ class Asset:
     cache_ttl: int | None = None
     parallel: bool = False
     lazy: bool = False
+    resources: Mapping[str, int | float] = field(default_factory=dict)
+    priority: int = 0
+    partitions: "PartitionsDefinition | None" = None
 
     def __post_init__(self) -> None:
         """Validate the asset configuration."""
@@ -366,6 +378,10 @@ class Asset:
         if not self.uri:
             msg = f"Asset URI cannot be empty for asset {self.name!r}"
             raise ValueError(msg)
+        for resource, amount in self.resources.items():
+            if amount < 0:
+                msg = f"Resource {resource!r} of asset {self.name!r} cannot be negative"
+                raise ValueError(msg)
 
 
 @dataclass(frozen=True)
@@ -496,6 +512,24 @@ class Pipeline:
         return result
 
 
+@dataclass
+class _AssetGraphIndex:
+    """
+    Lookup indexes and traversal caches for an AssetGraph.
+
+    Attributes:
+        assets: Mapping of asset name to asset, in declaration order
+        upstream: Mapping of asset name to its dependency names
+        downstream: Mapping of asset name to its dependent names
+        cache: Memoized traversal results
+    """
+
+    assets: dict[str, "Asset"]
+    upstream: dict[str, tuple[str, ...]]
+    downstream: dict[str, tuple[str, ...]]
+    cache: dict[tuple[Any, ...], Any] = field(default_factory=dict)
+
+
 @dataclass(frozen=True)
 class AssetGraph:
     """
@@ -552,85 +586,116 @@ class AssetGraph:
     config: Mapping[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        """Validate the asset graph configuration."""
+        """Validate the asset graph configuration and build lookup indexes."""
         if not self.name:
             msg = "AssetGraph name cannot be empty"
             raise ValueError(msg)
 
-        # Check for duplicate asset names
-        asset_names = {asset.name for asset in self.assets}
-        if len(asset_names) != len(self.assets):
+        # Index assets by name (also detects duplicate names)
+        asset_index: dict[str, Asset] = {asset.name: asset for asset in self.assets}
+        if len(asset_index) != len(self.assets):
             msg = f"Duplicate asset names in graph {self.name!r}"
             raise ValueError(msg)
 
         # Validate all dependencies reference existing assets
         for asset_name, deps in self.dependencies.items():
-            if asset_name not in asset_names:
+            if asset_name not in asset_index:
                 msg = f"Asset {asset_name!r} in dependencies but not in assets"
                 raise ValueError(msg)
             for dep in deps:
-                if dep not in asset_names:
+                if dep not in asset_index:
                     msg = f"Dependency {dep!r} of {asset_name!r} not found in assets"
                     raise ValueError(msg)
 
+        # Forward (upstream) and reverse (downstream) adjacency, with
+        # neighbours kept in the order the assets were declared
+        position = {name: index for index, name in enumerate(asset_index)}
+        upstream: dict[str, tuple[str, ...]] = {}
+        downstream_lists: dict[str, list[str]] = {name: [] for name in asset_index}
+        for asset_name in asset_index:
+            ordered = sorted(set(self.dependencies.get(asset_name, ())), key=position.__getitem__)
+            upstream[asset_name] = tuple(ordered)
+            for dep in ordered:
+                downstream_lists[dep].append(asset_name)
+        downstream = {
+            name: tuple(sorted(dependents, key=position.__getitem__))
+            for name, dependents in downstream_lists.items()
+        }
+
+        # The class is frozen, so the index is attached directly
+        object.__setattr__(
+            self,
+            "_index",
+            _AssetGraphIndex(assets=asset_index, upstream=upstream, downstream=downstream),
+        )
+
         # Validate no circular dependencies
         self._validate_no_cycles()
 
+    @property
+    def _graph_index(self) -> "_AssetGraphIndex":
+        """Lookup indexes built at construction."""
+        index: _AssetGraphIndex = self.__dict__["_index"]
+        return index
+
     def _validate_no_cycles(self) -> None:
-        """Detect circular dependencies using DFS."""
-        asset_names = {asset.name for asset in self.assets}
+        """Detect circular dependencies using an iterative DFS."""
+        upstream = self._graph_index.upstream
         visited: set[str] = set()
         rec_stack: set[str] = set()
 
-        def dfs(node: str) -> None:
-            visited.add(node)
-            rec_stack.add(node)
-
-            for neighbor in self.dependencies.get(node, ()):
-                if neighbor not in visited:
-                    dfs(neighbor)
-                elif neighbor in rec_stack:
-                    msg = f"Circular dependency detected involving {node!r} and {neighbor!r}"
-                    raise ValueError(msg)
-
-            rec_stack.remove(node)
-
-        for asset_name in asset_names:
-            if asset_name not in visited:
-                dfs(asset_name)
+        for root in upstream:
+            if root in visited:
+                continue
+
+            # Each frame holds a node and an iterator over its dependencies
+            visited.add(root)
+            rec_stack.add(root)
+            stack = [(root, iter(upstream[root]))]
+
+            while stack:
+                node, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        rec_stack.add(neighbor)
+                        stack.append((neighbor, iter(upstream[neighbor])))
+                        break
+                    if neighbor in rec_stack:
+                        msg = f"Circular dependency detected involving {node!r} and {neighbor!r}"
+                        raise ValueError(msg)
+                else:
+                    rec_stack.discard(node)
+                    stack.pop()
 
     def get_asset(self, name: str) -> Asset | None:
         """Get an asset by name."""
-        for asset in self.assets:
-            if asset.name == name:
-                return asset
-        return None
+        return self._graph_index.assets.get(name)
 
     def get_dependencies(self, asset_name: str) -> tuple[Asset, ...]:
         """Get all assets that the given asset depends on (upstream)."""
-        if asset_name not in self.dependencies:
-            return ()
-        dep_names = self.dependencies[asset_name]
-        deps: list[Asset] = []
-        for asset in self.assets:
-            if asset.name in dep_names:
-                deps.append(asset)
-        return tuple(deps)
+        index = self._graph_index
+        return tuple(index.assets[name] for name in index.upstream.get(asset_name, ()))
 
     def get_dependents(self, asset_name: str) -> tuple[Asset, ...]:
         """Get all assets that depend on the given asset (downstream)."""
-        dependents: list[Asset] = []
-        for asset in self.assets:
-            if asset_name in self.dependencies.get(asset.name, ()):
-                dependents.append(asset)
-        return tuple(dependents)
+        index = self._graph_index
+        return tuple(index.assets[name] for name in index.downstream.get(asset_name, ()))
+
+    def _cached(self, key: tuple[Any, ...], compute: Callable[[], Any]) -> Any:
+        """Memoize a traversal result (the graph is immutable)."""
+        cache = self._graph_index.cache
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
 
     def topological_order(self) -> tuple[str, ...]:
         """
         Compute topological ordering of assets for execution.
 
         Assets are ordered such that all dependencies appear before
-        the assets that depend on them.
+        the assets that depend on them. The order is computed once and
+        cached.
 
         Returns:
             Tuple of asset names in topological order.
@@ -639,22 +704,21 @@ class AssetGraph:
             ValueError: If the graph contains cycles (should not happen
                 if validation passed).
         """
-        # Kahn's algorithm for topological sorting
-        asset_names = {asset.name for asset in self.assets}
-        in_degree: dict[str, int] = {name: 0 for name in asset_names}
-
-        # Calculate in-degrees
-        for asset_name, deps in self.dependencies.items():
-            in_degree[asset_name] = len(deps)
+        order: tuple[str, ...] = self._cached(
+            ("topological_order",), self._compute_topological_order
+        )
+        return order
 
-        # Initialize queue with assets that have no dependencies
+    def _compute_topological_order(self) -> tuple[str, ...]:
+        """Compute topological order with Kahn's algorithm."""
         from collections import deque
 
-        queue: deque[str] = deque()
-        for name in asset_names:
-            if in_degree[name] == 0:
-                queue.append(name)
+        upstream = self._graph_index.upstream
+        downstream = self._graph_index.downstream
+        in_degree = {name: len(deps) for name, deps in upstream.items()}
 
+        # Initialize queue with assets that have no dependencies
+        queue: deque[str] = deque(name for name, degree in in_degree.items() if degree == 0)
         result: list[str] = []
 
         while queue:
@@ -662,23 +726,87 @@ class AssetGraph:
             result.append(node)
 
             # Reduce in-degree for all dependents
-            for dependent_asset in self.get_dependents(node):
-                in_degree[dependent_asset.name] -= 1
-                if in_degree[dependent_asset.name] == 0:
-                    queue.append(dependent_asset.name)
+            for dependent in downstream[node]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
 
-        if len(result) != len(asset_names):
+        if len(result) != len(upstream):
             msg = "Graph contains cycles - cannot compute topological order"
             raise ValueError(msg)
 
         return tuple(result)
 
+    def topological_levels(self) -> tuple[tuple[str, ...], ...]:
+        """
+        Group assets into levels that can execute concurrently.
+
+        Level 0 holds assets without dependencies; every other asset sits
+        one level below its deepest dependency. The levels are computed
+        once and cached.
+
+        Returns:
+            Tuple of levels, each a tuple of asset names in topological order
+
+        Example:
+            Run each level in parallel::
+
+                for level in graph.topological_levels():
+                    run_concurrently(level)
+        """
+        levels: tuple[tuple[str, ...], ...] = self._cached(
+            ("topological_levels",), self._compute_topological_levels
+        )
+        return levels
+
+    def _compute_topological_levels(self) -> tuple[tuple[str, ...], ...]:
+        """Compute topological levels from the cached order."""
+        upstream = self._graph_index.upstream
+        level_of: dict[str, int] = {}
+        levels: list[list[str]] = []
+
+        for name in self.topological_order():
+            level = max((level_of[dep] + 1 for dep in upstream[name]), default=0)
+            level_of[name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(name)
+
+        return tuple(tuple(level) for level in levels)
+
+    def _traverse(
+        self, asset_name: str, adjacency: Mapping[str, tuple[str, ...]], depth: int | None
+    ) -> tuple[str, ...]:
+        """
+        Collect names reachable from an asset in DFS preorder.
+
+        Uses an explicit stack so deep graphs do not hit the recursion limit.
+        """
+        visited: set[str] = set()
+        result: list[str] = []
+        stack = [(iter(adjacency[asset_name]), 1)]
+
+        while stack:
+            neighbors, current_depth = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    result.append(neighbor)
+                    if depth is None or current_depth < depth:
+                        stack.append((iter(adjacency[neighbor]), current_depth + 1))
+                    break
+            else:
+                stack.pop()
+
+        return tuple(result)
+
     def get_upstream(self, asset_name: str, depth: int | None = None) -> tuple[Asset, ...]:
         """
         Get all upstream assets (dependencies) recursively.
 
         This method traverses the dependency graph upstream from the given asset,
         collecting all assets that it depends on, either directly or indirectly.
+        Results are memoized per asset and depth.
 
         Args:
             asset_name: The name of the asset to query
@@ -701,28 +829,11 @@ class AssetGraph:
             msg = f"Asset {asset_name!r} not found in graph"
             raise ValueError(msg)
 
-        visited: set[str] = set()
-        result: list[Asset] = []
-
-        def traverse(name: str, current_depth: int) -> None:
-            """Recursively traverse upstream dependencies."""
-            # Check depth limit
-            if depth is not None and current_depth > depth:
-                return
-
-            # Get direct dependencies
-            deps = self.get_dependencies(name)
-
-            for dep in deps:
-                if dep.name not in visited:
-                    visited.add(dep.name)
-                    result.append(dep)
-                    # Recursively traverse dependencies
-                    traverse(dep.name, current_depth + 1)
-
-        traverse(asset_name, 1)
-
-        return tuple(result)
+        names = self._cached(
+            ("upstream", asset_name, depth),
+            lambda: self._traverse(asset_name, self._graph_index.upstream, depth),
+        )
+        return tuple(self._graph_index.assets[name] for name in names)
 
     def get_downstream(self, asset_name: str, depth: int | None = None) -> tuple[Asset, ...]:
         """
@@ -730,6 +841,7 @@ class AssetGraph:
 
         This method traverses the dependency graph downstream from the given asset,
         collecting all assets that depend on it, either directly or indirectly.
+        Results are memoized per asset and depth.
 
         Args:
             asset_name: The name of the asset to query
@@ -752,28 +864,11 @@ class AssetGraph:
             msg = f"Asset {asset_name!r} not found in graph"
             raise ValueError(msg)
 
-        visited: set[str] = set()
-        result: list[Asset] = []
-
-        def traverse(name: str, current_depth: int) -> None:
-            """Recursively traverse downstream dependents."""
-            # Check depth limit
-            if depth is not None and current_depth > depth:
-                return
-
-            # Get direct dependents
-            dependents = self.get_dependents(name)
-
-            for dependent in dependents:
-                if dependent.name not in visited:
-                    visited.add(dependent.name)
-                    result.append(dependent)
-                    # Recursively traverse dependents
-                    traverse(dependent.name, current_depth + 1)
-
-        traverse(asset_name, 1)
-
-        return tuple(result)
+        names = self._cached(
+            ("downstream", asset_name, depth),
+            lambda: self._traverse(asset_name, self._graph_index.downstream, depth),
+        )
+        return tuple(self._graph_index.assets[name] for name in names)
 
     def get_lineage_graph(self) -> dict[str, tuple[str, ...]]:
         """
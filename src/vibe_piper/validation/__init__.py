@@ -9,6 +9,7 @@ This module provides comprehensive data validation capabilities including:
 - Detailed validation results
 - Lazy validation mode (collect all errors)
 - Advanced validation: anomaly detection, data profiling, drift detection, quality scoring
+- Mergeable sketches for approximate statistics of very large tables
 - Validation history: PostgreSQL-based storage, trend analysis, failure pattern detection, baseline comparison
 """
 
@@ -68,6 +69,7 @@ from vibe_piper.validation.anomaly_detection import (
     detect_anomalies_isolation_forest,
     detect_anomalies_multi_method,
     detect_anomalies_one_class_svm,
+    detect_anomalies_with_model,
     detect_anomalies_zscore,
     expect_column_no_anomalies_iqr,
     expect_column_no_anomalies_isolation_forest,
@@ -75,6 +77,15 @@ from vibe_piper.validation.anomaly_detection import (
     expect_column_no_anomalies_zscore,
     rank_anomalies,
 )
+from vibe_piper.validation.anomaly_models import (
+    AnomalyModel,
+    AnomalyModelRegistry,
+    IQRModel,
+    IsolationForestModel,
+    OneClassSVMModel,
+    RobustZScoreModel,
+    ZScoreModel,
+)
 from vibe_piper.validation.data_profiling import (
     ColumnStatistics,
     DataProfile,
@@ -94,7 +105,9 @@ from vibe_piper.validation.decorators import (
 from vibe_piper.validation.drift_detection import (
     BaselineMetadata,
     BaselineStore,
+    BaselineSummary,
     ColumnDriftResult,
+    ColumnSummary,
     DriftHistory,
     DriftHistoryEntry,
     DriftResult,
@@ -112,6 +125,7 @@ from vibe_piper.validation.drift_detection import (
 from vibe_piper.validation.history import (
     FailurePattern,
     PostgreSQLValidationHistoryStore,
+    SQLiteValidationHistoryStore,
     TrendAnalysisResult,
     ValidationCheckRecord,
     ValidationHistoryAnalyzer,
@@ -134,6 +148,7 @@ from vibe_piper.validation.quality_scoring import (
     QualityHistory,
     QualityRecommendation,
     QualityScore,
+    QualityStatistics,
     QualityThresholdConfig,
     QualityTrend,
     calculate_column_quality,
@@ -142,11 +157,29 @@ from vibe_piper.validation.quality_scoring import (
     calculate_quality_score,
     calculate_uniqueness,
     calculate_validity,
+    compute_quality_statistics,
     create_quality_dashboard,
     generate_quality_alerts,
     generate_quality_recommendations,
     track_quality_history,
 )
+from vibe_piper.validation.scan import (
+    DatasetCheck,
+    DatasetStatistics,
+    StatisticalCheck,
+    StatKind,
+    StatRequest,
+    compute_statistics,
+)
+from vibe_piper.validation.sketches import (
+    CountMinSketch,
+    DistinctSample,
+    HyperLogLog,
+    KLLSketch,
+    ReservoirSample,
+    Sketch,
+    load_sketch,
+)
 from vibe_piper.validation.suite import (
     LazyValidationStrategy,
     SuiteValidationResult,
@@ -168,6 +201,21 @@ __all__ = [
     "ValidationContext",
     "SuiteValidationResult",
     "create_validation_suite",
+    # Fused statistics scan
+    "StatisticalCheck",
+    "DatasetCheck",
+    "StatKind",
+    "StatRequest",
+    "DatasetStatistics",
+    "compute_statistics",
+    # Mergeable sketches
+    "Sketch",
+    "KLLSketch",
+    "HyperLogLog",
+    "DistinctSample",
+    "CountMinSketch",
+    "ReservoirSample",
+    "load_sketch",
     # Check functions (30+ validations)
     "expect_column_mean_to_be_between",
     "expect_column_std_dev_to_be_between",
@@ -214,11 +262,19 @@ __all__ = [
     "detect_anomalies_one_class_svm",
     "detect_anomalies_multi_method",
     "detect_anomalies_against_baseline",
+    "detect_anomalies_with_model",
     "rank_anomalies",
     "expect_column_no_anomalies_zscore",
     "expect_column_no_anomalies_iqr",
     "expect_column_no_anomalies_isolation_forest",
     "expect_column_no_anomalies_one_class_svm",
+    "AnomalyModel",
+    "ZScoreModel",
+    "RobustZScoreModel",
+    "IQRModel",
+    "IsolationForestModel",
+    "OneClassSVMModel",
+    "AnomalyModelRegistry",
     # Advanced validation: data profiling
     "ColumnStatistics",
     "DataProfile",
@@ -229,6 +285,8 @@ __all__ = [
     "DriftResult",
     "DriftThresholds",
     "BaselineStore",
+    "BaselineSummary",
+    "ColumnSummary",
     "DriftHistory",
     "BaselineMetadata",
     "DriftHistoryEntry",
@@ -254,6 +312,8 @@ __all__ = [
     "calculate_consistency",
     "calculate_quality_score",
     "calculate_column_quality",
+    "QualityStatistics",
+    "compute_quality_statistics",
     "track_quality_history",
     "generate_quality_alerts",
     "generate_quality_recommendations",
@@ -266,6 +326,7 @@ __all__ = [
     "FailurePattern",
     "ValidationHistoryStore",
     "PostgreSQLValidationHistoryStore",
+    "SQLiteValidationHistoryStore",
     "ValidationHistoryAnalyzer",
     # Integration utilities
     "suite_result_to_run_metadata",
@@ -5,19 +5,31 @@ This module provides multiple algorithms for detecting anomalies:
 - Z-score: Standard score-based outlier detection
 - IQR: Interquartile range-based outlier detection
 - Isolation Forest: ML-based anomaly detection using scikit-learn
+- Fitted models, cached in a registry, that score new batches without refitting
 
 All methods return structured results with outlier indices and scores.
 """
 
 from __future__ import annotations
 
-import statistics
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from vibe_piper.types import DataRecord, ValidationResult
+from vibe_piper.validation.anomaly_models import (
+    AnomalyModel,
+    AnomalyModelRegistry,
+    IsolationForestModel,
+    OneClassSVMModel,
+    _iqr_scores,
+    _robust_zscores,
+    _zscores,
+)
+from vibe_piper.validation.scan import _column, _row_data
 
 if TYPE_CHECKING:
     pass
@@ -57,6 +69,29 @@ class AnomalyResult:
         return self.outlier_count / len(self.anomaly_scores)
 
 
+def _numeric_column(records: Sequence[Any], column: str) -> tuple[np.ndarray, np.ndarray]:
+    """Record indices and values of a column's numeric entries, excluding NaN."""
+    values = _column(_row_data(records), column)
+    indices = [index for index, value in enumerate(values) if isinstance(value, (int, float))]
+    numbers = np.array([values[index] for index in indices], dtype=float)
+    keep = ~np.isnan(numbers)
+    return np.array(indices, dtype=np.int64)[keep], numbers[keep]
+
+
+def _quartiles(values: np.ndarray) -> tuple[float, float]:
+    """Q1 and Q3, interpolated at positions (n + 1) / 4 and 3 (n + 1) / 4."""
+    q1, q3 = np.quantile(values, [0.25, 0.75], method="weibull")
+    return float(q1), float(q3)
+
+
+def _score_statistics(scores: np.ndarray) -> dict[str, float]:
+    return {
+        "min_score": float(scores.min()),
+        "max_score": float(scores.max()),
+        "median_score": float(np.median(scores)),
+    }
+
+
 # =============================================================================
 # Statistical Anomaly Detection Methods
 # =============================================================================
@@ -97,11 +132,7 @@ def detect_anomalies_zscore(
             )
 
         # Extract numeric values
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                values.append(float(val))
+        indices, values = _numeric_column(records, column)
 
         if len(values) < 2:
             return AnomalyResult(
@@ -114,47 +145,25 @@ def detect_anomalies_zscore(
 
         if use_modified_zscore:
             # Modified Z-score: uses median and MAD (more robust to outliers)
-            median_val = statistics.median(values)
-            mad = statistics.median(
-                [abs(v - median_val) for v in values]
-            )  # Median Absolute Deviation
-            # Constant factor for normality approximation
-            mad_scaled = 1.4826 * mad if mad != 0 else 1.0
-            scores = [abs(v - median_val) / mad_scaled for v in values]
-            center = median_val
-            scale = mad
+            center = float(np.median(values))
+            scale = float(np.median(np.abs(values - center)))  # Median Absolute Deviation
+            scores = _robust_zscores(values, center, scale)
         else:
             # Standard Z-score
-            mean_val = statistics.mean(values)
-            stdev = statistics.stdev(values) if len(values) > 1 else 0.0
-            stdev = stdev if stdev != 0 else 1.0
-            scores = [abs((v - mean_val) / stdev) for v in values]
-            center = mean_val
-            scale = stdev
+            center = float(values.mean())
+            scale = float(values.std(ddof=1)) or 1.0
+            scores = _zscores(values, center, scale)
 
         # Identify outliers
-        outlier_indices = []
-        current_idx = 0
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                if scores[current_idx] > threshold:
-                    outlier_indices.append(idx)
-                current_idx += 1
+        outlier_indices = indices[scores > threshold]
 
         return AnomalyResult(
             method="modified_zscore" if use_modified_zscore else "zscore",
-            outlier_indices=tuple(outlier_indices),
+            outlier_indices=tuple(outlier_indices.tolist()),
             outlier_count=len(outlier_indices),
-            anomaly_scores=tuple(scores),
+            anomaly_scores=tuple(scores.tolist()),
             threshold=threshold,
-            statistics={
-                "mean": center,
-                "std_dev": scale,
-                "min_score": min(scores),
-                "max_score": max(scores),
-                "median_score": statistics.median(scores),
-            },
+            statistics={"mean": center, "std_dev": scale, **_score_statistics(scores)},
         )
 
     return validate
@@ -192,11 +201,7 @@ def detect_anomalies_iqr(
             )
 
         # Extract numeric values
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                values.append(float(val))
+        indices, values = _numeric_column(records, column)
 
         if len(values) < 4:
             return AnomalyResult(
@@ -207,58 +212,22 @@ def detect_anomalies_iqr(
                 statistics={"error": "Need at least 4 values for IQR"},
             )
 
-        # Calculate quartiles
-        sorted_vals = sorted(values)
-        n = len(sorted_vals)
-
-        if use_quartiles:
-            q1, q3 = use_quartiles
-        else:
-            # Linear interpolation for quartiles
-            q1_pos = (n + 1) / 4.0 - 1
-            q3_pos = (3 * (n + 1) / 4.0) - 1
-
-            q1_floor = int(q1_pos)
-            q3_floor = int(q3_pos)
-            q1_ceil = q1_floor + 1
-            q3_ceil = q3_floor + 1
-
-            q1 = sorted_vals[q1_floor] + (q1_pos - q1_floor) * (
-                sorted_vals[q1_ceil] - sorted_vals[q1_floor]
-            )
-            q3 = sorted_vals[q3_floor] + (q3_pos - q3_floor) * (
-                sorted_vals[q3_ceil] - sorted_vals[q3_floor]
-            )
+        # Calculate quartiles (linear interpolation)
+        q1, q3 = use_quartiles if use_quartiles else _quartiles(values)
 
         iqr = q3 - q1
         lower_bound = q1 - multiplier * iqr
         upper_bound = q3 + multiplier * iqr
 
-        # Identify outliers and create anomaly scores
-        outlier_indices = []
-        scores = []
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                # Score based on distance from bounds
-                if val < lower_bound:
-                    distance = lower_bound - val
-                    score = distance / (iqr if iqr != 0 else 1.0)
-                elif val > upper_bound:
-                    distance = val - upper_bound
-                    score = distance / (iqr if iqr != 0 else 1.0)
-                else:
-                    score = 0.0
-                scores.append(score)
-
-                if score > 0:
-                    outlier_indices.append(idx)
+        # Score based on distance from bounds
+        scores = _iqr_scores(values, q1, q3, multiplier)
+        outlier_indices = indices[scores > 0]
 
         return AnomalyResult(
             method="iqr",
-            outlier_indices=tuple(outlier_indices),
+            outlier_indices=tuple(outlier_indices.tolist()),
             outlier_count=len(outlier_indices),
-            anomaly_scores=tuple(scores),
+            anomaly_scores=tuple(scores.tolist()),
             statistics={
                 "q1": q1,
                 "q3": q3,
@@ -277,6 +246,33 @@ def detect_anomalies_iqr(
 # =============================================================================
 
 
+def _estimator_result(
+    model: AnomalyModel, indices: np.ndarray, values: np.ndarray, hint: str
+) -> AnomalyResult:
+    """Fit a scikit-learn model on values and flag the outliers among them."""
+    # scikit-learn is imported only when a model is fitted (optional dependency)
+    try:
+        model.fit(values)
+    except ImportError as e:
+        return AnomalyResult(
+            method=model.method,
+            outlier_indices=(),
+            outlier_count=0,
+            anomaly_scores=(),
+            statistics={"error": str(e), "hint": hint},
+        )
+
+    scores, outliers = model.score(values)
+    outlier_indices = indices[outliers]
+    return AnomalyResult(
+        method=model.method,
+        outlier_indices=tuple(outlier_indices.tolist()),
+        outlier_count=len(outlier_indices),
+        anomaly_scores=tuple(scores.tolist()),
+        statistics={**model.statistics(), **_score_statistics(scores)},
+    )
+
+
 def detect_anomalies_isolation_forest(
     column: str,
     contamination: float = 0.1,
@@ -316,13 +312,7 @@ def detect_anomalies_isolation_forest(
             )
 
         # Extract numeric values and record indices
-        values = []
-        valid_indices = []
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                values.append(float(val))
-                valid_indices.append(idx)
+        indices, values = _numeric_column(records, column)
 
         if len(values) < 2:
             return AnomalyResult(
@@ -333,73 +323,17 @@ def detect_anomalies_isolation_forest(
                 statistics={"error": "Need at least 2 numeric values"},
             )
 
-        # Import scikit-learn only when needed (optional dependency)
-        try:
-            from sklearn.ensemble import IsolationForest  # type: ignore[import-untyped]
-        except ImportError as e:
-            msg = (
-                "scikit-learn is required for Isolation Forest. "
-                "Install with: pip install scikit-learn"
-            )
-            return AnomalyResult(
-                method="isolation_forest",
-                outlier_indices=(),
-                outlier_count=0,
-                anomaly_scores=(),
-                statistics={"error": str(e), "hint": msg},
-            )
-
-        # Convert to numpy array
-        try:
-            import numpy as np
-
-            X = np.array(values).reshape(-1, 1)
-        except ImportError:
-            # Fallback without numpy - return empty result
-            return AnomalyResult(
-                method="isolation_forest",
-                outlier_indices=(),
-                outlier_count=0,
-                anomaly_scores=(),
-                statistics={"error": "numpy is required for Isolation Forest"},
-            )
-
-        # Fit Isolation Forest
-        clf = IsolationForest(
-            n_estimators=n_estimators,
+        model = IsolationForestModel(
             contamination=contamination,
+            n_estimators=n_estimators,
             max_samples=max_samples,
             random_state=random_state,
         )
-        clf.fit(X)
-
-        # Predict anomalies (-1 = anomaly, 1 = normal)
-        predictions = clf.predict(X)
-        # Get anomaly scores (lower = more anomalous)
-        scores = clf.score_samples(X)
-
-        # Convert scores to positive (higher = more anomalous)
-        max_score = max(scores)
-        normalized_scores = [max_score - s for s in scores]
-
-        # Map back to original record indices
-        outlier_indices = []
-        for i, pred in enumerate(predictions):
-            if pred == -1:  # Anomaly
-                outlier_indices.append(valid_indices[i])
-
-        return AnomalyResult(
-            method="isolation_forest",
-            outlier_indices=tuple(outlier_indices),
-            outlier_count=len(outlier_indices),
-            anomaly_scores=tuple(normalized_scores),
-            statistics={
-                "contamination": contamination,
-                "n_estimators": n_estimators,
-                "min_score": min(normalized_scores),
-                "max_score": max(normalized_scores),
-                "median_score": statistics.median(normalized_scores),
-            },
+        return _estimator_result(
+            model,
+            indices,
+            values,
+            "scikit-learn is required for Isolation Forest. Install with: pip install scikit-learn",
         )
 
     return validate
@@ -466,13 +400,7 @@ def rank_anomalies(
             )
 
         # Extract numeric values
-        values = []
-        valid_indices = []
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                values.append(float(val))
-                valid_indices.append(idx)
+        indices, values = _numeric_column(records, column)
 
         if len(values) < 2:
             return AnomalyRankingResult(
@@ -485,30 +413,21 @@ def rank_anomalies(
             )
 
         # Calculate Z-scores
-        mean_val = statistics.mean(values)
-        stdev = statistics.stdev(values)
-        stdev = stdev if stdev != 0 else 1.0
-        scores = [abs((v - mean_val) / stdev) for v in values]
-
-        # Rank by score (descending)
-        sorted_pairs = sorted(zip(valid_indices, scores), key=lambda x: x[1], reverse=True)
-        ranked_indices = tuple(idx for idx, _ in sorted_pairs)
-        ranked_scores = tuple(score for _, score in sorted_pairs)
+        scores = _zscores(values, float(values.mean()), float(values.std(ddof=1)))
 
-        # Get top N
-        top_indices = tuple(idx for idx, score in sorted_pairs[:top_n])
-        top_scores = tuple(score for _, score in sorted_pairs[:top_n])
-
-        # Count anomalies (Z-score > 3)
-        anomaly_count = sum(1 for score in scores if score > 3.0)
+        # Rank by score (descending, ties in record order)
+        order = np.argsort(-scores, kind="stable")
+        ranked_indices = tuple(indices[order].tolist())
+        ranked_scores = tuple(scores[order].tolist())
 
         return AnomalyRankingResult(
             column=column,
             ranked_indices=ranked_indices,
             ranked_scores=ranked_scores,
-            top_n_indices=top_indices,
-            top_n_scores=top_scores,
-            total_anomalies=anomaly_count,
+            top_n_indices=ranked_indices[:top_n],
+            top_n_scores=ranked_scores[:top_n],
+            # Count anomalies (Z-score > 3)
+            total_anomalies=int((scores > 3.0).sum()),
         )
 
     return validate
@@ -572,11 +491,7 @@ def detect_anomalies_against_baseline(
     """
 
     # Pre-compute baseline statistics
-    baseline_values = []
-    for record in baseline_records:
-        val = record.get(column)
-        if isinstance(val, (int, float)):
-            baseline_values.append(float(val))
+    _, baseline_values = _numeric_column(baseline_records, column)
 
     if len(baseline_values) < 4:
         # Not enough data for baseline - return empty result
@@ -593,26 +508,9 @@ def detect_anomalies_against_baseline(
         return validate_no_baseline
 
     # Compute baseline statistics
-    baseline_mean = statistics.mean(baseline_values)
-    baseline_stdev = statistics.stdev(baseline_values) if len(baseline_values) > 1 else 1.0
-    baseline_stdev = baseline_stdev if baseline_stdev != 0 else 1.0
-
-    sorted_baseline = sorted(baseline_values)
-    n_baseline = len(sorted_baseline)
-    q1_pos = (n_baseline + 1) / 4.0 - 1
-    q3_pos = (3 * (n_baseline + 1) / 4.0) - 1
-
-    q1_floor = int(q1_pos)
-    q3_floor = int(q3_pos)
-    q1_ceil = q1_floor + 1
-    q3_ceil = q3_floor + 1
-
-    baseline_q1 = sorted_baseline[q1_floor] + (q1_pos - q1_floor) * (
-        sorted_baseline[q1_ceil] - sorted_baseline[q1_floor]
-    )
-    baseline_q3 = sorted_baseline[q3_floor] + (q3_pos - q3_floor) * (
-        sorted_baseline[q3_ceil] - sorted_baseline[q3_floor]
-    )
+    baseline_mean = float(baseline_values.mean())
+    baseline_stdev = float(baseline_values.std(ddof=1)) or 1.0
+    baseline_q1, baseline_q3 = _quartiles(baseline_values)
     baseline_iqr = baseline_q3 - baseline_q1
 
     baseline_stats = {
@@ -622,8 +520,8 @@ def detect_anomalies_against_baseline(
         "q3": baseline_q3,
         "iqr": baseline_iqr,
         "count": len(baseline_values),
-        "min": min(baseline_values),
-        "max": max(baseline_values),
+        "min": float(baseline_values.min()),
+        "max": float(baseline_values.max()),
     }
 
     def validate(records: Sequence[DataRecord]) -> BaselineComparisonResult:
@@ -638,15 +536,9 @@ def detect_anomalies_against_baseline(
             )
 
         # Extract current values
-        current_values = []
-        valid_indices = []
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                current_values.append(float(val))
-                valid_indices.append(idx)
-
-        if not current_values:
+        indices, current_values = _numeric_column(records, column)
+
+        if not len(current_values):
             return BaselineComparisonResult(
                 column=column,
                 baseline_stats=baseline_stats,
@@ -657,32 +549,23 @@ def detect_anomalies_against_baseline(
             )
 
         # Compute current statistics
-        current_mean = statistics.mean(current_values)
-        current_stdev = statistics.stdev(current_values) if len(current_values) > 1 else 0.0
+        current_mean = float(current_values.mean())
+        current_stdev = float(current_values.std(ddof=1)) if len(current_values) > 1 else 0.0
 
         current_stats = {
             "mean": current_mean,
             "std_dev": current_stdev,
             "count": len(current_values),
-            "min": min(current_values),
-            "max": max(current_values),
+            "min": float(current_values.min()),
+            "max": float(current_values.max()),
         }
 
-        # Detect anomalies using both std dev and IQR thresholds
-        drifted_indices = []
-        for idx, val in zip(valid_indices, current_values):
-            # Check std dev threshold
-            z_score = abs((val - baseline_mean) / baseline_stdev)
-            std_anomaly = z_score > threshold_std
-
-            # Check IQR threshold
-            lower_bound = baseline_q1 - threshold_iqr_multiplier * baseline_iqr
-            upper_bound = baseline_q3 + threshold_iqr_multiplier * baseline_iqr
-            iqr_anomaly = val < lower_bound or val > upper_bound
-
-            # Flag if either method detects anomaly
-            if std_anomaly or iqr_anomaly:
-                drifted_indices.append(idx)
+        # Flag records beyond either the std dev or the IQR threshold
+        std_anomaly = _zscores(current_values, baseline_mean, baseline_stdev) > threshold_std
+        iqr_anomaly = (
+            _iqr_scores(current_values, baseline_q1, baseline_q3, threshold_iqr_multiplier) > 0
+        )
+        drifted_indices = indices[std_anomaly | iqr_anomaly]
 
         # Compute overall drift score (distance between means as proportion of std dev)
         drift_magnitude = abs(current_mean - baseline_mean) / baseline_stdev
@@ -692,7 +575,7 @@ def detect_anomalies_against_baseline(
             column=column,
             baseline_stats=baseline_stats,
             current_stats=current_stats,
-            drifted_indices=tuple(drifted_indices),
+            drifted_indices=tuple(drifted_indices.tolist()),
             drift_score=drift_score,
             baseline_window=baseline_window,
         )
@@ -892,13 +775,7 @@ def detect_anomalies_one_class_svm(
             )
 
         # Extract numeric values and record indices
-        values = []
-        valid_indices = []
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, (int, float)):
-                values.append(float(val))
-                valid_indices.append(idx)
+        indices, values = _numeric_column(records, column)
 
         if len(values) < 2:
             return AnomalyResult(
@@ -909,67 +786,11 @@ def detect_anomalies_one_class_svm(
                 statistics={"error": "Need at least 2 numeric values"},
             )
 
-        # Import scikit-learn only when needed (optional dependency)
-        try:
-            from sklearn.svm import OneClassSVM  # type: ignore[import-untyped]
-        except ImportError as e:
-            msg = (
-                "scikit-learn is required for One-Class SVM. Install with: pip install scikit-learn"
-            )
-            return AnomalyResult(
-                method="one_class_svm",
-                outlier_indices=(),
-                outlier_count=0,
-                anomaly_scores=(),
-                statistics={"error": str(e), "hint": msg},
-            )
-
-        # Convert to numpy array
-        try:
-            import numpy as np
-
-            X = np.array(values).reshape(-1, 1)
-        except ImportError:
-            return AnomalyResult(
-                method="one_class_svm",
-                outlier_indices=(),
-                outlier_count=0,
-                anomaly_scores=(),
-                statistics={"error": "numpy is required for One-Class SVM"},
-            )
-
-        # Fit One-Class SVM
-        clf = OneClassSVM(nu=nu, kernel=kernel, gamma=gamma)
-        clf.fit(X)
-
-        # Predict anomalies (-1 = anomaly, 1 = normal)
-        predictions = clf.predict(X)
-        # Get decision function scores (lower = more anomalous)
-        scores = clf.decision_function(X)
-
-        # Convert scores to positive (higher = more anomalous)
-        max_score = max(scores)
-        normalized_scores = [max_score - s for s in scores]
-
-        # Map back to original record indices
-        outlier_indices = []
-        for i, pred in enumerate(predictions):
-            if pred == -1:  # Anomaly
-                outlier_indices.append(valid_indices[i])
-
-        return AnomalyResult(
-            method="one_class_svm",
-            outlier_indices=tuple(outlier_indices),
-            outlier_count=len(outlier_indices),
-            anomaly_scores=tuple(normalized_scores),
-            statistics={
-                "nu": nu,
-                "kernel": kernel,
-                "gamma": gamma,
-                "min_score": min(normalized_scores),
-                "max_score": max(normalized_scores),
-                "median_score": statistics.median(normalized_scores),
-            },
+        return _estimator_result(
+            OneClassSVMModel(nu=nu, kernel=kernel, gamma=gamma),
+            indices,
+            values,
+            "scikit-learn is required for One-Class SVM. Install with: pip install scikit-learn",
         )
 
     return validate
@@ -1032,6 +853,84 @@ def detect_anomalies_multi_method(
     return validate
 
 
+def detect_anomalies_with_model(
+    column: str,
+    model: AnomalyModel,
+    registry: AnomalyModelRegistry | None = None,
+    asset: str = "default",
+    baseline: str = "default",
+    update: bool = False,
+) -> Callable[[Sequence[DataRecord]], AnomalyResult]:
+    """
+    Detect anomalies with a model fitted once and reused across batches.
+
+    The first batch fits the model (or a fitted model is taken from the
+    registry); later batches are only scored against it. With update=True
+    each scored batch is also learned from, online for the statistical
+    models and through the registry's periodic refits for the
+    scikit-learn ones.
+
+    Args:
+        column: Column name to check for anomalies
+        model: Unfitted model with the method and parameters to use
+        registry: Registry that caches and persists the fitted model
+            (None to keep it in this detector only)
+        asset: Asset the data belongs to (registry key)
+        baseline: Baseline the model is fitted on (registry key)
+        update: Whether to learn from every scored batch
+
+    Returns:
+        Function that produces AnomalyResult when applied to data
+
+    Example:
+        >>> registry = AnomalyModelRegistry("./anomaly_models")
+        >>> detector = detect_anomalies_with_model(
+        ...     "amount", ZScoreModel(threshold=3.0), registry, asset="orders", update=True
+        ... )
+        >>> result = detector(records)
+    """
+    registry = registry or AnomalyModelRegistry(storage_dir=None)
+
+    def validate(records: Sequence[DataRecord]) -> AnomalyResult:
+        indices, values = _numeric_column(records, column)
+        fitted = registry.get(asset, column, baseline, model.method)
+        reused = fitted is not None and fitted.params == model.params
+
+        if not reused and len(values) < 2:
+            return AnomalyResult(
+                method=model.method,
+                outlier_indices=(),
+                outlier_count=0,
+                anomaly_scores=(),
+                statistics={"error": "Need at least 2 numeric values"},
+            )
+        if not len(values):
+            return AnomalyResult(
+                method=model.method,
+                outlier_indices=(),
+                outlier_count=0,
+                anomaly_scores=(),
+                statistics={"total_records": len(records)},
+            )
+
+        fitted = registry.get_or_fit(model, values, asset, column, baseline)
+        scores, outliers = fitted.score(values)
+        if update and reused:
+            fitted.update(values)
+            registry.put(fitted, asset, column, baseline)
+
+        outlier_indices = indices[outliers]
+        return AnomalyResult(
+            method=fitted.method,
+            outlier_indices=tuple(outlier_indices.tolist()),
+            outlier_count=len(outlier_indices),
+            anomaly_scores=tuple(scores.tolist()),
+            statistics={**fitted.statistics(), **_score_statistics(scores)},
+        )
+
+    return validate
+
+
 __all__ = [
     "AnomalyResult",
     "detect_anomalies_zscore",
@@ -1039,6 +938,7 @@ __all__ = [
     "detect_anomalies_isolation_forest",
     "detect_anomalies_one_class_svm",
     "detect_anomalies_multi_method",
+    "detect_anomalies_with_model",
     "AnomalyRankingResult",
     "rank_anomalies",
     "BaselineComparisonResult",
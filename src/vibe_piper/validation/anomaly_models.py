@@ -0,0 +1,582 @@
+"""
+Fitted anomaly models that score new batches without refitting.
+
+A model is fitted once on the values of a numeric column and then scores
+any number of later batches. Models can also keep learning from the
+batches they score:
+
+- ZScoreModel keeps a running (optionally windowed) mean and variance
+- RobustZScoreModel and IQRModel keep a KLL quantile sketch, from which
+  the median, MAD and quartiles are read
+- IsolationForestModel and OneClassSVMModel keep a uniform sample of the
+  values seen, and are refitted on it when asked to
+
+AnomalyModelRegistry caches fitted models per (asset, column, baseline,
+method) in memory and persists them with joblib, optionally refitting
+them periodically.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import math
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, ClassVar, Self
+
+import numpy as np
+
+from vibe_piper.validation.sketches import KLLSketch, ReservoirSample
+
+# =============================================================================
+# Scoring
+# =============================================================================
+
+
+def _zscores(values: np.ndarray, mean: float, std: float) -> np.ndarray:
+    """Absolute z-scores (a zero standard deviation counts as 1)."""
+    return np.abs(values - mean) / (std if std != 0 else 1.0)
+
+
+def _robust_zscores(values: np.ndarray, median: float, mad: float) -> np.ndarray:
+    """Modified z-scores from the median and MAD (a zero MAD counts as 1)."""
+    return np.abs(values - median) / (1.4826 * mad if mad != 0 else 1.0)
+
+
+def _iqr_scores(values: np.ndarray, q1: float, q3: float, multiplier: float) -> np.ndarray:
+    """Distance outside Tukey's fences in IQRs (0 inside the fences)."""
+    iqr = q3 - q1
+    distance = np.maximum(q1 - multiplier * iqr - values, values - (q3 + multiplier * iqr))
+    return np.maximum(distance, 0.0) / (iqr if iqr != 0 else 1.0)
+
+
+def _weighted_median(values: np.ndarray, cumulative: np.ndarray) -> float:
+    """Median of sorted values with cumulative weights."""
+    return float(values[np.searchsorted(cumulative, cumulative[-1] / 2)])
+
+
+# =============================================================================
+# Models
+# =============================================================================
+
+
+class AnomalyModel(ABC):
+    """
+    Anomaly model of a numeric column, fitted once and reused.
+
+    Attributes:
+        method: Name of the detection method
+        params: Parameters the model was created with
+        count: Number of values the model has learned from
+        fitted_at: When the model was last fitted (None until fitted)
+    """
+
+    method: ClassVar[str]
+
+    def __init__(self, **params: Any) -> None:
+        self.params = params
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget everything learned, returning to the unfitted state."""
+        self.count = 0
+        self.fitted_at: datetime | None = None
+
+    @abstractmethod
+    def update(self, values: np.ndarray) -> None:
+        """
+        Learn from more values without refitting from scratch.
+
+        Args:
+            values: Numeric values
+        """
+
+    @abstractmethod
+    def score(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Score values against the model.
+
+        Args:
+            values: Numeric values
+
+        Returns:
+            Anomaly scores (higher = more anomalous) and outlier flags
+        """
+
+    @abstractmethod
+    def statistics(self) -> dict[str, Any]:
+        """Fitted parameters, for reporting."""
+
+    def fit(self, values: np.ndarray) -> Self:
+        """
+        Fit the model on baseline values, discarding any earlier fit.
+
+        Args:
+            values: Numeric values
+
+        Returns:
+            The fitted model
+        """
+        self.reset()
+        self.update(values)
+        self.fitted_at = datetime.utcnow()
+        return self
+
+    def refit(self) -> None:
+        """
+        Refit on the values learned so far.
+
+        Online models are always up to date, so this only records the time.
+        """
+        self.fitted_at = datetime.utcnow()
+
+
+class ZScoreModel(AnomalyModel):
+    """
+    Z-scores from a running mean and variance.
+
+    Batches are merged with Chan's parallel update, so updating with a
+    batch gives the same moments as fitting on all values at once. With a
+    window, older values are down-weighted so the moments follow roughly
+    the last window values.
+    """
+
+    method = "zscore"
+
+    def __init__(self, threshold: float = 3.0, window: int | None = None) -> None:
+        """
+        Initialize an unfitted model.
+
+        Args:
+            threshold: Z-score above which values are outliers
+            window: Approximate number of recent values the moments follow
+                (None to weigh all values equally)
+        """
+        super().__init__(threshold=threshold, window=window)
+        self.threshold = threshold
+        self.window = window
+
+    def reset(self) -> None:
+        super().reset()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._weight = 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self._m2 / (self._weight - 1)) if self._weight > 1 else 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        if not len(values):
+            return
+        n = len(values)
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total = self._weight + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += batch_m2 + delta**2 * self._weight * n / total
+        self._weight = total
+        if self.window is not None and self._weight > self.window:
+            self._m2 *= self.window / self._weight
+            self._weight = float(self.window)
+        self.count += n
+
+    def score(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        scores = _zscores(values, self.mean, self.std)
+        return scores, scores > self.threshold
+
+    def statistics(self) -> dict[str, Any]:
+        return {"mean": self.mean, "std_dev": self.std or 1.0, "count": self.count}
+
+
+class _SketchModel(AnomalyModel):
+    """Model read from a KLL sketch of the values."""
+
+    def __init__(self, k: int, **params: Any) -> None:
+        super().__init__(k=k, **params)
+
+    def reset(self) -> None:
+        super().reset()
+        self._sketch = KLLSketch(k=self.params["k"])
+
+    def update(self, values: np.ndarray) -> None:
+        self._sketch.update(values)
+        self.count = self._sketch.count
+
+
+class RobustZScoreModel(_SketchModel):
+    """
+    Modified z-scores from the median and MAD of a quantile sketch.
+
+    The MAD is the weighted median of the sketch's retained values'
+    distances to the median, so both are within the sketch's rank error.
+    """
+
+    method = "modified_zscore"
+
+    def __init__(self, threshold: float = 3.0, k: int = 200) -> None:
+        """
+        Initialize an unfitted model.
+
+        Args:
+            threshold: Modified z-score above which values are outliers
+            k: KLL sketch size parameter (rank error is about 3.3 / k)
+        """
+        super().__init__(k, threshold=threshold)
+        self.threshold = threshold
+
+    def median_mad(self) -> tuple[float, float]:
+        """
+        Estimate the median and median absolute deviation.
+
+        Returns:
+            Median and MAD (NaN when no values were seen)
+        """
+        if not self._sketch.count:
+            return math.nan, math.nan
+        items, cumulative = self._sketch._weighted()
+        median = _weighted_median(items, cumulative)
+        deviations = np.abs(items - median)
+        order = np.argsort(deviations, kind="stable")
+        weights = np.diff(cumulative, prepend=0)[order]
+        return median, _weighted_median(deviations[order], np.cumsum(weights))
+
+    def score(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        median, mad = self.median_mad()
+        scores = _robust_zscores(values, median, mad)
+        return scores, scores > self.threshold
+
+    def statistics(self) -> dict[str, Any]:
+        median, mad = self.median_mad()
+        return {"mean": median, "std_dev": mad, "count": self.count}
+
+
+class IQRModel(_SketchModel):
+    """Tukey's fences from the quartiles of a quantile sketch."""
+
+    method = "iqr"
+
+    def __init__(self, multiplier: float = 1.5, k: int = 200) -> None:
+        """
+        Initialize an unfitted model.
+
+        Args:
+            multiplier: IQR multiplier (1.5 for Tukey's fences, 3.0 for extreme outliers)
+            k: KLL sketch size parameter (rank error is about 3.3 / k)
+        """
+        super().__init__(k, multiplier=multiplier)
+        self.multiplier = multiplier
+
+    def score(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        q1, q3 = self._sketch.quantiles([0.25, 0.75])
+        scores = _iqr_scores(values, q1, q3, self.multiplier)
+        return scores, scores > 0
+
+    def statistics(self) -> dict[str, Any]:
+        q1, q3 = self._sketch.quantiles([0.25, 0.75])
+        iqr = q3 - q1
+        return {
+            "q1": q1,
+            "q3": q3,
+            "iqr": iqr,
+            "lower_bound": q1 - self.multiplier * iqr,
+            "upper_bound": q3 + self.multiplier * iqr,
+            "multiplier": self.multiplier,
+        }
+
+
+class _EstimatorModel(AnomalyModel):
+    """
+    scikit-learn novelty detector of one feature.
+
+    Fitting trains on the given values. The model also keeps a uniform
+    sample of every value it has learned from, so refit() retrains on old
+    and new data without keeping all of it.
+    """
+
+    def __init__(self, sample_size: int, **params: Any) -> None:
+        super().__init__(sample_size=sample_size, **params)
+
+    def reset(self) -> None:
+        super().reset()
+        self._sample = ReservoirSample(self.params["sample_size"], seed=0)
+        self.estimator: Any = None
+
+    @abstractmethod
+    def _make_estimator(self) -> Any:
+        """New unfitted estimator."""
+
+    @abstractmethod
+    def _raw_scores(self, X: np.ndarray) -> np.ndarray:
+        """Estimator scores (lower = more anomalous)."""
+
+    def _train(self, values: np.ndarray) -> None:
+        estimator = self._make_estimator()
+        estimator.fit(np.asarray(values, dtype=float).reshape(-1, 1))
+        self.estimator = estimator
+        self.fitted_at = datetime.utcnow()
+
+    def update(self, values: np.ndarray) -> None:
+        self._sample.update(np.asarray(values, dtype=float).tolist())
+        self.count = self._sample.count
+
+    def fit(self, values: np.ndarray) -> Self:
+        self.reset()
+        self.update(values)
+        self._train(values)
+        return self
+
+    def refit(self) -> None:
+        """Retrain on the sample of the values learned so far."""
+        self._train(np.asarray(self._sample.values, dtype=float))
+
+    def score(self, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        X = np.asarray(values, dtype=float).reshape(-1, 1)
+        raw = self._raw_scores(X)
+        # Convert scores to positive (higher = more anomalous)
+        return raw.max() - raw, self.estimator.predict(X) == -1
+
+    def statistics(self) -> dict[str, Any]:
+        return {name: value for name, value in self.params.items() if name != "sample_size"}
+
+
+class IsolationForestModel(_EstimatorModel):
+    """Isolation Forest fitted once and reused to score new batches."""
+
+    method = "isolation_forest"
+
+    def __init__(
+        self,
+        contamination: float = 0.1,
+        n_estimators: int = 100,
+        max_samples: int | str = "auto",
+        random_state: int = 42,
+        sample_size: int = 10_000,
+    ) -> None:
+        """
+        Initialize an unfitted model.
+
+        Args:
+            contamination: Expected proportion of outliers (0-1)
+            n_estimators: Number of trees in the forest
+            max_samples: Number of samples to draw for each tree
+            random_state: Random seed for reproducibility
+            sample_size: Values kept for refitting
+        """
+        super().__init__(
+            sample_size,
+            contamination=contamination,
+            n_estimators=n_estimators,
+            max_samples=max_samples,
+            random_state=random_state,
+        )
+
+    def _make_estimator(self) -> Any:
+        from sklearn.ensemble import IsolationForest
+
+        return IsolationForest(
+            n_estimators=self.params["n_estimators"],
+            contamination=self.params["contamination"],
+            max_samples=self.params["max_samples"],
+            random_state=self.params["random_state"],
+        )
+
+    def _raw_scores(self, X: np.ndarray) -> np.ndarray:
+        scores: np.ndarray = self.estimator.score_samples(X)
+        return scores
+
+
+class OneClassSVMModel(_EstimatorModel):
+    """One-Class SVM fitted once and reused to score new batches."""
+
+    method = "one_class_svm"
+
+    def __init__(
+        self,
+        nu: float = 0.1,
+        kernel: str = "rbf",
+        gamma: str = "scale",
+        sample_size: int = 10_000,
+    ) -> None:
+        """
+        Initialize an unfitted model.
+
+        Args:
+            nu: Upper bound on the fraction of training errors (0-1)
+            kernel: Kernel type ('linear', 'poly', 'rbf', 'sigmoid')
+            gamma: Kernel coefficient ('scale', 'auto', or float)
+            sample_size: Values kept for refitting
+        """
+        super().__init__(sample_size, nu=nu, kernel=kernel, gamma=gamma)
+
+    def _make_estimator(self) -> Any:
+        from sklearn.svm import OneClassSVM
+
+        return OneClassSVM(
+            nu=self.params["nu"], kernel=self.params["kernel"], gamma=self.params["gamma"]
+        )
+
+    def _raw_scores(self, X: np.ndarray) -> np.ndarray:
+        scores: np.ndarray = self.estimator.decision_function(X)
+        return scores
+
+
+# =============================================================================
+# Model Registry
+# =============================================================================
+
+
+class AnomalyModelRegistry:
+    """
+    Fitted anomaly models cached per (asset, column, baseline, method).
+
+    Models are kept in memory and, when a storage directory is given, saved
+    with joblib so later runs and other processes reuse them instead of
+    refitting. A cached model created with different parameters is
+    replaced.
+
+    Example:
+        >>> registry = AnomalyModelRegistry("./anomaly_models", refit_interval=timedelta(days=1))
+        >>> detector = detect_anomalies_with_model(
+        ...     "amount", IsolationForestModel(), registry, asset="orders", update=True
+        ... )
+        >>> result = detector(batch)  # fits on the first batch, then only scores
+    """
+
+    def __init__(
+        self,
+        storage_dir: str | Path | None = ".anomaly_models",
+        refit_interval: timedelta | None = None,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            storage_dir: Directory to persist models in (None for memory only)
+            refit_interval: Refit models older than this when they are next
+                used (None to never refit)
+        """
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        if self.storage_dir is not None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.refit_interval = refit_interval
+        self._models: dict[tuple[str, str, str, str], AnomalyModel] = {}
+
+    def _path(self, key: tuple[str, str, str, str]) -> Path | None:
+        """Get filesystem path for a model."""
+        if self.storage_dir is None:
+            return None
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()[:32]
+        return self.storage_dir / f"{key[3]}-{digest}.joblib"
+
+    def get(self, asset: str, column: str, baseline: str, method: str) -> AnomalyModel | None:
+        """
+        Get a cached model.
+
+        Args:
+            asset: Asset the model belongs to
+            column: Column the model scores
+            baseline: Baseline the model was fitted on
+            method: Detection method
+
+        Returns:
+            The model, or None if there is none
+        """
+        key = (asset, column, baseline, method)
+        if key not in self._models:
+            path = self._path(key)
+            if path is None or not path.exists():
+                return None
+            import joblib
+
+            self._models[key] = joblib.load(path)
+        return self._models[key]
+
+    def put(self, model: AnomalyModel, asset: str, column: str, baseline: str) -> None:
+        """
+        Cache (and persist) a model.
+
+        Args:
+            model: Fitted model
+            asset: Asset the model belongs to
+            column: Column the model scores
+            baseline: Baseline the model was fitted on
+        """
+        key = (asset, column, baseline, model.method)
+        self._models[key] = model
+        path = self._path(key)
+        if path is not None:
+            import joblib
+
+            joblib.dump(model, path)
+
+    def get_or_fit(
+        self,
+        model: AnomalyModel,
+        values: np.ndarray,
+        asset: str,
+        column: str,
+        baseline: str,
+    ) -> AnomalyModel:
+        """
+        Get the cached model like the given one, fitting it if there is none.
+
+        A cached model older than refit_interval is refitted first. The
+        given model is only used as a template: a copy of it is fitted and
+        cached, so one instance can be passed for many columns.
+
+        Args:
+            model: Model with the wanted method and parameters
+            values: Values to fit on if there is no cached model
+            asset: Asset the model belongs to
+            column: Column the model scores
+            baseline: Baseline the model is fitted on
+
+        Returns:
+            Fitted model
+        """
+        cached = self.get(asset, column, baseline, model.method)
+        if cached is None or cached.params != model.params or cached.fitted_at is None:
+            cached = copy.deepcopy(model).fit(values)
+        elif (
+            self.refit_interval is not None
+            and datetime.utcnow() - cached.fitted_at >= self.refit_interval
+        ):
+            cached.refit()
+        else:
+            return cached
+        self.put(cached, asset, column, baseline)
+        return cached
+
+    def delete(self, asset: str, column: str, baseline: str, method: str) -> None:
+        """
+        Remove a model from the cache and storage.
+
+        Args:
+            asset: Asset the model belongs to
+            column: Column the model scores
+            baseline: Baseline the model was fitted on
+            method: Detection method
+        """
+        key = (asset, column, baseline, method)
+        self._models.pop(key, None)
+        path = self._path(key)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "AnomalyModel",
+    "ZScoreModel",
+    "RobustZScoreModel",
+    "IQRModel",
+    "IsolationForestModel",
+    "OneClassSVMModel",
+    "AnomalyModelRegistry",
+]
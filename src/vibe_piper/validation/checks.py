@@ -10,18 +10,32 @@ This module provides 20+ built-in validation types including:
 - Type and null checks
 - String length and format checks
 All checks return ValidationResult with detailed error information.
+
+Column and table checks that only need column statistics (counts, nulls,
+moments, quantiles, value frequencies, regex matches) are StatisticalChecks:
+a ValidationSuite computes the statistics of all of them in one scan and
+evaluates each check from the shared result. Checks with an `approximate`
+option compute their statistic from a bounded-size sketch instead, for
+tables too large to hold every value.
 """
 
 from __future__ import annotations
 
-import re
-import statistics
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+
 from vibe_piper.types import DataRecord, DataType, ValidationResult
+from vibe_piper.validation.scan import (
+    DatasetCheck,
+    DatasetStatistics,
+    StatisticalCheck,
+    StatKind,
+    StatRequest,
+)
 
 # =============================================================================
 # Validation Result with Details
@@ -87,23 +101,18 @@ def expect_column_mean_to_be_between(
         >>> result = check(records)
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)) and val is not None:
-                values.append(float(val))
-
-        if not values:
+        column_stats = statistics.column(column)
+        if not column_stats.numeric_count:
             return ValidationResult(
                 is_valid=False,
                 errors=(f"Column '{column}' has no numeric values",),
             )
 
-        mean_value = statistics.mean(values)
+        mean_value = column_stats.mean
         passed = min_value <= mean_value <= max_value
 
         if not passed:
@@ -117,7 +126,7 @@ def expect_column_mean_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.MOMENTS),))
 
 
 def expect_column_std_dev_to_be_between(
@@ -132,26 +141,21 @@ def expect_column_std_dev_to_be_between(
         max_value: Maximum acceptable std dev
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if len(records) < 2:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if statistics.row_count < 2:
             return ValidationResult(
                 is_valid=False,
                 errors=(f"Need at least 2 records to calculate std dev for '{column}'",),
             )
 
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)) and val is not None:
-                values.append(float(val))
-
-        if len(values) < 2:
+        column_stats = statistics.column(column)
+        if column_stats.numeric_count < 2:
             return ValidationResult(
                 is_valid=False,
                 errors=(f"Column '{column}' has fewer than 2 numeric values",),
             )
 
-        std_dev = statistics.stdev(values)
+        std_dev = column_stats.std_dev
         passed = min_value <= std_dev <= max_value
 
         if not passed:
@@ -165,7 +169,7 @@ def expect_column_std_dev_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.MOMENTS),))
 
 
 def expect_column_min_to_be_between(
@@ -173,23 +177,17 @@ def expect_column_min_to_be_between(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect column minimum value to be within a range."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)) and val is not None:
-                values.append(float(val))
-
-        if not values:
+        min_val = statistics.column(column).minimum
+        if min_val is None:
             return ValidationResult(
                 is_valid=False,
                 errors=(f"Column '{column}' has no numeric values",),
             )
 
-        min_val = min(values)
         passed = min_value <= min_val <= max_value
 
         if not passed:
@@ -203,7 +201,7 @@ def expect_column_min_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.MOMENTS),))
 
 
 def expect_column_max_to_be_between(
@@ -211,23 +209,17 @@ def expect_column_max_to_be_between(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect column maximum value to be within a range."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)) and val is not None:
-                values.append(float(val))
-
-        if not values:
+        max_val = statistics.column(column).maximum
+        if max_val is None:
             return ValidationResult(
                 is_valid=False,
                 errors=(f"Column '{column}' has no numeric values",),
             )
 
-        max_val = max(values)
         passed = min_value <= max_val <= max_value
 
         if not passed:
@@ -241,31 +233,43 @@ def expect_column_max_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.MOMENTS),))
 
 
 def expect_column_median_to_be_between(
-    column: str, min_value: float, max_value: float
+    column: str, min_value: float, max_value: float, approximate: bool = False
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
-    """Expect column median to be within a range."""
+    """
+    Expect column median to be within a range.
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
-            return ValidationResult(is_valid=True)
+    Args:
+        column: Column name to check
+        min_value: Minimum allowed median
+        max_value: Maximum allowed median
+        approximate: Estimate the median from a KLL sketch in bounded memory
+            instead of keeping every value; the estimate's rank is within
+            about 1.65% of the true median's (99% confidence)
+    """
+    kind = StatKind.QUANTILES if approximate else StatKind.VALUES
 
-        values = []
-        for record in records:
-            val = record.get(column)
-            if isinstance(val, (int, float)) and val is not None:
-                values.append(float(val))
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
+            return ValidationResult(is_valid=True)
 
-        if not values:
+        column_stats = statistics.column(column)
+        quantile: Callable[[float], float]
+        if approximate:
+            sketch = column_stats.sketch(kind)
+            count, quantile = sketch.count, sketch.quantile
+        else:
+            count, quantile = len(column_stats.values), column_stats.quantile
+        if not count:
             return ValidationResult(
                 is_valid=False,
                 errors=(f"Column '{column}' has no numeric values",),
             )
 
-        median_val = statistics.median(values)
+        median_val = quantile(0.5)
         passed = min_value <= median_val <= max_value
 
         if not passed:
@@ -279,7 +283,7 @@ def expect_column_median_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, kind),))
 
 
 # =============================================================================
@@ -299,27 +303,13 @@ def expect_column_values_to_match_regex(
         match_percentage: Minimum percentage of values that should match (0-1)
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        compiled_pattern = re.compile(pattern)
-        failed_indices: list[int] = []
-        total_values = 0
-        matched_values = 0
-
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if val is None:
-                continue
-            total_values += 1
-            if isinstance(val, str):
-                if compiled_pattern.match(val):
-                    matched_values += 1
-                else:
-                    failed_indices.append(idx)
-            else:
-                failed_indices.append(idx)
+        column_stats = statistics.column(column)
+        total_values = statistics.row_count - column_stats.nulls
+        matched_values = column_stats.regex_matches[pattern]
 
         if total_values == 0:
             return ValidationResult(
@@ -342,7 +332,10 @@ def expect_column_values_to_match_regex(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(
+        validate,
+        (StatRequest(column, StatKind.NULLS), StatRequest(column, StatKind.REGEX, pattern)),
+    )
 
 
 def expect_column_values_to_not_match_regex(
@@ -350,30 +343,25 @@ def expect_column_values_to_not_match_regex(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect column values to NOT match a regex pattern."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        compiled_pattern = re.compile(pattern)
-        failed_indices: list[int] = []
-
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if isinstance(val, str) and compiled_pattern.match(val):
-                failed_indices.append(idx)
+        matched_values = statistics.column(column).regex_matches[pattern]
 
-        if failed_indices:
+        if matched_values:
             return ValidationResult(
                 is_valid=False,
                 errors=(
-                    f"Column '{column}': {len(failed_indices)} values match "
-                    f"forbidden pattern {pattern}",
+                    f"Column '{column}': {matched_values} values match forbidden pattern {pattern}",
                 ),
             )
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(
+        validate, (StatRequest(column, StatKind.REGEX, pattern),), monotonic=True
+    )
 
 
 # =============================================================================
@@ -393,34 +381,28 @@ def expect_column_values_to_be_between(
         max_value: Maximum acceptable value (inclusive)
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        failed_indices: list[int] = []
-
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if val is None:
-                continue
-            if isinstance(val, (int, float)):
-                if not (min_value <= val <= max_value):
-                    failed_indices.append(idx)
-            else:
-                failed_indices.append(idx)
+        failed_count = statistics.column(column).outside_range[(min_value, max_value)]
 
-        if failed_indices:
+        if failed_count:
             return ValidationResult(
                 is_valid=False,
                 errors=(
-                    f"Column '{column}': {len(failed_indices)}/{len(records)} "
+                    f"Column '{column}': {failed_count}/{statistics.row_count} "
                     f"values are not between {min_value} and {max_value}",
                 ),
             )
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(
+        validate,
+        (StatRequest(column, StatKind.RANGE, (min_value, max_value)),),
+        monotonic=True,
+    )
 
 
 def expect_column_values_to_be_in_set(
@@ -428,26 +410,23 @@ def expect_column_values_to_be_in_set(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect column values to be in a specific set."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        failed_indices: list[int] = []
+        failed_count = 0
         unexpected_values: set[Any] = set()
 
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if val is None:
-                continue
-            if val not in value_set:
-                failed_indices.append(idx)
+        for val, count in statistics.column(column).value_counts.items():
+            if val is not None and val not in value_set:
+                failed_count += count
                 unexpected_values.add(val)
 
-        if failed_indices:
+        if failed_count:
             return ValidationResult(
                 is_valid=False,
                 errors=(
-                    f"Column '{column}': {len(failed_indices)}/{len(records)} "
+                    f"Column '{column}': {failed_count}/{statistics.row_count} "
                     f"values are not in expected set. "
                     f"Unexpected values: {sorted(str(v) for v in unexpected_values)[:10]}",
                 ),
@@ -455,7 +434,7 @@ def expect_column_values_to_be_in_set(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.VALUE_COUNTS),), monotonic=True)
 
 
 def expect_column_values_to_not_be_in_set(
@@ -463,35 +442,34 @@ def expect_column_values_to_not_be_in_set(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect column values to NOT be in a specific set."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        failed_indices: list[int] = []
+        failed_count = 0
         found_forbidden: set[Any] = set()
 
-        for idx, record in enumerate(records):
-            val = record.get(column)
+        for val, count in statistics.column(column).value_counts.items():
             if val in forbidden_set:
-                failed_indices.append(idx)
+                failed_count += count
                 found_forbidden.add(val)
 
-        if failed_indices:
+        if failed_count:
             return ValidationResult(
                 is_valid=False,
                 errors=(
-                    f"Column '{column}': {len(failed_indices)}/{len(records)} "
+                    f"Column '{column}': {failed_count}/{statistics.row_count} "
                     f"values are in forbidden set: {sorted(str(v) for v in found_forbidden)}",
                 ),
             )
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.VALUE_COUNTS),), monotonic=True)
 
 
 def expect_column_values_to_be_unique(
-    column: str, ignore_nulls: bool = True
+    column: str, ignore_nulls: bool = True, approximate: bool = False
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """
     Expect column values to be unique.
@@ -499,25 +477,25 @@ def expect_column_values_to_be_unique(
     Args:
         column: Column name to check
         ignore_nulls: Whether to ignore null values when checking uniqueness
+        approximate: Look for duplicates in a fixed-size sample of the
+            distinct values (DistinctSample, k=4096) instead of counting every
+            value. Exact below 4096 distinct values; beyond that a reported
+            duplicate is always real, and duplication affecting 0.1% of the
+            distinct values is detected with about 98% probability.
     """
+    if approximate:
+        return _expect_column_values_to_be_approximately_unique(column, ignore_nulls)
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        seen: dict[Any, list[int]] = {}
-        duplicate_count = 0
-
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if val is None and ignore_nulls:
-                continue
-            if val not in seen:
-                seen[val] = []
-            seen[val].append(idx)
-
-        duplicates = {val: indices for val, indices in seen.items() if len(indices) > 1}
-        duplicate_count = sum(len(indices) for indices in duplicates.values())
+        duplicates = {
+            val: count
+            for val, count in statistics.column(column).value_counts.items()
+            if count > 1 and not (val is None and ignore_nulls)
+        }
+        duplicate_count = sum(duplicates.values())
 
         if duplicates:
             return ValidationResult(
@@ -530,7 +508,39 @@ def expect_column_values_to_be_unique(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.VALUE_COUNTS),), monotonic=True)
+
+
+def _expect_column_values_to_be_approximately_unique(
+    column: str, ignore_nulls: bool
+) -> StatisticalCheck:
+    """Uniqueness check from a sample of distinct values."""
+
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
+            return ValidationResult(is_valid=True)
+
+        column_stats = statistics.column(column)
+        sample = column_stats.sketch(StatKind.DISTINCT_SAMPLE)
+        duplicated = int(np.count_nonzero(sample.counts > 1))
+        null_duplicates = int(not ignore_nulls and column_stats.nulls > 1)
+
+        if duplicated or null_duplicates:
+            error = (
+                f"Column '{column}': found {duplicated + null_duplicates} duplicate values "
+                f"among {len(sample.counts) + null_duplicates} sampled distinct values"
+            )
+            if not sample.is_exact:
+                estimate = round(sample.duplicated_count()) + null_duplicates
+                error += f" (about {estimate} duplicate values overall)"
+            return ValidationResult(is_valid=False, errors=(error,))
+
+        return ValidationResult(is_valid=True)
+
+    return StatisticalCheck(
+        validate,
+        (StatRequest(column, StatKind.NULLS), StatRequest(column, StatKind.DISTINCT_SAMPLE)),
+    )
 
 
 # =============================================================================
@@ -549,47 +559,46 @@ def expect_column_values_to_be_of_type(
         expected_type: Expected DataType or Python type
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    type_mapping: dict[DataType, type | tuple[type, ...]] = {
+        DataType.STRING: str,
+        DataType.INTEGER: int,
+        DataType.FLOAT: (int, float),
+        DataType.BOOLEAN: bool,
+        DataType.DATETIME: (datetime, str),
+        DataType.DATE: (datetime, str),
+        DataType.ARRAY: list,
+        DataType.OBJECT: dict,
+    }
+
+    python_types: type | tuple[type, ...]
+    if isinstance(expected_type, DataType):
+        python_types = type_mapping.get(expected_type, object)
+    else:
+        python_types = expected_type
+
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        failed_indices: list[int] = []
-
-        type_mapping = {
-            DataType.STRING: str,
-            DataType.INTEGER: int,
-            DataType.FLOAT: (int, float),
-            DataType.BOOLEAN: bool,
-            DataType.DATETIME: (datetime, str),
-            DataType.DATE: (datetime, str),
-            DataType.ARRAY: list,
-            DataType.OBJECT: dict,
-        }
-
-        if isinstance(expected_type, DataType):
-            python_types = type_mapping.get(expected_type, object)
-        else:
-            python_types = expected_type
-
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if val is None:
-                continue
-            if not isinstance(val, python_types):
-                failed_indices.append(idx)
+        # isinstance(val, T) is issubclass(type(val), T), so count by type
+        failed_count = sum(
+            count
+            for value_type, count in statistics.column(column).types.items()
+            if value_type is not type(None) and not issubclass(value_type, python_types)
+        )
 
-        if failed_indices:
+        if failed_count:
             return ValidationResult(
                 is_valid=False,
                 errors=(
-                    f"Column '{column}': {len(failed_indices)}/{len(records)} "
+                    f"Column '{column}': {failed_count}/{statistics.row_count} "
                     f"values are not of expected type {expected_type}",
                 ),
             )
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.TYPES),), monotonic=True)
 
 
 def expect_column_values_to_not_be_null(
@@ -603,28 +612,24 @@ def expect_column_values_to_not_be_null(
         allow_empty_strings: Whether empty strings are considered non-null
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        null_count = 0
-
-        for record in records:
-            val = record.get(column)
-            if val is None:
-                null_count += 1
-            elif not allow_empty_strings and val == "":
-                null_count += 1
+        column_stats = statistics.column(column)
+        null_count = column_stats.nulls
+        if not allow_empty_strings:
+            null_count += column_stats.empty_strings
 
         if null_count > 0:
             return ValidationResult(
                 is_valid=False,
-                errors=(f"Column '{column}': {null_count}/{len(records)} values are null",),
+                errors=(f"Column '{column}': {null_count}/{statistics.row_count} values are null",),
             )
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.NULLS),), monotonic=True)
 
 
 def expect_column_proportion_of_nulls_to_be_between(
@@ -639,12 +644,11 @@ def expect_column_proportion_of_nulls_to_be_between(
         max_value: Maximum proportion of nulls (0-1)
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        null_count = sum(1 for record in records if record.get(column) is None)
-        null_proportion = null_count / len(records)
+        null_proportion = statistics.column(column).nulls / statistics.row_count
 
         passed = min_value <= null_proportion <= max_value
 
@@ -659,7 +663,7 @@ def expect_column_proportion_of_nulls_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate, (StatRequest(column, StatKind.NULLS),))
 
 
 # =============================================================================
@@ -679,34 +683,28 @@ def expect_column_value_lengths_to_be_between(
         max_length: Maximum string length (inclusive)
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        failed_indices: list[int] = []
-
-        for idx, record in enumerate(records):
-            val = record.get(column)
-            if val is None:
-                continue
-            if isinstance(val, str):
-                if not (min_length <= len(val) <= max_length):
-                    failed_indices.append(idx)
-            else:
-                failed_indices.append(idx)
+        failed_count = statistics.column(column).outside_length[(min_length, max_length)]
 
-        if failed_indices:
+        if failed_count:
             return ValidationResult(
                 is_valid=False,
                 errors=(
-                    f"Column '{column}': {len(failed_indices)}/{len(records)} "
+                    f"Column '{column}': {failed_count}/{statistics.row_count} "
                     f"values have length not between {min_length} and {max_length}",
                 ),
             )
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(
+        validate,
+        (StatRequest(column, StatKind.LENGTH, (min_length, max_length)),),
+        monotonic=True,
+    )
 
 
 def expect_column_values_to_be_increasing(
@@ -751,7 +749,7 @@ def expect_column_values_to_be_increasing(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return DatasetCheck(validate)
 
 
 def expect_column_values_to_be_decreasing(
@@ -796,7 +794,7 @@ def expect_column_values_to_be_decreasing(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return DatasetCheck(validate)
 
 
 # =============================================================================
@@ -921,20 +919,12 @@ def expect_column_sum_to_equal_other_column_sum(
         tolerance: Allowed difference between sums
     """
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        if not records:
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        if not statistics.row_count:
             return ValidationResult(is_valid=True)
 
-        sum_a = 0.0
-        sum_b = 0.0
-
-        for record in records:
-            val_a = record.get(column_a)
-            val_b = record.get(column_b)
-            if isinstance(val_a, (int, float)):
-                sum_a += float(val_a)
-            if isinstance(val_b, (int, float)):
-                sum_b += float(val_b)
+        sum_a = statistics.column(column_a).numeric_sum
+        sum_b = statistics.column(column_b).numeric_sum
 
         difference = abs(sum_a - sum_b)
 
@@ -949,7 +939,10 @@ def expect_column_sum_to_equal_other_column_sum(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(
+        validate,
+        (StatRequest(column_a, StatKind.MOMENTS), StatRequest(column_b, StatKind.MOMENTS)),
+    )
 
 
 # =============================================================================
@@ -1004,7 +997,7 @@ def expect_column_groupby_value_counts_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return DatasetCheck(validate)
 
 
 def expect_column_groupby_mean_to_be_between(
@@ -1061,7 +1054,7 @@ def expect_column_groupby_mean_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return DatasetCheck(validate)
 
 
 def expect_table_row_count_to_be_between(
@@ -1069,8 +1062,8 @@ def expect_table_row_count_to_be_between(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect table row count to be within a range."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        row_count = len(records)
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        row_count = statistics.row_count
         passed = min_value <= row_count <= max_value
 
         if not passed:
@@ -1081,7 +1074,7 @@ def expect_table_row_count_to_be_between(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate)
 
 
 def expect_table_row_count_to_equal(
@@ -1089,8 +1082,8 @@ def expect_table_row_count_to_equal(
 ) -> Callable[[Sequence[DataRecord]], ValidationResult]:
     """Expect table row count to equal a specific value."""
 
-    def validate(records: Sequence[DataRecord]) -> ValidationResult:
-        row_count = len(records)
+    def validate(statistics: DatasetStatistics) -> ValidationResult:
+        row_count = statistics.row_count
 
         if row_count != expected_value:
             return ValidationResult(
@@ -1100,7 +1093,7 @@ def expect_table_row_count_to_equal(
 
         return ValidationResult(is_valid=True)
 
-    return validate
+    return StatisticalCheck(validate)
 
 
 def expect_column_values_to_be_dateutil_parseable(
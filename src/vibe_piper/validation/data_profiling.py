@@ -6,18 +6,39 @@ This module provides comprehensive data profiling capabilities:
 - Statistics: Calculate descriptive statistics for each column
 - Distribution analysis: Analyze value distributions and patterns
 - Null analysis: Identify missing value patterns
+
+Records are converted to columns once and each column is profiled in one
+vectorized pass, from a uniform random sample of rows. With approximate=True
+every row is profiled in bounded memory from mergeable sketches (see
+vibe_piper.validation.sketches) instead, and the profile can be updated
+incrementally with new batches.
 """
 
 from __future__ import annotations
 
-import statistics
+import random
+import time
 from collections import Counter
 from collections.abc import Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 from vibe_piper.types import DataRecord, DataType, Schema, SchemaField
+from vibe_piper.validation.scan import (
+    ColumnAccumulator,
+    DatasetStatistics,
+    StatKind,
+    StatRequest,
+    _column,
+    _ColumnChunk,
+    _columns,
+    _row_data,
+    compute_statistics,
+)
 
 if TYPE_CHECKING:
     pass
@@ -79,6 +100,8 @@ class DataProfile:
         inferred_schema: Inferred schema from data
         timestamp: When profile was generated
         duration_ms: Time taken to generate profile
+        sketch_state: Mergeable column statistics of an approximate
+            (full-data) profile, used by update
     """
 
     total_rows: int
@@ -87,6 +110,58 @@ class DataProfile:
     inferred_schema: Schema | None = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
     duration_ms: float = 0.0
+    sketch_state: DatasetStatistics | None = field(default=None, repr=False, compare=False)
+
+    def update(
+        self,
+        records: Sequence[DataRecord],
+        max_workers: int = 1,
+        executor: Executor | None = None,
+    ) -> DataProfile:
+        """
+        Profile a new batch of records together with the data profiled so far.
+
+        Only the new records are scanned; their sketches are merged into a
+        copy of this profile's, so this profile is left unchanged. Columns
+        that first appear in the batch are added (earlier rows count as
+        nulls).
+
+        Args:
+            records: New batch of records
+            max_workers: Scan row chunks on this many threads
+            executor: Optional executor to scan chunks on instead
+
+        Returns:
+            Profile of all records seen so far
+
+        Raises:
+            ValueError: If this profile was not computed with approximate=True
+
+        Example:
+            Keep a running profile of a daily feed::
+
+                profile = profile_data(first_batch, approximate=True)
+                for batch in later_batches:
+                    profile = profile.update(batch)
+        """
+        if self.sketch_state is None:
+            msg = "Only profiles computed with approximate=True can be updated"
+            raise ValueError(msg)
+        start_time = time.time()
+
+        columns = list(self.column_stats)
+        if records:
+            columns.extend(c for c in _columns_of(_row_data(records[:1])) if c not in columns)
+        requests = _sketch_requests(columns)
+        batch_stats = compute_statistics(
+            records, requests, max_workers=max_workers, executor=executor
+        )
+        dataset_stats = DatasetStatistics(requests)
+        dataset_stats.merge(self.sketch_state)
+        dataset_stats.merge(batch_stats)
+        return _profile_from_sketches(
+            dataset_stats, columns, self.inferred_schema is not None, start_time
+        )
 
     def get_null_summary(self) -> dict[str, float]:
         """Get null percentage for all columns."""
@@ -200,99 +275,189 @@ def _is_temporal_type(dtype: DataType) -> bool:
 # =============================================================================
 
 
-def _calculate_numeric_stats(values: list[float | int], column_name: str) -> ColumnStatistics:
+def _value_counts(values: list[Any]) -> Counter[Any]:
+    """Count values, by repr when they are unhashable (dicts, lists)."""
+    try:
+        return Counter(values)
+    except TypeError:
+        return Counter(map(repr, values))
+
+
+def _distinct_values(values: Sequence[Any]) -> tuple[Any, ...]:
+    """Distinct values in order, by repr when they are unhashable (dicts, lists)."""
+    try:
+        return tuple(dict.fromkeys(values))
+    except TypeError:
+        return tuple(dict.fromkeys(map(repr, values)))
+
+
+def _calculate_numeric_stats(chunk: _ColumnChunk, stats: dict[str, Any]) -> None:
     """Calculate statistics for numeric columns."""
-    if not values:
-        return ColumnStatistics(column_name=column_name, data_type=DataType.INTEGER)
+    numbers = chunk.numbers
+    if not len(numbers):
+        return
+    # Integer columns keep exact int values for the value-based statistics
+    values = numbers
+    convert: type[int] | type[float] = float
+    if set(chunk.types) <= {int, type(None)}:
+        try:
+            values = np.array(chunk.non_null, dtype=np.int64)
+        except OverflowError:
+            values = np.array(chunk.non_null, dtype=object)
+        convert = int
+    distinct, counts = np.unique(values, return_counts=True)
+    stats.update(
+        min_value=convert(values.min()),
+        max_value=convert(values.max()),
+        mean=float(numbers.mean()),
+        median=float(np.median(numbers)),
+        std_dev=float(numbers.std(ddof=1)) if len(numbers) > 1 else 0.0,
+        mode=tuple(distinct[counts == counts.max()].tolist()),
+        sample_values=tuple(dict.fromkeys(values[:10].tolist())),
+        distinct_count=len(distinct),
+        unique_count=int(np.count_nonzero(counts == 1)),
+    )
 
-    min_val = min(values)
-    max_val = max(values)
-    mean_val = statistics.mean(values)
-    median_val = statistics.median(values)
-    std_dev = statistics.stdev(values) if len(values) > 1 else 0.0
 
-    # Calculate mode
-    counter = Counter(values)
+def _calculate_counter_stats(counter: Counter[Any], stats: dict[str, Any]) -> None:
+    """Calculate frequency statistics shared by non-numeric columns."""
     max_freq = max(counter.values())
-    modes = [val for val, freq in counter.items() if freq == max_freq]
-
-    # Sample values
-    sample_vals = tuple(set(values[:10]))
-
-    return ColumnStatistics(
-        column_name=column_name,
-        data_type=DataType.FLOAT if isinstance(values[0], float) else DataType.INTEGER,
-        min_value=min_val,
-        max_value=max_val,
-        mean=mean_val,
-        median=median_val,
-        std_dev=std_dev,
-        mode=tuple(modes),
-        sample_values=sample_vals,
+    stats.update(
+        mode=tuple(val for val, freq in counter.items() if freq == max_freq),
+        sample_values=tuple(list(counter)[:10]),
+        distinct_count=len(counter),
+        unique_count=sum(1 for freq in counter.values() if freq == 1),
     )
 
 
-def _calculate_string_stats(values: list[str], column_name: str) -> ColumnStatistics:
+def _calculate_string_stats(chunk: _ColumnChunk, stats: dict[str, Any]) -> None:
     """Calculate statistics for string columns."""
-    if not values:
-        return ColumnStatistics(column_name=column_name, data_type=DataType.STRING)
-
-    # Length statistics
-    lengths = [len(v) for v in values]
-    length_stats = {
-        "min_length": min(lengths),
-        "max_length": max(lengths),
-        "mean_length": statistics.mean(lengths),
-        "median_length": statistics.median(lengths),
+    strings = chunk.strings
+    if len(strings) != len(chunk.non_null):
+        strings = list(map(str, chunk.non_null))
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    counter = Counter(strings)
+    _calculate_counter_stats(counter, stats)
+    stats.update(
+        histogram=dict(counter.most_common(20)),  # Top 20 values
+        length_stats={
+            "min_length": int(lengths.min()),
+            "max_length": int(lengths.max()),
+            "mean_length": float(lengths.mean()),
+            "median_length": float(np.median(lengths)),
+        },
+    )
+
+
+def _calculate_datetime_stats(chunk: _ColumnChunk, stats: dict[str, Any]) -> None:
+    """Calculate statistics for datetime columns."""
+    temporal = [v for v in chunk.non_null if isinstance(v, (datetime, date))]
+    if not temporal:
+        return
+    stats.update(min_value=min(temporal), max_value=max(temporal))
+    _calculate_counter_stats(Counter(map(str, temporal)), stats)
+    stats["data_type"] = DataType.DATETIME if isinstance(temporal[0], datetime) else DataType.DATE
+
+
+def _profile_column(column: str, values: list[Any]) -> ColumnStatistics:
+    """
+    Calculate every statistic of one column.
+
+    The value types, non-null values and numeric array are derived once
+    and shared by the statistics.
+
+    Args:
+        column: Column name
+        values: Column values (None for nulls)
+
+    Returns:
+        ColumnStatistics of the column
+    """
+    chunk = _ColumnChunk(values)
+    dtype = _infer_type(chunk.non_null)
+    stats: dict[str, Any] = {
+        "data_type": dtype,
+        "null_count": chunk.nulls,
+        "null_percentage": chunk.nulls / len(values) if values else 0.0,
     }
 
-    # Histogram (frequency distribution)
-    counter = Counter(values)
-    histogram = dict(counter.most_common(20))  # Top 20 values
+    if chunk.non_null:
+        if _is_numeric_type(dtype):
+            _calculate_numeric_stats(chunk, stats)
+        elif dtype == DataType.STRING:
+            _calculate_string_stats(chunk, stats)
+        elif _is_temporal_type(dtype):
+            _calculate_datetime_stats(chunk, stats)
+        else:
+            _calculate_counter_stats(_value_counts(chunk.non_null), stats)
 
-    # Sample values
-    sample_vals = tuple(list(counter.keys())[:10])
+    return ColumnStatistics(column_name=column, **stats)
 
-    # Mode
-    max_freq = max(counter.values())
-    modes = [val for val, freq in counter.items() if freq == max_freq]
-
-    return ColumnStatistics(
-        column_name=column_name,
-        data_type=DataType.STRING,
-        mode=tuple(modes),
-        sample_values=sample_vals,
-        histogram=histogram,
-        length_stats=length_stats,
-        distinct_count=len(counter),
-    )
 
+# =============================================================================
+# Sketch-Based Statistics
+# =============================================================================
 
-def _calculate_datetime_stats(values: list[datetime | date], column_name: str) -> ColumnStatistics:
-    """Calculate statistics for datetime columns."""
-    if not values:
-        return ColumnStatistics(column_name=column_name, data_type=DataType.DATETIME)
+_SKETCH_KINDS = (
+    StatKind.MOMENTS,
+    StatKind.QUANTILES,
+    StatKind.DISTINCT,
+    StatKind.DISTINCT_SAMPLE,
+    StatKind.HEAVY_HITTERS,
+    StatKind.SAMPLE,
+)
+
+
+def _sketch_requests(columns: Sequence[str]) -> list[StatRequest]:
+    return [StatRequest(col, kind) for col in columns for kind in _SKETCH_KINDS]
+
+
+def _column_stats_from_sketches(
+    column: str, acc: ColumnAccumulator, total_rows: int
+) -> ColumnStatistics:
+    """Calculate column statistics from the column's sketches."""
+    reservoir = acc.sketch(StatKind.SAMPLE)
+    sample = reservoir.values
+    # The reservoir sees every non-null value; rows scanned before a column
+    # first appeared count as nulls
+    null_count = total_rows - reservoir.count
+    dtype = _infer_type(sample)
+    heavy_hitters = acc.sketch(StatKind.HEAVY_HITTERS).heavy_hitters()
+    top_count = heavy_hitters[0][1] if heavy_hitters else 0
+    stats: dict[str, Any] = {
+        "null_count": null_count,
+        "null_percentage": null_count / total_rows if total_rows else 0.0,
+        "distinct_count": round(acc.sketch(StatKind.DISTINCT).estimate()),
+        "unique_count": round(acc.sketch(StatKind.DISTINCT_SAMPLE).singleton_count()),
+        "sample_values": _distinct_values(sample[:10]),
+        "mode": tuple(value for value, count in heavy_hitters if count == top_count),
+    }
 
-    min_val = min(values)
-    max_val = max(values)
+    if _is_numeric_type(dtype) and acc.numeric_count:
+        stats.update(
+            min_value=acc.minimum,
+            max_value=acc.maximum,
+            mean=acc.mean,
+            median=acc.sketch(StatKind.QUANTILES).quantile(0.5),
+            std_dev=acc.std_dev if acc.numeric_count > 1 else 0.0,
+        )
+    elif dtype == DataType.STRING and sample:
+        lengths = np.fromiter((len(str(v)) for v in sample), dtype=np.int64, count=len(sample))
+        stats.update(
+            histogram={str(value): count for value, count in heavy_hitters[:20]},
+            length_stats={
+                "min_length": int(lengths.min()),
+                "max_length": int(lengths.max()),
+                "mean_length": float(lengths.mean()),
+                "median_length": float(np.median(lengths)),
+            },
+        )
+    elif _is_temporal_type(dtype):
+        temporal = [v for v in sample if isinstance(v, (datetime, date))]
+        if temporal:
+            stats.update(min_value=min(temporal), max_value=max(temporal))
 
-    # Calculate mode
-    counter = Counter(str(v) for v in values)
-    max_freq = max(counter.values())
-    modes = [val for val, freq in counter.items() if freq == max_freq]
-
-    # Sample values
-    sample_vals = tuple(list(set([str(v) for v in values]))[:10])
-
-    return ColumnStatistics(
-        column_name=column_name,
-        data_type=DataType.DATETIME if isinstance(values[0], datetime) else DataType.DATE,
-        min_value=min_val,
-        max_value=max_val,
-        mode=tuple(modes),
-        sample_values=sample_vals,
-        distinct_count=len(counter),
-    )
+    return ColumnStatistics(column_name=column, data_type=dtype, **stats)
 
 
 # =============================================================================
@@ -300,10 +465,67 @@ def _calculate_datetime_stats(values: list[datetime | date], column_name: str) -
 # =============================================================================
 
 
+def _sample_rows(
+    records: Sequence[DataRecord], max_rows: int, seed: int | None
+) -> Sequence[DataRecord]:
+    """Uniform random sample of rows without replacement, in input order."""
+    if len(records) <= max_rows:
+        return records
+    indices = sorted(random.Random(seed).sample(range(len(records)), max_rows))
+    return [records[i] for i in indices]
+
+
+def _columns_of(rows: list[Any]) -> list[str]:
+    """Column names, from the first row."""
+    return list(rows[0].keys()) if rows and hasattr(rows[0], "keys") else []
+
+
+def _infer_schema(column_stats: dict[str, ColumnStatistics]) -> Schema:
+    """Build a Schema from profiled column types and nulls."""
+    schema_fields = []
+    for col, stats in column_stats.items():
+        schema_fields.append(
+            SchemaField(
+                name=col,
+                data_type=stats.data_type,
+                required=stats.null_percentage == 0.0,  # Required if no nulls
+                nullable=stats.null_percentage > 0.0,
+            )
+        )
+    return Schema(
+        name=f"inferred_{int(datetime.utcnow().timestamp())}",
+        fields=tuple(schema_fields),
+    )
+
+
+def _profile_from_sketches(
+    dataset_stats: DatasetStatistics,
+    columns: list[str],
+    infer_schema: bool,
+    start_time: float,
+) -> DataProfile:
+    column_stats = {
+        col: _column_stats_from_sketches(col, dataset_stats.column(col), dataset_stats.row_count)
+        for col in columns
+    }
+    return DataProfile(
+        total_rows=dataset_stats.row_count,
+        total_columns=len(columns),
+        column_stats=column_stats,
+        inferred_schema=_infer_schema(column_stats) if infer_schema else None,
+        duration_ms=(time.time() - start_time) * 1000,
+        sketch_state=dataset_stats,
+    )
+
+
 def profile_data(
     records: Sequence[DataRecord],
     infer_schema: bool = True,
     max_sample_rows: int = 10000,
+    approximate: bool = False,
+    max_workers: int = 1,
+    executor: Executor | None = None,
+    seed: int | None = None,
 ) -> DataProfile:
     """
     Profile data to infer schema and calculate statistics.
@@ -311,10 +533,29 @@ def profile_data(
     Analyzes data to understand its structure, types, and distributions.
     Useful for data exploration and validation.
 
+    Records are converted to columns once and each column is profiled in one
+    vectorized pass; columns are profiled concurrently with max_workers or an
+    executor.
+
     Args:
         records: Records to profile (list of DataRecord or dict)
         infer_schema: Whether to infer a Schema from the data (default: True)
-        max_sample_rows: Maximum rows to sample for profiling (performance optimization)
+        max_sample_rows: Maximum rows to profile; larger inputs are profiled
+            from a uniform random sample of this many rows
+        approximate: Profile every row (max_sample_rows is ignored) from
+            mergeable sketches in bounded memory. Null counts, mean, std dev
+            and numeric min/max are exact; the median is within about 1.65%
+            in rank (KLL), distinct counts within about 0.8% (HyperLogLog),
+            unique counts within about 1.6% (distinct sample), mode and
+            histogram counts overcount by at most 0.13% of the rows
+            (Count-Min). Types, sample values, string lengths and temporal
+            min/max come from a 1000-value random sample. The profile can
+            then be extended with DataProfile.update.
+        max_workers: Profile columns (row chunks when approximate) on this
+            many threads
+        executor: Optional executor (e.g. a ProcessPoolExecutor) to profile
+            on instead
+        seed: Seed of the row sample (for reproducible profiles)
 
     Returns:
         DataProfile with comprehensive statistics
@@ -324,8 +565,6 @@ def profile_data(
         >>> print(profile.get_summary_report())
         >>> schema = profile.inferred_schema
     """
-    import time
-
     start_time = time.time()
 
     if not records:
@@ -335,100 +574,33 @@ def profile_data(
             column_stats={},
         )
 
-    # Sample records for performance
-    sample_records = records[:max_sample_rows] if len(records) > max_sample_rows else records
-
-    # Get all column names
-    if isinstance(sample_records[0], dict):
-        columns = list(sample_records[0].keys())
-    else:
-        # Assume DataRecord or similar
-        columns = list(sample_records[0].data.keys()) if hasattr(sample_records[0], "data") else []
-
-    # Calculate statistics for each column
-    column_stats = {}
-    for col in columns:
-        # Extract values
-        values = []
-        for record in sample_records:
-            val = record.get(col) if hasattr(record, "get") else record.data.get(col)
-            values.append(val)
-
-        # Filter nulls
-        non_null = [v for v in values if v is not None]
-
-        # Null statistics
-        null_count = len(values) - len(non_null)
-        null_pct = null_count / len(values) if values else 0.0
-
-        # Infer type
-        dtype = _infer_type(non_null)
-
-        # Calculate type-specific statistics
-        if dtype in (DataType.INTEGER, DataType.FLOAT):
-            numeric_vals = [float(v) for v in non_null if isinstance(v, (int, float))]
-            stats = _calculate_numeric_stats(numeric_vals, col)
-        elif dtype == DataType.STRING:
-            str_vals = [str(v) for v in non_null]
-            stats = _calculate_string_stats(str_vals, col)
-        elif dtype in (DataType.DATETIME, DataType.DATE):
-            dt_vals = [v for v in non_null if isinstance(v, (datetime, date))]
-            stats = _calculate_datetime_stats(dt_vals, col)
-        else:
-            # Generic stats for other types
-            counter = Counter(non_null)
-            stats = ColumnStatistics(
-                column_name=col,
-                data_type=dtype,
-                sample_values=tuple(list(counter.keys())[:10]),
-                distinct_count=len(counter),
-            )
-
-        # Update with null statistics
-        stats = ColumnStatistics(
-            **{k: v for k, v in stats.__dict__.items() if not k.startswith("null")},
-            null_count=null_count,
-            null_percentage=null_pct,
-            distinct_count=stats.distinct_count if stats.distinct_count > 0 else 0,
-        )
-
-        # Count unique values (appears exactly once)
-        value_counts = Counter(non_null)
-        unique_count = sum(1 for count in value_counts.values() if count == 1)
-        stats = ColumnStatistics(
-            **stats.__dict__,
-            unique_count=unique_count,
+    if approximate:
+        columns = _columns_of(_row_data(records[:1]))
+        dataset_stats = compute_statistics(
+            records, _sketch_requests(columns), max_workers=max_workers, executor=executor
         )
+        return _profile_from_sketches(dataset_stats, columns, infer_schema, start_time)
 
-        column_stats[col] = stats
-
-    # Infer schema if requested
-    inferred_schema = None
-    if infer_schema:
-        schema_fields = []
-        for col, stats in column_stats.items():
-            schema_fields.append(
-                SchemaField(
-                    name=col,
-                    data_type=stats.data_type,
-                    required=stats.null_percentage == 0.0,  # Required if no nulls
-                    nullable=stats.null_percentage > 0.0,
-                )
-            )
-        inferred_schema = Schema(
-            name=f"inferred_{int(datetime.utcnow().timestamp())}",
-            fields=tuple(schema_fields),
-        )
-
-    # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
+    # Sample records for performance
+    rows = _row_data(_sample_rows(records, max_sample_rows, seed))
+    columns = _columns_of(rows)
+    values = _columns(rows, columns)
+
+    if executor is not None:
+        results = list(executor.map(_profile_column, columns, values))
+    elif max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_profile_column, columns, values))
+    else:
+        results = list(map(_profile_column, columns, values))
+    column_stats = dict(zip(columns, results, strict=True))
 
     return DataProfile(
         total_rows=len(records),
         total_columns=len(columns),
         column_stats=column_stats,
-        inferred_schema=inferred_schema,
-        duration_ms=duration_ms,
+        inferred_schema=_infer_schema(column_stats) if infer_schema else None,
+        duration_ms=(time.time() - start_time) * 1000,
     )
 
 
@@ -449,18 +621,11 @@ def profile_column(
     if not records:
         return None
 
-    # Get column values
-    values = []
-    for record in records:
-        val = record.get(column) if hasattr(record, "get") else record.data.get(column)
-        values.append(val)
-
-    if not values or all(v is None for v in values):
+    values = _column(_row_data(records), column)
+    if all(v is None for v in values):
         return None
 
-    # Get full profile and extract column stats
-    profile = profile_data(records, infer_schema=False)
-    return profile.column_stats.get(column)
+    return _profile_column(column, values)
 
 
 __all__ = [
@@ -13,6 +13,7 @@ from functools import wraps
 from typing import Any, ParamSpec, TypeVar
 
 from vibe_piper.types import DataRecord, Schema, ValidationResult
+from vibe_piper.validation.scan import compute_statistics, run_check, statistic_requests
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -183,9 +184,10 @@ class ValidateDecorator:
 
         # Run custom validation checks if configured
         if config.checks:
+            statistics = compute_statistics(records, statistic_requests(config.checks))
             for check_idx, check_fn in enumerate(config.checks):
                 try:
-                    result = check_fn(records)
+                    result = run_check(check_fn, records, statistics)
                     if not result.is_valid:
                         errors.extend(result.errors)
                         warnings.extend(result.warnings)
@@ -327,11 +329,11 @@ class ColumnExpectationBuilder:
 
         return expect_column_values_to_not_be_in_set(self.column, forbidden_set)
 
-    def to_be_unique(self, ignore_nulls: bool = True):
+    def to_be_unique(self, ignore_nulls: bool = True, approximate: bool = False):
         """Expect column values to be unique."""
         from vibe_piper.validation.checks import expect_column_values_to_be_unique
 
-        return expect_column_values_to_be_unique(self.column, ignore_nulls)
+        return expect_column_values_to_be_unique(self.column, ignore_nulls, approximate)
 
     def to_be_of_type(self, expected_type):
         """Expect column values to be of a specific type."""
@@ -387,11 +389,11 @@ class ColumnExpectationBuilder:
 
         return expect_column_max_to_be_between(self.column, min_value, max_value)
 
-    def median_to_be_between(self, min_value: float, max_value: float):
+    def median_to_be_between(self, min_value: float, max_value: float, approximate: bool = False):
         """Expect column median to be within a range."""
         from vibe_piper.validation.checks import expect_column_median_to_be_between
 
-        return expect_column_median_to_be_between(self.column, min_value, max_value)
+        return expect_column_median_to_be_between(self.column, min_value, max_value, approximate)
 
     def proportion_of_nulls_to_be_between(self, min_value: float, max_value: float):
         """Expect proportion of nulls to be within a range."""
@@ -2,7 +2,7 @@
 Validation history storage and analysis.
 
 This module provides comprehensive validation history tracking including:
-- Validation run history storage (PostgreSQL)
+- Validation run history storage (PostgreSQL, or SQLite for local use)
 - Per-asset validation history
 - Trend analysis and pattern detection
 - Historical baseline comparison
@@ -12,14 +12,20 @@ Design:
 - Follows ScheduleStore pattern but uses PostgreSQL for persistence
 - Provides APIs for storing, querying, and analyzing validation history
 - Supports trend analysis and failure pattern detection
+- Summaries and trends are aggregated in SQL from daily rollup tables
+  maintained on every write
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import sqlite3
+import threading
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
 
 # Optional dependencies for analysis
@@ -38,6 +44,7 @@ from vibe_piper.types import (
 )
 
 if TYPE_CHECKING:
+    from vibe_piper.connectors.base import QueryResult
     from vibe_piper.connectors.postgres import PostgreSQLConnector
 
 logger = logging.getLogger(__name__)
@@ -277,6 +284,343 @@ class ValidationHistoryStore(Protocol):
     def delete_old_runs(self, before_date: datetime, asset_name: str | None = None) -> int: ...
 
 
+# =============================================================================
+# Shared SQL Helpers
+# =============================================================================
+
+_RUN_COLUMNS = (
+    "validation_run_id",
+    "asset_name",
+    "suite_name",
+    "pipeline_id",
+    "status",
+    "started_at",
+    "completed_at",
+    "duration_ms",
+    "total_checks",
+    "passed_checks",
+    "failed_checks",
+    "warning_checks",
+    "total_records",
+    "error_count",
+    "warning_count",
+)
+
+_CHECK_COLUMNS = (
+    "validation_run_id",
+    "check_name",
+    "check_type",
+    "passed",
+    "error_message",
+    "warning_messages",
+    "metrics",
+    "column_name",
+    "duration_ms",
+)
+
+_METRIC_COLUMNS = (
+    "metric_name",
+    "metric_type",
+    "asset_name",
+    "check_name",
+    "value",
+    "timestamp",
+    "status",
+    "threshold",
+)
+
+_RUN_UPDATE_COLUMNS = (
+    "completed_at",
+    "duration_ms",
+    "total_checks",
+    "passed_checks",
+    "failed_checks",
+    "warning_checks",
+    "error_count",
+    "warning_count",
+)
+
+_RUN_SELECT = f"SELECT {', '.join(_RUN_COLUMNS)} FROM validation_runs"
+
+_RUN_DAILY_AGGREGATES = """
+    COUNT(*),
+    COUNT(*) FILTER (WHERE runs.status = 'passed'),
+    COUNT(*) FILTER (WHERE runs.status = 'failed'),
+    COUNT(*) FILTER (WHERE runs.status = 'warning'),
+    COALESCE(SUM(runs.duration_ms), 0),
+    COALESCE(SUM(runs.total_checks), 0),
+    COALESCE(SUM(runs.total_records), 0)
+"""
+
+_RUN_DAILY_COLUMNS = """
+    asset_name, day, total_runs, passed_runs, failed_runs, warning_runs,
+    total_duration_ms, total_checks, total_records
+"""
+
+_METRIC_DAILY_COLUMNS = """
+    asset_name, metric_name, day, value_count, value_sum, value_min, value_max, passed_count
+"""
+
+_METRIC_DAILY_SELECT = """
+    SELECT
+        asset_name, metric_name, (timestamp AT TIME ZONE 'UTC')::date,
+        COUNT(*), SUM(value), MIN(value), MAX(value),
+        COUNT(*) FILTER (WHERE status = 'passed')
+"""
+
+_POSTGRES_INDEXES = (
+    ("idx_validation_runs_asset_started", "validation_runs(asset_name, started_at DESC)"),
+    ("idx_validation_runs_status", "validation_runs(status)"),
+    ("idx_validation_runs_started_at", "validation_runs(started_at DESC)"),
+    ("idx_validation_runs_run_id", "validation_runs(validation_run_id)"),
+    ("idx_check_results_run_id", "validation_check_results(validation_run_id)"),
+    (
+        "idx_metrics_asset_metric_timestamp",
+        "validation_metrics(asset_name, metric_name, timestamp DESC)",
+    ),
+    ("idx_metrics_timestamp", "validation_metrics(timestamp DESC)"),
+)
+
+INSERT_PAGE_SIZE = 1000
+"""Rows per multi-row INSERT statement of PostgreSQLValidationHistoryStore."""
+
+
+def _check_row(record: ValidationCheckRecord) -> tuple[Any, ...]:
+    return (
+        record.validation_run_id,
+        record.check_name,
+        record.check_type,
+        record.passed,
+        record.error_message,
+        json.dumps(record.warning_messages),
+        json.dumps(record.metrics),
+        record.column_name,
+        record.duration_ms,
+    )
+
+
+def _metric_row(metric: ValidationMetric) -> tuple[Any, ...]:
+    return (
+        metric.metric_name,
+        metric.metric_type.value,
+        metric.asset_name,
+        metric.check_name,
+        metric.value,
+        metric.timestamp,
+        metric.status,
+        metric.threshold,
+    )
+
+
+def _metric_from_row(row: Mapping[str, Any]) -> ValidationMetric:
+    # metric_type is stored as the enum value in a text column
+    return ValidationMetric(
+        metric_name=row["metric_name"],
+        metric_type=QualityMetricType(int(row["metric_type"])),
+        asset_name=row["asset_name"],
+        check_name=row["check_name"],
+        value=row["value"],
+        timestamp=row["timestamp"],
+        status=row["status"],
+        threshold=row["threshold"],
+    )
+
+
+def _naive_utc(moment: datetime) -> datetime:
+    """A time as naive UTC (naive times are taken to be UTC already)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def _utc_date(moment: datetime) -> date:
+    """The UTC calendar day of a time."""
+    return _naive_utc(moment).date()
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime.combine(day, time(), timezone.utc)
+
+
+def _summary_sql(
+    asset_name: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    param: str,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Build the query summing run counts over [start_date, end_date].
+
+    Days entirely within the range are read from validation_run_daily;
+    runs on the partial days at either end are aggregated from
+    validation_runs. Both parts are unioned and summed.
+
+    Args:
+        asset_name: Asset to summarize
+        start_date: Optional start of the range
+        end_date: Optional end of the range (inclusive)
+        param: Placeholder format of the driver (e.g. "%({})s" or ":{}")
+
+    Returns:
+        Tuple of (sql, params)
+    """
+    p = param.format
+    params: dict[str, Any] = {"asset_name": asset_name}
+
+    first_day = None
+    if start_date is not None:
+        first_day = _utc_date(start_date)
+        if _naive_utc(start_date).time() != time():
+            first_day += timedelta(days=1)
+        params["start_date"] = start_date
+        params["first_day"] = first_day
+        params["first_midnight"] = _utc_midnight(first_day)
+    last_day = None
+    if end_date is not None:
+        last_day = _utc_date(end_date)
+        params["end_date"] = end_date
+        params["last_day"] = last_day
+        params["last_midnight"] = _utc_midnight(last_day)
+
+    daily = [f"asset_name = {p('asset_name')}"]
+    partial: list[str] = []
+    if first_day is not None and last_day is not None and first_day >= last_day:
+        daily.append("FALSE")
+        partial.append(f"started_at >= {p('start_date')} AND started_at <= {p('end_date')}")
+    else:
+        if first_day is not None:
+            daily.append(f"day >= {p('first_day')}")
+            partial.append(
+                f"started_at >= {p('start_date')} AND started_at < {p('first_midnight')}"
+            )
+        if last_day is not None:
+            daily.append(f"day < {p('last_day')}")
+            partial.append(f"started_at >= {p('last_midnight')} AND started_at <= {p('end_date')}")
+    partial_clause = " OR ".join(f"({condition})" for condition in partial) or "FALSE"
+
+    sql = f"""
+    SELECT
+        SUM(total_runs) AS total_runs,
+        SUM(passed_runs) AS passed_runs,
+        SUM(failed_runs) AS failed_runs,
+        SUM(warning_runs) AS warning_runs,
+        SUM(total_duration_ms) AS total_duration_ms,
+        SUM(total_checks) AS total_checks,
+        SUM(total_records) AS total_records
+    FROM (
+        SELECT
+            total_runs, passed_runs, failed_runs, warning_runs,
+            total_duration_ms, total_checks, total_records
+        FROM validation_run_daily
+        WHERE {" AND ".join(daily)}
+        UNION ALL
+        SELECT {_RUN_DAILY_AGGREGATES}
+        FROM validation_runs AS runs
+        WHERE asset_name = {p("asset_name")} AND ({partial_clause})
+    ) AS parts
+    """
+    return sql, params
+
+
+def _summary(row: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Summary statistics from summed run counts."""
+    total_runs = int(row["total_runs"] or 0) if row is not None else 0
+    if row is None or not total_runs:
+        return {
+            "total_runs": 0,
+            "passed_runs": 0,
+            "failed_runs": 0,
+            "warning_runs": 0,
+            "pass_rate": 0.0,
+        }
+    passed_runs = int(row["passed_runs"])
+    return {
+        "total_runs": total_runs,
+        "passed_runs": passed_runs,
+        "failed_runs": int(row["failed_runs"]),
+        "warning_runs": int(row["warning_runs"]),
+        "pass_rate": passed_runs / total_runs,
+        "avg_duration_ms": float(row["total_duration_ms"]) / total_runs,
+        "avg_checks_per_run": float(row["total_checks"]) / total_runs,
+        "total_records_validated": int(row["total_records"]),
+    }
+
+
+def _regression_sql(
+    asset_name: str,
+    metric_name: str,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    limit: int,
+    daily: bool,
+    param: str,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Build the query computing centered least-squares sums of a metric's history.
+
+    The latest `limit` points are numbered 1..n in time order (x) against
+    their values (y) — each measurement, or with daily=True each day's
+    mean from validation_metric_daily.
+
+    Returns:
+        Tuple of (sql, params)
+    """
+    p = param.format
+    params: dict[str, Any] = {
+        "asset_name": asset_name,
+        "metric_name": metric_name,
+        "limit": limit,
+    }
+    if daily:
+        source, time_column, value = "validation_metric_daily", "day", "value_sum / value_count"
+        params["start_date"] = _utc_date(start_date) if start_date else None
+        params["end_date"] = _utc_date(end_date) if end_date else None
+    else:
+        source, time_column, value = "validation_metrics", "timestamp", "value"
+        params["start_date"] = start_date
+        params["end_date"] = end_date
+
+    conditions = [f"asset_name = {p('asset_name')}", f"metric_name = {p('metric_name')}"]
+    if start_date is not None:
+        conditions.append(f"{time_column} >= {p('start_date')}")
+    if end_date is not None:
+        conditions.append(f"{time_column} <= {p('end_date')}")
+
+    sql = f"""
+    WITH points AS (
+        SELECT {time_column} AS t, {value} AS y
+        FROM {source}
+        WHERE {" AND ".join(conditions)}
+        ORDER BY {time_column} DESC
+        LIMIT {p("limit")}
+    ), numbered AS (
+        SELECT CAST(ROW_NUMBER() OVER (ORDER BY t) AS FLOAT) AS x, y FROM points
+    ), means AS (
+        SELECT COUNT(*) AS n, AVG(x) AS mean_x, AVG(y) AS mean_y FROM numbered
+    )
+    SELECT
+        MAX(n) AS n,
+        SUM((x - mean_x) * (x - mean_x)) AS sxx,
+        SUM((y - mean_y) * (y - mean_y)) AS syy,
+        SUM((x - mean_x) * (y - mean_y)) AS sxy
+    FROM numbered CROSS JOIN means
+    """
+    return sql, params
+
+
+def _regression(row: Mapping[str, Any] | None) -> tuple[int, float, float]:
+    """Number of points, slope and R-squared from centered least-squares sums."""
+    if row is None:
+        return 0, 0.0, 0.0
+    n = int(row["n"] or 0)
+    if n < 2 or not row["sxx"]:
+        return n, 0.0, 0.0
+    sxx, syy, sxy = float(row["sxx"]), float(row["syy"] or 0.0), float(row["sxy"])
+    slope = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 0.0
+    return n, slope, max(0.0, min(1.0, r_squared))
+
+
 # =============================================================================
 # PostgreSQL Implementation
 # =============================================================================
@@ -288,11 +632,25 @@ class PostgreSQLValidationHistoryStore:
 
     This implementation stores validation runs, check results, and metrics
     in PostgreSQL tables. It provides efficient querying and analysis
-    capabilities for large-scale validation history.
+    capabilities for large-scale validation history:
+
+    - Rows are written with multi-row INSERT statements of up to
+      INSERT_PAGE_SIZE rows instead of one statement per row.
+    - With partitioned=True, tables are range-partitioned by month on their
+      timestamp, so expired history is dropped a partition at a time (see
+      maintain_partitions). Rows outside the created partitions go to a
+      DEFAULT partition. Existing plain tables are converted with
+      migrate_to_partitioned.
+    - Daily rollups of runs per asset and of metrics per asset and metric
+      are maintained on every write, so summaries and daily trends are
+      SQL aggregations over one row per day (see summarize_runs and
+      metric_regression).
 
     Example:
         connector = PostgreSQLConnector(config)
-        store = PostgreSQLValidationHistoryStore(connector)
+        store = PostgreSQLValidationHistoryStore(
+            connector, partitioned=True, retention_days=365
+        )
         store.initialize_schema()
 
         # Save validation results
@@ -302,17 +660,47 @@ class PostgreSQLValidationHistoryStore:
 
         # Query history
         history = store.get_asset_history("my_asset")
-        trends = store.analyze_trends("my_asset", "quality_score")
+        summary = store.summarize_runs("my_asset")
+
+        # Periodically create upcoming partitions and drop expired ones
+        store.maintain_partitions()
     """
 
-    def __init__(self, connector: PostgreSQLConnector) -> None:
+    _PARTITIONED_TABLES = ("validation_runs", "validation_check_results", "validation_metrics")
+
+    def __init__(
+        self,
+        connector: PostgreSQLConnector,
+        partitioned: bool = False,
+        retention_days: int | None = None,
+        months_ahead: int = 3,
+    ) -> None:
         """
         Initialize PostgreSQL validation history store.
 
         Args:
             connector: PostgreSQL connector instance
+            partitioned: Use tables partitioned by month. Partitioned tables
+                are keyed on (validation_run_id, started_at) and check results
+                have no foreign key to their run (PostgreSQL requires the
+                partition key in every unique constraint); plain tables keep
+                validation_run_id as the primary key.
+            retention_days: Days of history kept by maintain_partitions
+                (None to keep all history)
+            months_ahead: Monthly partitions created ahead of the current month
         """
         self._connector = connector
+        self.partitioned = partitioned
+        self.retention_days = retention_days
+        self.months_ahead = months_ahead
+
+    def _query(self, sql: str, params: dict[str, Any] | None = None) -> QueryResult:
+        """Run a SELECT query through the connector."""
+        execute_query = getattr(self._connector, "execute_query", None)
+        if execute_query is not None:
+            result: QueryResult = execute_query(sql, params)
+            return result
+        return self._connector.query(sql, params)
 
     def initialize_schema(self) -> None:
         """
@@ -322,11 +710,50 @@ class PostgreSQLValidationHistoryStore:
         - validation_runs: Stores validation run metadata
         - validation_check_results: Stores individual check results
         - validation_metrics: Stores metric measurements
+        - validation_run_daily: Daily run counts per asset
+        - validation_metric_daily: Daily metric aggregates per asset and metric
+
+        When partitioned, the first three are partitioned by month and the
+        partitions up to months_ahead are created.
         """
-        schema_sql = """
+        self._connector.execute(self._schema_sql(self.partitioned))
+        if self.partitioned:
+            now = datetime.utcnow()
+            self.ensure_partitions(now, self._add_months(now, self.months_ahead + 1))
+        logger.info("Initialized validation history schema in PostgreSQL")
+
+    @staticmethod
+    def _schema_sql(partitioned: bool) -> str:
+        """CREATE statements of the tables and indexes (plain or partitioned)."""
+        if partitioned:
+            run_id = "validation_run_id VARCHAR(255) NOT NULL"
+            check_id = "id BIGSERIAL"
+            check_run_id = "validation_run_id VARCHAR(255) NOT NULL"
+            metric_id = "id BIGSERIAL"
+            runs_key = ",\n            PRIMARY KEY (validation_run_id, started_at)"
+            checks_key = ",\n            PRIMARY KEY (id, created_at)"
+            metrics_key = ",\n            PRIMARY KEY (id, timestamp)"
+            runs_partition = " PARTITION BY RANGE (started_at)"
+            checks_partition = " PARTITION BY RANGE (created_at)"
+            metrics_partition = " PARTITION BY RANGE (timestamp)"
+        else:
+            run_id = "validation_run_id VARCHAR(255) PRIMARY KEY"
+            check_id = "id SERIAL PRIMARY KEY"
+            check_run_id = (
+                "validation_run_id VARCHAR(255) NOT NULL "
+                "REFERENCES validation_runs(validation_run_id) ON DELETE CASCADE"
+            )
+            metric_id = "id SERIAL PRIMARY KEY"
+            runs_key = checks_key = metrics_key = ""
+            runs_partition = checks_partition = metrics_partition = ""
+        indexes = "\n        ".join(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {target};" for name, target in _POSTGRES_INDEXES
+        )
+
+        return f"""
         -- Validation runs table
         CREATE TABLE IF NOT EXISTS validation_runs (
-            validation_run_id VARCHAR(255) PRIMARY KEY,
+            {run_id},
             asset_name VARCHAR(255) NOT NULL,
             suite_name VARCHAR(255) NOT NULL,
             pipeline_id VARCHAR(255),
@@ -341,50 +768,983 @@ class PostgreSQLValidationHistoryStore:
             total_records INTEGER DEFAULT 0,
             error_count INTEGER DEFAULT 0,
             warning_count INTEGER DEFAULT 0,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(){runs_key}
+        ){runs_partition};
+
+        -- Validation check results table
+        CREATE TABLE IF NOT EXISTS validation_check_results (
+            {check_id},
+            {check_run_id},
+            check_name VARCHAR(255) NOT NULL,
+            check_type VARCHAR(255) NOT NULL,
+            passed BOOLEAN NOT NULL,
+            error_message TEXT,
+            warning_messages JSONB,
+            metrics JSONB,
+            column_name VARCHAR(255),
+            duration_ms FLOAT DEFAULT 0,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(){checks_key}
+        ){checks_partition};
+
+        -- Validation metrics table
+        CREATE TABLE IF NOT EXISTS validation_metrics (
+            {metric_id},
+            metric_name VARCHAR(255) NOT NULL,
+            metric_type VARCHAR(100) NOT NULL,
+            asset_name VARCHAR(255) NOT NULL,
+            check_name VARCHAR(255),
+            value FLOAT NOT NULL,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            status VARCHAR(50) NOT NULL,
+            threshold FLOAT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(){metrics_key}
+        ){metrics_partition};
+
+        -- Daily rollups (days are UTC)
+        CREATE TABLE IF NOT EXISTS validation_run_daily (
+            asset_name VARCHAR(255) NOT NULL,
+            day DATE NOT NULL,
+            total_runs INTEGER NOT NULL,
+            passed_runs INTEGER NOT NULL,
+            failed_runs INTEGER NOT NULL,
+            warning_runs INTEGER NOT NULL,
+            total_duration_ms FLOAT NOT NULL,
+            total_checks BIGINT NOT NULL,
+            total_records BIGINT NOT NULL,
+            PRIMARY KEY (asset_name, day)
         );
 
-        -- Validation check results table
-        CREATE TABLE IF NOT EXISTS validation_check_results (
-            id SERIAL PRIMARY KEY,
-            validation_run_id VARCHAR(255) NOT NULL REFERENCES validation_runs(validation_run_id) ON DELETE CASCADE,
-            check_name VARCHAR(255) NOT NULL,
-            check_type VARCHAR(255) NOT NULL,
-            passed BOOLEAN NOT NULL,
-            error_message TEXT,
-            warning_messages JSONB,
-            metrics JSONB,
-            column_name VARCHAR(255),
-            duration_ms FLOAT DEFAULT 0,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-        );
+        CREATE TABLE IF NOT EXISTS validation_metric_daily (
+            asset_name VARCHAR(255) NOT NULL,
+            metric_name VARCHAR(255) NOT NULL,
+            day DATE NOT NULL,
+            value_count INTEGER NOT NULL,
+            value_sum FLOAT NOT NULL,
+            value_min FLOAT NOT NULL,
+            value_max FLOAT NOT NULL,
+            passed_count INTEGER NOT NULL,
+            PRIMARY KEY (asset_name, metric_name, day)
+        );
+
+        -- Indexes for efficient querying
+        {indexes}
+        """
+
+    def rebuild_rollups(self) -> None:
+        """
+        Recompute both daily rollup tables from the stored runs and metrics.
+
+        Needed once after upgrading a database created before the rollups
+        existed (initialize_schema creates them empty); migrate_to_partitioned
+        calls it.
+        """
+        self._connector.execute(
+            f"""
+            DELETE FROM validation_run_daily;
+            INSERT INTO validation_run_daily ({_RUN_DAILY_COLUMNS})
+            SELECT runs.asset_name, (runs.started_at AT TIME ZONE 'UTC')::date,
+                {_RUN_DAILY_AGGREGATES}
+            FROM validation_runs AS runs
+            GROUP BY 1, 2;
+            DELETE FROM validation_metric_daily;
+            INSERT INTO validation_metric_daily ({_METRIC_DAILY_COLUMNS})
+            {_METRIC_DAILY_SELECT}
+            FROM validation_metrics
+            GROUP BY 1, 2, 3;
+            """
+        )
+        logger.info("Rebuilt validation history rollups")
+
+    def migrate_to_partitioned(self) -> None:
+        """
+        Convert plain (unpartitioned) history tables to the partitioned layout.
+
+        Runs in one transaction: the plain tables are renamed, the
+        partitioned tables are created with monthly partitions from the
+        earliest stored run or metric up to months_ahead, the rows are
+        copied over, the plain tables are dropped and the rollups rebuilt.
+        Check result and metric ids are renumbered. Does nothing if the
+        tables are already partitioned; creates the schema if there are no
+        tables yet. Afterwards use the store with partitioned=True.
+
+        Example:
+            Upgrade an existing database::
+
+                PostgreSQLValidationHistoryStore(connector).migrate_to_partitioned()
+                store = PostgreSQLValidationHistoryStore(connector, partitioned=True)
+        """
+        result = self._query(
+            "SELECT relkind FROM pg_class WHERE relname = 'validation_runs' "
+            "AND pg_table_is_visible(oid)"
+        )
+        if result.row_count == 0:
+            self.partitioned = True
+            self.initialize_schema()
+            return
+        if result.rows[0]["relkind"] == "p":
+            logger.info("Validation history tables are already partitioned")
+            self.partitioned = True
+            return
+
+        first = self._query(
+            """
+            SELECT LEAST(
+                (SELECT MIN(started_at) FROM validation_runs),
+                (SELECT MIN(timestamp) FROM validation_metrics)
+            ) AS first_time
+            """
+        )
+        now = datetime.utcnow()
+        first_time = first.rows[0]["first_time"] if first.row_count else None
+        start = _naive_utc(first_time) if first_time is not None else now
+
+        tables = self._PARTITIONED_TABLES
+        run_columns = ", ".join(_RUN_COLUMNS)
+        check_columns = ", ".join((*_CHECK_COLUMNS, "created_at"))
+        metric_columns = ", ".join((*_METRIC_COLUMNS, "created_at"))
+        statements = [
+            "BEGIN;",
+            *(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned;" for table in tables),
+            *(f"DROP INDEX IF EXISTS {name};" for name, _ in _POSTGRES_INDEXES),
+            self._schema_sql(partitioned=True),
+            *self._partition_statements(start, self._add_months(now, self.months_ahead + 1)),
+            f"""
+            INSERT INTO validation_runs ({run_columns})
+            SELECT {run_columns} FROM validation_runs_unpartitioned;
+            INSERT INTO validation_check_results ({check_columns})
+            SELECT {", ".join(_CHECK_COLUMNS)}, COALESCE(created_at, NOW())
+            FROM validation_check_results_unpartitioned;
+            INSERT INTO validation_metrics ({metric_columns})
+            SELECT {metric_columns} FROM validation_metrics_unpartitioned;
+            """,
+            "DROP TABLE " + ", ".join(f"{table}_unpartitioned" for table in reversed(tables)) + ";",
+            "COMMIT;",
+        ]
+        self._connector.execute("\n".join(statements))
+        self.partitioned = True
+        self.rebuild_rollups()
+        logger.info("Migrated validation history to monthly partitioned tables")
+
+    # =========================================================================
+    # Partitions and Retention
+    # =========================================================================
+
+    @staticmethod
+    def _add_months(moment: datetime, months: int) -> datetime:
+        """Start of the month `months` months after the month of moment."""
+        index = moment.year * 12 + moment.month - 1 + months
+        return datetime(index // 12, index % 12 + 1, 1)
+
+    def ensure_partitions(self, start: datetime, end: datetime) -> None:
+        """
+        Create the monthly partitions covering [start, end).
+
+        Also creates the DEFAULT partitions, which hold rows outside every
+        monthly partition. Call this before backfilling history older than
+        the existing partitions: a monthly partition cannot be created once
+        the DEFAULT partition holds rows for that month.
+
+        Args:
+            start: Earliest time to cover
+            end: Time to cover up to
+        """
+        self._connector.execute("\n".join(self._partition_statements(start, end)))
+
+    def _partition_statements(self, start: datetime, end: datetime) -> list[str]:
+        """CREATE statements of the DEFAULT and monthly partitions covering [start, end)."""
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT;"
+            for table in self._PARTITIONED_TABLES
+        ]
+        month = self._add_months(start, 0)
+        while month < end:
+            upper = self._add_months(month, 1)
+            statements.extend(
+                f"CREATE TABLE IF NOT EXISTS {table}_p{month:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') "
+                f"TO ('{upper:%Y-%m-%d} 00:00:00+00');"
+                for table in self._PARTITIONED_TABLES
+            )
+            month = upper
+        return statements
+
+    def maintain_partitions(self, now: datetime | None = None) -> None:
+        """
+        Create upcoming monthly partitions and apply the retention period.
+
+        Meant to be run periodically (e.g. daily by a scheduled job).
+
+        Args:
+            now: Current time (default: now, UTC)
+        """
+        now = now or datetime.utcnow()
+        if self.partitioned:
+            self.ensure_partitions(now, self._add_months(now, self.months_ahead + 1))
+        if self.retention_days is not None:
+            self.apply_retention(now - timedelta(days=self.retention_days))
+
+    def apply_retention(self, before_date: datetime) -> None:
+        """
+        Remove all history (runs, check results, metrics and rollups) before a date.
+
+        Monthly partitions entirely before the date are dropped; older rows
+        left in other partitions are deleted.
+
+        Args:
+            before_date: Remove history before this time
+        """
+        expired: list[str] = []
+        if self.partitioned:
+            result = self._query(
+                """
+                SELECT child.relname AS partition_name
+                FROM pg_inherits
+                JOIN pg_class AS parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class AS child ON pg_inherits.inhrelid = child.oid
+                WHERE parent.relname = ANY(%(tables)s)
+                """,
+                {"tables": list(self._PARTITIONED_TABLES)},
+            )
+            cutoff = f"{before_date:%Y%m}"
+            for row in result.rows:
+                name = row["partition_name"]
+                suffix = name.rpartition("_p")[2]
+                if suffix.isdigit() and len(suffix) == 6 and suffix < cutoff:
+                    expired.append(name)
+            if expired:
+                self._connector.execute("\n".join(f"DROP TABLE {name};" for name in expired))
+
+        self.delete_old_runs(before_date)
+        params = {
+            "before_date": before_date,
+            "cutoff_day": _utc_date(before_date),
+            "day_start": _utc_midnight(_utc_date(before_date)),
+            "day_end": _utc_midnight(_utc_date(before_date) + timedelta(days=1)),
+        }
+        self._connector.execute(
+            f"""
+            DELETE FROM validation_check_results WHERE created_at < %(before_date)s;
+            DELETE FROM validation_metrics WHERE timestamp < %(before_date)s;
+            DELETE FROM validation_metric_daily WHERE day <= %(cutoff_day)s;
+            INSERT INTO validation_metric_daily ({_METRIC_DAILY_COLUMNS})
+            {_METRIC_DAILY_SELECT}
+            FROM validation_metrics
+            WHERE timestamp >= %(day_start)s AND timestamp < %(day_end)s
+            GROUP BY 1, 2, 3;
+            """,
+            params,
+        )
+        logger.info(
+            f"Removed validation history before {before_date} ({len(expired)} partitions dropped)"
+        )
+
+    # =========================================================================
+    # Save Operations
+    # =========================================================================
+
+    def _insert_pages(
+        self, template: str, columns: Sequence[str], rows: Sequence[tuple[Any, ...]]
+    ) -> None:
+        """
+        Execute a statement with a multi-row VALUES list, a page of rows at a time.
+
+        Args:
+            template: Statement with a {values} placeholder for the row groups
+            columns: Column names, used to name the parameters of each row
+            rows: Rows of values in column order
+        """
+        for start in range(0, len(rows), INSERT_PAGE_SIZE):
+            params: dict[str, Any] = {}
+            groups = []
+            for i, row in enumerate(rows[start : start + INSERT_PAGE_SIZE]):
+                names = [f"{column}_{i}" for column in columns]
+                groups.append("(" + ", ".join(f"%({name})s" for name in names) + ")")
+                params.update(zip(names, row, strict=True))
+            self._connector.execute(template.format(values=",\n".join(groups)), params)
+
+    def save_validation_run(self, run_metadata: ValidationRunMetadata) -> None:
+        """
+        Save validation run metadata.
+
+        Args:
+            run_metadata: Validation run metadata to save
+        """
+        self.save_validation_runs([run_metadata])
+        logger.debug(f"Saved validation run {run_metadata.validation_run_id}")
+
+    def save_validation_runs(self, runs: Sequence[ValidationRunMetadata]) -> None:
+        """
+        Save the metadata of many validation runs in bulk.
+
+        Runs that already exist are updated (keeping their started_at), and
+        the daily rollups of the days the runs started on are recomputed.
+
+        Args:
+            runs: Validation run metadata to save
+        """
+        latest = {run.validation_run_id: run for run in runs}
+        if not latest:
+            return
+        conflict = "validation_run_id"
+        saved = list(latest.values())
+        if self.partitioned:
+            conflict = "validation_run_id, started_at"
+            saved = self._with_stored_start_times(saved)
+        updates = ",\n            ".join(f"{c} = EXCLUDED.{c}" for c in _RUN_UPDATE_COLUMNS)
+        template = f"""
+        INSERT INTO validation_runs ({", ".join(_RUN_COLUMNS)})
+        VALUES {{values}}
+        ON CONFLICT ({conflict}) DO UPDATE SET
+            {updates}
+        """
+        rows = [tuple(getattr(run, c) for c in _RUN_COLUMNS) for run in saved]
+        self._insert_pages(template, _RUN_COLUMNS, rows)
+
+        run_ids = list(latest)
+        for start in range(0, len(run_ids), INSERT_PAGE_SIZE):
+            self._refresh_run_rollups(
+                """
+                SELECT DISTINCT asset_name, (started_at AT TIME ZONE 'UTC')::date AS day
+                FROM validation_runs
+                WHERE validation_run_id = ANY(%(run_ids)s)
+                """,
+                {"run_ids": run_ids[start : start + INSERT_PAGE_SIZE]},
+            )
+
+    def _with_stored_start_times(
+        self, runs: Sequence[ValidationRunMetadata]
+    ) -> list[ValidationRunMetadata]:
+        """
+        Give runs that are already stored their stored started_at.
+
+        The partitioned key includes started_at, so a run re-saved with a
+        different started_at would otherwise be inserted a second time. As
+        with the plain key, started_at is never updated.
+        """
+        stored: dict[str, datetime] = {}
+        run_ids = [run.validation_run_id for run in runs]
+        for start in range(0, len(run_ids), INSERT_PAGE_SIZE):
+            result = self._query(
+                """
+                SELECT validation_run_id, started_at FROM validation_runs
+                WHERE validation_run_id = ANY(%(run_ids)s)
+                """,
+                {"run_ids": run_ids[start : start + INSERT_PAGE_SIZE]},
+            )
+            stored.update((row["validation_run_id"], row["started_at"]) for row in result.rows)
+        return [
+            replace(run, started_at=stored[run.validation_run_id])
+            if run.validation_run_id in stored
+            else run
+            for run in runs
+        ]
+
+    def _refresh_run_rollups(self, days_sql: str, params: dict[str, Any]) -> None:
+        """
+        Recompute the validation_run_daily rows of some (asset_name, day) pairs.
+
+        Args:
+            days_sql: Query selecting the asset_name and day pairs
+            params: Parameters of the query
+        """
+        self._connector.execute(
+            f"""
+            WITH days AS ({days_sql})
+            INSERT INTO validation_run_daily ({_RUN_DAILY_COLUMNS})
+            SELECT days.asset_name, days.day, {_RUN_DAILY_AGGREGATES}
+            FROM days
+            JOIN validation_runs AS runs
+                ON runs.asset_name = days.asset_name
+                AND runs.started_at >= days.day::timestamp AT TIME ZONE 'UTC'
+                AND runs.started_at < (days.day + 1)::timestamp AT TIME ZONE 'UTC'
+            GROUP BY days.asset_name, days.day
+            ON CONFLICT (asset_name, day) DO UPDATE SET
+                total_runs = EXCLUDED.total_runs,
+                passed_runs = EXCLUDED.passed_runs,
+                failed_runs = EXCLUDED.failed_runs,
+                warning_runs = EXCLUDED.warning_runs,
+                total_duration_ms = EXCLUDED.total_duration_ms,
+                total_checks = EXCLUDED.total_checks,
+                total_records = EXCLUDED.total_records
+            """,
+            params,
+        )
+
+    def save_check_results(self, check_records: Sequence[ValidationCheckRecord]) -> None:
+        """
+        Save validation check results in bulk.
+
+        Args:
+            check_records: Check result records to save
+        """
+        if not check_records:
+            return
+        template = f"""
+        INSERT INTO validation_check_results ({", ".join(_CHECK_COLUMNS)})
+        VALUES {{values}}
+        """
+        self._insert_pages(template, _CHECK_COLUMNS, [_check_row(r) for r in check_records])
+        logger.debug(f"Saved {len(check_records)} check results")
+
+    def save_metrics(self, metrics: Sequence[ValidationMetric]) -> None:
+        """
+        Save validation metrics in bulk and add them to the daily metric rollups.
+
+        Args:
+            metrics: Metric records to save
+        """
+        if not metrics:
+            return
+        template = f"""
+        WITH inserted AS (
+            INSERT INTO validation_metrics ({", ".join(_METRIC_COLUMNS)})
+            VALUES {{values}}
+            RETURNING asset_name, metric_name, timestamp, value, status
+        )
+        INSERT INTO validation_metric_daily AS daily ({_METRIC_DAILY_COLUMNS})
+        {_METRIC_DAILY_SELECT}
+        FROM inserted
+        GROUP BY 1, 2, 3
+        ON CONFLICT (asset_name, metric_name, day) DO UPDATE SET
+            value_count = daily.value_count + EXCLUDED.value_count,
+            value_sum = daily.value_sum + EXCLUDED.value_sum,
+            value_min = LEAST(daily.value_min, EXCLUDED.value_min),
+            value_max = GREATEST(daily.value_max, EXCLUDED.value_max),
+            passed_count = daily.passed_count + EXCLUDED.passed_count
+        """
+        self._insert_pages(template, _METRIC_COLUMNS, [_metric_row(m) for m in metrics])
+        logger.debug(f"Saved {len(metrics)} metrics")
+
+    # =========================================================================
+    # Query Operations
+    # =========================================================================
+
+    def get_validation_run(self, validation_run_id: str) -> ValidationRunMetadata | None:
+        """
+        Get a specific validation run by ID.
+
+        Args:
+            validation_run_id: ID of the validation run
+
+        Returns:
+            ValidationRunMetadata if found, None otherwise
+        """
+        sql = f"""
+        {_RUN_SELECT}
+        WHERE validation_run_id = %(validation_run_id)s
+        ORDER BY started_at DESC
+        LIMIT 1
+        """
+
+        result = self._query(sql, {"validation_run_id": validation_run_id})
+
+        if result.row_count == 0:
+            return None
+
+        row = result.rows[0]
+        return ValidationRunMetadata(**row)
+
+    def query_validation_runs(
+        self,
+        asset_name: str | None = None,
+        status: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 100,
+    ) -> Sequence[ValidationRunMetadata]:
+        """
+        Query validation runs with filters.
+
+        Args:
+            asset_name: Filter by asset name
+            status: Filter by status
+            start_date: Filter to runs after this date
+            end_date: Filter to runs before this date
+            limit: Maximum number of results
+
+        Returns:
+            Sequence of ValidationRunMetadata
+        """
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+
+        if asset_name:
+            conditions.append("asset_name = %(asset_name)s")
+            params["asset_name"] = asset_name
+
+        if status:
+            conditions.append("status = %(status)s")
+            params["status"] = status
+
+        if start_date:
+            conditions.append("started_at >= %(start_date)s")
+            params["start_date"] = start_date
+
+        if end_date:
+            conditions.append("started_at <= %(end_date)s")
+            params["end_date"] = end_date
+
+        where_clause = " AND ".join(conditions) if conditions else "TRUE"
+        params["limit"] = limit
+
+        sql = f"""
+        {_RUN_SELECT}
+        WHERE {where_clause}
+        ORDER BY started_at DESC
+        LIMIT %(limit)s
+        """
+
+        result = self._query(sql, params)
+        return [ValidationRunMetadata(**row) for row in result.rows]
+
+    def get_asset_history(
+        self, asset_name: str, limit: int = 100
+    ) -> Sequence[ValidationRunMetadata]:
+        """
+        Get validation history for a specific asset.
+
+        Args:
+            asset_name: Name of the asset
+            limit: Maximum number of runs to return
+
+        Returns:
+            Sequence of validation runs for the asset
+        """
+        return self.query_validation_runs(asset_name=asset_name, limit=limit)
+
+    def get_metrics_history(
+        self,
+        asset_name: str,
+        metric_name: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 1000,
+    ) -> Sequence[ValidationMetric]:
+        """
+        Get metrics history for an asset.
+
+        Args:
+            asset_name: Name of the asset
+            metric_name: Optional filter by metric name
+            start_date: Filter to metrics after this date
+            end_date: Filter to metrics before this date
+            limit: Maximum number of results
+
+        Returns:
+            Sequence of ValidationMetric
+        """
+        conditions: list[str] = ["asset_name = %(asset_name)s"]
+        params: dict[str, Any] = {"asset_name": asset_name}
+
+        if metric_name:
+            conditions.append("metric_name = %(metric_name)s")
+            params["metric_name"] = metric_name
+
+        if start_date:
+            conditions.append("timestamp >= %(start_date)s")
+            params["start_date"] = start_date
+
+        if end_date:
+            conditions.append("timestamp <= %(end_date)s")
+            params["end_date"] = end_date
+
+        where_clause = " AND ".join(conditions)
+        params["limit"] = limit
+
+        sql = f"""
+        SELECT {", ".join(_METRIC_COLUMNS)}
+        FROM validation_metrics
+        WHERE {where_clause}
+        ORDER BY timestamp DESC
+        LIMIT %(limit)s
+        """
+
+        result = self._query(sql, params)
+        return [_metric_from_row(row) for row in result.rows]
+
+    def search_validation_runs(
+        self, query: str, limit: int = 100
+    ) -> Sequence[ValidationRunMetadata]:
+        """
+        Search validation runs by text.
+
+        Args:
+            query: Search query (matches asset_name or suite_name)
+            limit: Maximum number of results
+
+        Returns:
+            Sequence of matching validation runs
+        """
+        sql = f"""
+        {_RUN_SELECT}
+        WHERE asset_name ILIKE %(query)s OR suite_name ILIKE %(query)s
+        ORDER BY started_at DESC
+        LIMIT %(limit)s
+        """
+
+        search_pattern = f"%{query}%"
+        result = self._query(sql, {"query": search_pattern, "limit": limit})
+        return [ValidationRunMetadata(**row) for row in result.rows]
+
+    def delete_old_runs(self, before_date: datetime, asset_name: str | None = None) -> int:
+        """
+        Delete old validation runs with their check results and rollups.
+
+        Args:
+            before_date: Delete runs before this date
+            asset_name: Optional filter by asset name
+
+        Returns:
+            Number of runs deleted
+        """
+        cutoff_day = _utc_date(before_date)
+        conditions: list[str] = ["started_at < %(before_date)s"]
+        params: dict[str, Any] = {
+            "before_date": before_date,
+            "cutoff_day": cutoff_day,
+            "day_start": _utc_midnight(cutoff_day),
+            "day_end": _utc_midnight(cutoff_day + timedelta(days=1)),
+        }
+
+        if asset_name:
+            conditions.append("asset_name = %(asset_name)s")
+            params["asset_name"] = asset_name
+
+        where_clause = " AND ".join(conditions)
+
+        self._connector.execute(
+            f"""
+            DELETE FROM validation_check_results
+            WHERE validation_run_id IN (SELECT validation_run_id FROM validation_runs WHERE {where_clause})
+            """,
+            params,
+        )
+        count = self._connector.execute(f"DELETE FROM validation_runs WHERE {where_clause}", params)
+
+        # Days before the cutoff are gone; the cutoff day is recomputed from its remaining runs
+        asset_clause = " AND asset_name = %(asset_name)s" if asset_name else ""
+        self._connector.execute(
+            f"DELETE FROM validation_run_daily WHERE day <= %(cutoff_day)s{asset_clause}", params
+        )
+        self._refresh_run_rollups(
+            f"""
+            SELECT DISTINCT asset_name, %(cutoff_day)s::date AS day
+            FROM validation_runs
+            WHERE started_at >= %(day_start)s AND started_at < %(day_end)s{asset_clause}
+            """,
+            params,
+        )
+
+        count = count or 0
+        logger.info(f"Deleted {count} old validation runs")
+        return count
+
+    # =========================================================================
+    # Aggregations
+    # =========================================================================
+
+    def summarize_runs(
+        self,
+        asset_name: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, Any]:
+        """
+        Summarize an asset's validation runs in SQL.
+
+        Full days come from the daily rollup; only the runs of the partial
+        days at either end of the range are read.
+
+        Args:
+            asset_name: Asset to summarize
+            start_date: Optional start date for summary
+            end_date: Optional end date for summary
+
+        Returns:
+            Dictionary with summary statistics (as get_summary_statistics)
+        """
+        sql, params = _summary_sql(asset_name, start_date, end_date, "%({})s")
+        result = self._query(sql, params)
+        return _summary(result.rows[0] if result.rows else None)
+
+    def metric_regression(
+        self,
+        asset_name: str,
+        metric_name: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 1000,
+        daily: bool = False,
+    ) -> tuple[int, float, float]:
+        """
+        Fit a linear trend to a metric's history in SQL.
+
+        Args:
+            asset_name: Asset of the metric
+            metric_name: Metric to fit
+            start_date: Optional start of the history
+            end_date: Optional end of the history
+            limit: Fit only the latest points
+            daily: Fit daily means from the rollup instead of each measurement
+                (whole UTC days overlapping the range are used)
+
+        Returns:
+            Tuple of (data_points, slope per point, r_squared)
+        """
+        sql, params = _regression_sql(
+            asset_name, metric_name, start_date, end_date, limit, daily, "%({})s"
+        )
+        result = self._query(sql, params)
+        return _regression(result.rows[0] if result.rows else None)
+
+    def failing_checks(
+        self,
+        asset_name: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        min_occurrences: int = 1,
+    ) -> Sequence[dict[str, Any]]:
+        """
+        Count the failures of each check in an asset's failed runs in SQL.
+
+        Args:
+            asset_name: Asset to analyze
+            start_date: Optional start of the period
+            end_date: Optional end of the period
+            min_occurrences: Minimum failures of a check to report it
+
+        Returns:
+            One dictionary per check with check_name, check_type, frequency,
+            first_occurrence, last_occurrence and run_ids (latest first),
+            most recently failed checks first
+        """
+        conditions = ["runs.asset_name = %(asset_name)s", "runs.status = 'failed'"]
+        params: dict[str, Any] = {"asset_name": asset_name, "min_occurrences": min_occurrences}
+        if start_date:
+            conditions.append("runs.started_at >= %(start_date)s")
+            params["start_date"] = start_date
+        if end_date:
+            conditions.append("runs.started_at <= %(end_date)s")
+            params["end_date"] = end_date
+
+        sql = f"""
+        SELECT
+            checks.check_name,
+            checks.check_type,
+            COUNT(*) AS frequency,
+            MIN(runs.started_at) AS first_occurrence,
+            MAX(runs.started_at) AS last_occurrence,
+            ARRAY_AGG(runs.validation_run_id ORDER BY runs.started_at DESC) AS run_ids
+        FROM validation_runs AS runs
+        JOIN validation_check_results AS checks
+            ON checks.validation_run_id = runs.validation_run_id AND NOT checks.passed
+        WHERE {" AND ".join(conditions)}
+        GROUP BY checks.check_name, checks.check_type
+        HAVING COUNT(*) >= %(min_occurrences)s
+        ORDER BY last_occurrence DESC
+        """
+        return [dict(row) for row in self._query(sql, params).rows]
+
+
+# =============================================================================
+# SQLite Implementation
+# =============================================================================
+
+
+def _sqlite_value(value: Any) -> Any:
+    """Convert a parameter to its SQLite representation (times as naive UTC text)."""
+    if isinstance(value, datetime):
+        return _naive_utc(value).isoformat(sep=" ", timespec="microseconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _sqlite_params(params: Mapping[str, Any]) -> dict[str, Any]:
+    return {name: _sqlite_value(value) for name, value in params.items()}
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
 
-        -- Validation metrics table
-        CREATE TABLE IF NOT EXISTS validation_metrics (
-            id SERIAL PRIMARY KEY,
-            metric_name VARCHAR(255) NOT NULL,
-            metric_type VARCHAR(100) NOT NULL,
-            asset_name VARCHAR(255) NOT NULL,
-            check_name VARCHAR(255),
-            value FLOAT NOT NULL,
-            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
-            status VARCHAR(50) NOT NULL,
-            threshold FLOAT,
-            created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
-        );
 
-        -- Indexes for efficient querying
-        CREATE INDEX IF NOT EXISTS idx_validation_runs_asset ON validation_runs(asset_name);
-        CREATE INDEX IF NOT EXISTS idx_validation_runs_status ON validation_runs(status);
-        CREATE INDEX IF NOT EXISTS idx_validation_runs_started_at ON validation_runs(started_at DESC);
-        CREATE INDEX IF NOT EXISTS idx_check_results_run ON validation_check_results(validation_run_id);
-        CREATE INDEX IF NOT EXISTS idx_metrics_asset ON validation_metrics(asset_name);
-        CREATE INDEX IF NOT EXISTS idx_metrics_metric ON validation_metrics(metric_name);
-        CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON validation_metrics(timestamp DESC);
+class SQLiteValidationHistoryStore:
+    """
+    SQLite-based validation history storage.
+
+    A local implementation of ValidationHistoryStore with the same tables,
+    daily rollups and SQL aggregations as PostgreSQLValidationHistoryStore,
+    for tests and single-machine use. Times are stored as naive UTC text.
+    Access is serialized with a lock.
+
+    Example:
+        store = SQLiteValidationHistoryStore(".vibe_piper/validation_history.db")
+        store.save_validation_run(run_metadata)
+        analyzer = ValidationHistoryAnalyzer(store)
+        summary = analyzer.get_summary_statistics("my_asset")
+
+    Attributes:
+        db_path: Path to the SQLite database file
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
         """
+        Initialize SQLite validation history store.
 
-        self._connector.execute(schema_sql)
-        logger.info("Initialized validation history schema in PostgreSQL")
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS validation_runs (
+                    validation_run_id TEXT PRIMARY KEY,
+                    asset_name TEXT NOT NULL,
+                    suite_name TEXT NOT NULL,
+                    pipeline_id TEXT,
+                    status TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    completed_at TEXT,
+                    duration_ms REAL DEFAULT 0,
+                    total_checks INTEGER DEFAULT 0,
+                    passed_checks INTEGER DEFAULT 0,
+                    failed_checks INTEGER DEFAULT 0,
+                    warning_checks INTEGER DEFAULT 0,
+                    total_records INTEGER DEFAULT 0,
+                    error_count INTEGER DEFAULT 0,
+                    warning_count INTEGER DEFAULT 0,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS validation_check_results (
+                    id INTEGER PRIMARY KEY,
+                    validation_run_id TEXT NOT NULL,
+                    check_name TEXT NOT NULL,
+                    check_type TEXT NOT NULL,
+                    passed INTEGER NOT NULL,
+                    error_message TEXT,
+                    warning_messages TEXT,
+                    metrics TEXT,
+                    column_name TEXT,
+                    duration_ms REAL DEFAULT 0,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                );
+
+                CREATE TABLE IF NOT EXISTS validation_metrics (
+                    id INTEGER PRIMARY KEY,
+                    metric_name TEXT NOT NULL,
+                    metric_type TEXT NOT NULL,
+                    asset_name TEXT NOT NULL,
+                    check_name TEXT,
+                    value REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    threshold REAL
+                );
+
+                CREATE TABLE IF NOT EXISTS validation_run_daily (
+                    asset_name TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    total_runs INTEGER NOT NULL,
+                    passed_runs INTEGER NOT NULL,
+                    failed_runs INTEGER NOT NULL,
+                    warning_runs INTEGER NOT NULL,
+                    total_duration_ms REAL NOT NULL,
+                    total_checks INTEGER NOT NULL,
+                    total_records INTEGER NOT NULL,
+                    PRIMARY KEY (asset_name, day)
+                );
+
+                CREATE TABLE IF NOT EXISTS validation_metric_daily (
+                    asset_name TEXT NOT NULL,
+                    metric_name TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    value_count INTEGER NOT NULL,
+                    value_sum REAL NOT NULL,
+                    value_min REAL NOT NULL,
+                    value_max REAL NOT NULL,
+                    passed_count INTEGER NOT NULL,
+                    PRIMARY KEY (asset_name, metric_name, day)
+                );
+
+                CREATE INDEX IF NOT EXISTS idx_validation_runs_asset_started
+                    ON validation_runs(asset_name, started_at);
+                CREATE INDEX IF NOT EXISTS idx_validation_runs_started_at
+                    ON validation_runs(started_at);
+                CREATE INDEX IF NOT EXISTS idx_check_results_run_id
+                    ON validation_check_results(validation_run_id);
+                CREATE INDEX IF NOT EXISTS idx_metrics_asset_metric_timestamp
+                    ON validation_metrics(asset_name, metric_name, timestamp);
+                """
+            )
+            self._initialized = True
+        return conn
+
+    def _fetch(self, sql: str, params: Mapping[str, Any]) -> list[sqlite3.Row]:
+        """Run a SELECT query."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                return conn.execute(sql, _sqlite_params(params)).fetchall()
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _run_from_row(row: sqlite3.Row) -> ValidationRunMetadata:
+        values = {column: row[column] for column in _RUN_COLUMNS}
+        values["started_at"] = _parse_time(values["started_at"])
+        values["completed_at"] = _parse_time(values["completed_at"])
+        return ValidationRunMetadata(**values)
+
+    @staticmethod
+    def _refresh_run_rollups(conn: sqlite3.Connection, days: set[tuple[str, str]]) -> None:
+        """Recompute the validation_run_daily rows of some (asset_name, day) pairs."""
+        conn.executemany("DELETE FROM validation_run_daily WHERE asset_name = ? AND day = ?", days)
+        conn.executemany(
+            f"""
+            INSERT INTO validation_run_daily ({_RUN_DAILY_COLUMNS})
+            SELECT asset_name, ?2, {_RUN_DAILY_AGGREGATES}
+            FROM validation_runs AS runs
+            WHERE asset_name = ?1 AND started_at >= ?2 AND started_at < date(?2, '+1 day')
+            GROUP BY asset_name
+            """,
+            days,
+        )
+
+    @staticmethod
+    def _refresh_metric_rollups(
+        conn: sqlite3.Connection, condition: str, params: Sequence[Any]
+    ) -> None:
+        """Add the metrics matching a condition to validation_metric_daily."""
+        conn.execute(
+            f"""
+            INSERT INTO validation_metric_daily AS daily ({_METRIC_DAILY_COLUMNS})
+            SELECT
+                asset_name, metric_name, date(timestamp),
+                COUNT(*), SUM(value), MIN(value), MAX(value),
+                COUNT(*) FILTER (WHERE status = 'passed')
+            FROM validation_metrics
+            WHERE {condition}
+            GROUP BY 1, 2, 3
+            ON CONFLICT (asset_name, metric_name, day) DO UPDATE SET
+                value_count = daily.value_count + excluded.value_count,
+                value_sum = daily.value_sum + excluded.value_sum,
+                value_min = MIN(daily.value_min, excluded.value_min),
+                value_max = MAX(daily.value_max, excluded.value_max),
+                passed_count = daily.passed_count + excluded.passed_count
+            """,
+            params,
+        )
 
     # =========================================================================
     # Save Operations
@@ -397,108 +1757,91 @@ class PostgreSQLValidationHistoryStore:
         Args:
             run_metadata: Validation run metadata to save
         """
-        sql = """
-        INSERT INTO validation_runs (
-            validation_run_id, asset_name, suite_name, pipeline_id, status,
-            started_at, completed_at, duration_ms, total_checks, passed_checks,
-            failed_checks, warning_checks, total_records, error_count, warning_count
-        ) VALUES (%(validation_run_id)s, %(asset_name)s, %(suite_name)s, %(pipeline_id)s, %(status)s,
-        %(started_at)s, %(completed_at)s, %(duration_ms)s, %(total_checks)s, %(passed_checks)s,
-        %(failed_checks)s, %(warning_checks)s, %(total_records)s, %(error_count)s, %(warning_count)s)
-        ON CONFLICT (validation_run_id) DO UPDATE SET
-            completed_at = EXCLUDED.completed_at,
-            duration_ms = EXCLUDED.duration_ms,
-            total_checks = EXCLUDED.total_checks,
-            passed_checks = EXCLUDED.passed_checks,
-            failed_checks = EXCLUDED.failed_checks,
-            warning_checks = EXCLUDED.warning_checks,
-            error_count = EXCLUDED.error_count,
-            warning_count = EXCLUDED.warning_count
+        self.save_validation_runs([run_metadata])
+
+    def save_validation_runs(self, runs: Sequence[ValidationRunMetadata]) -> None:
         """
+        Save the metadata of many validation runs in bulk.
 
-        params = {
-            "validation_run_id": run_metadata.validation_run_id,
-            "asset_name": run_metadata.asset_name,
-            "suite_name": run_metadata.suite_name,
-            "pipeline_id": run_metadata.pipeline_id,
-            "status": run_metadata.status,
-            "started_at": run_metadata.started_at,
-            "completed_at": run_metadata.completed_at,
-            "duration_ms": run_metadata.duration_ms,
-            "total_checks": run_metadata.total_checks,
-            "passed_checks": run_metadata.passed_checks,
-            "failed_checks": run_metadata.failed_checks,
-            "warning_checks": run_metadata.warning_checks,
-            "total_records": run_metadata.total_records,
-            "error_count": run_metadata.error_count,
-            "warning_count": run_metadata.warning_count,
-        }
+        Runs that already exist are updated, and the daily rollups of the
+        days the runs started on are recomputed.
 
-        self._connector.execute(sql, params)
-        logger.debug(f"Saved validation run {run_metadata.validation_run_id}")
+        Args:
+            runs: Validation run metadata to save
+        """
+        latest = {run.validation_run_id: run for run in runs}
+        if not latest:
+            return
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _RUN_UPDATE_COLUMNS)
+        sql = f"""
+        INSERT INTO validation_runs ({", ".join(_RUN_COLUMNS)})
+        VALUES ({", ".join("?" for _ in _RUN_COLUMNS)})
+        ON CONFLICT (validation_run_id) DO UPDATE SET {updates}
+        """
+        rows = [
+            tuple(_sqlite_value(getattr(run, c)) for c in _RUN_COLUMNS) for run in latest.values()
+        ]
+        days = {(run.asset_name, _utc_date(run.started_at).isoformat()) for run in latest.values()}
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                run_ids = list(latest)
+                for start in range(0, len(run_ids), INSERT_PAGE_SIZE):
+                    chunk = run_ids[start : start + INSERT_PAGE_SIZE]
+                    previous = conn.execute(
+                        "SELECT asset_name, date(started_at) FROM validation_runs "
+                        f"WHERE validation_run_id IN ({', '.join('?' for _ in chunk)})",
+                        chunk,
+                    )
+                    days.update(tuple(row) for row in previous)
+                conn.executemany(sql, rows)
+                self._refresh_run_rollups(conn, days)
+                conn.commit()
+            finally:
+                conn.close()
 
     def save_check_results(self, check_records: Sequence[ValidationCheckRecord]) -> None:
         """
-        Save validation check results.
+        Save validation check results in bulk.
 
         Args:
             check_records: Check result records to save
         """
-        sql = """
-        INSERT INTO validation_check_results (
-            validation_run_id, check_name, check_type, passed, error_message,
-            warning_messages, metrics, column_name, duration_ms
-        ) VALUES (%(validation_run_id)s, %(check_name)s, %(check_type)s, %(passed)s, %(error_message)s,
-        %(warning_messages)s, %(metrics)s, %(column_name)s, %(duration_ms)s)
-        """
-
-        for record in check_records:
-            import json
-
-            params = {
-                "validation_run_id": record.validation_run_id,
-                "check_name": record.check_name,
-                "check_type": record.check_type,
-                "passed": record.passed,
-                "error_message": record.error_message,
-                "warning_messages": json.dumps(record.warning_messages),
-                "metrics": json.dumps(record.metrics),
-                "column_name": record.column_name,
-                "duration_ms": record.duration_ms,
-            }
-            self._connector.execute(sql, params)
-
-        logger.debug(f"Saved {len(check_records)} check results")
+        sql = f"""
+        INSERT INTO validation_check_results ({", ".join(_CHECK_COLUMNS)})
+        VALUES ({", ".join("?" for _ in _CHECK_COLUMNS)})
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany(sql, [_check_row(record) for record in check_records])
+                conn.commit()
+            finally:
+                conn.close()
 
     def save_metrics(self, metrics: Sequence[ValidationMetric]) -> None:
         """
-        Save validation metrics.
+        Save validation metrics in bulk and add them to the daily metric rollups.
 
         Args:
             metrics: Metric records to save
         """
-        sql = """
-        INSERT INTO validation_metrics (
-            metric_name, metric_type, asset_name, check_name, value,
-            timestamp, status, threshold
-        ) VALUES (%(metric_name)s, %(metric_type)s, %(asset_name)s, %(check_name)s, %(value)s,
-        %(timestamp)s, %(status)s, %(threshold)s)
-        """
-
-        for metric in metrics:
-            params = {
-                "metric_name": metric.metric_name,
-                "metric_type": metric.metric_type.value,
-                "asset_name": metric.asset_name,
-                "check_name": metric.check_name,
-                "value": metric.value,
-                "timestamp": metric.timestamp,
-                "status": metric.status,
-                "threshold": metric.threshold,
-            }
-            self._connector.execute(sql, params)
-
-        logger.debug(f"Saved {len(metrics)} metrics")
+        sql = f"""
+        INSERT INTO validation_metrics ({", ".join(_METRIC_COLUMNS)})
+        VALUES ({", ".join("?" for _ in _METRIC_COLUMNS)})
+        """
+        rows = [tuple(_sqlite_value(value) for value in _metric_row(m)) for m in metrics]
+        with self._lock:
+            conn = self._connect()
+            try:
+                last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM validation_metrics")
+                last_id = last_id.fetchone()[0]
+                conn.executemany(sql, rows)
+                self._refresh_metric_rollups(conn, "id > ?", (last_id,))
+                conn.commit()
+            finally:
+                conn.close()
 
     # =========================================================================
     # Query Operations
@@ -514,22 +1857,11 @@ class PostgreSQLValidationHistoryStore:
         Returns:
             ValidationRunMetadata if found, None otherwise
         """
-        sql = """
-        SELECT
-            validation_run_id, asset_name, suite_name, pipeline_id, status,
-            started_at, completed_at, duration_ms, total_checks, passed_checks,
-            failed_checks, warning_checks, total_records, error_count, warning_count
-        FROM validation_runs
-        WHERE validation_run_id = %(validation_run_id)s
-        """
-
-        result = self._connector.execute_query(sql, {"validation_run_id": validation_run_id})
-
-        if result.row_count == 0:
-            return None
-
-        row = result.rows[0]
-        return ValidationRunMetadata(**row)
+        rows = self._fetch(
+            f"{_RUN_SELECT} WHERE validation_run_id = :validation_run_id",
+            {"validation_run_id": validation_run_id},
+        )
+        return self._run_from_row(rows[0]) if rows else None
 
     def query_validation_runs(
         self,
@@ -553,40 +1885,25 @@ class PostgreSQLValidationHistoryStore:
             Sequence of ValidationRunMetadata
         """
         conditions: list[str] = []
-        params: dict[str, Any] = {}
-
+        params: dict[str, Any] = {"limit": limit}
         if asset_name:
-            conditions.append("asset_name = %(asset_name)s")
+            conditions.append("asset_name = :asset_name")
             params["asset_name"] = asset_name
-
         if status:
-            conditions.append("status = %(status)s")
+            conditions.append("status = :status")
             params["status"] = status
-
         if start_date:
-            conditions.append("started_at >= %(start_date)s")
+            conditions.append("started_at >= :start_date")
             params["start_date"] = start_date
-
         if end_date:
-            conditions.append("started_at <= %(end_date)s")
+            conditions.append("started_at <= :end_date")
             params["end_date"] = end_date
 
         where_clause = " AND ".join(conditions) if conditions else "TRUE"
-        params["limit"] = limit
-
-        sql = f"""
-        SELECT
-            validation_run_id, asset_name, suite_name, pipeline_id, status,
-            started_at, completed_at, duration_ms, total_checks, passed_checks,
-            failed_checks, warning_checks, total_records, error_count, warning_count
-        FROM validation_runs
-        WHERE {where_clause}
-        ORDER BY started_at DESC
-        LIMIT %(limit)s
-        """
-
-        result = self._connector.execute_query(sql, params)
-        return [ValidationRunMetadata(**row) for row in result.rows]
+        rows = self._fetch(
+            f"{_RUN_SELECT} WHERE {where_clause} ORDER BY started_at DESC LIMIT :limit", params
+        )
+        return [self._run_from_row(row) for row in rows]
 
     def get_asset_history(
         self, asset_name: str, limit: int = 100
@@ -624,47 +1941,31 @@ class PostgreSQLValidationHistoryStore:
         Returns:
             Sequence of ValidationMetric
         """
-        conditions: list[str] = ["asset_name = %(asset_name)s"]
-        params: dict[str, Any] = {"asset_name": asset_name}
-
+        conditions: list[str] = ["asset_name = :asset_name"]
+        params: dict[str, Any] = {"asset_name": asset_name, "limit": limit}
         if metric_name:
-            conditions.append("metric_name = %(metric_name)s")
+            conditions.append("metric_name = :metric_name")
             params["metric_name"] = metric_name
-
         if start_date:
-            conditions.append("timestamp >= %(start_date)s")
+            conditions.append("timestamp >= :start_date")
             params["start_date"] = start_date
-
         if end_date:
-            conditions.append("timestamp <= %(end_date)s")
+            conditions.append("timestamp <= :end_date")
             params["end_date"] = end_date
 
-        where_clause = " AND ".join(conditions)
-        params["limit"] = limit
-
-        sql = f"""
-        SELECT
-            metric_name, metric_type, asset_name, check_name, value,
-            timestamp, status, threshold
-        FROM validation_metrics
-        WHERE {where_clause}
-        ORDER BY timestamp DESC
-        LIMIT %(limit)s
-        """
-
-        result = self._connector.execute_query(sql, params)
+        rows = self._fetch(
+            f"""
+            SELECT {", ".join(_METRIC_COLUMNS)}
+            FROM validation_metrics
+            WHERE {" AND ".join(conditions)}
+            ORDER BY timestamp DESC
+            LIMIT :limit
+            """,
+            params,
+        )
         return [
-            ValidationMetric(
-                metric_name=row["metric_name"],
-                metric_type=QualityMetricType(row["metric_type"]),
-                asset_name=row["asset_name"],
-                check_name=row["check_name"],
-                value=row["value"],
-                timestamp=row["timestamp"],
-                status=row["status"],
-                threshold=row["threshold"],
-            )
-            for row in result.rows
+            _metric_from_row({**dict(row), "timestamp": _parse_time(row["timestamp"])})
+            for row in rows
         ]
 
     def search_validation_runs(
@@ -674,30 +1975,26 @@ class PostgreSQLValidationHistoryStore:
         Search validation runs by text.
 
         Args:
-            query: Search query (matches asset_name or suite_name)
+            query: Search query (matches asset_name or suite_name, ignoring case)
             limit: Maximum number of results
 
         Returns:
             Sequence of matching validation runs
         """
-        sql = """
-        SELECT
-            validation_run_id, asset_name, suite_name, pipeline_id, status,
-            started_at, completed_at, duration_ms, total_checks, passed_checks,
-            failed_checks, warning_checks, total_records, error_count, warning_count
-        FROM validation_runs
-        WHERE asset_name ILIKE %(query)s OR suite_name ILIKE %(query)s
-        ORDER BY started_at DESC
-        LIMIT %(limit)s
-        """
-
-        search_pattern = f"%{query}%"
-        result = self._connector.execute_query(sql, {"query": search_pattern, "limit": limit})
-        return [ValidationRunMetadata(**row) for row in result.rows]
+        rows = self._fetch(
+            f"""
+            {_RUN_SELECT}
+            WHERE asset_name LIKE :query OR suite_name LIKE :query
+            ORDER BY started_at DESC
+            LIMIT :limit
+            """,
+            {"query": f"%{query}%", "limit": limit},
+        )
+        return [self._run_from_row(row) for row in rows]
 
     def delete_old_runs(self, before_date: datetime, asset_name: str | None = None) -> int:
         """
-        Delete old validation runs.
+        Delete old validation runs with their check results and rollups.
 
         Args:
             before_date: Delete runs before this date
@@ -706,33 +2003,189 @@ class PostgreSQLValidationHistoryStore:
         Returns:
             Number of runs deleted
         """
-        conditions: list[str] = ["started_at < %(before_date)s"]
-        params: dict[str, Any] = {"before_date": before_date}
+        cutoff_day = _utc_date(before_date).isoformat()
+        asset_clause = " AND asset_name = :asset_name" if asset_name else ""
+        params = _sqlite_params(
+            {"before_date": before_date, "cutoff_day": cutoff_day, "asset_name": asset_name}
+        )
+        where_clause = f"started_at < :before_date{asset_clause}"
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    f"""
+                    DELETE FROM validation_check_results WHERE validation_run_id IN (
+                        SELECT validation_run_id FROM validation_runs WHERE {where_clause}
+                    )
+                    """,
+                    params,
+                )
+                count = conn.execute(
+                    f"DELETE FROM validation_runs WHERE {where_clause}", params
+                ).rowcount
+                boundary = conn.execute(
+                    "SELECT asset_name, day FROM validation_run_daily "
+                    f"WHERE day = :cutoff_day{asset_clause}",
+                    params,
+                )
+                days = {tuple(row) for row in boundary}
+                conn.execute(
+                    f"DELETE FROM validation_run_daily WHERE day < :cutoff_day{asset_clause}",
+                    params,
+                )
+                self._refresh_run_rollups(conn, days)
+                conn.commit()
+            finally:
+                conn.close()
 
-        if asset_name:
-            conditions.append("asset_name = %(asset_name)s")
-            params["asset_name"] = asset_name
+        logger.info(f"Deleted {count} old validation runs")
+        return count
 
-        where_clause = " AND ".join(conditions)
+    def apply_retention(self, before_date: datetime) -> None:
+        """
+        Remove all history (runs, check results, metrics and rollups) before a date.
 
-        sql = f"""
-        DELETE FROM validation_runs
-        WHERE {where_clause}
+        Args:
+            before_date: Remove history before this time
         """
+        self.delete_old_runs(before_date)
+        cutoff_day = _utc_date(before_date)
+        before, day_start, day_end = (
+            _sqlite_value(before_date),
+            cutoff_day.isoformat(),
+            (cutoff_day + timedelta(days=1)).isoformat(),
+        )
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM validation_check_results WHERE created_at < ?", (before,))
+                conn.execute("DELETE FROM validation_metrics WHERE timestamp < ?", (before,))
+                conn.execute("DELETE FROM validation_metric_daily WHERE day <= ?", (day_start,))
+                self._refresh_metric_rollups(
+                    conn, "timestamp >= ? AND timestamp < ?", (day_start, day_end)
+                )
+                conn.commit()
+            finally:
+                conn.close()
 
-        self._connector.execute(sql, params)
+    # =========================================================================
+    # Aggregations
+    # =========================================================================
 
-        # Get count of deleted (query before delete)
-        count_sql = f"""
-        SELECT COUNT(*) as count FROM validation_runs
-        WHERE {where_clause}
+    def summarize_runs(
+        self,
+        asset_name: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict[str, Any]:
         """
+        Summarize an asset's validation runs in SQL.
+
+        Args:
+            asset_name: Asset to summarize
+            start_date: Optional start date for summary
+            end_date: Optional end date for summary
 
-        result = self._connector.execute_query(count_sql, params)
-        count = result.rows[0]["count"] if result.row_count > 0 else 0
+        Returns:
+            Dictionary with summary statistics (as get_summary_statistics)
+        """
+        sql, params = _summary_sql(asset_name, start_date, end_date, ":{}")
+        rows = self._fetch(sql, params)
+        return _summary(dict(rows[0]) if rows else None)
 
-        logger.info(f"Deleted {count} old validation runs")
-        return count
+    def metric_regression(
+        self,
+        asset_name: str,
+        metric_name: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        limit: int = 1000,
+        daily: bool = False,
+    ) -> tuple[int, float, float]:
+        """
+        Fit a linear trend to a metric's history in SQL.
+
+        Args:
+            asset_name: Asset of the metric
+            metric_name: Metric to fit
+            start_date: Optional start of the history
+            end_date: Optional end of the history
+            limit: Fit only the latest points
+            daily: Fit daily means from the rollup instead of each measurement
+                (whole UTC days overlapping the range are used)
+
+        Returns:
+            Tuple of (data_points, slope per point, r_squared)
+        """
+        sql, params = _regression_sql(
+            asset_name, metric_name, start_date, end_date, limit, daily, ":{}"
+        )
+        rows = self._fetch(sql, params)
+        return _regression(dict(rows[0]) if rows else None)
+
+    def failing_checks(
+        self,
+        asset_name: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        min_occurrences: int = 1,
+    ) -> Sequence[dict[str, Any]]:
+        """
+        Count the failures of each check in an asset's failed runs in SQL.
+
+        Args:
+            asset_name: Asset to analyze
+            start_date: Optional start of the period
+            end_date: Optional end of the period
+            min_occurrences: Minimum failures of a check to report it
+
+        Returns:
+            One dictionary per check with check_name, check_type, frequency,
+            first_occurrence, last_occurrence and run_ids (latest first),
+            most recently failed checks first
+        """
+        conditions = ["runs.asset_name = :asset_name", "runs.status = 'failed'"]
+        params: dict[str, Any] = {"asset_name": asset_name, "min_occurrences": min_occurrences}
+        if start_date:
+            conditions.append("runs.started_at >= :start_date")
+            params["start_date"] = start_date
+        if end_date:
+            conditions.append("runs.started_at <= :end_date")
+            params["end_date"] = end_date
+
+        rows = self._fetch(
+            f"""
+            SELECT
+                check_name,
+                check_type,
+                COUNT(*) AS frequency,
+                MIN(started_at) AS first_occurrence,
+                MAX(started_at) AS last_occurrence,
+                json_group_array(validation_run_id) AS run_ids
+            FROM (
+                SELECT checks.check_name, checks.check_type, runs.started_at, runs.validation_run_id
+                FROM validation_runs AS runs
+                JOIN validation_check_results AS checks
+                    ON checks.validation_run_id = runs.validation_run_id AND NOT checks.passed
+                WHERE {" AND ".join(conditions)}
+                ORDER BY runs.started_at DESC
+            )
+            GROUP BY check_name, check_type
+            HAVING COUNT(*) >= :min_occurrences
+            ORDER BY last_occurrence DESC
+            """,
+            params,
+        )
+        return [
+            {
+                **dict(row),
+                "first_occurrence": _parse_time(row["first_occurrence"]),
+                "last_occurrence": _parse_time(row["last_occurrence"]),
+                "run_ids": json.loads(row["run_ids"]),
+            }
+            for row in rows
+        ]
 
 
 # =============================================================================
@@ -748,6 +2201,10 @@ class ValidationHistoryAnalyzer:
     validation history store, including trend analysis,
     failure pattern detection, and baseline comparisons.
 
+    Stores providing metric_regression, failing_checks and summarize_runs
+    (the PostgreSQL and SQLite stores) compute these in SQL; for other
+    stores the history is loaded and analyzed in Python.
+
     Example:
         store = PostgreSQLValidationHistoryStore(connector)
         analyzer = ValidationHistoryAnalyzer(store)
@@ -777,40 +2234,88 @@ class ValidationHistoryAnalyzer:
         metric_name: str,
         period_days: int = 30,
         min_data_points: int = 5,
+        daily: bool = False,
     ) -> TrendAnalysisResult | None:
         """
         Analyze trends in validation metrics.
 
+        The trend is fitted in SQL when the store provides metric_regression;
+        otherwise the metrics are loaded and fitted with numpy.
+
         Args:
             asset_name: Asset to analyze
             metric_name: Metric to analyze
             period_days: Analysis period in days
             min_data_points: Minimum data points required for analysis
+            daily: Fit the daily means of the metric instead of each
+                measurement (for long periods; data points are then days)
 
         Returns:
             TrendAnalysisResult if enough data, None otherwise
         """
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=period_days)
+        limit = period_days + 1 if daily else 1000
+
+        if hasattr(self._store, "metric_regression"):
+            data_points, slope, r_squared = self._store.metric_regression(
+                asset_name, metric_name, start_date, end_date, limit=limit, daily=daily
+            )
+        else:
+            fit = self._fit_trend(asset_name, metric_name, start_date, end_date, limit, daily)
+            if fit is None:
+                return None
+            data_points, slope, r_squared = fit
+
+        if data_points < min_data_points:
+            logger.debug(
+                f"Not enough data points for trend analysis: {data_points} < {min_data_points}"
+            )
+            return None
+
+        # Determine direction
+        if abs(slope) < 0.01:  # Threshold for "stable"
+            direction = "stable"
+        elif slope > 0:
+            direction = "improving"
+        else:
+            direction = "declining"
+
+        return TrendAnalysisResult(
+            metric_name=metric_name,
+            asset_name=asset_name,
+            direction=direction,
+            trend_value=float(slope),
+            confidence=float(max(0, min(1, r_squared))),
+            period_start=start_date,
+            period_end=end_date,
+            data_points=data_points,
+        )
+
+    def _fit_trend(
+        self,
+        asset_name: str,
+        metric_name: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int,
+        daily: bool,
+    ) -> tuple[int, float, float] | None:
+        """Fit a linear trend to fetched metrics: (data_points, slope, r_squared)."""
         if pd is None or np is None:
             logger.warning("pandas or numpy not available for trend analysis")
             return None
 
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=period_days)
-
         # Get metrics history
         metrics = self._store.get_metrics_history(
             asset_name=asset_name,
             metric_name=metric_name,
             start_date=start_date,
             end_date=end_date,
-            limit=1000,
+            limit=1_000_000 if daily else limit,
         )
-
-        if len(metrics) < min_data_points:
-            logger.debug(
-                f"Not enough data points for trend analysis: {len(metrics)} < {min_data_points}"
-            )
-            return None
+        if not metrics:
+            return 0, 0.0, 0.0
 
         # Convert to pandas DataFrame for analysis
         df = pd.DataFrame(
@@ -824,39 +2329,25 @@ class ValidationHistoryAnalyzer:
         )
 
         df = df.sort_values("timestamp").reset_index(drop=True)
+        values = df["value"]
+        if daily:
+            values = values.groupby(df["timestamp"].map(_utc_date)).mean().tail(limit)
+        y: np.ndarray = values.to_numpy(dtype=float)
+        if len(y) < 2:
+            return len(y), 0.0, 0.0
 
         # Calculate trend using linear regression
-        x = np.arange(len(df))
-        y = df["value"].values
+        x = np.arange(len(y))
 
         # Fit linear regression
         slope, intercept = np.polyfit(x, y, 1)
 
-        # Determine direction
-        if abs(slope) < 0.01:  # Threshold for "stable"
-            direction = "stable"
-        elif slope > 0:
-            direction = "improving"
-        else:
-            direction = "declining"
-
         # Calculate R-squared for confidence
         y_pred = slope * x + intercept
         ss_res = ((y - y_pred) ** 2).sum()
         ss_tot = ((y - y.mean()) ** 2).sum()
         r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-        confidence = float(max(0, min(1, r_squared)))
-
-        return TrendAnalysisResult(
-            metric_name=metric_name,
-            asset_name=asset_name,
-            direction=direction,
-            trend_value=float(slope),
-            confidence=confidence,
-            period_start=start_date,
-            period_end=end_date,
-            data_points=len(metrics),
-        )
+        return len(y), float(slope), float(r_squared)
 
     def detect_failure_patterns(
         self,
@@ -878,6 +2369,23 @@ class ValidationHistoryAnalyzer:
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=period_days)
 
+        if hasattr(self._store, "failing_checks"):
+            return [
+                FailurePattern(
+                    pattern_type="recurring_failure",
+                    asset_name=asset_name,
+                    check_name=row["check_name"],
+                    frequency=row["frequency"],
+                    first_occurrence=row["first_occurrence"],
+                    last_occurrence=row["last_occurrence"],
+                    affected_runs=tuple(row["run_ids"]),
+                    description=f"Check '{row['check_name']}' has failed {row['frequency']} times in the last {period_days} days",
+                )
+                for row in self._store.failing_checks(
+                    asset_name, start_date, end_date, min_occurrences=min_occurrences
+                )
+            ]
+
         # Get validation runs
         runs = self._store.query_validation_runs(
             asset_name=asset_name,
@@ -1025,6 +2533,10 @@ class ValidationHistoryAnalyzer:
         Returns:
             Dictionary with summary statistics
         """
+        if hasattr(self._store, "summarize_runs"):
+            summary: dict[str, Any] = self._store.summarize_runs(asset_name, start_date, end_date)
+            return summary
+
         runs = self._store.query_validation_runs(
             asset_name=asset_name,
             start_date=start_date,
@@ -1076,6 +2588,7 @@ __all__ = [
     # Storage
     "ValidationHistoryStore",
     "PostgreSQLValidationHistoryStore",
+    "SQLiteValidationHistoryStore",
     # Analysis
     "ValidationHistoryAnalyzer",
 ]
@@ -0,0 +1,667 @@
+"""
+Single-scan column statistics for validation checks.
+
+Built-in checks declare the column statistics they need as StatRequests and
+are evaluated from a shared DatasetStatistics instead of walking the records
+themselves. compute_statistics extracts each requested column once per
+chunk of records and derives every requested statistic from that one
+column: numeric moments and quantile values with NumPy, type histograms and
+value frequencies with C-level counters, regex and length checks over the
+string values only. Approximate statistics (quantiles, distinct counts,
+frequencies, samples) are kept in mergeable sketches of bounded size.
+
+A ValidationSuite gathers the requests of all its statistical checks, scans
+the data once, and evaluates every check from the result; custom checks
+still receive the records. Statistics merge, so chunks scanned separately
+combine into the statistics of the whole dataset.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, field
+from enum import Enum
+from functools import cached_property, lru_cache, partial
+from typing import Any
+
+import numpy as np
+
+from vibe_piper.types import DataRecord, ValidationResult
+from vibe_piper.validation.sketches import (
+    CountMinSketch,
+    DistinctSample,
+    HyperLogLog,
+    KLLSketch,
+    ReservoirSample,
+    Sketch,
+    hash_values,
+)
+
+SCAN_CHUNK_SIZE = 65_536
+"""Records per chunk; bounds the temporary column arrays of a scan."""
+
+_NONE_TYPE = type(None)
+
+
+# =============================================================================
+# Statistic Requests
+# =============================================================================
+
+
+class StatKind(str, Enum):
+    """Column statistic a check can request."""
+
+    NULLS = "nulls"  # None values and empty strings
+    MOMENTS = "moments"  # numeric count, sum, mean, variance, min, max
+    VALUES = "values"  # numeric values, kept for exact quantiles
+    TYPES = "types"  # histogram of value types
+    VALUE_COUNTS = "value_counts"  # frequency of each distinct value
+    RANGE = "range"  # values outside an inclusive (min, max) range
+    LENGTH = "length"  # values whose string length is outside (min, max)
+    REGEX = "regex"  # string values matching a pattern
+    QUANTILES = "quantiles"  # KLL sketch of the numeric values
+    DISTINCT = "distinct"  # HyperLogLog sketch of the non-null values
+    DISTINCT_SAMPLE = "distinct_sample"  # bottom-k sample of non-null distinct values
+    HEAVY_HITTERS = "heavy_hitters"  # Count-Min sketch of the non-null values
+    SAMPLE = "sample"  # reservoir sample of the non-null values
+
+
+_SKETCHES: dict[StatKind, Callable[..., Sketch]] = {
+    StatKind.QUANTILES: KLLSketch,
+    StatKind.DISTINCT: HyperLogLog,
+    StatKind.DISTINCT_SAMPLE: DistinctSample,
+    StatKind.HEAVY_HITTERS: CountMinSketch,
+    StatKind.SAMPLE: ReservoirSample,
+}
+
+
+@dataclass(frozen=True)
+class StatRequest:
+    """
+    A column statistic needed by a check.
+
+    Attributes:
+        column: Column name
+        kind: Statistic to compute
+        argument: Parameter of the statistic ((min, max) for RANGE and
+            LENGTH, the pattern for REGEX, the size parameter of sketches,
+            None for the sketch's default)
+    """
+
+    column: str
+    kind: StatKind
+    argument: Any = None
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+# =============================================================================
+# Column Accumulator
+# =============================================================================
+
+
+class _ColumnChunk:
+    """One chunk of one column, with views derived on first use."""
+
+    def __init__(self, values: list[Any]) -> None:
+        self.values = values
+
+    @cached_property
+    def types(self) -> Counter[type]:
+        return Counter(map(type, self.values))
+
+    @cached_property
+    def nulls(self) -> int:
+        return self.types.get(_NONE_TYPE, 0)
+
+    @cached_property
+    def numbers(self) -> np.ndarray:
+        """Numeric (int, float and bool) values as float64."""
+        numeric = [t for t in self.types if t is not _NONE_TYPE and issubclass(t, (int, float))]
+        if not numeric:
+            return np.empty(0)
+        if len(numeric) == len(self.types):
+            return np.array(self.values, dtype=float)
+        if len(numeric) + 1 == len(self.types) and self.nulls:
+            return np.array([v for v in self.values if v is not None], dtype=float)
+        return np.array([v for v in self.values if isinstance(v, (int, float))], dtype=float)
+
+    @cached_property
+    def non_null(self) -> list[Any]:
+        if not self.nulls:
+            return self.values
+        return [v for v in self.values if v is not None]
+
+    @cached_property
+    def hashes(self) -> np.ndarray:
+        """Stable hashes of the non-null values, shared by the sketches."""
+        # Integers hash exactly, not through their float64 view
+        if all(t is _NONE_TYPE or issubclass(t, float) for t in self.types):
+            return hash_values(self.numbers)
+        return hash_values(self.non_null)
+
+    @cached_property
+    def strings(self) -> list[str]:
+        if all(t is _NONE_TYPE or issubclass(t, str) for t in self.types):
+            if not self.nulls:
+                return self.values
+            return [v for v in self.values if v is not None]
+        return [v for v in self.values if isinstance(v, str)]
+
+
+@dataclass
+class ColumnAccumulator:
+    """
+    Mergeable statistics of one column.
+
+    Only the statistics that were requested are maintained; the others keep
+    their defaults.
+
+    Attributes:
+        nulls: Number of None (or missing) values
+        empty_strings: Number of values equal to ""
+        numeric_count: Number of int, float or bool values
+        numeric_sum: Sum of the numeric values
+        mean: Mean of the numeric values
+        m2: Sum of squared deviations from the mean (for the variance)
+        minimum: Smallest numeric value
+        maximum: Largest numeric value
+        types: Histogram of value types (including NoneType)
+        value_counts: Frequency of each distinct value (including None)
+        outside_range: Non-null values outside each requested (min, max)
+            range; non-numeric values count as outside
+        outside_length: Non-null values whose length is outside each
+            requested (min, max); non-strings count as outside
+        regex_matches: String values matching each requested pattern
+        sketches: Sketch of each requested (kind, argument)
+    """
+
+    nulls: int = 0
+    empty_strings: int = 0
+    numeric_count: int = 0
+    numeric_sum: float = 0.0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+    types: Counter[type] = field(default_factory=Counter)
+    value_counts: Counter[Any] = field(default_factory=Counter)
+    outside_range: dict[tuple[Any, Any], int] = field(default_factory=dict)
+    outside_length: dict[tuple[Any, Any], int] = field(default_factory=dict)
+    regex_matches: dict[str, int] = field(default_factory=dict)
+    sketches: dict[tuple[StatKind, Any], Sketch] = field(default_factory=dict)
+    _values: list[np.ndarray] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of the numeric values (NaN for fewer than 2)."""
+        if self.numeric_count < 2:
+            return math.nan
+        return self.m2 / (self.numeric_count - 1)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation of the numeric values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def values(self) -> np.ndarray:
+        """Numeric values seen so far (requires StatKind.VALUES)."""
+        if len(self._values) != 1:
+            self._values = [np.concatenate(self._values) if self._values else np.empty(0)]
+        return self._values[0]
+
+    def quantile(self, q: float) -> float:
+        """
+        Exact quantile of the numeric values (requires StatKind.VALUES).
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Linearly interpolated quantile (the median for q=0.5)
+        """
+        return float(np.quantile(self.values, q))
+
+    def sketch(self, kind: StatKind, argument: Any = None) -> Any:
+        """
+        Get a requested sketch.
+
+        Args:
+            kind: Sketch statistic (QUANTILES, DISTINCT, DISTINCT_SAMPLE,
+                HEAVY_HITTERS or SAMPLE)
+            argument: Argument of the request
+
+        Returns:
+            The sketch (empty if the column had no values)
+        """
+        key = (StatKind(kind), argument)
+        if key not in self.sketches:
+            factory = _SKETCHES[key[0]]
+            self.sketches[key] = factory() if argument is None else factory(argument)
+        return self.sketches[key]
+
+    def _add_moments(self, count: int, total: float, mean: float, m2: float) -> None:
+        """Combine moments of another partition (Chan et al. parallel variance)."""
+        if not count:
+            return
+        n = self.numeric_count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.numeric_count * count / n
+        self.mean += delta * count / n
+        self.numeric_count = n
+        self.numeric_sum += total
+
+    def update(self, chunk: _ColumnChunk, request: StatRequest) -> None:
+        """Accumulate one requested statistic over one chunk of the column."""
+        kind = request.kind
+        if kind == StatKind.NULLS:
+            self.nulls += chunk.nulls
+            self.empty_strings += chunk.values.count("")
+        elif kind == StatKind.MOMENTS:
+            numbers = chunk.numbers
+            if len(numbers):
+                total = float(numbers.sum())
+                mean = total / len(numbers)
+                m2 = float(np.square(numbers - mean).sum())
+                self._add_moments(len(numbers), total, mean, m2)
+                low, high = float(numbers.min()), float(numbers.max())
+                self.minimum = low if self.minimum is None else float(np.minimum(self.minimum, low))
+                self.maximum = (
+                    high if self.maximum is None else float(np.maximum(self.maximum, high))
+                )
+        elif kind == StatKind.VALUES:
+            if len(chunk.numbers):
+                self._values.append(chunk.numbers)
+        elif kind == StatKind.TYPES:
+            self.types.update(chunk.types)
+        elif kind == StatKind.VALUE_COUNTS:
+            self.value_counts.update(chunk.values)
+        elif kind == StatKind.RANGE:
+            low, high = request.argument
+            numbers = chunk.numbers
+            inside = int(np.count_nonzero((numbers >= low) & (numbers <= high)))
+            outside = len(chunk.values) - chunk.nulls - inside
+            self.outside_range[request.argument] = (
+                self.outside_range.get(request.argument, 0) + outside
+            )
+        elif kind == StatKind.LENGTH:
+            low, high = request.argument
+            strings = chunk.strings
+            lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+            inside = int(np.count_nonzero((lengths >= low) & (lengths <= high)))
+            outside = len(chunk.values) - chunk.nulls - inside
+            self.outside_length[request.argument] = (
+                self.outside_length.get(request.argument, 0) + outside
+            )
+        elif kind == StatKind.REGEX:
+            strings = chunk.strings
+            matches = list(map(_compile(request.argument).match, strings))
+            matched = len(matches) - matches.count(None)
+            self.regex_matches[request.argument] = (
+                self.regex_matches.get(request.argument, 0) + matched
+            )
+        elif kind == StatKind.QUANTILES:
+            self.sketch(kind, request.argument).update(chunk.numbers)
+        elif kind == StatKind.SAMPLE:
+            self.sketch(kind, request.argument).update(chunk.non_null)
+        elif kind == StatKind.HEAVY_HITTERS:
+            self.sketch(kind, request.argument).update_hashes(chunk.hashes, chunk.non_null)
+        elif kind in _SKETCHES:
+            self.sketch(kind, request.argument).update_hashes(chunk.hashes)
+
+    def merge(self, other: ColumnAccumulator) -> None:
+        """
+        Merge the statistics of another partition of the same column.
+
+        Args:
+            other: Accumulator built with the same requests
+        """
+        self.nulls += other.nulls
+        self.empty_strings += other.empty_strings
+        self._add_moments(other.numeric_count, other.numeric_sum, other.mean, other.m2)
+        for name in ("minimum", "maximum"):
+            mine, theirs = getattr(self, name), getattr(other, name)
+            if mine is None or theirs is None:
+                setattr(self, name, theirs if mine is None else mine)
+            else:
+                combine = np.minimum if name == "minimum" else np.maximum
+                setattr(self, name, float(combine(mine, theirs)))
+        self._values.extend(other._values)
+        self.types.update(other.types)
+        self.value_counts.update(other.value_counts)
+        counters: tuple[tuple[dict[Any, int], dict[Any, int]], ...] = (
+            (self.outside_range, other.outside_range),
+            (self.outside_length, other.outside_length),
+            (self.regex_matches, other.regex_matches),
+        )
+        for counts, theirs in counters:
+            for key, count in theirs.items():
+                counts[key] = counts.get(key, 0) + count
+        for key, sketch in other.sketches.items():
+            if key in self.sketches:
+                self.sketches[key].merge(sketch)
+            else:
+                self.sketches[key] = deepcopy(sketch)
+
+
+# =============================================================================
+# Dataset Statistics
+# =============================================================================
+
+
+def _row_data(records: Sequence[Any]) -> list[Any]:
+    """Underlying mappings of DataRecords (other mappings are used as-is)."""
+    try:
+        return list(map(operator.attrgetter("data"), records))
+    except AttributeError:
+        return [getattr(record, "data", record) for record in records]
+
+
+def _column(rows: list[Any], name: str) -> list[Any]:
+    """One column of row mappings, with None where the field is absent."""
+    try:
+        return list(map(operator.itemgetter(name), rows))
+    except KeyError:
+        return [row.get(name) for row in rows]
+
+
+def _columns(rows: list[Any], names: Sequence[str]) -> list[list[Any]]:
+    """
+    Several columns of row mappings.
+
+    When every row is a dict with the same fields in the same order, and
+    most of the fields are wanted, the rows are transposed in one pass
+    instead of looking up each field of each row.
+    """
+    if rows and len(names) * 2 >= len(rows[0]):
+        fields = tuple(rows[0])
+        if all(type(row) is dict and tuple(row) == fields for row in rows):
+            transposed = dict(zip(fields, map(list, zip(*map(dict.values, rows))), strict=True))
+            missing = [None] * len(rows)
+            return [transposed.get(name, missing) for name in names]
+    return [_column(rows, name) for name in names]
+
+
+class DatasetStatistics:
+    """
+    Requested column statistics of a dataset, built chunk by chunk.
+
+    A statistic that fails to compute (e.g. value counts of unhashable
+    values, an invalid regex) is recorded and re-raised only for the checks
+    that need it.
+
+    Attributes:
+        requests: Statistics maintained
+        row_count: Records scanned
+        errors: Statistics that failed, with their exception
+    """
+
+    def __init__(self, requests: Iterable[StatRequest] = ()) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            requests: Statistics to maintain
+        """
+        self.requests = tuple(dict.fromkeys(requests))
+        self.row_count = 0
+        self.errors: dict[StatRequest, Exception] = {}
+        self._by_column: dict[str, list[StatRequest]] = {}
+        for request in self.requests:
+            self._by_column.setdefault(request.column, []).append(request)
+        self._columns = {column: ColumnAccumulator() for column in self._by_column}
+
+    def column(self, name: str) -> ColumnAccumulator:
+        """
+        Get the statistics of one column.
+
+        Args:
+            name: Column name
+
+        Returns:
+            The column's accumulator
+
+        Raises:
+            KeyError: If no statistic of the column was requested
+        """
+        return self._columns[name]
+
+    def update(self, records: Sequence[DataRecord]) -> None:
+        """
+        Accumulate statistics over one chunk of records.
+
+        Args:
+            records: Chunk of records
+        """
+        if not records:
+            return
+        self.row_count += len(records)
+        if not self._by_column:
+            return
+        rows = _row_data(records)
+        pending_by_column = {
+            name: [request for request in requests if request not in self.errors]
+            for name, requests in self._by_column.items()
+        }
+        pending_by_column = {
+            name: pending for name, pending in pending_by_column.items() if pending
+        }
+        try:
+            columns = dict(zip(pending_by_column, _columns(rows, list(pending_by_column))))
+        except Exception:
+            columns = {}  # extracted (and failed) per column below
+        for name, pending in pending_by_column.items():
+            try:
+                chunk = _ColumnChunk(columns[name] if name in columns else _column(rows, name))
+            except Exception as e:
+                self.errors.update(dict.fromkeys(pending, e))
+                continue
+            accumulator = self._columns[name]
+            for request in pending:
+                try:
+                    accumulator.update(chunk, request)
+                except Exception as e:
+                    self.errors[request] = e
+
+    def merge(self, other: DatasetStatistics) -> None:
+        """
+        Merge statistics of another partition of the dataset.
+
+        Args:
+            other: Statistics built with the same requests
+        """
+        self.row_count += other.row_count
+        for request, error in other.errors.items():
+            self.errors.setdefault(request, error)
+        for name, accumulator in other._columns.items():
+            self._columns[name].merge(accumulator)
+
+    def raise_for(self, requests: Iterable[StatRequest]) -> None:
+        """
+        Re-raise the error of the first failed statistic among requests.
+
+        Args:
+            requests: Statistics about to be used
+        """
+        for request in requests:
+            if request in self.errors:
+                raise self.errors[request]
+
+
+def compute_statistics(
+    records: Sequence[DataRecord],
+    requests: Iterable[StatRequest],
+    chunk_size: int = SCAN_CHUNK_SIZE,
+    max_workers: int = 1,
+    executor: Executor | None = None,
+) -> DatasetStatistics:
+    """
+    Compute column statistics in one scan over the records.
+
+    With several workers the records are split into row chunks whose
+    statistics are computed concurrently and merged. Threads help for the
+    NumPy-heavy statistics; a ProcessPoolExecutor also parallelizes the
+    Python-level work (chunks are pickled to the workers).
+
+    Args:
+        records: Records to scan
+        requests: Statistics to compute
+        chunk_size: Records per chunk
+        max_workers: Scan chunks on this many threads
+        executor: Optional executor (e.g. a ProcessPoolExecutor) to scan
+            chunks on instead
+
+    Returns:
+        DatasetStatistics with every requested statistic
+
+    Example:
+        Compute the statistics of two checks at once::
+
+            statistics = compute_statistics(
+                records, [*mean_check.requires, *unique_check.requires]
+            )
+            mean_check.evaluate(statistics)
+    """
+    statistics = DatasetStatistics(requests)
+    if executor is None and max_workers <= 1:
+        for start in range(0, len(records), chunk_size):
+            statistics.update(records[start : start + chunk_size])
+        return statistics
+
+    if executor is None:
+        # Enough chunks to keep every worker busy
+        chunk_size = max(1, min(chunk_size, math.ceil(len(records) / max_workers)))
+    chunks = [records[start : start + chunk_size] for start in range(0, len(records), chunk_size)]
+    scan = partial(compute_statistics, requests=statistics.requests, chunk_size=chunk_size)
+    if executor is not None:
+        partials = list(executor.map(scan, chunks))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            partials = list(pool.map(scan, chunks))
+    for chunk_statistics in partials:
+        statistics.merge(chunk_statistics)
+    return statistics
+
+
+# =============================================================================
+# Statistical Checks
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class StatisticalCheck:
+    """
+    A check evaluated from column statistics rather than from records.
+
+    Called with records it behaves like any other check function (it scans
+    the records for its own statistics); ValidationSuite instead evaluates
+    it from statistics shared with the other checks of the suite.
+
+    Attributes:
+        evaluator: Function computing the result from DatasetStatistics
+        requires: Statistics the evaluator reads
+        monotonic: Whether a failure on part of the data implies a failure
+            on all of it (e.g. a count of invalid values), so streaming
+            validation can stop as soon as the check fails
+    """
+
+    evaluator: Callable[[DatasetStatistics], ValidationResult]
+    requires: tuple[StatRequest, ...] = ()
+    monotonic: bool = False
+
+    def evaluate(self, statistics: DatasetStatistics) -> ValidationResult:
+        """
+        Evaluate the check from precomputed statistics.
+
+        Args:
+            statistics: Statistics including everything in requires
+
+        Returns:
+            ValidationResult of the check
+        """
+        statistics.raise_for(self.requires)
+        return self.evaluator(statistics)
+
+    def __call__(self, records: Sequence[DataRecord]) -> ValidationResult:
+        return self.evaluate(compute_statistics(records, self.requires))
+
+
+@dataclass(frozen=True)
+class DatasetCheck:
+    """
+    A record check that must see every record of the dataset at once.
+
+    Checks comparing rows or aggregating without mergeable statistics (e.g.
+    ordering, group-by counts) give wrong results on one chunk at a time,
+    so streaming validation rejects them instead of merging chunk results.
+
+    Attributes:
+        fn: Check function over all records
+    """
+
+    fn: Callable[[Sequence[DataRecord]], ValidationResult]
+
+    def __call__(self, records: Sequence[DataRecord]) -> ValidationResult:
+        return self.fn(records)
+
+
+def statistic_requests(checks: Iterable[Any]) -> list[StatRequest]:
+    """
+    Collect the statistics needed by the statistical checks among checks.
+
+    Args:
+        checks: Check functions (non-statistical checks are ignored)
+
+    Returns:
+        Distinct requests in check order
+    """
+    requests: dict[StatRequest, None] = {}
+    for check in checks:
+        if isinstance(check, StatisticalCheck):
+            requests.update(dict.fromkeys(check.requires))
+    return list(requests)
+
+
+def run_check(
+    check: Callable[[Sequence[DataRecord]], ValidationResult],
+    records: Sequence[DataRecord],
+    statistics: DatasetStatistics,
+) -> ValidationResult:
+    """
+    Run a check, from shared statistics when it is a StatisticalCheck.
+
+    Args:
+        check: Check function
+        records: Records (passed to non-statistical checks)
+        statistics: Shared statistics of the records
+
+    Returns:
+        ValidationResult of the check
+    """
+    if isinstance(check, StatisticalCheck):
+        return check.evaluate(statistics)
+    return check(records)
+
+
+__all__ = [
+    "SCAN_CHUNK_SIZE",
+    "ColumnAccumulator",
+    "DatasetCheck",
+    "DatasetStatistics",
+    "StatKind",
+    "StatRequest",
+    "StatisticalCheck",
+    "compute_statistics",
+    "run_check",
+    "statistic_requests",
+]
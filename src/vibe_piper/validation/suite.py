@@ -3,16 +3,35 @@ Validation suite framework for organizing and running validation checks.
 
 This module provides utilities for organizing validation checks into suites,
 with support for different execution strategies (lazy vs. fail-fast).
+
+Built-in statistical checks are fused: the suite computes the column
+statistics all of them need in a single scan of the records and evaluates
+each check from the shared statistics. Other checks receive the records.
+Suites can also run on several workers and validate chunked or async
+streams of records without materializing them.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
+import time
+from collections.abc import AsyncIterable, Callable, Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from typing import Any
 
+from vibe_piper.expectations import merge_chunk_results
 from vibe_piper.types import DataRecord, ValidationResult
+from vibe_piper.validation.scan import (
+    SCAN_CHUNK_SIZE,
+    DatasetCheck,
+    DatasetStatistics,
+    StatisticalCheck,
+    compute_statistics,
+    run_check,
+    statistic_requests,
+)
 
 # =============================================================================
 # Validation Strategy
@@ -313,20 +332,151 @@ class ValidationSuite:
         self,
         records: Sequence[DataRecord],
         context: ValidationContext | None = None,
+        max_workers: int = 1,
+        executor: Executor | None = None,
     ) -> SuiteValidationResult:
         """
         Validate data against all checks in this suite.
 
+        Statistics needed by the suite's statistical checks are computed in
+        one scan before any check runs. With several workers the scan is
+        split across row chunks and the checks run concurrently on a thread
+        pool; results and strategy handling are the same as sequentially.
+
         Args:
             records: Records to validate
             context: Optional validation context
+            max_workers: Scan chunks and run checks on this many threads
+            executor: Optional executor (e.g. a ProcessPoolExecutor) to scan
+                chunks on instead; checks, which are usually closures, still
+                run on threads
 
         Returns:
             SuiteValidationResult with detailed results
         """
-        import time
+        start_time = time.time()
+
+        # One scan for every statistic the statistical checks need
+        statistics = compute_statistics(
+            records,
+            statistic_requests(self._checks.values()),
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+        if max_workers <= 1 or len(self._checks) <= 1:
+            outcomes = (
+                (name, partial(run_check, check_fn, records, statistics))
+                for name, check_fn in self._checks.items()
+            )
+            return self._collect(outcomes, len(records), context, start_time)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                name: pool.submit(run_check, check_fn, records, statistics)
+                for name, check_fn in self._checks.items()
+            }
+            result = self._collect(
+                ((name, future.result) for name, future in futures.items()),
+                len(records),
+                context,
+                start_time,
+            )
+            # Checks after a fail-fast stop are not needed
+            for future in futures.values():
+                future.cancel()
+        return result
+
+    def validate_stream(
+        self,
+        chunks: Iterable[Sequence[DataRecord]],
+        context: ValidationContext | None = None,
+        max_workers: int = 1,
+    ) -> SuiteValidationResult:
+        """
+        Validate data delivered in chunks (e.g. a FileReaderIterator).
+
+        Statistical checks are evaluated from statistics accumulated over
+        all chunks, so they see the whole dataset while only one chunk is
+        held in memory. Other checks run on each chunk and their per-chunk
+        results are merged (valid only if valid on every chunk), which is
+        right for row-level checks only. Checks that need every record at
+        once (DatasetChecks such as ordering or group-by aggregates) are
+        rejected; custom checks that compare rows or aggregate should be
+        wrapped in DatasetCheck so they are rejected too.
+
+        With the fail-fast strategy the stream stops at the first failure
+        that further data cannot undo (a failing per-chunk check or a failing
+        count-based statistical check); the result then holds that check and
+        total_records counts the records read.
+
+        Args:
+            chunks: Iterable of record chunks
+            context: Optional validation context
+            max_workers: Run the checks of each chunk on this many threads
+
+        Returns:
+            SuiteValidationResult with detailed results
+
+        Raises:
+            ValueError: If the suite has checks that need the whole dataset
+        """
+        start_time = time.time()
+        stream = _SuiteStream(self, max_workers)
+        for chunk in chunks:
+            if stream.add(chunk):
+                break
+        return stream.finish(context, start_time)
+
+    async def validate_async_stream(
+        self,
+        records: AsyncIterable[DataRecord],
+        chunk_size: int = SCAN_CHUNK_SIZE,
+        context: ValidationContext | None = None,
+        max_workers: int = 1,
+    ) -> SuiteValidationResult:
+        """
+        Validate records from an async stream (e.g. Source.stream).
+
+        Records are batched into chunks and validated as in validate_stream.
+
+        Args:
+            records: Async iterable of records
+            chunk_size: Records per chunk
+            context: Optional validation context
+            max_workers: Run the checks of each chunk on this many threads
+
+        Returns:
+            SuiteValidationResult with detailed results
+
+        Raises:
+            ValueError: If the suite has checks that need the whole dataset
+
+        Example:
+            Validate a source without materializing it::
 
+                result = await suite.validate_async_stream(source.stream(context))
+        """
         start_time = time.time()
+        stream = _SuiteStream(self, max_workers)
+        chunk: list[DataRecord] = []
+        async for record in records:
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                if stream.add(chunk):
+                    return stream.finish(context, start_time)
+                chunk = []
+        stream.add(chunk)
+        return stream.finish(context, start_time)
+
+    def _collect(
+        self,
+        outcomes: Iterable[tuple[str, Callable[[], ValidationResult]]],
+        total_records: int,
+        context: ValidationContext | None,
+        start_time: float,
+    ) -> SuiteValidationResult:
+        """Run check outcomes in suite order, applying the strategy."""
         check_results: dict[str, ValidationResult] = {}
         failed: list[str] = []
         warning_checks: list[str] = []
@@ -338,9 +488,9 @@ class ValidationSuite:
             context = ValidationContext(validation_suite=self.name)
 
         # Run all checks
-        for check_name, check_fn in self._checks.items():
+        for check_name, outcome in outcomes:
             try:
-                result = check_fn(records)
+                result = outcome()
                 check_results[check_name] = result
 
                 # Collect warnings
@@ -383,7 +533,7 @@ class ValidationSuite:
             failed_checks=tuple(failed),
             warning_checks=tuple(warning_checks),
             total_checks=len(self._checks),
-            total_records=len(records),
+            total_records=total_records,
             errors=tuple(all_errors),
             warnings=tuple(all_warnings),
             duration_ms=duration_ms,
@@ -403,6 +553,106 @@ class ValidationSuite:
         return f"ValidationSuite(name='{self.name}', checks={len(self._checks)})"
 
 
+class _SuiteStream:
+    """Partial results of a ValidationSuite validated chunk by chunk."""
+
+    def __init__(self, suite: ValidationSuite, max_workers: int) -> None:
+        whole_dataset = [
+            name for name, check_fn in suite._checks.items() if isinstance(check_fn, DatasetCheck)
+        ]
+        if whole_dataset:
+            msg = f"Checks {whole_dataset} need the whole dataset and cannot validate a stream"
+            raise ValueError(msg)
+        self.suite = suite
+        self.max_workers = max_workers
+        self.statistics = DatasetStatistics(statistic_requests(suite._checks.values()))
+        self.partials: dict[str, list[ValidationResult]] = {}
+        self.exceptions: dict[str, Exception] = {}
+        self.stopped_at: str | None = None
+
+    def _run_chunk(self, chunk: Sequence[DataRecord]) -> None:
+        """Update the statistics and run the per-chunk checks on one chunk."""
+        record_checks = {
+            name: check_fn
+            for name, check_fn in self.suite._checks.items()
+            if not isinstance(check_fn, StatisticalCheck) and name not in self.exceptions
+        }
+        outcomes: dict[str, ValidationResult | Exception] = {}
+        if self.max_workers > 1 and record_checks:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                scan = pool.submit(self.statistics.update, chunk)
+                futures = {name: pool.submit(fn, chunk) for name, fn in record_checks.items()}
+                scan.result()
+                for name, future in futures.items():
+                    try:
+                        outcomes[name] = future.result()
+                    except Exception as e:
+                        outcomes[name] = e
+        else:
+            self.statistics.update(chunk)
+            for name, check_fn in record_checks.items():
+                try:
+                    outcomes[name] = check_fn(chunk)
+                except Exception as e:
+                    outcomes[name] = e
+
+        for name, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                self.exceptions[name] = outcome
+            else:
+                self.partials.setdefault(name, []).append(outcome)
+
+    def _first_conclusive_failure(self) -> str | None:
+        """First check (in suite order) whose failure more data cannot undo."""
+        for name, check_fn in self.suite._checks.items():
+            if isinstance(check_fn, StatisticalCheck):
+                if not check_fn.monotonic:
+                    continue
+                try:
+                    failed = not check_fn.evaluate(self.statistics).is_valid
+                except Exception:
+                    failed = True
+            else:
+                failed = name in self.exceptions or not all(
+                    result.is_valid for result in self.partials.get(name, ())
+                )
+            if failed:
+                return name
+        return None
+
+    def add(self, chunk: Sequence[DataRecord]) -> bool:
+        """
+        Validate one chunk.
+
+        Returns:
+            True if validation should stop (fail-fast after a failure)
+        """
+        if not chunk:
+            return False
+        self._run_chunk(chunk)
+        if self.suite.strategy == ValidationStrategy.FAIL_FAST:
+            self.stopped_at = self._first_conclusive_failure()
+        return self.stopped_at is not None
+
+    def _outcome(self, name: str) -> Callable[[], ValidationResult]:
+        check_fn = self.suite._checks[name]
+        if isinstance(check_fn, StatisticalCheck):
+            return partial(check_fn.evaluate, self.statistics)
+
+        def merged() -> ValidationResult:
+            if name in self.exceptions:
+                raise self.exceptions[name]
+            return merge_chunk_results(self.partials.get(name, ()))
+
+        return merged
+
+    def finish(self, context: ValidationContext | None, start_time: float) -> SuiteValidationResult:
+        """Assemble the suite result from the accumulated state."""
+        names = [self.stopped_at] if self.stopped_at is not None else list(self.suite._checks)
+        outcomes = ((name, self._outcome(name)) for name in names)
+        return self.suite._collect(outcomes, self.statistics.row_count, context, start_time)
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
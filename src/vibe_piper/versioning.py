@@ -0,0 +1,267 @@
+"""
+Asset versioning for change-based incremental runs.
+
+This module provides a persistent ledger of asset versions. Each successful
+materialization records the asset's code hash, config hash, the versions of
+the upstream data it consumed and a fingerprint of its output. An asset is
+up to date when all of these still match, so incremental runs only rebuild
+what changed.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from vibe_piper.types import Asset
+
+# =============================================================================
+# Logger
+# =============================================================================
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Hashing
+# =============================================================================
+
+
+def compute_code_hash(asset: Asset) -> str:
+    """
+    Hash the code that produces an asset.
+
+    Operator functions wrapped by the asset factory are unwrapped so the
+    hash reflects the user's function rather than the shared wrapper.
+
+    Args:
+        asset: The asset to hash
+
+    Returns:
+        Hexadecimal hash string (empty for assets without an operator)
+    """
+    if asset.operator is None:
+        return ""
+    return _hash_function(inspect.unwrap(asset.operator.fn))
+
+
+@lru_cache(maxsize=4096)
+def _hash_function(fn: Any) -> str:
+    """Hash a function's source (cached, since source lookup is slow)."""
+    try:
+        source = inspect.getsource(fn)
+    except (TypeError, OSError):
+        # Fallback: use function name and module
+        source = f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', repr(fn))}"
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def compute_config_hash(asset: Asset) -> str:
+    """
+    Hash the configuration that affects an asset's output.
+
+    Args:
+        asset: The asset to hash
+
+    Returns:
+        Hexadecimal hash string
+    """
+    payload = {
+        "config": asset.config,
+        "io_manager": asset.io_manager,
+        "materialization": str(asset.materialization),
+    }
+    json_str = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(json_str.encode()).hexdigest()
+
+
+# =============================================================================
+# Version Ledger
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class AssetVersion:
+    """
+    Version of an asset's last successful materialization.
+
+    Attributes:
+        pipeline_id: ID of the pipeline (asset graph) the asset belongs to
+        asset_name: Name of the asset
+        code_hash: Hash of the asset's code
+        config_hash: Hash of the asset's configuration
+        upstream_versions: Output fingerprint of each upstream asset consumed
+        output_fingerprint: Fingerprint of the materialized output
+        run_id: Run that produced this version
+        materialized_at: When the version was materialized
+    """
+
+    pipeline_id: str
+    asset_name: str
+    code_hash: str
+    config_hash: str
+    upstream_versions: Mapping[str, str] = field(default_factory=dict)
+    output_fingerprint: str = ""
+    run_id: str | None = None
+    materialized_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class VersionLedger:
+    """
+    SQLite-backed ledger of asset versions.
+
+    One row is kept per (pipeline, asset): the version of its last
+    successful materialization. Access is serialized with a lock so assets
+    executing in parallel can record versions concurrently.
+
+    Attributes:
+        db_path: Path to the SQLite database file
+    """
+
+    def __init__(self, db_path: Path | str) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS asset_versions (
+                    pipeline_id TEXT NOT NULL,
+                    asset_name TEXT NOT NULL,
+                    code_hash TEXT NOT NULL,
+                    config_hash TEXT NOT NULL,
+                    upstream_versions TEXT NOT NULL,
+                    output_fingerprint TEXT NOT NULL,
+                    run_id TEXT,
+                    materialized_at TEXT NOT NULL,
+                    PRIMARY KEY (pipeline_id, asset_name)
+                )
+                """
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _from_row(row: tuple[Any, ...]) -> AssetVersion:
+        """Create an AssetVersion from a database row."""
+        return AssetVersion(
+            pipeline_id=row[0],
+            asset_name=row[1],
+            code_hash=row[2],
+            config_hash=row[3],
+            upstream_versions=json.loads(row[4]),
+            output_fingerprint=row[5],
+            run_id=row[6],
+            materialized_at=datetime.fromisoformat(row[7]),
+        )
+
+    def record(self, version: AssetVersion) -> None:
+        """
+        Record the version of a successful materialization.
+
+        Args:
+            version: The version to store (replaces the previous one)
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO asset_versions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        version.pipeline_id,
+                        version.asset_name,
+                        version.code_hash,
+                        version.config_hash,
+                        json.dumps(dict(version.upstream_versions), sort_keys=True),
+                        version.output_fingerprint,
+                        version.run_id,
+                        version.materialized_at.isoformat(),
+                    ),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def get(self, pipeline_id: str, asset_name: str) -> AssetVersion | None:
+        """
+        Get the last recorded version of an asset.
+
+        Args:
+            pipeline_id: ID of the pipeline
+            asset_name: Name of the asset
+
+        Returns:
+            AssetVersion if recorded, None otherwise
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT * FROM asset_versions WHERE pipeline_id = ? AND asset_name = ?",
+                    (pipeline_id, asset_name),
+                ).fetchone()
+            finally:
+                conn.close()
+        return self._from_row(row) if row else None
+
+    def get_all(self, pipeline_id: str) -> dict[str, AssetVersion]:
+        """
+        Get the recorded versions of every asset in a pipeline.
+
+        Args:
+            pipeline_id: ID of the pipeline
+
+        Returns:
+            Mapping of asset name to AssetVersion
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT * FROM asset_versions WHERE pipeline_id = ?", (pipeline_id,)
+                ).fetchall()
+            finally:
+                conn.close()
+        return {row[1]: self._from_row(row) for row in rows}
+
+    def clear(self, pipeline_id: str, asset_name: str | None = None) -> None:
+        """
+        Remove recorded versions, forcing assets to be rebuilt.
+
+        Args:
+            pipeline_id: ID of the pipeline
+            asset_name: Optional single asset to clear (defaults to all)
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                if asset_name is None:
+                    conn.execute("DELETE FROM asset_versions WHERE pipeline_id = ?", (pipeline_id,))
+                else:
+                    conn.execute(
+                        "DELETE FROM asset_versions WHERE pipeline_id = ? AND asset_name = ?",
+                        (pipeline_id, asset_name),
+                    )
+                conn.commit()
+            finally:
+                conn.close()
@@ -271,6 +271,48 @@ class TestTransformSteps:
         assert "id" in result[0]
         assert "name" in result[0]
 
+    def test_filter_rows_expression(self) -> None:
+        """Test filtering rows with a compound expression."""
+        step = TransformStep(
+            type=TransformType.FILTER,
+            condition="age >= 18 AND (status IN ('active', 'trial') OR vip)",
+        )
+
+        data = [
+            {"id": 1, "age": 30, "status": "active", "vip": False},
+            {"id": 2, "age": 16, "status": "active", "vip": True},
+            {"id": 3, "age": 40, "status": "closed", "vip": True},
+            {"id": 4, "age": None, "status": "trial", "vip": False},
+        ]
+
+        result = _filter_rows(step, data)
+
+        assert [row["id"] for row in result] == [1, 3]
+
+    def test_filter_rows_invalid_condition(self) -> None:
+        """Test that an invalid condition raises instead of keeping every row."""
+        step = TransformStep(type=TransformType.FILTER, condition="age >")
+
+        with pytest.raises(PipelineGeneratorError, match="Failed to evaluate filter condition"):
+            _filter_rows(step, [{"age": 1}])
+
+    def test_compute_field_expression(self) -> None:
+        """Test computing a field from arithmetic and CASE expressions."""
+        total = TransformStep(type=TransformType.COMPUTE_FIELD, field="total", value="price * qty")
+        tier = TransformStep(
+            type=TransformType.COMPUTE_FIELD,
+            field="tier",
+            value="CASE WHEN total >= 100 THEN 'large' ELSE 'small' END",
+        )
+
+        data = [{"price": 20.0, "qty": 10}, {"price": 5.0, "qty": 2}, {"price": None, "qty": 1}]
+
+        result = _compute_field(tier, _compute_field(total, data))
+
+        assert [row["total"] for row in result] == [200.0, 10.0, None]
+        assert [row["tier"] for row in result] == ["large", "small", "small"]
+        assert "total" not in data[0]
+
     def test_compute_field_now_function(self) -> None:
         """Test computing field with now() function."""
         step = TransformStep(type=TransformType.COMPUTE_FIELD, field="timestamp", value="now()")
@@ -357,6 +399,14 @@ class TestHelperFunctions:
 
         assert result == "John"
 
+    def test_compute_value_literal_fallback(self) -> None:
+        """Test that unknown names and non-expressions are kept as literal strings."""
+        record = {"id": 1, "name": "John"}
+
+        assert _compute_value("pending", record) == "pending"
+        assert _compute_value("pending review", record) == "pending review"
+        assert _compute_value("upper(name)", record) == "JOHN"
+
 
 class TestGenerateExpectations:
     """Tests for generating expectations from config."""
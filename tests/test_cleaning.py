@@ -3,12 +3,16 @@ Tests for data cleaning transformation utilities.
 """
 
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
+import numpy as np
 import pytest
 
 from vibe_piper.transformations.cleaning import (
     CleaningConfig,
     CleaningReport,
+    FusedCleaner,
     NullStrategy,
     OutlierAction,
     OutlierMethod,
@@ -35,6 +39,7 @@ from vibe_piper.transformations.cleaning import (
     summarize_report,
     trim_whitespace,
 )
+from vibe_piper.transformations.dedup import BloomFilter, Deduplicator, key_hash
 from vibe_piper.types import DataRecord, DataType, Schema, SchemaField
 
 # =============================================================================
@@ -510,6 +515,119 @@ class TestCleanDataset:
         assert report.original_count == 0
         assert report.final_count == 0
 
+    def test_clean_dataset_matches_steps(self) -> None:
+        """Test the fused pass gives the same records as the individual steps."""
+        scores = [10.0, None, 11.0, 9.0, 10.5, 50.0, None, 9.5, 10.0, 11.5]
+        data = [
+            DataRecord(data={"id": i, "score": score}, schema=EVENT_SCHEMA)
+            for i, score in enumerate(scores)
+        ]
+        config = CleaningConfig(
+            null_strategy=NullStrategy.FILL_MEDIAN,
+            outlier_method=OutlierMethod.ZSCORE,
+            outlier_action=OutlierAction.DROP,
+            outlier_threshold=2.0,
+            outlier_columns=("score",),
+            standardize_columns=("score",),
+        )
+
+        expected, _ = handle_nulls(data, NullStrategy.FILL_MEDIAN)
+        expected, _ = handle_outliers(
+            expected, OutlierMethod.ZSCORE, OutlierAction.DROP, 2.0, ("score",)
+        )
+        expected, _ = standardize_columns(expected, ("score",))
+        cleaned, report = clean_dataset(data, config)
+
+        assert [r.data["id"] for r in cleaned] == [r.data["id"] for r in expected]
+        assert [r.data["score"] for r in cleaned] == pytest.approx(
+            [r.data["score"] for r in expected]
+        )
+        assert report.nulls_filled == 2
+        assert report.outliers_handled == 1
+        assert report.types_converted == 9
+        assert report.operations == ("null_handling", "outlier_treatment", "standardization")
+        assert report.details["score"] == {
+            "nulls_filled": 2,
+            "outliers_handled": 1,
+            "types_converted": 9,
+        }
+
+    def test_clean_dataset_text(self, sample_data: list[DataRecord]) -> None:
+        """Test text cleaning counts the values it changes."""
+        config = CleaningConfig(case_normalization="lower")
+        cleaned, report = clean_dataset(sample_data, config)
+        assert cleaned[0].data["name"] == "john doe"
+        assert cleaned[0].data["email"] == "john@example.com"
+        assert report.text_normalized == len(sample_data)
+        assert report.details["name"] == {"text_normalized": len(sample_data)}
+
+
+class TestFusedCleaner:
+    """Tests for the fused cleaning engine."""
+
+    def test_chunked_matches_whole(self) -> None:
+        """Test chunked input gives the same result and report as one list."""
+        data = [
+            DataRecord(
+                data={"id": i % 12, "score": None if i % 4 else float(i)}, schema=EVENT_SCHEMA
+            )
+            for i in range(20)
+        ]
+        chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+        config = CleaningConfig(null_strategy=NullStrategy.FILL_BACKWARD)
+
+        cleaner = FusedCleaner(config).fit(chunks)
+        streamed = [record.data for chunk in cleaner.transform(chunks) for record in chunk]
+        whole, report = clean_dataset(data, config)
+
+        assert streamed == [record.data for record in whole]
+        assert [r["score"] for r in streamed[:5]] == [0.0, 4.0, 4.0, 4.0, 4.0]
+        assert cleaner.report is not None
+        assert cleaner.report.duplicates_removed == report.duplicates_removed == 6
+        assert cleaner.report.nulls_filled == report.nulls_filled == 9
+
+    def test_none_default_fill_keeps_numeric_column(self) -> None:
+        """Test FILL_DEFAULT without a fill value leaves nulls and still standardizes."""
+        data = [
+            DataRecord(data={"id": i, "score": score}, schema=EVENT_SCHEMA)
+            for i, score in enumerate([1.0, None, 3.0, 5.0])
+        ]
+        config = CleaningConfig(
+            null_strategy=NullStrategy.FILL_DEFAULT, standardize_columns=("score",)
+        )
+
+        cleaned, report = clean_dataset(data, config)
+
+        assert [r.data["score"] for r in cleaned] == [-1.0, None, 0.0, 1.0]
+        assert report.nulls_filled == 0
+        assert report.types_converted == 3
+
+    def test_drop_removes_records_missing_a_field(self) -> None:
+        """Test DROP treats a missing field as null, like the step-by-step cleaner."""
+        rows = [{"id": 1}, {"id": 2, "score": 1.0}, {"id": 3}, {"id": 4, "score": 2.0}]
+        data = [DataRecord(data=row, schema=EVENT_SCHEMA) for row in rows]
+        config = CleaningConfig(null_strategy=NullStrategy.DROP)
+
+        expected, _ = handle_nulls(data, NullStrategy.DROP)
+        cleaned, report = clean_dataset(data, config)
+        cleaner = FusedCleaner(config).fit([data[:1], data[1:]])
+        streamed = [record for chunk in cleaner.transform([data[:1], data[1:]]) for record in chunk]
+
+        assert [r.data["id"] for r in cleaned] == [r.data["id"] for r in expected] == [2, 4]
+        assert [r.data["id"] for r in streamed] == [2, 4]
+        assert report.nulls_filled == 2
+
+    def test_unchanged_records_pass_through(self, sample_data: list[DataRecord]) -> None:
+        """Test records that need no fix are not rebuilt."""
+        cleaned, report = clean_dataset(sample_data)
+        assert all(a is b for a, b in zip(cleaned, sample_data, strict=True))
+        assert report.operations == ()
+
+    def test_transform_before_fit(self) -> None:
+        """Test transform() requires fit()."""
+        with pytest.raises(RuntimeError, match="before fit"):
+            list(FusedCleaner().transform([_events([1])]))
+
 
 # =============================================================================
 # Deduplication Tests
@@ -577,6 +695,154 @@ class TestFindDuplicates:
         assert len(duplicates) == 0
 
 
+EVENT_SCHEMA = Schema(
+    name="events",
+    fields=(
+        SchemaField(name="id", data_type=DataType.INTEGER),
+        SchemaField(name="score", data_type=DataType.FLOAT, nullable=True, required=False),
+    ),
+)
+
+
+def _events(ids: list[int]) -> list[DataRecord]:
+    """Create one event record per id."""
+    return [DataRecord(data={"id": i}, schema=EVENT_SCHEMA) for i in ids]
+
+
+class TestDeduplicator:
+    """Tests for streaming deduplication."""
+
+    def test_keep_none_and_last(self, data_with_duplicates: list[DataRecord]) -> None:
+        """Test keep='none' drops every duplicated key and keep='last' keeps the last one."""
+        unique, report = remove_duplicates(data_with_duplicates, columns=("id",), keep="none")
+        last, _ = remove_duplicates(data_with_duplicates, columns=("id",), keep="last")
+
+        assert [r.data["id"] for r in unique] == [3]
+        assert report["removed_count"] == 4
+        assert [r.data["id"] for r in last] == [1, 3, 2]
+
+    def test_exact_mode_across_chunks(self) -> None:
+        """Test keys seen in earlier chunks are dropped from later ones."""
+        dedup = Deduplicator(columns=["id"])
+        chunks = [_events([1, 2, 2]), _events([2, 3, 1, 4])]
+
+        result = [[r.data["id"] for r in chunk] for chunk in dedup.stream(chunks)]
+
+        assert result == [[1, 2], [3, 4]]
+        assert (dedup.stats.seen, dedup.stats.removed, dedup.stats.kept) == (7, 3, 4)
+
+    def test_equal_values_share_a_key(self) -> None:
+        """Test 1 and 1.0 hash to the same key."""
+        records = [
+            DataRecord(data={"id": 1, "score": 2.0}, schema=EVENT_SCHEMA),
+            DataRecord(data={"id": 1, "score": 2}, schema=EVENT_SCHEMA),
+        ]
+
+        assert len(Deduplicator(columns=["id", "score"]).filter(records)) == 1
+
+    def test_bloom_mode(self) -> None:
+        """Test the Bloom filter drops redeliveries with few false positives."""
+        dedup = Deduplicator(columns=["id"], mode="bloom", capacity=5_000, error_rate=0.01)
+        ids = list(range(5_000))
+        redelivered = ids[::20]
+
+        kept = dedup.filter(_events(ids))
+        again = dedup.filter(_events(redelivered))
+
+        assert again == []
+        assert len(kept) >= 5_000 * 0.98
+        assert isinstance(dedup.keys, BloomFilter)
+        assert dedup.keys.nbytes < 8_000
+
+    def test_persistent_mode_across_runs(self, tmp_path: Path) -> None:
+        """Test keys from a previous run are remembered."""
+        db_path = tmp_path / "dedup.db"
+        first_run = Deduplicator(columns=["id"], mode="persistent", path=db_path)
+        assert len(first_run.filter(_events([1, 2, 3]))) == 3
+        first_run.commit()
+
+        second_run = Deduplicator(columns=["id"], mode="persistent", path=db_path)
+        kept = second_run.filter(_events([3, 4, 4, 1, 5]))
+        other_feed = Deduplicator(
+            columns=["id"], mode="persistent", path=db_path, namespace="other"
+        )
+
+        assert [r.data["id"] for r in kept] == [4, 5]
+        assert len(other_feed.filter(_events([1, 2]))) == 2
+        second_run.commit()
+        assert len(second_run.keys) == 5
+
+    def test_keys_are_committed_only_after_ack(self, tmp_path: Path) -> None:
+        """Test a failed write can be retried without its records being dropped."""
+        db_path = tmp_path / "dedup.db"
+        dedup = Deduplicator(columns=["id"], mode="persistent", path=db_path)
+
+        assert len(dedup.filter(_events([1, 2]))) == 2
+        assert len(dedup.filter(_events([2, 3]))) == 1
+        assert dedup.pending == 3
+        assert len(dedup.keys) == 0
+
+        dedup.rollback()
+        retry = Deduplicator(columns=["id"], mode="persistent", path=db_path)
+        assert len(retry.filter(_events([1, 2, 3]))) == 3
+        retry.commit()
+        assert len(Deduplicator(columns=["id"], mode="persistent", path=db_path).keys) == 3
+        assert (dedup.stats.seen, dedup.stats.removed) == (0, 0)
+
+    def test_stream_commits_after_consumer_succeeds(self, tmp_path: Path) -> None:
+        """Test a chunk whose downstream write raises is not committed."""
+        dedup = Deduplicator(columns=["id"], mode="persistent", path=tmp_path / "dedup.db")
+        written: list[int] = []
+
+        with pytest.raises(RuntimeError):
+            for chunk in dedup.stream([_events([1, 2]), _events([3])]):
+                if chunk[0].data["id"] == 3:
+                    raise RuntimeError("write failed")
+                written.extend(r.data["id"] for r in chunk)
+
+        assert written == [1, 2]
+        assert dedup.keys.contains([key_hash({"id": i}, ["id"]) for i in (1, 2, 3)]) == [
+            True,
+            True,
+            False,
+        ]
+
+    def test_key_hash_is_order_and_address_independent(self) -> None:
+        """Test nested dicts and plain objects hash by value."""
+
+        class Point:
+            def __init__(self, x: int, y: int) -> None:
+                self.x = x
+                self.y = y
+
+        assert key_hash({"k": {"a": 1, "b": [1, 2]}}, ["k"]) == key_hash(
+            {"k": {"b": [1, 2], "a": 1}}, ["k"]
+        )
+        assert key_hash({"p": Point(1, 2)}, ["p"]) == key_hash({"p": Point(1, 2)}, ["p"])
+        assert key_hash({"p": Point(1, 2)}, ["p"]) != key_hash({"p": Point(2, 1)}, ["p"])
+        assert key_hash({"s": {3, 1, 2}}, ["s"]) == key_hash({"s": {2, 3, 1}}, ["s"])
+
+    @pytest.mark.parametrize(
+        ("numpy_value", "value"),
+        [
+            (np.int64(5), 5),
+            (np.float64(5.0), 5),
+            (np.float64(2.5), 2.5),
+            (np.bool_(True), True),
+            (np.str_("a"), "a"),
+        ],
+    )
+    def test_key_hash_normalizes_numpy_scalars(self, numpy_value: Any, value: Any) -> None:
+        """Test numpy scalars hash like the equal Python values."""
+        assert key_hash({"k": numpy_value}, ["k"]) == key_hash({"k": value}, ["k"])
+        assert key_hash({"k": [numpy_value]}, ["k"]) == key_hash({"k": [value]}, ["k"])
+
+    def test_persistent_mode_requires_path(self) -> None:
+        """Test persistent mode without a database path is rejected."""
+        with pytest.raises(ValueError, match="requires a database path"):
+            Deduplicator(mode="persistent")
+
+
 # =============================================================================
 # Null Handling Tests
 # =============================================================================
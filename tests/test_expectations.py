@@ -10,6 +10,7 @@ from typing import Any
 import pytest
 
 from vibe_piper import (
+    DataRecord,
     DataType,
     Expectation,
     ExpectationLibrary,
@@ -37,6 +38,12 @@ from vibe_piper.expectations import (
     expect_table_columns_to_match_set,
     expect_table_columns_to_not_contain,
 )
+from vibe_piper.validation.checks import (
+    expect_column_mean_to_be_between,
+    expect_column_values_to_be_increasing,
+    expect_column_values_to_be_unique,
+    expect_table_row_count_to_equal,
+)
 
 
 class TestExpectationLibrary:
@@ -425,6 +432,87 @@ class TestExpectationSuite:
         assert retrieved.name == "expect_not_null"
 
 
+class TestExpectationSuiteExecution:
+    """Tests for parallel and streaming ExpectationSuite execution."""
+
+    @staticmethod
+    def _suite(failure_strategy: str = FailureStrategy.COLLECT_ALL) -> ExpectationSuite:
+        @expect
+        def expect_no_negatives(values: Any) -> bool:
+            return all(value >= 0 for value in values)
+
+        @expect
+        def expect_small(values: Any) -> bool:
+            return all(value < 100 for value in values)
+
+        suite = ExpectationSuite(name="chunks", failure_strategy=failure_strategy)
+        return suite.add_expectations([expect_no_negatives, expect_small])
+
+    def test_parallel_matches_sequential(self) -> None:
+        """Test running expectations on several threads gives the same result."""
+        for strategy in (FailureStrategy.COLLECT_ALL, FailureStrategy.FAIL_FAST):
+            suite = self._suite(strategy)
+            data = [5, -1, 500]
+
+            assert suite.validate(data, max_workers=2) == suite.validate(data)
+
+    def test_stream_merges_chunk_results(self) -> None:
+        """Test an expectation passes only if it passes on every chunk."""
+        result = self._suite().validate_stream([[1, 2], [3, 200], [4]])
+
+        assert result.failed_expectations == ("expect_small",)
+        assert result.expectation_results["expect_no_negatives"].is_valid
+
+    def test_stream_fail_fast_stops_reading(self) -> None:
+        """Test fail-fast streaming stops at the first failing chunk."""
+        consumed: list[int] = []
+
+        def chunks():
+            for chunk in ([1], [-1], [2]):
+                consumed.append(chunk[0])
+                yield chunk
+
+        result = self._suite(FailureStrategy.FAIL_FAST).validate_stream(chunks())
+
+        assert consumed == [1, -1]
+        assert result.failed_expectations == ("expect_no_negatives",)
+
+    def test_stream_aggregates_over_whole_stream(self) -> None:
+        """Test statistical expectations see every chunk, not each chunk alone."""
+        schema = Schema(name="loose")
+        records = [DataRecord(data={"id": i % 6}, schema=schema) for i in range(12)]
+        suite = ExpectationSuite(name="aggregates").add_expectations(
+            [
+                Expectation(name="mean", fn=expect_column_mean_to_be_between("id", 2, 3)),
+                Expectation(name="unique", fn=expect_column_values_to_be_unique("id")),
+                Expectation(name="row_count", fn=expect_table_row_count_to_equal(12)),
+            ]
+        )
+
+        whole = suite.validate(records)
+        streamed = suite.validate_stream(records[i : i + 6] for i in range(0, 12, 6))
+
+        # Each chunk alone has unique ids and 6 rows
+        assert streamed.failed_expectations == whole.failed_expectations == ("unique",)
+        assert streamed.expectation_results == whole.expectation_results
+
+    def test_stream_rejects_whole_dataset_expectations(self) -> None:
+        """Test expectations that need every record at once cannot validate a stream."""
+        suite = ExpectationSuite(name="ordering").add_expectations(
+            [
+                Expectation(name="increasing", fn=expect_column_values_to_be_increasing("id")),
+                Expectation(
+                    name="custom",
+                    fn=lambda data: ValidationResult(is_valid=True),
+                    metadata={"whole_dataset": True},
+                ),
+            ]
+        )
+
+        with pytest.raises(ValueError, match="'increasing', 'custom'"):
+            suite.validate_stream([[]])
+
+
 class TestComposeExpectations:
     """Tests for compose_expectations utility."""
 
@@ -0,0 +1,173 @@
+"""
+Tests for the expression language.
+"""
+
+import importlib.util
+from typing import Any
+
+import pytest
+
+from vibe_piper.expressions import (
+    VECTORIZE_MIN_ROWS,
+    ExpressionError,
+    compile_expression,
+)
+
+ROW = {
+    "age": 30,
+    "price": 2.5,
+    "name": "Alice",
+    "status": "inactive",
+    "email": None,
+    "company": {"name": "Acme"},
+}
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("age * 2 + 1", 61),
+        ("price * (1 + 0.5)", 3.75),
+        ("age / 4", 7.5),
+        ("age // 4", 7),
+        ("age % 7", 2),
+        ("-age ** 2", -900),
+        ("name + '!'", "Alice!"),
+        ("age = 30 AND price < 3", True),
+        ("age <> 30 OR name == 'Bob'", False),
+        ("NOT age > 40", True),
+        ("email IS NULL", True),
+        ("email is not None", False),
+        ("age IN (10, 20, 30)", True),
+        ("name NOT IN ['Alice', 'Bob']", False),
+        ("age BETWEEN 18 AND 65", True),
+        ("company.name LIKE 'Ac_e'", True),
+        ("status CONTAINS 'active'", False),
+        ("'is active now' CONTAINS 'active'", True),
+        ("upper(trim('  a '))", "A"),
+        ("length(name)", 5),
+        ("substr(name, 2, 3)", "lic"),
+        ("coalesce(email, company.name)", "Acme"),
+        ("concat(name, '-', age)", "Alice-30"),
+        ("round(price * 3, 1)", 7.5),
+        ("CASE WHEN age > 40 THEN 'old' WHEN age > 20 THEN 'mid' END", "mid"),
+        ("CASE WHEN age > 40 THEN 'old' END", None),
+    ],
+)
+def test_evaluate(expression: str, expected: Any) -> None:
+    """Test operators and functions on a single row."""
+    assert compile_expression(expression).evaluate(ROW) == expected
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("email + 'x'", None),
+        ("missing * 2", None),
+        ("age / 0", None),
+        ("name * name", None),
+        ("email = null", None),
+        ("email > 1 AND age > 40", False),
+        ("email > 1 OR age > 20", True),
+        ("email > 1 OR age > 40", None),
+        ("NOT (email > 1)", None),
+        ("-name", None),
+        ("9 ** 9 ** 9", None),
+        ("age ** 10000", None),
+        ("name * 10000000000", None),
+        ("'%0999999999d' % age", None),
+    ],
+)
+def test_null_semantics(expression: str, expected: Any) -> None:
+    """Test nulls and row errors propagate as null with three-valued logic."""
+    assert compile_expression(expression).evaluate(ROW) is expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "",
+        "age >",
+        "age age",
+        "foo(1)",
+        "lower()",
+        "CASE END",
+        "name = 'open",
+        "a || b",
+        "__import__('os')",
+    ],
+)
+def test_invalid_expressions(expression: str) -> None:
+    """Test invalid expressions are rejected when compiled."""
+    with pytest.raises(ExpressionError):
+        compile_expression(expression)
+
+
+def test_compiled_expressions_are_cached() -> None:
+    """Test the same source compiles once."""
+    expression = compile_expression("age + 1")
+
+    assert compile_expression("age + 1") is expression
+    assert expression.columns == frozenset({"age"})
+
+
+def test_filter_mask_treats_null_as_false() -> None:
+    """Test filters drop rows whose condition is null."""
+    rows = [{"age": 30}, {"age": None}, {"age": 10}]
+
+    assert compile_expression("age > 18").filter_mask(rows) == [True, False, False]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed")
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "a * 2 + b",
+        "a / b",
+        "a // 3 + a % 3",
+        "-a",
+        "a > 1 AND (b < 0 OR s IS NULL)",
+        "NOT flag",
+        "s + '!'",
+        "s IN ('x', 'yy') OR a NOT IN (1, 2)",
+        "s LIKE 'y%' AND s CONTAINS 'yy'",
+        "upper(s)",
+        "length(trim(s))",
+        "coalesce(s, 'none')",
+        "CASE WHEN a > 5 THEN s WHEN flag THEN a ELSE b END",
+        "mixed + 1",
+        "a * a * a * a * a * a",
+    ],
+)
+def test_batch_matches_row_evaluation(expression: str) -> None:
+    """Test vectorized batch evaluation agrees with per-row evaluation."""
+    rows = [
+        {
+            "a": [None, 0, 1, -3, 7, 2**20][i % 6],
+            "b": [None, 0.0, 2.5, -1.5, float("nan")][i % 5],
+            "s": [None, "x", " yy ", "yy z"][i % 4],
+            "flag": [True, False, None][i % 3],
+            "mixed": [1, "x", None][i % 3],
+        }
+        for i in range(VECTORIZE_MIN_ROWS * 4)
+    ]
+    compiled = compile_expression(expression)
+
+    assert compiled.evaluate_batch(rows) == [compiled.evaluate(row) for row in rows]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="numpy not installed")
+@pytest.mark.parametrize("expression", ["n", "n + 1", "-n", "-s", "+s", "n * 2 - m"])
+def test_batch_keeps_value_types(expression: str) -> None:
+    """Test batch results keep the row path's types for mixed int/float columns."""
+    rows = [
+        {"n": [1, 2.5, None][i % 3], "m": [3, 4][i % 2], "s": [None, "x"][i % 2]}
+        for i in range(VECTORIZE_MIN_ROWS * 2)
+    ]
+    compiled = compile_expression(expression)
+
+    batch = compiled.evaluate_batch(rows)
+    expected = [compiled.evaluate(row) for row in rows]
+
+    assert batch == expected
+    assert [type(value) for value in batch] == [type(value) for value in expected]
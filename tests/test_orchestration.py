@@ -306,6 +306,36 @@ class TestOrchestrationEngine:
         assert result.asset_results["source"].success is True
         assert result.asset_results["derived"].success is True
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_each_asset_executes_once(self, max_workers: int) -> None:
+        """Test every asset function is called exactly once per execute."""
+        calls: dict[str, int] = {}
+
+        def make_op(name: str) -> Operator:
+            def fn(data, ctx):
+                calls[name] = calls.get(name, 0) + 1
+                return name
+
+            return Operator(name=name, operator_type=OperatorType.TRANSFORM, fn=fn)
+
+        assets = tuple(
+            Asset(
+                name=name,
+                asset_type=AssetType.MEMORY,
+                uri=f"memory://{name}",
+                operator=make_op(name),
+            )
+            for name in ("a", "b", "c")
+        )
+        graph = AssetGraph(name="test_graph", assets=assets, dependencies={"c": ("a", "b")})
+
+        config = OrchestrationConfig(max_workers=max_workers, enable_incremental=False)
+        engine = OrchestrationEngine(config=config)
+        result = engine.execute(graph)
+
+        assert result.success is True
+        assert calls == {"a": 1, "b": 1, "c": 1}
+
     def test_parallel_execution(self) -> None:
         """Test parallel execution of independent assets."""
 
@@ -717,3 +747,307 @@ class TestOrchestrationEngine:
 
             # Cleanup
             engine.clear_state("test_graph")
+
+
+class TestOutputRelease:
+    """Tests for reference-counted release of asset outputs."""
+
+    @staticmethod
+    def _chain_graph() -> AssetGraph:
+        """Build a graph a -> b -> c where every asset returns a list."""
+
+        def source_op(data, ctx):
+            return [1, 2, 3]
+
+        def double_op(data, ctx):
+            return [x * 2 for x in data]
+
+        source = Operator(name="source", operator_type=OperatorType.SOURCE, fn=source_op)
+        double = Operator(name="double", operator_type=OperatorType.TRANSFORM, fn=double_op)
+
+        a = Asset(name="a", asset_type=AssetType.MEMORY, uri="memory://a", operator=source)
+        b = Asset(name="b", asset_type=AssetType.MEMORY, uri="memory://b", operator=double)
+        c = Asset(name="c", asset_type=AssetType.MEMORY, uri="memory://c", operator=double)
+
+        return AssetGraph(
+            name="chain",
+            assets=(a, b, c),
+            dependencies={"b": ("a",), "c": ("b",)},
+        )
+
+    def test_consumed_outputs_are_released(self) -> None:
+        """Test intermediate data is dropped once its consumers have run."""
+        config = OrchestrationConfig(max_workers=1, enable_incremental=False)
+        engine = OrchestrationEngine(config=config)
+        result = engine.execute(self._chain_graph())
+
+        assert result.success is True
+        assert result.asset_results["a"].data is None
+        assert result.asset_results["a"].metrics["released"] == 1
+        assert result.asset_results["b"].data is None
+        assert result.asset_results["b"].checksum is not None
+        assert result.asset_results["c"].data == [4, 8, 12]
+        assert result.metrics["released_outputs"] == 2
+
+    def test_retain_outputs_keeps_all_data(self) -> None:
+        """Test retain_outputs keeps every asset's data."""
+        config = OrchestrationConfig(max_workers=1, enable_incremental=False, retain_outputs=True)
+        engine = OrchestrationEngine(config=config)
+        result = engine.execute(self._chain_graph())
+
+        assert result.asset_results["a"].data == [1, 2, 3]
+        assert result.asset_results["b"].data == [2, 4, 6]
+        assert result.metrics["released_outputs"] == 0
+
+    def test_parallel_release_waits_for_all_consumers(self) -> None:
+        """Test a shared upstream is only released after every consumer ran."""
+        seen: list[object] = []
+
+        def op(data, ctx):
+            seen.append(data)
+            return ["value"]
+
+        operator = Operator(name="op", operator_type=OperatorType.TRANSFORM, fn=op)
+        a = Asset(name="a", asset_type=AssetType.MEMORY, uri="memory://a", operator=operator)
+        b = Asset(name="b", asset_type=AssetType.MEMORY, uri="memory://b", operator=operator)
+        c = Asset(name="c", asset_type=AssetType.MEMORY, uri="memory://c", operator=operator)
+
+        graph = AssetGraph(
+            name="fan_out",
+            assets=(a, b, c),
+            dependencies={"b": ("a",), "c": ("a",)},
+        )
+
+        config = OrchestrationConfig(max_workers=4, enable_incremental=False)
+        engine = OrchestrationEngine(config=config)
+        result = engine.execute(graph)
+
+        assert result.success is True
+        assert result.asset_results["a"].data is None
+        assert result.asset_results["b"].data == ["value"]
+        assert result.asset_results["c"].data == ["value"]
+
+    def test_target_assets_are_retained(self) -> None:
+        """Test explicitly targeted assets keep their data."""
+        config = OrchestrationConfig(max_workers=1, enable_incremental=False)
+        engine = OrchestrationEngine(config=config)
+        result = engine.execute(self._chain_graph(), target_assets=("b", "c"))
+
+        assert result.asset_results["a"].data is None
+        assert result.asset_results["b"].data == [2, 4, 6]
+
+    def test_released_outputs_spill_to_disk(self) -> None:
+        """Test released outputs are written to spill_dir before being dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = OrchestrationConfig(
+                max_workers=1,
+                enable_incremental=False,
+                spill_dir=Path(tmpdir),
+            )
+            engine = OrchestrationEngine(config=config)
+            context = PipelineContext(pipeline_id="chain", run_id="run1")
+            result = engine.execute(self._chain_graph(), context=context)
+
+            assert result.asset_results["a"].data is None
+            assert result.asset_results["a"].metrics["spilled"] == 1
+
+            from vibe_piper.io_managers import FileIOManager
+
+            spilled = FileIOManager(base_path=tmpdir, format="pickle")
+            assert spilled.load_input(PipelineContext(pipeline_id="a", run_id="run1")) == [1, 2, 3]
+
+
+class TestResourceScheduling:
+    """Tests for resource-aware parallel scheduling."""
+
+    def test_asset_declares_resources(self) -> None:
+        """Test resources and priority are carried by assets from all creation paths."""
+        from vibe_piper import asset
+
+        @asset(resources={"postgres": 1, "memory_gb": 8}, priority=5)
+        def heavy_asset():
+            return []
+
+        assert heavy_asset.resources == {"postgres": 1, "memory_gb": 8}
+        assert heavy_asset.priority == 5
+
+    def test_negative_resources_rejected(self) -> None:
+        """Test assets cannot declare negative resource units."""
+        with pytest.raises(ValueError, match="cannot be negative"):
+            Asset(
+                name="bad",
+                asset_type=AssetType.MEMORY,
+                uri="memory://bad",
+                resources={"postgres": -1},
+            )
+
+    def test_pool_limits_concurrency(self) -> None:
+        """Test assets sharing a pool never exceed its capacity."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def op(data, ctx):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return "done"
+
+        operator = Operator(name="op", operator_type=OperatorType.TRANSFORM, fn=op)
+        assets = tuple(
+            Asset(
+                name=f"load{i}",
+                asset_type=AssetType.MEMORY,
+                uri=f"memory://load{i}",
+                operator=operator,
+                resources={"postgres": 1},
+            )
+            for i in range(6)
+        )
+        graph = AssetGraph(name="pooled", assets=assets)
+
+        config = OrchestrationConfig(
+            max_workers=6,
+            enable_incremental=False,
+            resource_pools={"postgres": 2},
+        )
+        engine = OrchestrationEngine(config=config)
+        result = engine.execute(graph)
+
+        assert result.success is True
+        assert result.assets_executed == 6
+        assert peak <= 2
+
+    def test_priority_orders_dispatch(self) -> None:
+        """Test higher-priority assets start first when resources are scarce."""
+        started: list[str] = []
+
+        def op(data, ctx):
+            return "done"
+
+        class RecordingExecutor:
+            def execute(self, asset, context, upstream_results):
+                started.append(asset.name)
+                return AssetResult(asset_name=asset.name, success=True, data="done")
+
+        operator = Operator(name="op", operator_type=OperatorType.TRANSFORM, fn=op)
+        assets = tuple(
+            Asset(
+                name=name,
+                asset_type=AssetType.MEMORY,
+                uri=f"memory://{name}",
+                operator=operator,
+                resources={"slot": 1},
+                priority=priority,
+            )
+            for name, priority in (("low", 0), ("mid", 5), ("high", 10))
+        )
+        graph = AssetGraph(name="priorities", assets=assets)
+
+        config = OrchestrationConfig(
+            max_workers=4,
+            enable_incremental=False,
+            resource_pools={"slot": 1},
+        )
+        engine = OrchestrationEngine(config=config, executor=RecordingExecutor())
+        engine.execute(graph)
+
+        assert started[:3] == ["high", "mid", "low"]
+
+    def test_oversized_request_rejected(self) -> None:
+        """Test an asset requesting more than a pool holds fails fast."""
+        heavy = Asset(
+            name="heavy",
+            asset_type=AssetType.MEMORY,
+            uri="memory://heavy",
+            resources={"memory_gb": 64},
+        )
+        graph = AssetGraph(name="oversized", assets=(heavy,))
+
+        config = OrchestrationConfig(
+            max_workers=2,
+            enable_incremental=False,
+            resource_pools={"memory_gb": 32},
+        )
+        engine = OrchestrationEngine(config=config)
+
+        with pytest.raises(ValueError, match="only has 32"):
+            engine.execute(graph)
+
+
+class TestChangeBasedIncremental:
+    """Tests for version-ledger based incremental runs."""
+
+    @staticmethod
+    def _graph(prefix: str, b_config: dict | None = None) -> AssetGraph:
+        """Build a three-asset chain a -> b -> c."""
+        a_name, b_name, c_name = f"{prefix}_a", f"{prefix}_b", f"{prefix}_c"
+
+        def load(data, ctx):
+            return [1, 2, 3]
+
+        def double(data, ctx):
+            return [value * 2 for value in data[a_name]]
+
+        def total(data, ctx):
+            return [sum(data[b_name])]
+
+        def make(name: str, fn, config: dict | None = None) -> Asset:
+            return Asset(
+                name=name,
+                asset_type=AssetType.MEMORY,
+                uri=f"memory://{name}",
+                operator=Operator(name=name, operator_type=OperatorType.TRANSFORM, fn=fn),
+                config=config or {},
+            )
+
+        return AssetGraph(
+            name=f"{prefix}_graph",
+            assets=(make(a_name, load), make(b_name, double, b_config), make(c_name, total)),
+            dependencies={b_name: (a_name,), c_name: (b_name,)},
+        )
+
+    def test_unchanged_assets_are_skipped(self, tmp_path: Path) -> None:
+        """Test a second run with no changes executes nothing."""
+        graph = self._graph("unchanged")
+        engine = OrchestrationEngine(config=OrchestrationConfig(state_dir=tmp_path, max_workers=1))
+
+        assert engine.execute(graph).assets_executed == 3
+        assert engine.execute(graph).assets_executed == 0
+        assert engine.get_stale_assets(graph) == {}
+
+    def test_config_change_propagates_downstream(self, tmp_path: Path) -> None:
+        """Test a changed asset and its downstream rerun with skipped upstream data loaded."""
+        engine = OrchestrationEngine(config=OrchestrationConfig(state_dir=tmp_path, max_workers=2))
+        engine.execute(self._graph("changed"))
+
+        changed = self._graph("changed", b_config={"factor": 2})
+        assert engine.get_stale_assets(changed) == {
+            "changed_b": "config changed",
+            "changed_c": "upstream changed_b is stale",
+        }
+
+        result = engine.execute(changed)
+        assert set(result.asset_results) == {"changed_b", "changed_c"}
+        assert result.asset_results["changed_c"].data == [12]
+
+    def test_versions_are_persisted(self, tmp_path: Path) -> None:
+        """Test recorded versions survive a new engine and clear_state resets them."""
+        graph = self._graph("persisted")
+        OrchestrationEngine(config=OrchestrationConfig(state_dir=tmp_path)).execute(graph)
+
+        engine = OrchestrationEngine(config=OrchestrationConfig(state_dir=tmp_path))
+        version = engine.version_ledger.get(graph.name, "persisted_b")
+        assert version is not None
+        assert set(version.upstream_versions) == {"persisted_a"}
+        assert version.output_fingerprint
+
+        engine.clear_state(graph.name)
+        assert len(engine.get_stale_assets(graph)) == 3
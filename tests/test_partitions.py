@@ -0,0 +1,329 @@
+"""
+Tests for partitioned assets.
+"""
+
+import json
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from vibe_piper import (
+    Asset,
+    AssetGraph,
+    AssetType,
+    ErrorStrategy,
+    MultiPartitionsDefinition,
+    Operator,
+    OperatorType,
+    PartitionStatus,
+    PartitionStatusStore,
+    StaticPartitionsDefinition,
+    TimeWindowPartitionsDefinition,
+)
+from vibe_piper.orchestration import OrchestrationConfig, OrchestrationEngine
+from vibe_piper.partitions import UNPARTITIONED_KEY, PartitionRecord, partition_storage_key
+from vibe_piper.scheduling import BackfillConfig, BackfillManager, ScheduleStore
+
+
+def _asset(
+    name: str,
+    fn: Any,
+    partitions: Any = None,
+    operator_type: OperatorType = OperatorType.SOURCE,
+) -> Asset:
+    """Create an asset backed by a function."""
+    return Asset(
+        name=name,
+        asset_type=AssetType.MEMORY,
+        uri=f"memory://{name}",
+        operator=Operator(name=name, operator_type=operator_type, fn=fn),
+        partitions=partitions,
+    )
+
+
+def _engine(tmp_path: Path, **kwargs: Any) -> OrchestrationEngine:
+    """Create an orchestration engine with isolated state."""
+    return OrchestrationEngine(
+        config=OrchestrationConfig(state_dir=tmp_path / "state", **kwargs),
+        error_strategy=ErrorStrategy.CONTINUE,
+    )
+
+
+class TestPartitionDefinitions:
+    """Tests for partition definitions."""
+
+    def test_static_keys(self) -> None:
+        """Test static partitions keep key order."""
+        regions = StaticPartitionsDefinition(keys=("us", "eu"))
+        assert regions.get_partition_keys() == ("us", "eu")
+        assert regions.has_partition_key("eu")
+
+    def test_static_rejects_duplicates(self) -> None:
+        """Test duplicate static keys are rejected."""
+        with pytest.raises(ValueError, match="Duplicate"):
+            StaticPartitionsDefinition(keys=("us", "us"))
+
+    def test_daily_windows(self) -> None:
+        """Test daily windows and their context."""
+        daily = TimeWindowPartitionsDefinition(start=datetime(2024, 1, 1), end=datetime(2024, 1, 4))
+        assert daily.get_partition_keys() == ("2024-01-01", "2024-01-02", "2024-01-03")
+
+        context = daily.get_partition_context("2024-01-02")
+        assert context["partition_start"] == "2024-01-02T00:00:00"
+        assert context["partition_end"] == "2024-01-03T00:00:00"
+
+    def test_monthly_windows_in_range(self) -> None:
+        """Test monthly windows overlapping a timezone-aware range."""
+        monthly = TimeWindowPartitionsDefinition(
+            start=datetime(2023, 11, 1), end=datetime(2024, 4, 1), frequency="monthly"
+        )
+        keys = monthly.get_keys_in_range(
+            datetime(2023, 12, 15, tzinfo=UTC), datetime(2024, 2, 1, tzinfo=UTC)
+        )
+        assert keys == ("2023-12", "2024-01")
+
+    def test_multi_dimensional_keys(self) -> None:
+        """Test multi-dimensional keys are the cross product of dimensions."""
+        partitions = MultiPartitionsDefinition(
+            dimensions={
+                "date": TimeWindowPartitionsDefinition(
+                    start=datetime(2024, 1, 1), end=datetime(2024, 1, 3)
+                ),
+                "region": StaticPartitionsDefinition(keys=("us", "eu")),
+            }
+        )
+        assert partitions.get_partition_keys() == (
+            "2024-01-01|us",
+            "2024-01-01|eu",
+            "2024-01-02|us",
+            "2024-01-02|eu",
+        )
+        context = partitions.get_partition_context("2024-01-02|eu")
+        assert context["partition_dimensions"] == {"date": "2024-01-02", "region": "eu"}
+        assert context["partition_start"] == "2024-01-02T00:00:00"
+
+    def test_hourly_keys_are_path_safe(self) -> None:
+        """Test hourly keys avoid ':' and round-trip to their window."""
+        hourly = TimeWindowPartitionsDefinition(
+            start=datetime(2024, 1, 1), end=datetime(2024, 1, 1, 3), frequency="hourly"
+        )
+        assert hourly.get_partition_keys() == ("2024-01-01T00", "2024-01-01T01", "2024-01-01T02")
+        assert hourly.time_window("2024-01-01T01") == (
+            datetime(2024, 1, 1, 1),
+            datetime(2024, 1, 1, 2),
+        )
+
+    def test_storage_key(self) -> None:
+        """Test partition storage keys."""
+        assert partition_storage_key("sales", "2024-01-01") == "sales[2024-01-01]"
+        assert partition_storage_key("sales", UNPARTITIONED_KEY) == "sales"
+
+
+class TestPartitionStatusStore:
+    """Tests for persistent partition status."""
+
+    def test_record_and_reload(self, tmp_path: Path) -> None:
+        """Test status survives a new store instance."""
+        store = PartitionStatusStore(state_dir=tmp_path)
+        store.record("sales", "us", success=True, checksum="abc")
+        store.record("sales", "eu", success=False, error="boom")
+
+        reloaded = PartitionStatusStore(state_dir=tmp_path)
+        assert reloaded.get_status("sales", "us") == PartitionStatus.MATERIALIZED
+        assert reloaded.get_status("sales", "eu") == PartitionStatus.FAILED
+        assert reloaded.get_status("sales", "apac") == PartitionStatus.MISSING
+
+    def test_failure_keeps_last_materialization(self, tmp_path: Path) -> None:
+        """Test a failed re-run keeps the previous materialization time."""
+        store = PartitionStatusStore(state_dir=tmp_path)
+        first = store.record("sales", "us", success=True)
+        failed = store.record("sales", "us", success=False, error="boom")
+        assert failed.materialized_at == first.materialized_at
+
+    def test_updates_append_to_log(self, tmp_path: Path) -> None:
+        """Test each update appends one line and reloads compact the log."""
+        store = PartitionStatusStore(state_dir=tmp_path)
+        log = tmp_path / "sales.partitions.jsonl"
+        for attempt in range(3):
+            store.record("sales", "us", success=attempt == 2)
+            store.record("sales", "eu", success=True)
+        assert len(log.read_text().splitlines()) == 6
+
+        reloaded = PartitionStatusStore(state_dir=tmp_path)
+        assert reloaded.get_status("sales", "us") == PartitionStatus.MATERIALIZED
+        assert len(log.read_text().splitlines()) == 2
+
+    def test_reads_legacy_status_file(self, tmp_path: Path) -> None:
+        """Test whole-file JSON status from older versions is migrated to the log."""
+        legacy = PartitionRecord("sales", "us", PartitionStatus.MATERIALIZED, checksum="abc")
+        (tmp_path / "sales.partitions.json").write_text(json.dumps([legacy.to_dict()]))
+
+        store = PartitionStatusStore(state_dir=tmp_path)
+        assert store.get_record("sales", "us") == legacy
+        assert not (tmp_path / "sales.partitions.json").exists()
+
+        store.record("sales", "eu", success=True)
+        reloaded = PartitionStatusStore(state_dir=tmp_path)
+        assert set(reloaded.get_records("sales")) == {"us", "eu"}
+
+    def test_naive_timestamps_load_as_utc(self, tmp_path: Path) -> None:
+        """Test naive stored timestamps compare with new timezone-aware ones."""
+        legacy = PartitionRecord(
+            "sales", "us", PartitionStatus.MATERIALIZED, updated_at=datetime(2024, 1, 1)
+        ).to_dict()
+        legacy["materialized_at"] = legacy["updated_at"]
+        (tmp_path / "sales.partitions.json").write_text(json.dumps([legacy]))
+
+        store = PartitionStatusStore(state_dir=tmp_path)
+        old = store.get_record("sales", "us")
+        new = store.record("sales", "eu", success=True)
+
+        assert old is not None and old.materialized_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert new.materialized_at is not None and new.materialized_at > old.materialized_at
+
+
+class TestPartitionedExecution:
+    """Tests for partition fan-out in the orchestration engine."""
+
+    def test_executes_each_partition(self, tmp_path: Path) -> None:
+        """Test every partition runs with its own context."""
+        name = f"regional_{uuid.uuid4().hex[:8]}"
+        regions = StaticPartitionsDefinition(keys=("us", "eu", "apac"))
+        source = _asset(
+            name,
+            lambda data, ctx: [ctx.get_config("partition_key")],
+            partitions=regions,
+        )
+        graph = AssetGraph(name="partitioned", assets=(source,))
+        engine = _engine(tmp_path, max_workers=3)
+
+        result = engine.execute_partitions(graph)
+
+        assert result.success
+        assert result.assets_executed == 3
+        assert result.asset_results[f"{name}[eu]"].data == ["eu"]
+        assert set(engine.get_partition_status(source).values()) == {PartitionStatus.MATERIALIZED}
+
+    def test_downstream_receives_matching_partition(self, tmp_path: Path) -> None:
+        """Test same-partitioned assets map partitions one-to-one."""
+        prefix = f"p{uuid.uuid4().hex[:8]}"
+        regions = StaticPartitionsDefinition(keys=("us", "eu"))
+        source = _asset(
+            f"{prefix}_source",
+            lambda data, ctx: [ctx.get_config("partition_key")],
+            partitions=regions,
+        )
+        upper = _asset(
+            f"{prefix}_upper",
+            lambda data, ctx: [value.upper() for value in data[source.name]],
+            partitions=regions,
+            operator_type=OperatorType.TRANSFORM,
+        )
+        total = _asset(
+            f"{prefix}_total",
+            lambda data, ctx: sorted(
+                value for values in data[upper.name].values() for value in values
+            ),
+            operator_type=OperatorType.TRANSFORM,
+        )
+        graph = AssetGraph(
+            name="fan_in",
+            assets=(source, upper, total),
+            dependencies={upper.name: (source.name,), total.name: (upper.name,)},
+        )
+
+        result = _engine(tmp_path).execute_partitions(graph)
+
+        assert result.success
+        assert result.asset_results[total.name].data == ["EU", "US"]
+        # Intermediate partitions are released once the fan-in consumed them
+        assert result.asset_results[f"{upper.name}[us]"].metrics["released"] == 1
+
+    def test_only_missing_or_stale(self, tmp_path: Path) -> None:
+        """Test materialized partitions are skipped and staleness propagates."""
+        prefix = f"p{uuid.uuid4().hex[:8]}"
+        regions = StaticPartitionsDefinition(keys=("us", "eu"))
+        source = _asset(
+            f"{prefix}_source",
+            lambda data, ctx: [ctx.get_config("partition_key")],
+            partitions=regions,
+        )
+        downstream = _asset(
+            f"{prefix}_downstream",
+            lambda data, ctx: data,
+            partitions=regions,
+            operator_type=OperatorType.TRANSFORM,
+        )
+        graph = AssetGraph(
+            name="stale",
+            assets=(source, downstream),
+            dependencies={downstream.name: (source.name,)},
+        )
+        engine = _engine(tmp_path)
+
+        assert engine.execute_partitions(graph).assets_executed == 4
+        assert engine.execute_partitions(graph, only_missing_or_stale=True).assets_executed == 0
+
+        # Re-running one source partition makes the matching downstream stale
+        engine.execute_partitions(graph, partition_keys=["eu"], asset_names=[source.name])
+        rerun = engine.execute_partitions(graph, only_missing_or_stale=True)
+        assert set(rerun.asset_results) == {f"{downstream.name}[eu]"}
+
+    def test_failed_partition_is_tracked(self, tmp_path: Path) -> None:
+        """Test a failing partition does not stop its siblings."""
+        name = f"flaky_{uuid.uuid4().hex[:8]}"
+
+        def load(data: Any, ctx: Any) -> list[str]:
+            key = ctx.get_config("partition_key")
+            if key == "eu":
+                msg = "eu is down"
+                raise RuntimeError(msg)
+            return [key]
+
+        source = _asset(name, load, partitions=StaticPartitionsDefinition(keys=("us", "eu")))
+        graph = AssetGraph(name="flaky", assets=(source,))
+        engine = _engine(tmp_path)
+
+        result = engine.execute_partitions(graph)
+
+        assert result.assets_succeeded == 1
+        assert result.assets_failed == 1
+        assert engine.get_partition_status(source) == {
+            "us": PartitionStatus.MATERIALIZED,
+            "eu": PartitionStatus.FAILED,
+        }
+
+
+class TestPartitionBackfill:
+    """Tests for partition-aware backfills."""
+
+    def test_backfill_runs_missing_partitions_in_range(self, tmp_path: Path) -> None:
+        """Test backfill only executes missing partitions inside the range."""
+        name = f"daily_{uuid.uuid4().hex[:8]}"
+        daily = TimeWindowPartitionsDefinition(
+            start=datetime(2024, 1, 1), end=datetime(2024, 1, 11)
+        )
+        source = _asset(name, lambda data, ctx: [ctx.get_config("partition_key")], daily)
+        graph = AssetGraph(name="backfill", assets=(source,))
+        engine = _engine(tmp_path, max_workers=4)
+        manager = BackfillManager(store=ScheduleStore(storage_dir=tmp_path / "schedules"))
+
+        engine.execute_partitions(graph, partition_keys=["2024-01-03"])
+
+        config = BackfillConfig(
+            backfill_id="bf_partitions",
+            schedule_id="daily",
+            start_date=datetime(2024, 1, 2, tzinfo=UTC),
+            end_date=datetime(2024, 1, 5, tzinfo=UTC),
+        )
+        result = manager.backfill_partitions(config, graph, engine)
+
+        assert result.tasks_created == 2
+        assert result.tasks_succeeded == 2
+        status = engine.get_partition_status(source)
+        assert status["2024-01-02"] == PartitionStatus.MATERIALIZED
+        assert status["2024-01-04"] == PartitionStatus.MATERIALIZED
+        assert status["2024-01-05"] == PartitionStatus.MISSING
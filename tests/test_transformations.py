@@ -4,6 +4,12 @@ Tests for transformation framework.
 Comprehensive tests covering all transformation operations including edge cases.
 """
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Number
+from pathlib import Path
+
+import pandas as pd
 import pytest
 
 from vibe_piper import DataRecord, DataType, PipelineContext, Schema, SchemaField
@@ -13,19 +19,32 @@ from vibe_piper.transformations import (
     Cube,
     GroupBy,
     Join,
+    JoinStrategy,
     JoinType,
     Max,
     Min,
     Pivot,
     Rollup,
+    StdDev,
     Sum,
     TransformationBuilder,
     Unpivot,
+    Variance,
     Window,
     join,
     transform,
     window_function,
 )
+from vibe_piper.transformations.windows import (
+    DenseRank,
+    Lag,
+    Rank,
+    RowNumber,
+    WindowAvg,
+    WindowCount,
+    WindowMax,
+    WindowSum,
+)
 
 
 @pytest.fixture
@@ -227,6 +246,219 @@ class TestJoinOperators:
 
         assert len(result) >= 3
 
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "full"])
+    @pytest.mark.parametrize("strategy", ["broadcast_hash", "sort_merge", "grace_hash"])
+    def test_join_strategies_match_backend(
+        self,
+        customers: list[DataRecord],
+        orders: list[DataRecord],
+        strategy: str,
+        how: str,
+    ) -> None:
+        """Test every record-level strategy produces the backend join's rows."""
+        expected = Join(
+            name="backend", right_data=orders, on="customer_id", how=how, strategy="backend"
+        ).transform(customers, ctx=None)
+        join_op = Join(
+            name=strategy,
+            right_data=orders,
+            on="customer_id",
+            how=how,
+            strategy=strategy,
+            spill_partitions=3,
+        )
+
+        result = join_op.transform(customers, ctx=None)
+
+        def rows(records: list[DataRecord]) -> list[str]:
+            # pandas turns integer columns with nulls into floats
+            return sorted(
+                repr({k: float(v) if isinstance(v, Number) else v for k, v in r.data.items()})
+                for r in records
+            )
+
+        assert rows(result) == rows(expected)
+        assert [f.name for f in result[0].schema.fields] == [
+            f.name for f in expected[0].schema.fields
+        ]
+        assert join_op.last_stats is not None
+        assert join_op.last_stats.strategy == JoinStrategy(strategy)
+        assert join_op.last_stats.output_rows == len(result)
+
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "full"])
+    def test_forced_sort_merge_sorts_unsorted_input(
+        self, customers: list[DataRecord], orders: list[DataRecord], how: str
+    ) -> None:
+        """Test a forced sort-merge sorts its inputs and matches null keys like the hash join."""
+        loose = Schema(name="loose")
+        left = [
+            *reversed(customers),
+            DataRecord(data={"customer_id": None, "name": "Nil"}, schema=loose),
+        ]
+        right = [
+            orders[2],
+            DataRecord(data={"order_id": 104, "customer_id": None, "amount": 5.0}, schema=loose),
+            *orders[:2],
+        ]
+
+        def rows(strategy: str) -> list[str]:
+            join_op = Join(
+                name=strategy, right_data=right, on="customer_id", how=how, strategy=strategy
+            )
+            return sorted(repr(record.data) for record in join_op.transform(left, ctx=None))
+
+        assert rows("sort_merge") == rows("broadcast_hash")
+        if how == "inner":
+            assert len(rows("sort_merge")) == 4
+
+    def test_forced_sort_merge_rejects_incomparable_keys(
+        self, customers: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test keys that cannot be ordered raise instead of dropping matches."""
+        dee = DataRecord(data={"customer_id": "4", "name": "Dee"}, schema=Schema(name="loose"))
+        left = [*customers, dee]
+        join_op = Join(name="merge", right_data=orders, on="customer_id", strategy="sort_merge")
+
+        with pytest.raises(ValueError, match="not comparable"):
+            join_op.transform(left, ctx=None)
+
+    def test_default_strategy_is_backend(
+        self, customers: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test the backend join stays the default for small right sides."""
+        join_op = Join(name="default", right_data=orders, on="customer_id")
+
+        join_op.transform(customers, ctx=None)
+
+        assert join_op.last_stats is not None
+        assert join_op.last_stats.strategy == JoinStrategy.BACKEND
+
+    def test_broadcast_index_reused(
+        self, customers: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test the right-side index is reused while right_version is unchanged."""
+        join_op = Join(
+            name="broadcast",
+            right_data=orders,
+            on="customer_id",
+            how="left",
+            strategy="broadcast_hash",
+            right_version=1,
+        )
+
+        first = join_op.transform(customers, ctx=None)
+        assert join_op.last_stats is not None
+        assert join_op.last_stats.strategy == JoinStrategy.BROADCAST_HASH
+        assert not join_op.last_stats.index_reused
+
+        second = join_op.transform(customers[:1], ctx=None)
+        assert join_op.last_stats.index_reused
+        assert join_op.last_stats.left_rows == 1
+        assert [r.data for r in second] == [r.data for r in first[:2]]
+
+        # A new version invalidates the index
+        join_op.right_version = 2
+        join_op.transform(customers, ctx=None)
+        assert not join_op.last_stats.index_reused
+
+        # So does replacing the right side
+        join_op.right_data = orders[:1]
+        join_op.transform(customers, ctx=None)
+        assert not join_op.last_stats.index_reused
+
+    def test_unversioned_index_sees_in_place_changes(
+        self, customers: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test the index is rebuilt per call when right_version is not set."""
+        right = list(orders)
+        join_op = Join(
+            name="broadcast", right_data=right, on="customer_id", strategy="broadcast_hash"
+        )
+        assert len(join_op.transform(customers, ctx=None)) == 3
+
+        right[0] = DataRecord(data={**orders[0].data, "customer_id": 3}, schema=orders[0].schema)
+        result = join_op.transform(customers, ctx=None)
+
+        assert join_op.last_stats is not None
+        assert not join_op.last_stats.index_reused
+        assert sorted(r.data["customer_id"] for r in result) == [1, 2, 3]
+
+    def test_auto_strategy_selection(
+        self, customers: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test AUTO picks sort-merge for sorted inputs and grace hash for large ones."""
+        sorted_orders = sorted(orders, key=lambda r: r.data["customer_id"])
+        join_op = Join(
+            name="auto",
+            right_data=sorted_orders,
+            on="customer_id",
+            strategy="auto",
+            broadcast_threshold=0,
+        )
+        join_op.transform(customers, ctx=None)
+        assert join_op.last_stats is not None
+        assert join_op.last_stats.strategy == JoinStrategy.SORT_MERGE
+
+        join_op = Join(
+            name="auto",
+            right_data=list(reversed(orders)),
+            on="customer_id",
+            strategy="auto",
+            broadcast_threshold=0,
+            spill_threshold=1,
+            spill_partitions=2,
+        )
+        result = join_op.transform(customers, ctx=None)
+        assert join_op.last_stats is not None
+        assert join_op.last_stats.strategy == JoinStrategy.GRACE_HASH
+        assert join_op.last_stats.spilled_bytes > 0
+        assert len(result) == 3
+
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "full"])
+    def test_transform_chunks_streams_grace_join(
+        self,
+        tmp_path: Path,
+        customers: list[DataRecord],
+        orders: list[DataRecord],
+        how: str,
+    ) -> None:
+        """Test a chunked left side joins partition by partition and cleans up."""
+        expected = Join(
+            name="grace", right_data=orders, on="customer_id", how=how, strategy="grace_hash"
+        ).transform(customers, ctx=None)
+        join_op = Join(
+            name="chunks",
+            right_data=orders,
+            on="customer_id",
+            how=how,
+            spill_partitions=3,
+            spill_dir=tmp_path,
+        )
+        pulled: list[int] = []
+
+        def chunks() -> Iterator[list[DataRecord]]:
+            for i in range(0, len(customers), 2):
+                pulled.append(i)
+                yield customers[i : i + 2]
+
+        stream = join_op.transform_chunks(chunks())
+        assert not pulled
+        result = [record for batch in stream for record in batch]
+
+        assert sorted(map(repr, (r.data for r in result))) == sorted(
+            map(repr, (r.data for r in expected))
+        )
+        assert join_op.last_stats is not None
+        assert join_op.last_stats.strategy == JoinStrategy.GRACE_HASH
+        assert join_op.last_stats.left_rows == len(customers)
+        assert join_op.last_stats.output_rows == len(result)
+        assert not list(tmp_path.iterdir())
+
+    def test_invalid_join_strategy(self, orders: list[DataRecord]) -> None:
+        """Test unknown strategies are rejected."""
+        with pytest.raises(ValueError, match="Invalid join strategy"):
+            Join(name="bad", right_data=orders, on="customer_id", strategy="nested_loop")
+
 
 class TestAggregationOperators:
     """Tests for aggregation operations."""
@@ -292,8 +524,16 @@ class TestAggregationOperators:
 
         result = rollup_op.transform(sales_data, ctx=None)
 
-        # Should have grand total + category totals + detail rows
-        assert len(result) > 0
+        # Grand total + category subtotals + detail rows
+        assert [(r.get("category"), r.get("product"), r.get("total")) for r in result] == [
+            (None, None, 700.0),
+            ("A", None, 250.0),
+            ("B", None, 450.0),
+            ("A", "P1", 100.0),
+            ("A", "P2", 150.0),
+            ("B", "P1", 200.0),
+            ("B", "P2", 250.0),
+        ]
 
     def test_cube(self, sales_data: list[DataRecord]) -> None:
         """Test cube aggregation."""
@@ -308,6 +548,114 @@ class TestAggregationOperators:
         # Cube should create all combinations
         assert len(result) > 0
 
+        # Grand total + 2 categories + 2 products + 4 details
+        assert len(result) == 9
+        product_totals = {
+            r.get("product"): r.get("total") for r in result if r.get("category") is None
+        }
+        assert product_totals == {None: 700.0, "P1": 300.0, "P2": 400.0}
+
+    def test_groupby_chunks_match_single_pass(self, sales_data: list[DataRecord]) -> None:
+        """Test merging per-chunk partial aggregates gives the single-pass result."""
+        groupby_op = GroupBy(
+            name="chunked",
+            group_by="category",
+            aggregations=[
+                Sum("amount", "total"),
+                Count("amount", "n"),
+                Avg("amount", "mean"),
+                Min("amount", "low"),
+                Max("amount", "high"),
+                Variance("amount", "var"),
+                StdDev("amount", "std", ddof=0),
+            ],
+        )
+        chunks = [sales_data[:1], sales_data[1:3], sales_data[3:]]
+
+        single = groupby_op.finalize(groupby_op.partial(sales_data))
+        chunked = groupby_op.transform_chunks(chunks)
+        parallel = groupby_op.transform_chunks(chunks, max_workers=3)
+
+        for result in (chunked, parallel):
+            assert len(result) == len(single)
+            for actual, expected in zip(result, single, strict=True):
+                assert actual.data == pytest.approx(expected.data)
+        assert single[0].data == pytest.approx(
+            {
+                "category": "A",
+                "total": 250.0,
+                "n": 2,
+                "mean": 125.0,
+                "low": 100.0,
+                "high": 150.0,
+                "var": 1250.0,
+                "std": 25.0,
+            }
+        )
+
+    def test_parallel_chunks_are_read_lazily(self, sales_data: list[DataRecord]) -> None:
+        """Test parallel chunk aggregation keeps a bounded number of chunks in flight."""
+        groupby_op = GroupBy(name="lazy", group_by="category", aggregations=[Sum("amount", "t")])
+        partial = groupby_op.partial
+        done: list[int] = []
+        ahead: list[int] = []
+
+        def counted_partial(chunk):
+            result = partial(chunk)
+            done.append(1)
+            return result
+
+        def chunks():
+            for produced in range(1, 51):
+                ahead.append(produced - len(done))
+                yield sales_data
+
+        groupby_op.partial = counted_partial
+        result = groupby_op.transform_chunks(chunks(), max_workers=2)
+
+        assert len(done) == 50
+        assert max(ahead) <= 2 * 2 + 1
+        assert result[0].data["t"] == 50 * 250.0
+
+    def test_executor_chunks_in_flight_follow_max_workers(
+        self, sales_data: list[DataRecord]
+    ) -> None:
+        """Test a given executor keeps max_workers' worth of chunks in flight."""
+        groupby_op = GroupBy(name="lazy", group_by="category", aggregations=[Sum("amount", "t")])
+        partial = groupby_op.partial
+        done: list[int] = []
+        ahead: list[int] = []
+
+        def counted_partial(chunk):
+            result = partial(chunk)
+            done.append(1)
+            return result
+
+        def chunks():
+            for produced in range(1, 51):
+                ahead.append(produced - len(done))
+                yield sales_data
+
+        groupby_op.partial = counted_partial
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            result = groupby_op.transform_chunks(chunks(), max_workers=1, executor=pool)
+
+        assert len(done) == 50
+        assert max(ahead) <= 1 * 2 + 1
+        assert result[0].data["t"] == 50 * 250.0
+
+    def test_partial_matches_backend_groupby(self, sales_data: list[DataRecord]) -> None:
+        """Test partial aggregation agrees with the backend groupby."""
+        groupby_op = GroupBy(
+            name="compare",
+            group_by="category",
+            aggregations=[Sum("amount", "total"), Avg("amount", "mean")],
+        )
+
+        expected = [r.data for r in groupby_op.transform(sales_data, ctx=None)]
+
+        assert [r.data for r in groupby_op.transform_chunks([sales_data])] == expected
+
 
 class TestWindowFunctions:
     """Tests for window function operations."""
@@ -399,6 +747,111 @@ class TestWindowFunctions:
         assert lag_func.column == "value"
         assert lag_func.offset == 1
 
+    def test_rank_and_dense_rank_ties(self, sales_schema: Schema) -> None:
+        """Test ties in the order columns share a rank."""
+        amounts = [("A", 10.0), ("A", 20.0), ("A", 20.0), ("A", 30.0), ("B", 5.0), ("B", 5.0)]
+        data = [
+            DataRecord(
+                data={"category": c, "product": "P", "amount": a, "date": "2024-01-01"},
+                schema=sales_schema,
+            )
+            for c, a in amounts
+        ]
+        window_op = Window(
+            name="ranks",
+            functions=[Rank("rank"), DenseRank("dense_rank")],
+            partition_by="category",
+            order_by="amount",
+        )
+
+        result = window_op.transform(data, ctx=None)
+
+        ranks = [(r.get("category"), r.get("rank"), r.get("dense_rank")) for r in result]
+        assert ranks == [
+            ("B", 1, 1),
+            ("B", 1, 1),
+            ("A", 1, 1),
+            ("A", 2, 2),
+            ("A", 2, 2),
+            ("A", 4, 3),
+        ]
+
+    def test_running_and_moving_aggregates(self, sales_data: list[DataRecord]) -> None:
+        """Test cumulative and row-frame aggregates within partitions."""
+        window_op = Window(
+            name="running",
+            functions=[
+                WindowSum("amount", alias="running_total"),
+                WindowCount("amount", alias="running_count"),
+                WindowMax("amount", alias="running_max"),
+                WindowAvg("amount", preceding=1, alias="moving_avg"),
+            ],
+            partition_by="category",
+            order_by="date",
+        )
+
+        result = window_op.transform(sales_data, ctx=None)
+
+        rows = {r.get("product") + r.get("category"): r.data for r in result}
+        assert rows["P1A"]["running_total"] == 100.0
+        assert rows["P2A"]["running_total"] == 250.0
+        assert rows["P2A"]["running_count"] == 2
+        assert rows["P2A"]["moving_avg"] == 125.0
+        assert rows["P2B"]["running_max"] == 250.0
+        assert rows["P1B"]["moving_avg"] == 200.0
+
+    def test_time_range_frame(self, sales_schema: Schema) -> None:
+        """Test RANGE BETWEEN INTERVAL frames over a datetime order column."""
+        dates = ["2024-01-01", "2024-01-02", "2024-01-05", "2024-01-06"]
+        data = [
+            DataRecord(
+                data={"category": "A", "product": "P", "amount": 1.0, "date": d},
+                schema=sales_schema,
+            )
+            for d in dates
+        ]
+        window_op = Window(
+            name="two_days",
+            functions=[WindowSum("amount", interval="1D", alias="sum_1d")],
+            order_by="date",
+        )
+
+        result = window_op.transform(data, ctx=None)
+
+        assert [r.get("sum_1d") for r in result] == [1.0, 2.0, 1.0, 2.0]
+
+        descending = Window(
+            name="bad",
+            functions=[WindowSum("amount", interval="1D")],
+            order_by="date desc",
+        )
+        with pytest.raises(ValueError, match="time-range frame"):
+            descending.transform(data, ctx=None)
+
+    def test_transform_stream(self, sales_data: list[DataRecord]) -> None:
+        """Test streaming partitions gives the same rows as a full transform."""
+        window_op = Window(
+            name="stream",
+            functions=[RowNumber("rn"), Lag("amount", alias="prev")],
+            partition_by="category",
+            order_by="amount desc",
+        )
+
+        streamed = list(window_op.transform_stream(iter(sales_data), ctx=None))
+        expected = window_op.transform(sales_data, ctx=None)
+
+        def key(r: DataRecord) -> str:
+            return r.get("product") + r.get("category")
+
+        assert sorted((r.data for r in streamed), key=str) == sorted(
+            (r.data for r in expected), key=str
+        )
+        assert {key(r): r.get("rn") for r in streamed} == {key(r): r.get("rn") for r in expected}
+
+        interleaved = [sales_data[0], sales_data[2], sales_data[1]]
+        with pytest.raises(ValueError, match="reappeared"):
+            list(window_op.transform_stream(interleaved, ctx=None))
+
 
 class TestPivotUnpivot:
     """Tests for pivot and unpivot operations."""
@@ -447,6 +900,118 @@ class TestPivotUnpivot:
         assert "category" in result[0].data
         assert "amount" in result[0].data
 
+    def test_pivot_chunks_match_transform(self, sales_data: list[DataRecord]) -> None:
+        """Test the columnar pivot gives the same records as the backend pivot."""
+        pivot_op = Pivot(
+            name="pivot", index="product", columns="category", values="amount", aggfunc="sum"
+        )
+
+        expected = pivot_op.transform(sales_data, ctx=None)
+        chunked = pivot_op.transform_chunks([sales_data[:1], sales_data[1:3], sales_data[3:]])
+
+        assert [r.data for r in chunked] == [r.data for r in expected]
+
+    @pytest.mark.parametrize("aggfunc", ["first", "last", "median", "nunique"])
+    def test_pivot_chunk_aggfuncs(self, aggfunc: str) -> None:
+        """Test running and per-column reduced aggregations match pandas."""
+        batch = {
+            "id": [1, 1, 1, 2, 2, 3],
+            "key": ["x", "x", "y", "x", "x", "y"],
+            "value": [4.0, 1.0, 2.0, 3.0, 3.0, 5.0],
+        }
+        pivot_op = Pivot(name="pivot", index="id", columns="key", values="value", aggfunc=aggfunc)
+
+        result = pivot_op.transform_chunks([batch])
+
+        expected = pd.DataFrame(batch).pivot_table(
+            index="id", columns="key", values="value", aggfunc=aggfunc
+        )
+        assert [r.data for r in result] == [
+            {
+                "id": key,
+                **{
+                    label: None if pd.isna(value) else value
+                    for label, value in expected.loc[key].items()
+                },
+            }
+            for key in expected.index
+        ]
+
+    def test_pivot_column_batch(self) -> None:
+        """Test pivoting a column batch instead of records."""
+        batch = {"id": [1, 1, 2], "key": ["x", "y", "x"], "value": [1.0, 2.0, 3.0]}
+        pivot_op = Pivot(name="pivot", index="id", columns="key", values="value", aggfunc="max")
+
+        result = pivot_op.transform_chunks([batch])
+
+        assert [r.data for r in result] == [
+            {"id": 1, "x": 1.0, "y": 2.0},
+            {"id": 2, "x": 3.0, "y": None},
+        ]
+
+    def test_pivot_domain_and_sparse(self, sales_data: list[DataRecord]) -> None:
+        """Test a declared domain fixes the columns and sparse output skips empty cells."""
+        pivot_op = Pivot(
+            name="pivot",
+            index="category",
+            columns="product",
+            values="amount",
+            aggfunc="sum",
+            domain=["P2", "P3"],
+            sparse=True,
+        )
+
+        result = pivot_op.transform(sales_data, ctx=None)
+
+        assert [f.name for f in result[0].schema.fields] == ["category", "P2", "P3"]
+        assert [r.data for r in result] == [
+            {"category": "A", "P2": 150.0},
+            {"category": "B", "P2": 250.0},
+        ]
+
+    def test_pivot_stream(self, sales_data: list[DataRecord]) -> None:
+        """Test streaming pivots keep the schema sampled from the first chunk."""
+        pivot_op = Pivot(
+            name="pivot", index="category", columns="product", values="amount", fill_value=0
+        )
+
+        chunks = list(pivot_op.transform_stream([sales_data[:2], sales_data[2:3], sales_data[3:]]))
+
+        # Category B spans the last two chunks, so it is emitted at the end
+        assert [[r.data for r in chunk] for chunk in chunks] == [
+            [],
+            [{"category": "A", "P1": 100.0, "P2": 150.0}],
+            [],
+            [{"category": "B", "P1": 200.0, "P2": 250.0}],
+        ]
+        with pytest.raises(ValueError, match="not in the domain"):
+            list(pivot_op.transform_stream([sales_data[:1], sales_data[1:]]))
+
+        interleaved = [sales_data[:1], sales_data[2:3], sales_data[:1]]
+        with pytest.raises(ValueError, match="reappeared"):
+            list(pivot_op.transform_stream(interleaved))
+
+    def test_unpivot_dropna(self, sales_data: list[DataRecord]) -> None:
+        """Test unpivoting sparse pivot output skips the empty cells."""
+        pivoted = Pivot(
+            name="pivot",
+            index="category",
+            columns="product",
+            values="amount",
+            domain=["P1", "P3"],
+            sparse=True,
+        ).transform(sales_data, ctx=None)
+        unpivot_op = Unpivot(
+            name="unpivot", id_vars="category", value_vars=["P1", "P3"], dropna=True
+        )
+
+        result = unpivot_op.transform(pivoted, ctx=None)
+
+        assert [r.data for r in result] == [
+            {"category": "A", "variable": "P1", "value": 100.0},
+            {"category": "B", "variable": "P1", "value": 200.0},
+        ]
+
 
 class TestTransformationBuilder:
     """Tests for transformation builder API."""
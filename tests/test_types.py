@@ -856,6 +856,53 @@ class TestAssetGraph:
         with pytest.raises(ValueError, match="not found in graph"):
             graph.get_downstream("nonexistent")
 
+    def test_topological_levels(self) -> None:
+        """Test assets are grouped by their deepest dependency."""
+        assets = tuple(
+            Asset(name=name, asset_type=AssetType.MEMORY, uri=f"memory://{name}")
+            for name in ("a", "b", "c", "d")
+        )
+        graph = AssetGraph(
+            name="levels",
+            assets=assets,
+            dependencies={"b": ("a",), "c": ("a",), "d": ("b", "c")},
+        )
+
+        assert graph.topological_levels() == (("a",), ("b", "c"), ("d",))
+        assert graph.topological_order() == ("a", "b", "c", "d")
+
+    def test_deep_graph_does_not_recurse(self) -> None:
+        """Test very deep chains validate and traverse without hitting the recursion limit."""
+        size = 5000
+        assets = tuple(
+            Asset(name=f"asset_{i}", asset_type=AssetType.MEMORY, uri=f"memory://asset_{i}")
+            for i in range(size)
+        )
+        graph = AssetGraph(
+            name="deep",
+            assets=assets,
+            dependencies={f"asset_{i}": (f"asset_{i - 1}",) for i in range(1, size)},
+        )
+
+        assert len(graph.get_upstream(f"asset_{size - 1}")) == size - 1
+        assert len(graph.get_downstream("asset_0", depth=3)) == 3
+        assert len(graph.topological_levels()) == size
+
+    def test_traversals_are_memoized(self) -> None:
+        """Test repeated traversals reuse the cached result."""
+        raw = Asset(name="raw", asset_type=AssetType.TABLE, uri="db://raw")
+        cleaned = Asset(name="cleaned", asset_type=AssetType.TABLE, uri="db://cleaned")
+        graph = AssetGraph(
+            name="memo",
+            assets=(raw, cleaned),
+            dependencies={"cleaned": ("raw",)},
+        )
+
+        assert graph.topological_order() is graph.topological_order()
+        assert graph.get_downstream("raw") == (cleaned,)
+        assert graph.get_dependents("raw") == (cleaned,)
+        assert graph.get_asset("cleaned") is cleaned
+
 
 class TestMaterializationStrategy:
     """Tests for MaterializationStrategy enum."""
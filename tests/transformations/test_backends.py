@@ -0,0 +1,236 @@
+"""
+Tests for transformation execution backends.
+
+Every operator is run on pandas and on each installed native backend, and the
+results must match.
+"""
+
+import math
+from typing import Any
+
+import pytest
+
+from vibe_piper import DataRecord, DataType, PipelineContext, Schema, SchemaField
+from vibe_piper.transformations import (
+    Avg,
+    Count,
+    GroupBy,
+    Join,
+    Max,
+    Min,
+    Pivot,
+    Sum,
+    TransformationBuilder,
+    Unpivot,
+    Window,
+    get_default_backend,
+    set_default_backend,
+)
+from vibe_piper.transformations.aggregations import AggregationFunction
+from vibe_piper.transformations.backends import PandasBackend, get_backend, resolve_backend
+from vibe_piper.transformations.windows import Lag, Lead, Rank, RowNumber
+
+NATIVE_BACKENDS = [
+    pytest.param(
+        name,
+        marks=pytest.mark.skipif(
+            not get_backend(name).is_available(), reason=f"{name} not installed"
+        ),
+    )
+    for name in ("polars", "duckdb")
+]
+
+
+@pytest.fixture
+def sales() -> list[DataRecord]:
+    """Create sales records, including a null amount and a null region."""
+    schema = Schema(
+        name="sales",
+        fields=(
+            SchemaField(name="id", data_type=DataType.INTEGER),
+            SchemaField(name="region", data_type=DataType.STRING, nullable=True),
+            SchemaField(name="month", data_type=DataType.STRING),
+            SchemaField(name="amount", data_type=DataType.FLOAT, nullable=True),
+        ),
+    )
+    rows = [
+        (1, "north", "jan", 10.0),
+        (2, "north", "feb", 20.0),
+        (3, "south", "jan", 5.0),
+        (4, "south", "feb", None),
+        (5, "south", "jan", 7.5),
+        (6, None, "mar", 1.0),
+    ]
+    return [
+        DataRecord(data={"id": i, "region": r, "month": m, "amount": a}, schema=schema)
+        for i, r, m, a in rows
+    ]
+
+
+@pytest.fixture
+def regions() -> list[DataRecord]:
+    """Create region records with a column that collides with sales."""
+    schema = Schema(
+        name="regions",
+        fields=(
+            SchemaField(name="region", data_type=DataType.STRING),
+            SchemaField(name="manager", data_type=DataType.STRING),
+            SchemaField(name="amount", data_type=DataType.FLOAT),
+        ),
+    )
+    rows = [("north", "ana", 1.0), ("west", "bo", 2.0)]
+    return [
+        DataRecord(data={"region": r, "manager": m, "amount": a}, schema=schema) for r, m, a in rows
+    ]
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize values that differ only in representation across engines."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if hasattr(value, "item"):
+        return _normalize(value.item())
+    return value
+
+
+def _rows(records: list[DataRecord]) -> list[dict[str, Any]]:
+    """Normalized row dicts in output order."""
+    return [{k: _normalize(v) for k, v in record.data.items()} for record in records]
+
+
+def _assert_equivalent(op: Any, data: list[DataRecord], backend: str, ordered: bool = True) -> None:
+    """Run an operator on pandas and a native backend and compare the results."""
+    op.backend = "pandas"
+    expected = op.transform(data, None)
+    op.backend = backend
+    actual = op.transform(data, None)
+
+    if ordered:
+        assert _rows(actual) == _rows(expected)
+    else:
+        assert sorted(map(repr, _rows(actual))) == sorted(map(repr, _rows(expected)))
+    if expected:
+        assert [f.name for f in actual[0].schema.fields] == [
+            f.name for f in expected[0].schema.fields
+        ]
+
+
+@pytest.mark.parametrize("backend", NATIVE_BACKENDS)
+class TestBackendEquivalence:
+    """Native backends produce the same records as pandas."""
+
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "full"])
+    def test_join(
+        self,
+        backend: str,
+        how: str,
+        sales: list[DataRecord],
+        regions: list[DataRecord],
+    ) -> None:
+        """Test joins, including suffixed overlapping columns."""
+        op = Join(name="join", right_data=regions, on="region", how=how, strategy="backend")
+        # Null keys sort differently on outer joins, so only compare contents there
+        _assert_equivalent(op, sales, backend, ordered=how != "full")
+
+    def test_groupby(self, backend: str, sales: list[DataRecord]) -> None:
+        """Test every native aggregation, with null keys dropped."""
+        op = GroupBy(
+            name="groupby",
+            group_by=["region"],
+            aggregations=[
+                Sum("amount", "total"),
+                Count("amount", "n"),
+                Avg("amount", "mean"),
+                Min("amount", "low"),
+                Max("amount", "high"),
+            ],
+        )
+        _assert_equivalent(op, sales, backend)
+
+    def test_window(self, backend: str, sales: list[DataRecord]) -> None:
+        """Test row numbers, lags and leads within ordered partitions."""
+        op = Window(
+            name="window",
+            functions=[
+                RowNumber("rn"),
+                Lag("id", alias="prev_id"),
+                Lead("id", default=0, alias="next_id"),
+            ],
+            partition_by="month",
+            order_by="id desc",
+        )
+        _assert_equivalent(op, sales, backend)
+
+    def test_pivot(self, backend: str, sales: list[DataRecord]) -> None:
+        """Test pivoting with sorted labels and fill values."""
+        op = Pivot(
+            name="pivot",
+            index="region",
+            columns="month",
+            values="amount",
+            aggfunc="sum",
+            fill_value=0,
+        )
+        _assert_equivalent(op, sales, backend)
+
+    def test_unpivot(self, backend: str, sales: list[DataRecord]) -> None:
+        """Test unpivoting column by column."""
+        op = Unpivot(name="unpivot", id_vars="id", value_vars=["region", "month"])
+        _assert_equivalent(op, sales, backend)
+
+    def test_builder_plan(
+        self, backend: str, sales: list[DataRecord], regions: list[DataRecord]
+    ) -> None:
+        """Test a builder pipeline gives the same result on every backend."""
+
+        def run(name: str) -> list[DataRecord]:
+            return (
+                TransformationBuilder(sales, backend=name)
+                .join(regions, on="region", how="left")
+                .groupby(["region"], [Sum("amount_x", "total")])
+                .execute()
+            )
+
+        assert _rows(run(backend)) == _rows(run("pandas"))
+
+
+class TestBackendSelection:
+    """Tests for choosing and falling back between backends."""
+
+    def test_custom_aggregation_falls_back_to_pandas(self) -> None:
+        """Test operators with custom functions run on pandas."""
+
+        class Median(AggregationFunction):
+            def apply(self, series: Any) -> Any:
+                return series.median()
+
+        op = GroupBy(name="median", group_by="region", aggregations=[Median("amount")])
+        op.backend = "duckdb"
+
+        assert isinstance(resolve_backend("groupby", op), PandasBackend)
+
+    def test_unsupported_window_function_falls_back(self) -> None:
+        """Test window functions without a native equivalent run on pandas."""
+        op = Window(name="rank", functions=[Rank("rank")], backend="polars")
+
+        assert isinstance(resolve_backend("window", op), PandasBackend)
+
+    def test_context_and_default_selection(self) -> None:
+        """Test operator, pipeline and global backend precedence."""
+        op = GroupBy(name="sum", group_by="region", aggregations=[Sum("amount")])
+        ctx = PipelineContext(pipeline_id="p", run_id="r", config={"transform_backend": "pandas"})
+        previous = get_default_backend()
+        try:
+            set_default_backend("duckdb")
+            assert resolve_backend("groupby", op, ctx).name == "pandas"
+            op.backend = "pandas"
+            assert resolve_backend("groupby", op).name == "pandas"
+        finally:
+            set_default_backend(previous)
+
+    def test_unknown_backend(self) -> None:
+        """Test unknown backend names are rejected."""
+        with pytest.raises(ValueError, match="Unknown transformation backend"):
+            set_default_backend("spark")
@@ -11,6 +11,7 @@ from vibe_piper import DataRecord, DataType, PipelineContext, Schema, SchemaFiel
 from vibe_piper.transformations import (
     Avg,
     Count,
+    StepKind,
     Sum,
     TransformationBuilder,
     compute_field,
@@ -74,6 +75,18 @@ class TestTransformationBuilderBasics:
         builder = TransformationBuilder(sample_data, context)
         assert builder.context.pipeline_id == "test"
 
+    def test_transformations_are_writable(self, sample_data: list[DataRecord]) -> None:
+        """Test functions added through builder.transformations run as custom steps."""
+        builder = TransformationBuilder(sample_data).filter(lambda r: r.get("active"))
+        builder.transformations.append(lambda data: data[:2])
+        assert [step.kind for step in builder.plan] == [StepKind.FILTER, StepKind.CUSTOM]
+        assert [r.get("id") for r in builder.execute()] == [1, 2]
+
+        builder.transformations = [lambda data: data[-1:]]
+        assert [r.get("id") for r in builder.execute()] == [4]
+        with pytest.warns(DeprecationWarning):
+            assert [r.get("id") for r in builder._current_data] == [4]
+
     def test_transform_convenience_function(self, sample_data: list[DataRecord]) -> None:
         """Test transform() convenience function."""
         builder = transform(sample_data)
@@ -384,3 +397,103 @@ class TestIntegrationWithExistingTransforms:
         )
 
         assert len(result) == 2
+
+
+class TestPlanOptimizer:
+    """Test logical plan optimization."""
+
+    @pytest.fixture
+    def orders(self) -> list[DataRecord]:
+        """Create orders keyed by category."""
+        schema = Schema(
+            name="orders",
+            fields=(
+                SchemaField(name="category", data_type=DataType.STRING),
+                SchemaField(name="order_count", data_type=DataType.INTEGER),
+                SchemaField(name="note", data_type=DataType.STRING),
+            ),
+        )
+        return [
+            DataRecord(data={"category": "A", "order_count": 3, "note": "x"}, schema=schema),
+            DataRecord(data={"category": "B", "order_count": 5, "note": "y"}, schema=schema),
+        ]
+
+    def test_consecutive_record_steps_are_fused(self, sample_data: list[DataRecord]) -> None:
+        """Test filters and maps run as a single pass."""
+        builder = (
+            TransformationBuilder(sample_data)
+            .filter(lambda r: r.get("active"))
+            .map(lambda r: r)
+            .filter("not_null", field="name")
+        )
+
+        plan = builder.optimized_plan()
+
+        assert len(plan) == 1
+        assert plan[0].kind == StepKind.FUSED
+        assert "fused pass (3 steps)" in builder.explain()
+        assert len(builder.execute()) == 3
+
+    def test_filter_pushed_below_join(
+        self, sample_data: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test a filter on left columns runs before the join."""
+        builder = (
+            TransformationBuilder(sample_data)
+            .join(orders, on="category", how="left")
+            .filter("equals", field="category", value="A")
+        )
+
+        kinds = [step.kind for step in builder.optimized_plan()]
+
+        assert kinds == [StepKind.FILTER, StepKind.JOIN]
+        result = builder.execute()
+        assert {r.get("name") for r in result} == {"Alice", "Charlie"}
+
+    def test_filter_on_right_columns_not_pushed(
+        self, sample_data: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test a filter reading joined columns stays after the join."""
+        builder = (
+            TransformationBuilder(sample_data)
+            .join(orders, on="category")
+            .filter("equals", field="order_count", value=5)
+        )
+
+        kinds = [step.kind for step in builder.optimized_plan()]
+
+        assert kinds == [StepKind.JOIN, StepKind.FILTER]
+
+    def test_unused_columns_pruned_before_groupby(
+        self, sample_data: list[DataRecord], orders: list[DataRecord]
+    ) -> None:
+        """Test only the columns a groupby reads are carried through a join."""
+        builder = (
+            TransformationBuilder(sample_data)
+            .filter("equals", field="active", value=True)
+            .join(orders, on="category")
+            .groupby(["category"], [Sum("order_count", "orders")])
+        )
+
+        explained = builder.explain()
+        result = builder.execute()
+
+        assert "project(active, category, order_count)" in explained
+        assert "pruned right: note" in explained
+        assert {r.get("category"): r.get("orders") for r in result} == {"A": 3, "B": 10}
+
+    def test_optimized_matches_unoptimized(self, sample_data: list[DataRecord]) -> None:
+        """Test optimization does not change results."""
+
+        def build(optimize: bool) -> TransformationBuilder:
+            return (
+                TransformationBuilder(sample_data, optimize=optimize)
+                .filter(lambda r: r.get("value") > 100, columns=["value"])
+                .groupby(["category"], [Sum("value", "total"), Count("id")])
+                .filter("equals", field="category", value="B")
+            )
+
+        optimized = build(optimize=True)
+
+        assert optimized.optimized_plan()[0].kind == StepKind.FUSED
+        assert [r.data for r in optimized.execute()] == [r.data for r in build(False).execute()]
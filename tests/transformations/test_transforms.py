@@ -16,6 +16,7 @@ from vibe_piper.transformations import (
     enrich_from_lookup,
     extract_fields,
     extract_nested_value,
+    filter_by_expression,
     filter_by_field,
     filter_rows,
     map_field,
@@ -269,6 +270,54 @@ class TestComputeFieldFromExpression:
 
         assert result[0].get("computed") is None
 
+    def test_compute_from_case_expression(self, sample_data: list[DataRecord]) -> None:
+        """Test computing a label with CASE and string functions."""
+        transform = compute_field_from_expression(
+            "label",
+            "CASE WHEN status = 'A' THEN upper(name) WHEN age < 28 THEN 'young' ELSE 'other' END",
+        )
+        result = transform(sample_data)
+
+        assert [r.get("label") for r in result] == ["ALICE", "young", "CHARLIE", "other"]
+
+    def test_compute_rejects_invalid_expression(self) -> None:
+        """Test invalid expressions fail when the transform is created."""
+        with pytest.raises(ValueError, match="Unknown function"):
+            compute_field_from_expression("x", "__import__('os')")
+
+
+class TestFilterByExpression:
+    """Test filter_by_expression transformation."""
+
+    def test_filter_with_expression(self, sample_data: list[DataRecord]) -> None:
+        """Test filtering with a compound condition."""
+        transform = filter_by_expression("age >= 28 and status in ('A', 'P') and name like 'C%'")
+        result = transform(sample_data)
+
+        assert [r.get("id") for r in result] == [3]
+
+    def test_filter_matches_row_evaluation(self, sample_schema: Schema) -> None:
+        """Test large (vectorized) batches agree with row-by-row evaluation."""
+        data = [
+            DataRecord(
+                data={
+                    "id": i,
+                    "name": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "age": i % 50,
+                    "status": "AIP"[i % 3],
+                },
+                schema=sample_schema,
+            )
+            for i in range(500)
+        ]
+        condition = "age * 2 > 40 and not (status = 'I') or id % 97 = 0"
+        transform = filter_by_expression(condition)
+
+        expected = [r for r in data if (r.get("age") * 2 > 40 and r.get("status") != "I")]
+        expected_ids = {r.get("id") for r in expected} | {i for i in range(500) if i % 97 == 0}
+        assert [r.get("id") for r in transform(data)] == sorted(expected_ids)
+
 
 class TestFilterRows:
     """Test filter_rows transformation."""
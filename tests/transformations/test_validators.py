@@ -1,13 +1,16 @@
 """
 Tests for validation helpers.
 
-Tests for validate_record, validate_batch, field validators, and validator creators.
+Tests for validate_record, validate_batch, field validators, validator creators,
+and the compiled SchemaValidator.
 """
 
+import numpy as np
 import pytest
 
 from vibe_piper import DataRecord, DataType, Schema, SchemaField
 from vibe_piper.transformations.validators import (
+    SchemaValidator,
     create_filter_validator,
     create_validator_from_schema,
     validate_batch,
@@ -425,3 +428,89 @@ class TestCreateFilterValidator:
         assert validator(valid)
         assert not validator(invalid1)
         assert not validator(invalid2)
+
+
+# Records are built against an empty schema so invalid data can be constructed
+LOOSE_SCHEMA = Schema(name="loose")
+
+PRODUCT_SCHEMA = Schema(
+    name="products",
+    fields=(
+        SchemaField(name="id", data_type=DataType.INTEGER, constraints={"min_value": 1}),
+        SchemaField(
+            name="sku",
+            data_type=DataType.STRING,
+            constraints={"pattern": r"^[A-Z]{3}-\d+$", "max_length": 8},
+        ),
+        SchemaField(
+            name="status",
+            data_type=DataType.STRING,
+            required=False,
+            constraints={"enum": ["active", "retired"]},
+        ),
+        SchemaField(name="price", data_type=DataType.FLOAT, nullable=True),
+    ),
+)
+
+
+def _products(*rows: dict) -> list[DataRecord]:
+    """Create product records without schema checks."""
+    return [DataRecord(data=row, schema=LOOSE_SCHEMA) for row in rows]
+
+
+class TestSchemaValidator:
+    """Tests for the compiled batch validator."""
+
+    def test_error_bitmap_and_summary(self) -> None:
+        """Test each failed check is flagged on its row and counted."""
+        records = _products(
+            {"id": 1, "sku": "ABC-1", "status": "active", "price": 9.5},
+            {"id": 0, "sku": "abc-1", "price": None},
+            {"sku": "ABC-123456", "status": "sold", "price": "free"},
+        )
+
+        report = SchemaValidator(PRODUCT_SCHEMA).validate(records)
+
+        assert not report.is_valid
+        assert report.invalid_rows.tolist() == [1, 2]
+        assert report.failures("id:min_value").tolist() == [False, True, False]
+        assert report.failures("sku:pattern").tolist() == [False, True, False]
+        assert report.summary["id:required"] == 1
+        assert report.summary["sku:max_length"] == 1
+        assert report.summary["status:enum"] == 1
+        assert report.summary["price:type"] == 1
+        assert report.bitmap.shape == (3, 2)
+
+    def test_messages_match_validate_record(self) -> None:
+        """Test validate_batch messages are the same as per-record validation."""
+        records = _products(
+            {"id": "x", "sku": "", "status": None, "extra": 1},
+            {"id": 2, "sku": "ABC-1", "status": "active"},
+            {"id": -5, "status": "gone", "price": 1},
+        )
+
+        expected = [
+            f"Record {idx}: {error}"
+            for idx, record in enumerate(records)
+            for error in validate_record(record, PRODUCT_SCHEMA, strict=True).errors
+        ]
+        result = validate_batch(records, PRODUCT_SCHEMA, strict=True)
+
+        assert list(result.errors) == expected
+        assert result.warnings == ("Record 0: Field 'extra' is not defined in schema",)
+
+    def test_column_batch(self) -> None:
+        """Test validating a column batch, including typed arrays."""
+        batch = {
+            "id": np.array([1, 2, 0]),
+            "sku": ["ABC-1", "XYZ-22", "bad"],
+            "price": np.array([1.0, np.nan, 3.0]),
+        }
+
+        report = SchemaValidator(PRODUCT_SCHEMA).validate(batch)
+
+        assert report.invalid_rows.tolist() == [2]
+        assert report.to_validation_result().errors == (
+            "Record 2: Field 'id' is below minimum value 1",
+            "Record 2: Field 'sku' does not match pattern '^[A-Z]{3}-\\d+$'",
+        )
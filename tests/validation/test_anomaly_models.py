@@ -0,0 +1,183 @@
+"""
+Tests for fitted anomaly models and the model registry.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from vibe_piper.validation import (
+    AnomalyModelRegistry,
+    IQRModel,
+    IsolationForestModel,
+    RobustZScoreModel,
+    ZScoreModel,
+    detect_anomalies_iqr,
+    detect_anomalies_with_model,
+    detect_anomalies_zscore,
+    rank_anomalies,
+)
+
+
+@pytest.fixture
+def values():
+    """Normal values with a few extreme ones."""
+    sample = np.random.default_rng(0).normal(100, 10, 5_000)
+    sample[[10, 500, 4_000]] = [400.0, -250.0, 900.0]
+    return sample
+
+
+def _rows(values):
+    return [{"amount": float(value)} for value in values]
+
+
+class TestVectorizedDetectors:
+    """Test the array-based detectors against reference computations."""
+
+    def test_zscore_and_iqr_match_reference(self) -> None:
+        """Test scores and flags match the textbook formulas, skipping non-numbers."""
+        rows = _rows([1, 2, 3, 4, 5, 6, 7, 8, 9, 100]) + [{"amount": None}, {"amount": "x"}]
+
+        zscore = detect_anomalies_zscore("amount", threshold=2.0)(rows)
+        numbers = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 100], dtype=float)
+        expected = np.abs(numbers - numbers.mean()) / numbers.std(ddof=1)
+        assert zscore.anomaly_scores == pytest.approx(expected.tolist())
+        assert zscore.outlier_indices == (9,)
+
+        iqr = detect_anomalies_iqr("amount")(rows)
+        assert (iqr.statistics["q1"], iqr.statistics["q3"]) == (2.75, 8.25)
+        assert iqr.outlier_indices == (9,)
+
+    def test_rank_anomalies_orders_ties_by_record(self) -> None:
+        """Test ranking is descending by score with ties in record order."""
+        result = rank_anomalies("amount", top_n=2)(_rows([5, 1, 9, 5, 1, 9]))
+
+        assert result.ranked_indices == (1, 2, 4, 5, 0, 3)
+        assert result.top_n_indices == (1, 2)
+
+
+class TestAnomalyModels:
+    """Test models that learn online and score without refitting."""
+
+    def test_zscore_updates_match_full_moments(self, values) -> None:
+        """Test batch updates give the mean and std of all values."""
+        model = ZScoreModel().fit(values[:1_000])
+        for start in range(1_000, len(values), 700):
+            model.update(values[start : start + 700])
+
+        assert model.count == len(values)
+        assert model.mean == pytest.approx(values.mean())
+        assert model.std == pytest.approx(values.std(ddof=1))
+
+    def test_windowed_zscore_follows_recent_values(self) -> None:
+        """Test a windowed model forgets old values."""
+        model = ZScoreModel(window=1_000).fit(np.zeros(10_000))
+        for _ in range(10):
+            model.update(np.full(1_000, 50.0))
+
+        assert model.mean > 49
+
+    def test_sketch_models_approximate_exact_statistics(self, values) -> None:
+        """Test sketch-based median, MAD and quartiles are close to the exact ones."""
+        robust = RobustZScoreModel().fit(values)
+        median, mad = robust.median_mad()
+        assert median == pytest.approx(np.median(values), abs=1.0)
+        assert mad == pytest.approx(np.median(np.abs(values - np.median(values))), abs=1.0)
+
+        iqr = IQRModel().fit(values)
+        _, outliers = iqr.score(values)
+        assert set(np.flatnonzero(outliers).tolist()) >= {10, 500, 4_000}
+        assert iqr.statistics()["q1"] == pytest.approx(np.quantile(values, 0.25), abs=1.0)
+
+    def test_isolation_forest_refits_on_sample(self, values) -> None:
+        """Test the forest scores new data and refits on the kept sample."""
+        model = IsolationForestModel(sample_size=1_000).fit(values[:2_000])
+        estimator = model.estimator
+        model.update(values[2_000:])
+        _, outliers = model.score(np.array([100.0, 900.0]))
+
+        assert model.estimator is estimator
+        assert outliers.tolist() == [False, True]
+        model.refit()
+        assert model.estimator is not estimator
+        assert model.count == len(values)
+
+
+class TestModelRegistry:
+    """Test caching, persisting and reusing fitted models."""
+
+    def test_model_is_fitted_once(self, values) -> None:
+        """Test later batches are scored against the first batch's model."""
+        registry = AnomalyModelRegistry(storage_dir=None)
+        detector = detect_anomalies_with_model("amount", ZScoreModel(), registry, asset="a")
+
+        detector(_rows(values))
+        result = detector(_rows([100.0, 1_000.0]))
+
+        model = registry.get("a", "amount", "default", "zscore")
+        assert model.count == len(values)
+        assert result.outlier_indices == (1,)
+        assert result.statistics["mean"] == pytest.approx(values.mean())
+
+    def test_updates_and_persistence(self, values, tmp_path) -> None:
+        """Test updated models are saved and reloaded by a new registry."""
+        detector = detect_anomalies_with_model(
+            "amount",
+            IQRModel(),
+            AnomalyModelRegistry(tmp_path),
+            asset="orders",
+            baseline="2024",
+            update=True,
+        )
+        detector(_rows(values[:3_000]))
+        detector(_rows(values[3_000:]))
+
+        reloaded = AnomalyModelRegistry(tmp_path).get("orders", "amount", "2024", "iqr")
+        assert reloaded.count == len(values)
+        assert AnomalyModelRegistry(tmp_path).get("orders", "amount", "other", "iqr") is None
+
+    def test_changed_params_and_refit_interval(self, values, tmp_path) -> None:
+        """Test different parameters replace a model and stale models are refitted."""
+        registry = AnomalyModelRegistry(tmp_path, refit_interval=timedelta(hours=1))
+        first = registry.get_or_fit(ZScoreModel(), values, "a", "amount", "default")
+        assert registry.get_or_fit(ZScoreModel(), values[:10], "a", "amount", "default") is first
+
+        replaced = registry.get_or_fit(
+            ZScoreModel(threshold=4.0), values[:10], "a", "amount", "default"
+        )
+        assert replaced.count == 10
+
+        replaced.fitted_at = datetime.utcnow() - timedelta(hours=2)
+        refitted = registry.get_or_fit(ZScoreModel(threshold=4.0), values, "a", "amount", "default")
+        assert refitted.fitted_at > datetime.utcnow() - timedelta(minutes=1)
+        registry.delete("a", "amount", "default", "zscore")
+        assert AnomalyModelRegistry(tmp_path).get("a", "amount", "default", "zscore") is None
+
+    def test_shared_model_instance_is_not_cached(self, values) -> None:
+        """Test one model instance passed for several columns fits each separately."""
+        registry = AnomalyModelRegistry(storage_dir=None)
+        template = ZScoreModel()
+
+        prices = registry.get_or_fit(template, values, "a", "price", "default")
+        counts = registry.get_or_fit(template, values[:20] * 0 + 5.0, "a", "count", "default")
+
+        assert template.count == 0 and template.fitted_at is None
+        assert prices is not template and counts is not prices
+        assert prices.count == len(values)
+        assert prices.mean == pytest.approx(values.mean())
+        assert (counts.count, counts.mean) == (20, 5.0)
+
+    def test_refit_after_delete_and_double_fit(self, values) -> None:
+        """Test fit() starts over instead of adding to the previous fit."""
+        registry = AnomalyModelRegistry(storage_dir=None)
+        model = ZScoreModel()
+        registry.get_or_fit(model, values[:20], "a", "amount", "default")
+        registry.delete("a", "amount", "default", "zscore")
+
+        refitted = registry.get_or_fit(model, values[:20], "a", "amount", "default")
+        assert refitted.count == 20
+
+        for fresh in (ZScoreModel(), IQRModel(), IsolationForestModel(sample_size=100)):
+            fresh.fit(values[:20]).fit(values[:20])
+            assert fresh.count == 20
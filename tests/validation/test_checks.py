@@ -475,6 +475,65 @@ class TestDateValidation:
         assert not result.is_valid
 
 
+# =============================================================================
+# Approximate Checks
+# =============================================================================
+
+
+class TestApproximateChecks:
+    """Test sketch-based approximate checks."""
+
+    @pytest.fixture
+    def id_records(self):
+        """Create records with 20,000 distinct ids, two of them duplicated."""
+        schema = Schema(name="loose")
+        ids = [*range(20_000), 7, 19_999]
+        return [DataRecord(data={"id": i, "value": i % 101}, schema=schema) for i in ids]
+
+    def test_approximate_median(self, sample_records, id_records):
+        """Test approximate median agrees with the exact check."""
+        assert expect_column_median_to_be_between("age", 25, 35, approximate=True)(
+            sample_records
+        ).is_valid
+        assert expect_column_median_to_be_between("value", 48, 52, approximate=True)(
+            id_records
+        ).is_valid
+        result = expect_column_median_to_be_between("value", 60, 70, approximate=True)(id_records)
+        assert not result.is_valid
+        assert "median" in result.errors[0]
+
+    def test_approximate_unique_exact_below_sample_size(self, sample_records):
+        """Test small columns are checked exactly, including nulls."""
+        assert expect_column_values_to_be_unique("id", approximate=True)(sample_records).is_valid
+        schema = Schema(name="loose")
+        records = [DataRecord(data={"id": i}, schema=schema) for i in (1, 2, 3, None, None)]
+        assert expect_column_values_to_be_unique("id", approximate=True)(records).is_valid
+        result = expect_column_values_to_be_unique("id", ignore_nulls=False, approximate=True)(
+            records
+        )
+        assert not result.is_valid
+        assert "1 duplicate values" in result.errors[0]
+
+    def test_approximate_unique_on_sampled_column(self, id_records):
+        """Test duplicates are only reported when found, never invented."""
+        unique = expect_column_values_to_be_unique("id", approximate=True)(id_records[:20_000])
+        heavy = expect_column_values_to_be_unique("value", approximate=True)(id_records)
+
+        assert unique.is_valid
+        assert not heavy.is_valid
+        assert "101 duplicate values" in heavy.errors[0]
+
+    def test_approximate_unique_large_ids(self):
+        """Test distinct IDs beyond float precision are not reported as duplicates."""
+        schema = Schema(name="loose")
+        records = [
+            DataRecord(data={"id": 1_234_567_890_123_456_789 + i}, schema=schema)
+            for i in range(2000)
+        ]
+
+        assert expect_column_values_to_be_unique("id", approximate=True)(records).is_valid
+
+
 # =============================================================================
 # Edge Cases
 # =============================================================================
@@ -0,0 +1,141 @@
+"""
+Tests for data profiling.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from vibe_piper.types import DataRecord, DataType, Schema
+from vibe_piper.validation.data_profiling import profile_column, profile_data
+
+
+@pytest.fixture
+def records():
+    """Create records with numeric, string, temporal, nested and null columns."""
+    schema = Schema(name="loose")
+    return [
+        DataRecord(
+            data={
+                "amount": [10, 20, 20, 40][i % 4],
+                "city": ["Oslo", "Lima", None, "Oslo"][i % 4],
+                "seen": datetime(2024, 1, 1 + i % 3),
+                "tags": {"id": i % 2},
+            },
+            schema=schema,
+        )
+        for i in range(8)
+    ]
+
+
+class TestProfileData:
+    """Test exact (sampled) profiling."""
+
+    def test_column_statistics(self, records) -> None:
+        """Test every column type is profiled in one pass."""
+        profile = profile_data(records)
+
+        amount = profile.column_stats["amount"]
+        assert amount.data_type == DataType.INTEGER
+        assert (amount.min_value, amount.max_value) == (10.0, 40.0)
+        assert amount.mean == 22.5
+        assert amount.median == 20.0
+        assert amount.mode == (20,)
+        assert all(type(value) is int for value in (*amount.mode, *amount.sample_values))
+        assert type(amount.min_value) is int
+        assert amount.distinct_count == 3
+        assert amount.unique_count == 0
+
+        city = profile.column_stats["city"]
+        assert city.null_count == 2
+        assert city.null_percentage == 0.25
+        assert city.histogram == {"Oslo": 4, "Lima": 2}
+        assert city.length_stats["max_length"] == 4
+
+        seen = profile.column_stats["seen"]
+        assert seen.data_type == DataType.DATETIME
+        assert seen.max_value == datetime(2024, 1, 3)
+
+        assert profile.column_stats["tags"].distinct_count == 2
+        assert profile.inferred_schema.get_field("city").nullable
+
+    def test_sample_is_uniform(self) -> None:
+        """Test large inputs are sampled from all rows, not the first ones."""
+        rows = [{"half": 0 if i < 5_000 else 1} for i in range(10_000)]
+
+        profile = profile_data(rows, max_sample_rows=1_000, seed=3)
+
+        assert profile.total_rows == 10_000
+        assert 0.4 < profile.column_stats["half"].mean < 0.6
+        repeated = profile_data(rows, max_sample_rows=1_000, seed=3)
+        assert repeated.column_stats == profile.column_stats
+
+    def test_parallel_columns(self, records) -> None:
+        """Test profiling columns on several threads gives the same profile."""
+        sequential = profile_data(records, infer_schema=False)
+        parallel = profile_data(records, infer_schema=False, max_workers=4)
+
+        assert parallel.column_stats == sequential.column_stats
+
+    def test_profile_column(self, records) -> None:
+        """Test profiling a single column."""
+        assert profile_column(records, "amount").mean == 22.5
+        assert profile_column(records, "missing") is None
+
+    @pytest.mark.parametrize("base", [2**53, 2**64])
+    def test_large_integers_stay_exact(self, base: int) -> None:
+        """Test integer statistics are not rounded through floats."""
+        schema = Schema(name="loose")
+        ids = [base + 1, base + 2, base + 2]
+        records = [DataRecord(data={"id": value}, schema=schema) for value in ids]
+
+        stats = profile_column(records, "id")
+
+        assert (stats.min_value, stats.max_value) == (base + 1, base + 2)
+        assert stats.mode == (base + 2,)
+        assert stats.sample_values == (base + 1, base + 2)
+        assert stats.distinct_count == 2
+
+
+class TestIncrementalProfile:
+    """Test updating sketch-based profiles with new batches."""
+
+    def test_update_matches_full_profile(self) -> None:
+        """Test an updated profile agrees with profiling all rows at once."""
+        rows = [{"amount": float(i % 500), "city": f"c{i % 7}"} for i in range(12_000)]
+        batch = [{"amount": 1_000.0, "city": "new", "flag": True} for _ in range(3_000)]
+
+        profile = profile_data(rows, approximate=True)
+        updated = profile.update(batch)
+        full = profile_data(rows + batch, approximate=True)
+
+        assert profile.total_rows == 12_000
+        assert updated.total_rows == full.total_rows == 15_000
+        for column in ("amount", "city"):
+            assert updated.column_stats[column].null_count == 0
+            assert updated.column_stats[column].distinct_count == pytest.approx(
+                full.column_stats[column].distinct_count, rel=0.01
+            )
+        assert updated.column_stats["amount"].mean == pytest.approx(
+            full.column_stats["amount"].mean
+        )
+        assert updated.column_stats["amount"].max_value == 1_000.0
+        assert updated.column_stats["flag"].null_count == 12_000
+        assert profile.column_stats["amount"].max_value == 499.0
+
+    def test_unhashable_columns(self) -> None:
+        """Test list and dict columns are profiled from sketches without errors."""
+        rows = [{"tags": ["a", str(i % 3)], "meta": {"id": i % 2}} for i in range(20)]
+
+        profile = profile_data(rows, approximate=True)
+
+        tags = profile.column_stats["tags"]
+        meta = profile.column_stats["meta"]
+        assert set(tags.sample_values) == {repr(["a", str(i)]) for i in range(3)}
+        assert set(meta.sample_values) == {"{'id': 0}", "{'id': 1}"}
+        assert profile.update(rows).total_rows == 40
+
+    def test_exact_profiles_cannot_be_updated(self, records) -> None:
+        """Test updating a sampled profile is rejected."""
+        with pytest.raises(ValueError, match="approximate=True"):
+            profile_data(records).update(records)
@@ -14,7 +14,7 @@ Tests cover:
 
 import json
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -23,13 +23,16 @@ from vibe_piper.types import DataRecord, DataType, Schema, SchemaField
 from vibe_piper.validation import (
     BaselineMetadata,
     BaselineStore,
+    BaselineSummary,
     DriftHistory,
     DriftResult,
     DriftThresholds,
     check_drift_alert,
     check_drift_ks,
     check_drift_psi,
+    detect_drift_chi_square,
     detect_drift_ks,
+    detect_drift_multi_method,
     detect_drift_psi,
 )
 
@@ -270,6 +273,129 @@ class TestBaselineStore:
             store.delete_baseline("nonexistent")
 
 
+# =============================================================================
+# Baseline Summary Tests
+# =============================================================================
+
+
+class TestBaselineSummary:
+    """Tests for drift detection against precomputed baseline summaries."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> BaselineStore:
+        """Create BaselineStore instance with temp directory."""
+        return BaselineStore(storage_dir=tmp_path)
+
+    def test_summary_matches_records(
+        self, normal_baseline: list[DataRecord], drifted_baseline: list[DataRecord]
+    ) -> None:
+        """Test each detector gives the same result against records and their summary."""
+        summary = BaselineSummary.from_records(normal_baseline)
+
+        for detector in (
+            detect_drift_ks("value"),
+            detect_drift_psi("value"),
+            detect_drift_chi_square("category"),
+        ):
+            from_records = detector((normal_baseline, drifted_baseline))
+            from_summary = detector((summary, drifted_baseline))
+
+            assert from_summary.drift_score == pytest.approx(from_records.drift_score)
+            assert from_summary.drifted_columns == from_records.drifted_columns
+
+    def test_large_summary_approximates_ks(self) -> None:
+        """Test the KS statistic from ECDF knots is within the knot spacing."""
+        import random
+
+        from scipy.stats import ks_2samp
+
+        random.seed(7)
+        schema = Schema(name="loose")
+        baseline = [
+            DataRecord(data={"value": random.gauss(50, 10)}, schema=schema) for _ in range(50_000)
+        ]
+        new_data = [
+            DataRecord(data={"value": random.gauss(51, 10)}, schema=schema) for _ in range(5_000)
+        ]
+        summary = BaselineSummary.from_records(baseline, num_knots=512)
+
+        result = detect_drift_ks("value")((summary, new_data))
+        exact = ks_2samp([r["value"] for r in baseline], [r["value"] for r in new_data])
+
+        assert len(summary.columns["value"].knots) == 512
+        assert abs(result.drift_score - exact.statistic) <= 2 / 512
+        assert result.drifted_columns == ("value",)
+
+    def test_truncated_categories(self, sample_schema: Schema) -> None:
+        """Test values beyond the frequency table are compared as one category."""
+        baseline = [
+            DataRecord(data={"id": i, "value": 1.0, "category": f"c{i % 40}"}, schema=sample_schema)
+            for i in range(400)
+        ]
+        summary = BaselineSummary.from_records(baseline, max_categories=10)
+
+        assert len(summary.columns["category"].categories) == 10
+        assert summary.columns["category"].other_count == 300
+        result = detect_drift_chi_square("category")((summary, baseline))
+        assert result.drifted_columns == ()
+
+    def test_psi_bins_must_match(self, normal_baseline: list[DataRecord]) -> None:
+        """Test PSI against a summary needs the summary's number of bins."""
+        summary = BaselineSummary.from_records(normal_baseline, num_bins=20)
+
+        with pytest.raises(ValueError, match="20 PSI bins"):
+            detect_drift_psi("value", num_bins=10)((summary, normal_baseline))
+
+    def test_store_without_records(
+        self, store: BaselineStore, normal_baseline: list[DataRecord], tmp_path: Path
+    ) -> None:
+        """Test summary-only baselines are small and usable by drift checks."""
+        store.add_baseline("summary_only", normal_baseline, store_records=False)
+        summary = store.get_summary("summary_only")
+
+        assert len(summary) == 200
+        assert summary.columns["value"].distribution["mean"] == pytest.approx(
+            sum(r["value"] for r in normal_baseline) / 200
+        )
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "summary_only.json",
+            "summary_only.summary",
+        ]
+        assert check_drift_ks("value", summary)(normal_baseline).is_valid
+        with pytest.raises(ValueError, match="without records"):
+            store.get_baseline("summary_only")
+
+        store.delete_baseline("summary_only")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_store_record_sample(
+        self, store: BaselineStore, normal_baseline: list[DataRecord]
+    ) -> None:
+        """Test storing a sample of the records while summarizing all of them."""
+        metadata = store.add_baseline("sampled", normal_baseline, sample_size=50)
+
+        assert metadata.sample_size == 200
+        assert len(store.get_baseline("sampled")) == 50
+        assert len(store.get_summary("sampled")) == 200
+
+    def test_legacy_baseline(self, store: BaselineStore, tmp_path: Path) -> None:
+        """Test baselines with records inside the JSON file are still readable."""
+        legacy = {
+            "metadata": {
+                "baseline_id": "legacy",
+                "created_at": "2024-01-01T00:00:00",
+                "sample_size": 2,
+                "columns": ["value"],
+                "description": None,
+            },
+            "data": [{"data": {"value": 1.0}}, {"data": {"value": 3.0}}],
+        }
+        (tmp_path / "legacy.json").write_text(json.dumps(legacy))
+
+        assert [r["value"] for r in store.get_baseline("legacy")] == [1.0, 3.0]
+        assert store.get_summary("legacy").columns["value"].distribution["median"] == 2.0
+
+
 # =============================================================================
 # Drift History Tests
 # =============================================================================
@@ -463,6 +589,103 @@ class TestDriftHistory:
         history.clear_history("test_baseline")
         assert len(history.get_entries("test_baseline")) == 0
 
+    def test_time_range_and_latest_first(
+        self,
+        history: DriftHistory,
+        sample_result: DriftResult,
+        thresholds: DriftThresholds,
+    ) -> None:
+        """Test entries are read latest first, by time range, per baseline."""
+        added = [history.add_entry(sample_result, "test_baseline", thresholds) for _ in range(6)]
+        history.add_entry(sample_result, "other_baseline", thresholds)
+
+        latest = history.get_entries("test_baseline", limit=2)
+        assert [e.timestamp for e in latest] == [added[5].timestamp, added[4].timestamp]
+        in_range = history.get_entries(
+            "test_baseline", start=added[1].timestamp, end=added[3].timestamp
+        )
+        assert [e.timestamp for e in in_range] == [e.timestamp for e in added[3:0:-1]]
+
+    def test_downsampling_and_retention(
+        self,
+        temp_dir: tempfile.TemporaryDirectory,
+        thresholds: DriftThresholds,
+    ) -> None:
+        """Test old entries are merged per interval and expired ones deleted."""
+        history = DriftHistory(
+            storage_dir=temp_dir.name,
+            retention_days=30,
+            downsample_after_days=1,
+            downsample_interval=timedelta(days=1),
+        )
+        for score in (0.05, 0.15, 0.3, 0.1):
+            result = DriftResult(
+                method="ks_test",
+                drift_score=score,
+                drifted_columns=("a",) if score > 0.2 else ("b",),
+                p_values={},
+                statistics={},
+                recommendations=[],
+            )
+            history.add_entry(result, "test_baseline", thresholds)
+        now = history.get_entries("test_baseline", limit=1)[0].timestamp
+
+        history.compact(now=now + timedelta(days=3))
+        (merged,) = history.get_entries("test_baseline")
+        assert merged.count == 4
+        assert merged.drift_score == pytest.approx(0.15)
+        assert merged.max_drift_score == 0.3
+        assert set(merged.drifted_columns) == {"a", "b"}
+        assert merged.alert_level == "critical"
+        assert merged.timestamp == now
+
+        history.compact(now=now + timedelta(days=31))
+        assert history.get_entries("test_baseline") == []
+
+    def test_max_entries(
+        self,
+        temp_dir: tempfile.TemporaryDirectory,
+        sample_result: DriftResult,
+        thresholds: DriftThresholds,
+    ) -> None:
+        """Test only the latest max_entries entries are kept."""
+        history = DriftHistory(storage_dir=temp_dir.name, max_entries=3)
+        added = [history.add_entry(sample_result, "test_baseline", thresholds) for _ in range(5)]
+
+        history.compact("test_baseline")
+
+        entries = history.get_entries("test_baseline")
+        assert [e.timestamp for e in entries] == [e.timestamp for e in added[:1:-1]]
+        with pytest.raises(ValueError, match="max_entries"):
+            DriftHistory(storage_dir=temp_dir.name, max_entries=0)
+
+    def test_legacy_history_file(
+        self,
+        temp_dir: tempfile.TemporaryDirectory,
+        history: DriftHistory,
+    ) -> None:
+        """Test JSON lines history of earlier versions is imported once."""
+        legacy = Path(temp_dir.name) / "legacy_history.jsonl"
+        lines = [
+            {
+                "timestamp": f"2024-01-0{day}T00:00:00",
+                "baseline_id": "legacy",
+                "method": "psi",
+                "drift_score": day / 10,
+                "max_drift_score": day / 10,
+                "drifted_columns": [],
+                "alert_level": "none",
+            }
+            for day in (2, 1, 3)
+        ]
+        legacy.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+        entries = history.get_entries("legacy")
+
+        assert [e.drift_score for e in entries] == [0.3, 0.2, 0.1]
+        assert not legacy.exists()
+        assert len(DriftHistory(storage_dir=temp_dir.name).get_entries("legacy")) == 3
+
 
 # =============================================================================
 # Drift Detection Tests
@@ -525,6 +748,86 @@ class TestDriftDetection:
         assert any("Insufficient sample size" in rec for rec in result.recommendations)
 
 
+# =============================================================================
+# Multi-Method Drift Tests
+# =============================================================================
+
+
+class TestMultiMethodDrift:
+    """Tests for batch drift detection across columns and methods."""
+
+    @pytest.fixture
+    def new_data(self, sample_schema: Schema) -> list[DataRecord]:
+        """Create new data with drift in value and category."""
+        import random
+
+        random.seed(5)
+        return [
+            DataRecord(
+                data={"id": i, "value": random.gauss(60, 10), "category": random.choice("AB")},
+                schema=sample_schema,
+            )
+            for i in range(150)
+        ]
+
+    def test_matches_single_method_detectors(
+        self, normal_baseline: list[DataRecord], new_data: list[DataRecord]
+    ) -> None:
+        """Test batch results equal the single-column detectors, for records and summaries."""
+        detector = detect_drift_multi_method(
+            ["id", "value", "category", "missing"], methods=["ks_test", "chi_square", "psi"]
+        )
+        single = {
+            "ks_test": lambda column: detect_drift_ks(column),
+            "chi_square": lambda column: detect_drift_chi_square(column),
+            "psi": lambda column: detect_drift_psi(column),
+        }
+
+        for baseline in (normal_baseline, BaselineSummary.from_records(normal_baseline)):
+            results = detector((baseline, new_data))
+
+            assert len(results) == 12
+            for column in ("id", "value", "category", "missing"):
+                for method, make in single.items():
+                    expected = make(column)((baseline, new_data))
+                    result = results[f"{column}_{method}"]
+                    assert result.method == expected.method
+                    assert result.drift_score == pytest.approx(expected.drift_score)
+                    assert result.drifted_columns == expected.drifted_columns
+                    assert result.statistics.get("error") == expected.statistics.get("error")
+            assert results["value_ks_test"].drifted_columns == ("value",)
+            assert results["category_chi_square"].drifted_columns == ("category",)
+
+    def test_parallel_columns(
+        self, normal_baseline: list[DataRecord], new_data: list[DataRecord]
+    ) -> None:
+        """Test checking columns on several threads gives the same results."""
+        columns = ["id", "value", "category"]
+        sequential = detect_drift_multi_method(columns)((normal_baseline, new_data))
+        parallel = detect_drift_multi_method(columns, max_workers=3)((normal_baseline, new_data))
+
+        assert list(parallel) == list(sequential)
+        assert [r.drift_score for r in parallel.values()] == [
+            r.drift_score for r in sequential.values()
+        ]
+
+    def test_minimum_samples_per_method(
+        self, normal_baseline: list[DataRecord], new_data: list[DataRecord]
+    ) -> None:
+        """Test each method keeps its own minimum number of records."""
+        results = detect_drift_multi_method(["category"], methods=["ks_test", "chi_square"])(
+            (normal_baseline, new_data[:40])
+        )
+
+        assert "Insufficient sample size for KS test" in results["category_ks_test"].recommendations
+        assert "error" not in results["category_chi_square"].statistics
+
+    def test_unknown_method(self) -> None:
+        """Test unknown methods are rejected when the detector is built."""
+        with pytest.raises(ValueError, match="Unknown drift methods"):
+            detect_drift_multi_method(["value"], methods=["ks_test", "wasserstein"])
+
+
 # =============================================================================
 # Alerting Tests
 # =============================================================================
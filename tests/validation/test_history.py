@@ -14,6 +14,7 @@ from vibe_piper.validation.history import (
     BaselineComparisonResult,
     FailurePattern,
     PostgreSQLValidationHistoryStore,
+    SQLiteValidationHistoryStore,
     TrendAnalysisResult,
     ValidationCheckRecord,
     ValidationHistoryAnalyzer,
@@ -279,7 +280,11 @@ def test_save_check_results(mock_connector, sample_check_records):
 
     store.save_check_results(sample_check_records)
 
-    assert len(mock_connector.executed_queries) == len(sample_check_records)
+    # All records are inserted with one multi-row statement
+    assert len(mock_connector.executed_queries) == 1
+    query, params = mock_connector.executed_queries[0]
+    assert query.count("%(check_name_") == len(sample_check_records)
+    assert params["check_name_1"] == "check_2"
 
 
 def test_save_metrics(mock_connector, sample_validation_metrics):
@@ -288,7 +293,10 @@ def test_save_metrics(mock_connector, sample_validation_metrics):
 
     store.save_metrics(sample_validation_metrics)
 
-    assert len(mock_connector.executed_queries) == len(sample_validation_metrics)
+    # One statement inserts the metrics and adds them to the daily rollup
+    assert len(mock_connector.executed_queries) == 1
+    query, _ = mock_connector.executed_queries[0]
+    assert "validation_metric_daily" in query
 
 
 def test_query_validation_runs(mock_connector, sample_validation_run):
@@ -298,3 +306,216 @@ def test_query_validation_runs(mock_connector, sample_validation_run):
     runs = store.query_validation_runs(asset_name="test_asset")
 
     assert len(runs) >= 0
+
+
+def test_partitioned_schema(mock_connector):
+    """Test the schema is partitioned by month with a default partition."""
+    store = PostgreSQLValidationHistoryStore(mock_connector, partitioned=True, months_ahead=1)
+
+    store.initialize_schema()
+
+    schema, _ = mock_connector.executed_queries[0]
+    assert "PARTITION BY RANGE (started_at)" in schema
+    assert "PRIMARY KEY (validation_run_id, started_at)" in schema
+    assert "validation_run_daily" in schema
+    partitions, _ = mock_connector.executed_queries[1]
+    assert "validation_runs_default PARTITION OF validation_runs DEFAULT" in partitions
+    assert partitions.count("PARTITION OF validation_metrics FOR VALUES") == 2
+
+
+def test_plain_schema_keeps_run_id_key(mock_connector, sample_validation_run):
+    """Test unpartitioned tables keep the run id key, cascade and upsert target."""
+    store = PostgreSQLValidationHistoryStore(mock_connector)
+
+    store.initialize_schema()
+    store.save_validation_run(sample_validation_run)
+
+    schema, _ = mock_connector.executed_queries[0]
+    upsert, _ = mock_connector.executed_queries[1]
+    assert "PARTITION BY" not in schema
+    assert "validation_run_id VARCHAR(255) PRIMARY KEY" in schema
+    assert "REFERENCES validation_runs(validation_run_id) ON DELETE CASCADE" in schema
+    assert "ON CONFLICT (validation_run_id) DO UPDATE" in upsert
+
+
+def test_partitioned_resave_keeps_stored_start_time(mock_connector, sample_validation_run):
+    """Test re-saving a run with a new started_at updates the stored row."""
+    stored_at = sample_validation_run.started_at - timedelta(hours=3)
+
+    def execute_query(query: str, params: dict | None = None) -> QueryResult:
+        mock_connector.executed_queries.append((query, params or {}))
+        rows = [{"validation_run_id": "test-run-1", "started_at": stored_at}]
+        return QueryResult(rows=rows, row_count=1)
+
+    mock_connector.execute_query = execute_query
+    store = PostgreSQLValidationHistoryStore(mock_connector, partitioned=True)
+
+    store.save_validation_run(sample_validation_run)
+
+    upsert, params = mock_connector.executed_queries[1]
+    assert "ON CONFLICT (validation_run_id, started_at) DO UPDATE" in upsert
+    assert params["started_at_0"] == stored_at
+
+
+def test_migrate_to_partitioned(mock_connector):
+    """Test plain tables are copied into partitioned ones in one transaction."""
+    responses = iter(
+        [
+            QueryResult(rows=[{"relkind": "r"}], row_count=1),
+            QueryResult(rows=[{"first_time": datetime(2024, 1, 15)}], row_count=1),
+        ]
+    )
+    mock_connector.execute_query = lambda query, params=None: next(responses)
+    store = PostgreSQLValidationHistoryStore(mock_connector, months_ahead=0)
+
+    store.migrate_to_partitioned()
+
+    migration, _ = mock_connector.executed_queries[0]
+    rebuild, _ = mock_connector.executed_queries[1]
+    assert store.partitioned is True
+    assert migration.startswith("BEGIN;") and migration.endswith("COMMIT;")
+    assert "ALTER TABLE validation_runs RENAME TO validation_runs_unpartitioned;" in migration
+    assert "PARTITION OF validation_runs FOR VALUES FROM ('2024-01-01" in migration
+    assert "SELECT validation_run_id" in migration
+    assert "FROM validation_check_results_unpartitioned" in migration
+    assert "DROP TABLE validation_metrics_unpartitioned" in migration
+    assert "INSERT INTO validation_run_daily" in rebuild
+
+
+def _run(run_id: str, started_at: datetime, status: str = "passed") -> ValidationRunMetadata:
+    return ValidationRunMetadata(
+        validation_run_id=run_id,
+        asset_name="orders",
+        suite_name="suite",
+        status=status,
+        started_at=started_at,
+        duration_ms=10.0,
+        total_checks=4,
+        total_records=100,
+    )
+
+
+class PythonHistoryStore:
+    """Store without SQL aggregations, so the analyzer computes them in Python."""
+
+    def __init__(self, store: SQLiteValidationHistoryStore) -> None:
+        self._store = store
+
+    def query_validation_runs(self, **kwargs):
+        return self._store.query_validation_runs(**kwargs)
+
+    def get_metrics_history(self, **kwargs):
+        return self._store.get_metrics_history(**kwargs)
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    """Create a SQLite store with a month of runs of the orders asset."""
+    store = SQLiteValidationHistoryStore(tmp_path / "history.db")
+    start = datetime(2024, 1, 1, 3)
+    store.save_validation_runs(
+        [
+            _run(f"run-{i}", start + timedelta(hours=5 * i), ["passed", "failed", "warning"][i % 3])
+            for i in range(150)
+        ]
+    )
+    return store
+
+
+def test_sqlite_store_round_trip(sqlite_store, sample_check_records, sample_validation_metrics):
+    """Test runs and metrics read back from the SQLite store."""
+    run = sqlite_store.get_validation_run("run-4")
+    assert run == _run("run-4", datetime(2024, 1, 1, 23), "failed")
+    assert len(sqlite_store.get_asset_history("orders", limit=10)) == 10
+    assert sqlite_store.search_validation_runs("ORD", limit=500)[0].validation_run_id == "run-149"
+    assert sqlite_store.get_validation_run("missing") is None
+
+    sqlite_store.save_check_results(sample_check_records)
+    sqlite_store.save_metrics(sample_validation_metrics)
+    metrics = sqlite_store.get_metrics_history("test_asset")
+    assert [m.metric_name for m in metrics] == ["pass_rate", "completeness"]
+    assert metrics[1].metric_type == QualityMetricType.COMPLETENESS
+
+
+def test_sqlite_summary_matches_python(sqlite_store):
+    """Test SQL summaries over rollups and partial days match summarizing the runs."""
+    sql = ValidationHistoryAnalyzer(sqlite_store)
+    python = ValidationHistoryAnalyzer(PythonHistoryStore(sqlite_store))
+
+    sqlite_store.save_validation_run(_run("run-7", datetime(2024, 1, 2, 14), "failed"))
+    for start, end in [
+        (None, None),
+        (datetime(2024, 1, 3, 7, 30), datetime(2024, 1, 20, 11)),
+        (datetime(2024, 1, 5), datetime(2024, 1, 9)),
+        (datetime(2024, 1, 4, 1), datetime(2024, 1, 4, 20)),
+    ]:
+        assert sql.get_summary_statistics("orders", start, end) == pytest.approx(
+            python.get_summary_statistics("orders", start, end)
+        )
+
+
+def test_sqlite_delete_keeps_rollups_consistent(sqlite_store):
+    """Test deleting runs updates the rollups, including the partial cutoff day."""
+    deleted = sqlite_store.delete_old_runs(datetime(2024, 1, 10, 12))
+
+    remaining = sqlite_store.query_validation_runs(limit=1000)
+    assert deleted == 150 - len(remaining)
+    assert min(run.started_at for run in remaining) >= datetime(2024, 1, 10, 12)
+    summary = sqlite_store.summarize_runs("orders")
+    assert summary["total_runs"] == len(remaining)
+    assert summary["passed_runs"] == sum(run.status == "passed" for run in remaining)
+
+
+def test_sqlite_trends_match_python(tmp_path):
+    """Test trends fitted in SQL match fitting the fetched metrics."""
+    store = SQLiteValidationHistoryStore(tmp_path / "history.db")
+    now = datetime.utcnow()
+    store.save_metrics(
+        [
+            ValidationMetric(
+                metric_name="pass_rate",
+                metric_type=QualityMetricType.VALIDITY,
+                asset_name="orders",
+                value=0.5 + 0.01 * (i % 7) - 0.002 * i,
+                timestamp=now - timedelta(hours=i),
+                status="passed",
+            )
+            for i in range(300)
+        ]
+    )
+
+    trend = ValidationHistoryAnalyzer(store).analyze_trends("orders", "pass_rate")
+    expected = ValidationHistoryAnalyzer(PythonHistoryStore(store)).analyze_trends(
+        "orders", "pass_rate"
+    )
+
+    assert trend.data_points == expected.data_points == 300
+    assert trend.trend_value == pytest.approx(expected.trend_value)
+    assert trend.confidence == pytest.approx(expected.confidence)
+    daily = ValidationHistoryAnalyzer(store).analyze_trends("orders", "pass_rate", daily=True)
+    assert daily.data_points in (13, 14)
+    assert daily.direction == "improving"
+
+
+def test_sqlite_failure_patterns(sqlite_store):
+    """Test recurring failed checks are found with one aggregation query."""
+    runs = sqlite_store.query_validation_runs(status="failed", limit=1000)
+    sqlite_store.save_check_results(
+        [
+            ValidationCheckRecord(
+                validation_run_id=run.validation_run_id,
+                check_name="not_null" if i % 4 else "unique",
+                check_type="expect",
+                passed=False,
+            )
+            for i, run in enumerate(runs)
+        ]
+    )
+    analyzer = ValidationHistoryAnalyzer(sqlite_store)
+
+    patterns = analyzer.detect_failure_patterns("orders", period_days=100_000)
+
+    # Most recently failing check first, affected runs latest first
+    assert [(p.check_name, p.frequency) for p in patterns] == [("unique", 13), ("not_null", 37)]
+    assert patterns[0].affected_runs[:2] == (runs[0].validation_run_id, runs[4].validation_run_id)
+    assert patterns[1].last_occurrence == runs[1].started_at
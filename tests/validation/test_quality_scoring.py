@@ -20,9 +20,13 @@ from vibe_piper.validation.quality_scoring import (
     QualityHistory,
     QualityRecommendation,
     QualityScore,
+    QualityStatistics,
     QualityTrend,
     calculate_column_quality,
+    calculate_completeness,
     calculate_quality_score,
+    calculate_uniqueness,
+    compute_quality_statistics,
     create_quality_dashboard,
     generate_quality_alerts,
     generate_quality_recommendations,
@@ -575,3 +579,82 @@ class TestColumnQuality:
         assert col_quality.null_count == 2
         # Completeness should reflect missing values (50% complete)
         assert 48 <= col_quality.completeness <= 52  # Allow for rounding
+
+    def test_approximate_uniqueness(self) -> None:
+        """Test sketch-based uniqueness is close to the exact score."""
+        schema = Schema(name="loose")
+        records = [
+            DataRecord(data={"id": i % 45_000 if i % 3 else None}, schema=schema)
+            for i in range(60_000)
+        ]
+
+        exact = calculate_uniqueness(records, "id")
+        approximate = calculate_uniqueness(records, "id", approximate=True)
+
+        assert approximate == pytest.approx(exact, rel=0.07)
+        assert calculate_uniqueness(records[:300], "id", approximate=True) == calculate_uniqueness(
+            records[:300], "id"
+        )
+
+
+class TestSinglePassQuality:
+    """Tests for scoring all dimensions from mergeable statistics."""
+
+    @pytest.fixture
+    def records(self) -> list[DataRecord]:
+        schema = Schema(name="loose")
+        now = datetime.now()
+        return [
+            DataRecord(
+                data={
+                    "id": i % 700,
+                    "email": None if i % 5 == 0 else f"user{i}@example.com",
+                    "updated_at": now - timedelta(hours=i % 48),
+                    **({"note": "x"} if i % 2 else {}),
+                },
+                schema=schema,
+            )
+            for i in range(1_000)
+        ]
+
+    def test_matches_per_dimension_functions(self, records) -> None:
+        """Test one pass gives the scores of the separate calculations."""
+        score = calculate_quality_score(records, timestamp_field="updated_at")
+
+        assert score.completeness_score == pytest.approx(calculate_completeness(records) * 100)
+        expected_uniqueness = [
+            calculate_uniqueness(records, column) * 100 for column in ("id", "email", "updated_at")
+        ]
+        assert score.uniqueness_score == pytest.approx(sum(expected_uniqueness) / 3)
+        assert score.timeliness_score == pytest.approx(50.0, abs=0.5)
+
+        note = calculate_column_quality(records, "note")
+        assert (note.null_count, note.distinct_count, note.unique_count) == (500, 1, 0)
+        assert note.duplicate_count == 500
+
+    def test_chunks_and_workers_merge(self, records) -> None:
+        """Test streamed and parallel statistics equal a single scan."""
+        # A field only the first records have is missing from most chunks
+        records = [
+            DataRecord(data={"rare": i, **record.data}, schema=record.schema) if i < 10 else record
+            for i, record in enumerate(records)
+        ]
+        now = datetime.now()
+        whole = compute_quality_statistics(records, timestamp_field="updated_at", now=now)
+        parallel = compute_quality_statistics(
+            records, timestamp_field="updated_at", now=now, max_workers=4
+        )
+        streamed = QualityStatistics(timestamp_field="updated_at", now=now)
+        for start in range(0, len(records), 128):
+            streamed.update(records[start : start + 128])
+
+        for statistics in (parallel, streamed):
+            assert statistics.score().overall_score == whole.score().overall_score
+            assert statistics.column_quality("id") == whole.column_quality("id")
+            assert statistics.column_quality("rare") == whole.column_quality("rare")
+            assert statistics.null_cells == whole.null_cells
+        assert whole.scored_columns == ["rare", "id", "email", "updated_at"]
+        rare = whole.column_quality("rare")
+        assert rare.null_count == 990
+        assert rare.completeness == pytest.approx(1.0)
+        assert rare.uniqueness == 100.0
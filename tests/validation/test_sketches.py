@@ -0,0 +1,231 @@
+"""
+Tests for mergeable sketches and approximate statistics.
+"""
+
+import numpy as np
+import pytest
+
+from vibe_piper.types import DataRecord, DataType, Schema
+from vibe_piper.validation.data_profiling import profile_data
+from vibe_piper.validation.sketches import (
+    CountMinSketch,
+    DistinctSample,
+    HyperLogLog,
+    KLLSketch,
+    ReservoirSample,
+    hash_values,
+    load_sketch,
+)
+
+
+def _chunks(values, size):
+    return [values[start : start + size] for start in range(0, len(values), size)]
+
+
+def _merged(factory, values, size=7_000):
+    """Sketch values chunk by chunk in separate sketches, then merge them."""
+    sketches = []
+    for chunk in _chunks(values, size):
+        sketch = factory()
+        sketch.update(chunk)
+        sketches.append(sketch)
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    return merged
+
+
+class TestHashing:
+    """Test stable value hashing."""
+
+    def test_numbers_hash_by_value(self) -> None:
+        """Test equal numbers hash equally regardless of type or neighbours."""
+        hashes = hash_values([1, 1.0, True, -0.0, 0])
+
+        assert hashes[0] == hashes[1] == hashes[2]
+        assert hashes[3] == hashes[4]
+        assert hash_values([1])[0] == hashes[0]
+        assert hash_values(["x", 1, None])[1] == hashes[0]
+
+    def test_large_integers_hash_exactly(self) -> None:
+        """Test distinct int64 IDs beyond float precision get distinct hashes."""
+        ids = [1_234_567_890_123_456_789 + i for i in range(2000)]
+        hashes = hash_values(ids)
+
+        assert len(set(hashes.tolist())) == 2000
+        assert (hash_values(np.array(ids)) == hashes).all()
+        assert hash_values([np.int64(ids[0]), float(2**60)]).tolist() == (
+            hash_values([ids[0], 2**60]).tolist()
+        )
+        assert hash_values([2**70])[0] != hash_values([2**70 + 1])[0]
+
+    def test_strings_and_other_values(self) -> None:
+        """Test strings hash by content and differ from numbers and reprs."""
+        hashes = hash_values(["1", 1, (1,), "a"])
+
+        assert len(set(hashes.tolist())) == 4
+        assert hash_values(["a"])[0] == hashes[3]
+
+
+class TestKLLSketch:
+    """Test KLL quantile sketches."""
+
+    def test_quantiles_within_rank_error(self) -> None:
+        """Test merged chunk sketches estimate quantiles within the bound."""
+        values = np.random.default_rng(0).lognormal(size=200_000)
+        sketch = _merged(KLLSketch, values, size=20_000)
+        ordered = np.sort(values)
+
+        assert sketch.count == len(values)
+        assert sketch.minimum == ordered[0]
+        assert sketch.maximum == ordered[-1]
+        for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+            rank = np.searchsorted(ordered, sketch.quantile(q), side="right") / len(values)
+            assert abs(rank - q) < sketch.rank_error
+        assert abs(sketch.rank(float(np.median(values))) - 0.5) < sketch.rank_error
+
+    def test_small_input_is_exact(self) -> None:
+        """Test a sketch below capacity keeps every value."""
+        sketch = KLLSketch()
+        sketch.update([5.0, 1.0, float("nan"), 3.0])
+
+        assert sketch.count == 3
+        assert sketch.quantiles([0, 0.5, 1]) == [1.0, 3.0, 5.0]
+        assert np.isnan(KLLSketch().quantile(0.5))
+
+    def test_round_trip_and_incompatible_merge(self) -> None:
+        """Test serialization preserves estimates and mismatched k is rejected."""
+        sketch = KLLSketch()
+        sketch.update(np.arange(50_000, dtype=float))
+        restored = load_sketch(sketch.to_bytes())
+
+        assert isinstance(restored, KLLSketch)
+        assert restored.quantiles([0.1, 0.5, 0.9]) == sketch.quantiles([0.1, 0.5, 0.9])
+        assert len(sketch.to_bytes()) < 10_000
+        with pytest.raises(ValueError, match="different k"):
+            sketch.merge(KLLSketch(k=100))
+
+
+class TestDistinctCounts:
+    """Test HyperLogLog and distinct samples."""
+
+    def test_hyperloglog_estimate(self) -> None:
+        """Test distinct counts are within a few standard errors."""
+        values = [f"user-{i % 150_000}" for i in range(300_000)]
+        sketch = _merged(HyperLogLog, values, size=50_000)
+
+        assert sketch.count == 300_000
+        assert abs(sketch.estimate() / 150_000 - 1) < 4 * sketch.relative_error
+        restored = HyperLogLog.from_bytes(sketch.to_bytes())
+        assert restored.estimate() == sketch.estimate()
+
+    def test_hyperloglog_small_counts(self) -> None:
+        """Test small cardinalities are estimated almost exactly."""
+        sketch = HyperLogLog()
+        sketch.update([1, 2, 3, 1.0, 2, None])
+
+        assert round(sketch.estimate()) == 4
+        assert HyperLogLog().estimate() == 0
+
+    def test_distinct_sample_exact_below_k(self) -> None:
+        """Test exact frequencies while the sample holds every value."""
+        sample = _merged(DistinctSample, [1, 2, 2, 3, 3, 3, "a"], size=3)
+
+        assert sample.is_exact
+        assert sample.distinct_count() == 4
+        assert sample.singleton_count() == 2
+        assert sample.duplicated_count() == 2
+
+    def test_distinct_sample_estimates(self) -> None:
+        """Test merged samples estimate singletons and duplicates."""
+        values = list(range(200_000)) + list(range(0, 200_000, 10))
+        sample = _merged(DistinctSample, values, size=30_000)
+
+        assert not sample.is_exact
+        tolerance = 4 * sample.relative_error
+        assert abs(sample.distinct_count() / 200_000 - 1) < tolerance
+        assert abs(sample.singleton_count() / 180_000 - 1) < tolerance
+        assert abs(sample.duplicated_count() / 20_000 - 1) < 4 / np.sqrt(sample.k * 0.1)
+        assert set(np.unique(sample.counts).tolist()) == {1, 2}
+
+
+class TestFrequencyAndSamples:
+    """Test Count-Min heavy hitters and reservoir samples."""
+
+    def test_heavy_hitters(self) -> None:
+        """Test the most frequent values are found and never undercounted."""
+        values = [int(v) for v in np.random.default_rng(1).zipf(1.6, 100_000)]
+        sketch = _merged(CountMinSketch, values, size=10_000)
+        exact = {v: values.count(v) for v in range(1, 6)}
+
+        top = sketch.heavy_hitters(5)
+        assert [value for value, _ in top] == [1, 2, 3, 4, 5]
+        for value, estimate in top:
+            assert exact[value] <= estimate <= exact[value] + sketch.error * len(values)
+        restored = load_sketch(sketch.to_bytes())
+        assert restored.heavy_hitters(5) == top
+        assert restored.estimate(1) == sketch.estimate(1)
+
+    def test_reservoir_sample_is_uniform_after_merge(self) -> None:
+        """Test merged reservoirs draw from each partition by its size."""
+        first, second = ReservoirSample(500, seed=1), ReservoirSample(500, seed=2)
+        for chunk in _chunks(list(range(10_000)), 1_000):
+            first.update(chunk)
+        second.update(list(range(10_000, 40_000)))
+        first.merge(second)
+
+        assert first.count == 40_000
+        assert len(first.values) == len(set(first.values)) == 500
+        from_second = sum(value >= 10_000 for value in first.values)
+        assert 320 < from_second < 430
+        assert ReservoirSample.from_bytes(first.to_bytes()).values == first.values
+
+    def test_reservoir_below_capacity_keeps_everything(self) -> None:
+        """Test small inputs are kept whole."""
+        sample = ReservoirSample(10)
+        sample.update(["a", "b"])
+        sample.merge(_merged(lambda: ReservoirSample(10), ["c", "d", "e"], size=2))
+
+        assert sorted(sample.values) == ["a", "b", "c", "d", "e"]
+
+    def test_load_rejects_other_data(self) -> None:
+        """Test loading bytes that are not a sketch."""
+        with pytest.raises(ValueError, match="not a serialized sketch"):
+            load_sketch(b"nope")
+        with pytest.raises(ValueError, match="not a HyperLogLog"):
+            HyperLogLog.from_bytes(KLLSketch().to_bytes())
+
+
+class TestApproximateProfile:
+    """Test sketch-based data profiling."""
+
+    def test_profile_matches_exact_values(self) -> None:
+        """Test sketch-based statistics agree with the exact values."""
+        schema = Schema(name="loose")
+        records = [
+            DataRecord(
+                data={
+                    "amount": float(i % 1_000),
+                    "city": ["Oslo", "Lima", "Pune", None][i % 4],
+                },
+                schema=schema,
+            )
+            for i in range(20_000)
+        ]
+
+        approximate = profile_data(records, approximate=True)
+
+        amount, city = approximate.column_stats["amount"], approximate.column_stats["city"]
+        assert approximate.total_rows == 20_000
+        assert amount.data_type == DataType.FLOAT
+        assert amount.mean == pytest.approx(499.5)
+        assert amount.min_value == 0.0
+        assert amount.max_value == 999.0
+        assert abs(amount.median - 499.5) < 30
+        assert amount.distinct_count == pytest.approx(1_000, rel=0.03)
+        assert city.data_type == DataType.STRING
+        assert city.null_count == 5_000
+        assert city.distinct_count == 3
+        assert city.histogram == {"Oslo": 5_000, "Lima": 5_000, "Pune": 5_000}
+        assert city.length_stats["max_length"] == 4
+        assert approximate.inferred_schema is not None
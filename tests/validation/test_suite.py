@@ -1,15 +1,20 @@
 """
 Tests for validation suite framework.
 
-Tests ValidationSuite, different strategies, and result handling.
+Tests ValidationSuite, different strategies, fused statistics and result handling.
 """
 
+from unittest.mock import patch
+
 import pytest
 
-from vibe_piper.types import DataRecord, DataType, Schema, SchemaField
+from vibe_piper.types import DataRecord, DataType, Schema, SchemaField, ValidationResult
 from vibe_piper.validation import (
+    StatKind,
+    StatRequest,
     ValidationStrategy,
     ValidationSuite,
+    compute_statistics,
     create_validation_suite,
     expect,
 )
@@ -256,6 +261,196 @@ class TestValidationExecution:
         assert "exception" in str(result.errors).lower()
 
 
+# =============================================================================
+# Fused Execution Tests
+# =============================================================================
+
+
+class TestFusedExecution:
+    """Test statistical checks evaluated from one shared scan."""
+
+    def test_checks_share_one_scan(self, sample_records, invalid_records):
+        """Test suite results match running each check on its own, from one scan."""
+        checks = {
+            "unique_ids": expect.column("id").to_be_unique(),
+            "valid_ages": expect.column("age").to_be_between(20, 40),
+            "valid_emails": expect.column("email").to_match_regex(r"^[\w\.-]+@"),
+            "mean_score": expect.column("score").mean_to_be_between(90, 100),
+            "median_age": expect.column("age").median_to_be_between(18, 22),
+            "row_count": expect.table().row_count_to_be_between(1, 2),
+        }
+        suite = create_validation_suite("fused", checks=checks)
+
+        with patch(
+            "vibe_piper.validation.suite.compute_statistics", wraps=compute_statistics
+        ) as scan:
+            for records in (sample_records, invalid_records):
+                result = suite.validate(records)
+                assert result.check_results == {
+                    name: check(records) for name, check in checks.items()
+                }
+
+        assert scan.call_count == 2
+
+    def test_custom_checks_receive_records(self, sample_records):
+        """Test non-statistical checks still run on the records."""
+        seen: list[int] = []
+
+        def custom_check(records):
+            seen.append(len(records))
+            return ValidationResult(is_valid=True)
+
+        suite = ValidationSuite(name="mixed")
+        suite.add_check("custom", custom_check)
+        suite.add_check("increasing_ids", expect.column("id").to_be_increasing())
+        suite.add_check("unique_ids", expect.column("id").to_be_unique())
+
+        assert suite.validate(sample_records).success is True
+        assert seen == [3]
+
+    def test_failed_statistic_only_fails_its_checks(self):
+        """Test a statistic that cannot be computed fails only the checks using it."""
+        schema = Schema(name="loose")
+        records = [DataRecord(data={"tags": [i], "score": i}, schema=schema) for i in range(3)]
+
+        suite = ValidationSuite(name="unhashable")
+        suite.add_check("unique_tags", expect.column("tags").to_be_unique())
+        suite.add_check("mean_score", expect.column("score").mean_to_be_between(0, 2))
+        result = suite.validate(records)
+
+        assert result.failed_checks == ("unique_tags",)
+        assert "unhashable" in result.errors[0]
+
+    def test_chunked_statistics_merge(self):
+        """Test statistics over chunks and merged partitions match one pass."""
+        schema = Schema(name="loose")
+        records = [
+            DataRecord(data={"x": [None, 1, 2.5, "a", -4][i % 5], "s": f"v{i % 4}"}, schema=schema)
+            for i in range(23)
+        ]
+        requests = [
+            StatRequest("x", StatKind.MOMENTS),
+            StatRequest("x", StatKind.VALUES),
+            StatRequest("x", StatKind.RANGE, (0, 2)),
+            StatRequest("s", StatKind.VALUE_COUNTS),
+            StatRequest("s", StatKind.REGEX, r"v[12]"),
+        ]
+        whole = compute_statistics(records, requests)
+        chunked = compute_statistics(records, requests, chunk_size=4)
+        merged = compute_statistics(records[:10], requests)
+        merged.merge(compute_statistics(records[10:], requests))
+
+        for statistics in (chunked, merged):
+            assert statistics.row_count == 23
+            x, s = statistics.column("x"), statistics.column("s")
+            assert x.numeric_count == whole.column("x").numeric_count == 14
+            assert x.mean == pytest.approx(whole.column("x").mean)
+            assert x.std_dev == pytest.approx(whole.column("x").std_dev)
+            assert (x.minimum, x.maximum) == (-4.0, 2.5)
+            assert x.quantile(0.5) == whole.column("x").quantile(0.5)
+            assert x.outside_range[(0, 2)] == whole.column("x").outside_range[(0, 2)] == 13
+            assert s.value_counts == whole.column("s").value_counts
+            assert s.regex_matches[r"v[12]"] == 12
+
+
+class TestParallelAndStreaming:
+    """Test parallel execution and chunk-streaming validation."""
+
+    @staticmethod
+    def _records(count):
+        schema = Schema(name="loose")
+        return [
+            DataRecord(data={"id": i, "age": [None, 20, 35, 150][i % 4]}, schema=schema)
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _checks():
+        return {
+            "unique_ids": expect.column("id").to_be_unique(),
+            "valid_ages": expect.column("age").to_be_between(0, 120),
+            "mean_age": expect.column("age").mean_to_be_between(30, 80),
+            "row_count": expect.table().row_count_to_be_between(1, 1000),
+        }
+
+    def test_parallel_matches_sequential(self):
+        """Test parallel validation gives the sequential result."""
+        records = self._records(100)
+        checks = {**self._checks(), "increasing_ids": expect.column("id").to_be_increasing()}
+        for strategy in (ValidationStrategy.COLLECT_ALL, ValidationStrategy.FAIL_FAST):
+            suite = create_validation_suite("parallel", checks=checks, strategy=strategy)
+
+            sequential = suite.validate(records)
+            parallel = suite.validate(records, max_workers=4)
+
+            assert parallel.check_results == sequential.check_results
+            assert parallel.failed_checks == sequential.failed_checks
+            assert parallel.errors == sequential.errors
+
+    def test_stream_matches_whole(self):
+        """Test statistical checks over a stream see the whole dataset."""
+        records = self._records(100)
+        suite = create_validation_suite("stream", checks=self._checks())
+
+        whole = suite.validate(records)
+        streamed = suite.validate_stream(records[i : i + 30] for i in range(0, 100, 30))
+
+        assert streamed.total_records == 100
+        assert streamed.failed_checks == whole.failed_checks == ("valid_ages",)
+        assert streamed.check_results == whole.check_results
+
+    def test_stream_rejects_whole_dataset_checks(self):
+        """Test checks that compare rows across chunks cannot validate a stream."""
+        checks = {**self._checks(), "increasing_ids": expect.column("id").to_be_increasing()}
+        suite = create_validation_suite("stream", checks=checks)
+        consumed = []
+
+        def chunks():
+            consumed.append(0)
+            yield self._records(10)
+
+        with pytest.raises(ValueError, match="increasing_ids"):
+            suite.validate_stream(chunks())
+        assert consumed == []
+
+    def test_stream_fail_fast_stops_reading(self):
+        """Test fail-fast streaming stops at the first conclusive failure."""
+        records = self._records(100)
+        consumed = []
+
+        def chunks():
+            for start in range(0, 100, 10):
+                consumed.append(start)
+                yield records[start : start + 10]
+
+        suite = create_validation_suite(
+            "stream", checks=self._checks(), strategy=ValidationStrategy.FAIL_FAST
+        )
+        result = suite.validate_stream(chunks())
+
+        assert consumed == [0]
+        assert result.total_records == 10
+        assert result.failed_checks == ("valid_ages",)
+        assert result.errors == ("Column 'age': 2/10 values are not between 0 and 120",)
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self):
+        """Test validating an async record stream in chunks."""
+        records = self._records(100)
+
+        async def stream():
+            for record in records:
+                yield record
+
+        suite = create_validation_suite("stream", checks=self._checks())
+        result = await suite.validate_async_stream(stream(), chunk_size=30)
+
+        assert (
+            result.check_results
+            == suite.validate_stream(records[i : i + 30] for i in range(0, 100, 30)).check_results
+        )
+
+
 # =============================================================================
 # Validation Strategy Tests
 # =============================================================================